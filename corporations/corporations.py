@@ -1,6 +1,5 @@
 import discord
 from discord import app_commands
-import json
 import os
 from datetime import datetime, timezone, timedelta
 from discord.ext import commands
@@ -12,56 +11,12 @@ import humanize
 import random, math
 from .config import STATE_OPTIONS, LAND_OPTIONS, office_options, CORPORATE_CATEGORIES, PRODUCT_TEMPLATES
 import copy
+from .corp_store import get_store, release_store
 
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "data")
 CORPORATIONS_FILE = os.path.join(DATA_DIR, "corporations.json")
-
-def load_corporations():
-    timezone = pytz.timezone("US/Pacific")
-    if os.path.exists(CORPORATIONS_FILE):
-        with open(CORPORATIONS_FILE, "r") as f:
-            data = json.load(f)
-    else:
-        data = {}  # Start with an empty registry.
-        save_corporations(data)
-    
-    for comp_name, comp in data.items():
-        if ("CEO" not in comp or comp["CEO"] is None) and "owner" in comp:
-            comp["CEO"] = comp["owner"]
-    # Migration: Ensure each company has the expected fields.
-    default_fields = {
-        "name": None,
-        "category": "general",       # e.g., tech, retail, healthcare, etc.
-        "office_purchased": False,   # Whether the company has purchased HQ space
-        "CEO": None,                 # Owner's Discord user id (as string)
-        "employees": 0,
-        "busy_season": 1.0,          # Multiplier for seasonal performance; default is neutral.
-        "date_registered": str(datetime.now(timezone)),
-        "land": None,
-        "office": None,
-        "balance": 0,
-        "randd_skill": 0,
-        "employees": {},
-        "active_projects": [], 
-        "pending_projects": {},
-        "products": {},
-        "manufacturing_line": {},
-        "manufacturing_locations": {}
-    }
-    for comp_name, comp in data.items():
-        for field, default in default_fields.items():
-            if field == "name":
-                comp[field] = comp_name
-            if field not in comp:
-                comp[field] = default
-    save_corporations(data)
-    return data
-
-def save_corporations(data):
-    with open(CORPORATIONS_FILE, "w") as f:
-        json.dump(data, f, indent=4)
-
+CORPORATIONS_DB = os.path.join(DATA_DIR, "corporations.db")
 
 
 class Corporations(commands.Cog):
@@ -72,15 +27,16 @@ class Corporations(commands.Cog):
     """
     def __init__(self, bot):
         self.bot = bot
-        # Load corporations data into an in-memory dictionary.
-        self.data = load_corporations()
+        # The shared registry (Treasury uses the same dicts); save rows with self.store.save(name).
+        self.store = get_store(bot, CORPORATIONS_DB, CORPORATIONS_FILE)
+        self.data = self.store.corps
         self.config = Config.get_conf(self, identifier=12038120841)
         self.config.register_guild(
             active_projs = {}
         )
     
     def cog_unload(self):
-        save_corporations(self.data)
+        release_store(self.bot)
 
     
     corp = app_commands.Group(name="corp", description="Commands for managing your corporation.")
@@ -180,7 +136,7 @@ class Corporations(commands.Cog):
                 corp["balance"] = start_balance
             await ctx.send(f"There was an error ({e})beginning the project. Any balance that was invested has been refunded to the company.")
         
-        save_corporations(self.data)
+        self.store.save(company)
 
 
     def new_product_research(self, corp: dict, project_budget: int, employees_assigned: int, time_assigned: int, leader_assigned: str = None)-> tuple:
@@ -283,7 +239,7 @@ class Corporations(commands.Cog):
                     if str(project) in corp["active_projects"]:
                         corp["active_projects"].remove(str(project))
             corp["randd_skill"] += random.randint(1, 2)
-            save_corporations(self.data)
+            self.store.save(company)
             await interaction.followup.send(message)
         else:
             time_remaining = finish_time - now
@@ -372,6 +328,7 @@ class Corporations(commands.Cog):
         corp = self.data[company]
         if scrapit:
             corp["pending_projects"].pop(project, None)
+            self.store.save(company)
             await interaction.followup.send(f"The project with ID **{project}** has been scrapped.")
             return
         
@@ -413,7 +370,7 @@ class Corporations(commands.Cog):
             product_dict["base_manufacture_cost"] = int(template_dict["base_manufacture_cost"] * cost_variation)
         
         corp["pending_projects"].pop(project, None)
-        save_corporations(self.data)
+        self.store.save(company)
 
         await interaction.followup.send(f"Your {name} {product_type} has been created with a quality of {product_dict['base_quality']}%! From here you can either refine the product or put it straight onto the market!")
 
@@ -542,7 +499,7 @@ class Corporations(commands.Cog):
         # If currently product_type is '1' but it should be "Smartphone":
         pending[project]["product_type"] = "Smartphone"
         # Save your changes:
-        save_corporations(self.data)
+        self.store.save(company)
         await ctx.send(f"Project {project} for company {company} has been fixed!")
 
 
@@ -712,7 +669,7 @@ class Corporations(commands.Cog):
         else:
             await interaction.response.send_message("Invalid option.", ephemeral=True)
         
-        save_corporations(self.data)
+        self.store.save(company)
     
     @setcorpdetails.autocomplete("company")
     async def company_autocomplete(self, interaction: discord.Interaction, current: str):
@@ -783,7 +740,7 @@ class Corporations(commands.Cog):
         comp["land"] = land_option
         comp["land_details"] = LAND_OPTIONS[land_option]
         comp["employee_cap"] = LAND_OPTIONS[land_option]["base_employee_cap"]
-        save_corporations(self.data)
+        self.store.save(company)
         await ctx.send(f"Congratulations! {company} has purchased **{land_option}** in {state} for {cost} credits as its HQ land.")
 
     
@@ -836,6 +793,7 @@ class Corporations(commands.Cog):
         # If the office requires land, reduce the available developable land accordingly.
         if option["land_usage"] > 0:
             comp["land_details"]["developable_land"] = available_land - option["land_usage"]
+        self.store.save(company)
 
         await ctx.send(f"{company}'s {office_size} office building purchase has been initiated. Construction will take {option['build_time']} seconds.")
         await asyncio.sleep(option["build_time"])
@@ -843,7 +801,7 @@ class Corporations(commands.Cog):
         comp["hq_built"] = True
         comp["employee_cap"] += option["additional_employee_cap"]
         comp["office"] = office_size
-        save_corporations(self.data)
+        self.store.save(company)
         await ctx.send(f"Construction complete! {company}'s office building is now built. Its employee cap has increased by {option['additional_employee_cap']} to {comp['employee_cap']} employees.")
     
     @commands.hybrid_command(name="publiccorpinfo", with_app_command=True, description="View public details of a corporation.")
@@ -897,7 +855,7 @@ class Corporations(commands.Cog):
             corp["balance"] = 0
         corp["balance"] += amount
 
-        save_corporations(self.data)
+        self.store.save(company)
         await ctx.send(f"Successfully invested {humanize.intword(amount)} credits into "
                     f"{corp.get('name', company)}'s account. New company balance: {humanize.intword(corp['balance'])} credits.")
 
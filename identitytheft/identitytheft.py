@@ -9,6 +9,11 @@ from redbot.core import Config, checks, commands
 from redbot.core.bot import Red
 from redbot.core.commands import Cog
 
+from .message_router import get_router, release_router
+from .name_index import MemberNameIndex, normalize
+
+WEBHOOK_NAME = "IdentityTheftWebhook"
+
 async def fetch_url(session, url):
     async with session.get(url) as response:
         assert response.status == 200
@@ -32,6 +37,12 @@ class IdentityTheft(Cog):
         self.config.register_guild(**default_guild)
 
         self.cooldown = defaultdict(datetime.now)
+        # guild id -> {"enabled", "cooldown", "blacklist" (as a set)}; dropped whenever a setting changes
+        self.settings: dict[int, dict] = {}
+        self.names = MemberNameIndex()
+        self.webhooks: dict[int, discord.Webhook] = {}
+        self.router = get_router(bot)
+        self.router.register("identitytheft", self.handle_message, without_command=True)
 
         self.self_mention_responses = [
             "Yes, we know lol",
@@ -77,6 +88,14 @@ class IdentityTheft(Cog):
         ]
 
 
+    async def cog_load(self):
+        for guild_id, data in (await self.config.all_guilds()).items():
+            if data.get("enabled"):
+                self.router.enable_guild("identitytheft", guild_id)
+
+    def cog_unload(self):
+        release_router(self.bot, "identitytheft")
+
     async def red_delete_data_for_user(self, **kwargs):
         """no data is collected from users"""
         return
@@ -92,6 +111,8 @@ class IdentityTheft(Cog):
         """Toggles if you want the automatic bot responses on."""
         is_on = await self.config.guild(ctx.guild).enabled()
         await self.config.guild(ctx.guild).enabled.set(not is_on)
+        self.settings.pop(ctx.guild.id, None)
+        self.router.enable_guild("identitytheft", ctx.guild.id, not is_on)
         await ctx.send("Automatic responses to identify theft messages are now set to {}".format(not is_on))
 
     @identitytheft.command(name="cooldown")
@@ -99,6 +120,7 @@ class IdentityTheft(Cog):
         """Set the cooldown (in seconds) of auto responses."""
 
         await self.config.guild(ctx.guild).cooldown.set(cooldown)
+        self.settings.pop(ctx.guild.id, None)
         self.cooldown[ctx.guild.id] = datetime.now()
         await ctx.send("Auto responses cooldown is now set to {} seconds".format(cooldown))
     
@@ -116,6 +138,7 @@ class IdentityTheft(Cog):
             return
         guild_blacklist.append(ctx.author.id)
         await self.config.guild(ctx.guild).blacklist.set(guild_blacklist)
+        self.settings.pop(ctx.guild.id, None)
         await ctx.send("You have opted out of webhook impersonation.")
     
     @blacklist.command(name="optin", aliases=["on", "oi"])
@@ -127,12 +150,61 @@ class IdentityTheft(Cog):
             return
         guild_blacklist.remove(ctx.author.id)
         await self.config.guild(ctx.guild).blacklist.set(guild_blacklist)
+        self.settings.pop(ctx.guild.id, None)
         await ctx.send("You have opted in for webhook impersonation.")
 
+    async def guild_settings(self, guild: discord.Guild) -> dict:
+        settings = self.settings.get(guild.id)
+        if settings is None:
+            settings = await self.config.guild(guild).all()
+            settings["blacklist"] = set(settings["blacklist"])
+            self.settings[guild.id] = settings
+        return settings
+
+    async def channel_webhook(self, channel: discord.TextChannel) -> discord.Webhook:
+        webhook = self.webhooks.get(channel.id)
+        if webhook is None:
+            webhooks = await channel.webhooks()
+            webhook = next((wh for wh in webhooks if wh.name == WEBHOOK_NAME), None)
+            if webhook is None:
+                webhook = await channel.create_webhook(name=WEBHOOK_NAME)
+            self.webhooks[channel.id] = webhook
+        return webhook
+
     @commands.Cog.listener()
-    async def on_message_without_command(self, message: discord.Message):
-        if message.author.bot:
-            return
+    async def on_member_join(self, member: discord.Member):
+        self.names.update(member)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.display_name != after.display_name or before.name != after.name:
+            self.names.update(after)
+
+    @commands.Cog.listener()
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        if before.name != after.name:
+            self.names.update_user(self.bot, after)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self.names.remove(member.guild.id, member.id)
+
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild: discord.Guild):
+        # fires again after an outage or reconnect; the member cache may have changed underneath
+        self.names.drop_guild(guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.names.drop_guild(guild.id)
+        self.settings.pop(guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_webhooks_update(self, channel: discord.abc.GuildChannel):
+        self.webhooks.pop(channel.id, None)
+
+    async def handle_message(self, message: discord.Message):
+        """Routed here for messages in guilds that have the auto-response enabled."""
         guild: discord.Guild = message.guild
         if guild is None:
             return
@@ -140,9 +212,8 @@ class IdentityTheft(Cog):
         if await self.bot.cog_disabled_in_guild(self, guild):
             return
         
-        guild_config = self.config.guild(guild)
-        is_on = await guild_config.enabled()
-        if not is_on:
+        settings = await self.guild_settings(guild)
+        if not settings["enabled"]:
             return
         
         if self.cooldown[guild.id] > datetime.now():
@@ -167,9 +238,6 @@ class IdentityTheft(Cog):
             target_text = match_candidate.group(1).strip()
         else:
             return
-        
-        def normalize(text: str) -> str:
-            return re.sub(r'[^a-z]', '', text.lower())
 
         target_member = None
         mention_match = re.match(r"<@!?(\d+)>", target_text)
@@ -181,10 +249,8 @@ class IdentityTheft(Cog):
             if (normalize(message.author.display_name).startswith(normalized_candidate) or normalize(message.author.name).startswith(normalized_candidate)):
                 target_member = message.author
             else:
-                for member in guild.members:
-                    if (normalize(member.display_name).startswith(normalized_candidate) or normalize(member.name).startswith(normalized_candidate)):
-                        target_member = member
-                        break
+                member_id = self.names.for_guild(guild).find(normalized_candidate)
+                target_member = guild.get_member(member_id) if member_id else None
         
         if target_member is None:
             return
@@ -198,9 +264,7 @@ class IdentityTheft(Cog):
             except discord.HTTPException:
                 return
             
-            self.cooldown[guild.id] = datetime.now() + timedelta(
-                seconds=(await guild_config.cooldown())
-            )
+            self.cooldown[guild.id] = datetime.now() + timedelta(seconds=settings["cooldown"])
             return
         
         if target_member.id == message.author.id:
@@ -209,7 +273,7 @@ class IdentityTheft(Cog):
                 await message.channel.send(response)
             except discord.HTTPException:
                 return
-            self.cooldown[guild.id] = datetime.now() + timedelta(seconds=(await guild_config.cooldown()))
+            self.cooldown[guild.id] = datetime.now() + timedelta(seconds=settings["cooldown"])
             return
         
         try:
@@ -217,29 +281,27 @@ class IdentityTheft(Cog):
         except discord.HTTPException:
             return
         
-        guild_blacklist = await self.config.guild(guild).blacklist()
-        if message.author.id in guild_blacklist:
-            self.cooldown[guild.id] = datetime.now() + timedelta(seconds=(await guild_config.cooldown()))
+        if message.author.id in settings["blacklist"]:
+            self.cooldown[guild.id] = datetime.now() + timedelta(seconds=settings["cooldown"])
             return
         
         permissions = message.channel.permissions_for(guild.me)
         if not permissions.manage_webhooks:
-            self.cooldown[guild.id] = datetime.now() + timedelta(seconds=(await guild_config.cooldown()))
+            self.cooldown[guild.id] = datetime.now() + timedelta(seconds=settings["cooldown"])
             return
         
         try:
-            webhooks = await message.channel.webhooks()
-            webhook = next((wh for wh in webhooks if wh.name == "IdentityTheftWebhook"), None)
-            if webhook is None:
-                webhook = await message.channel.create_webhook(name="IdentityTheftWebhook")
-            
+            webhook = await self.channel_webhook(message.channel)
             impersonation_message = random.choice(self.impersonation_responses).format(author=message.author.display_name)
             await webhook.send(
                 impersonation_message,
                 username=message.author.display_name,
                 avatar_url=message.author.display_avatar.url
             )
+        except discord.NotFound:
+            # the cached webhook was deleted; look it up again next time
+            self.webhooks.pop(message.channel.id, None)
         except Exception:
             pass
         
-        self.cooldown[guild.id] = datetime.now() + timedelta(seconds = (await guild_config.cooldown()))
+        self.cooldown[guild.id] = datetime.now() + timedelta(seconds=settings["cooldown"])
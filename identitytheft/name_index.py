@@ -0,0 +1,98 @@
+from __future__ import annotations
+import re
+from bisect import bisect_left, insort
+
+import discord
+
+_NON_LETTERS = re.compile(r"[^a-z]")
+
+
+def normalize(text: str) -> str:
+    """Lowercase letters only, which is how "I'm ..." targets are compared to names."""
+    return _NON_LETTERS.sub("", text.lower())
+
+
+class GuildNameIndex:
+    """
+    Sorted (normalized name, member id) pairs for one guild, two per member (display
+    name and username), so finding a member whose name starts with a prefix is a
+    bisect rather than a scan of guild.members.
+    """
+
+    def __init__(self, members, *, complete: bool = True):
+        # False when built before the guild finished chunking; such an index is rebuilt
+        # once the member cache catches up instead of being trusted forever.
+        self.complete = complete
+        self._entries: list[tuple[str, int]] = []
+        self._names: dict[int, tuple[str, ...]] = {}
+        for member in members:
+            names = self._names_of(member)
+            self._names[member.id] = names
+            self._entries.extend((name, member.id) for name in names)
+        self._entries.sort()
+
+    @staticmethod
+    def _names_of(member) -> tuple[str, ...]:
+        return tuple({normalize(member.display_name), normalize(member.name)})
+
+    def add(self, member) -> None:
+        self.remove(member.id)
+        names = self._names_of(member)
+        self._names[member.id] = names
+        for name in names:
+            insort(self._entries, (name, member.id))
+
+    def remove(self, member_id: int) -> None:
+        for name in self._names.pop(member_id, ()):
+            i = bisect_left(self._entries, (name, member_id))
+            if i < len(self._entries) and self._entries[i] == (name, member_id):
+                del self._entries[i]
+
+    def find(self, prefix: str) -> int | None:
+        """Id of a member with a name starting with `prefix` (the alphabetically first one)."""
+        i = bisect_left(self._entries, (prefix, -1))
+        if i < len(self._entries) and self._entries[i][0].startswith(prefix):
+            return self._entries[i][1]
+        return None
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+class MemberNameIndex:
+    """
+    Per-guild name indexes, built on first use and kept current from member events.
+
+    An index built while the guild was still chunking only holds the members cached at
+    the time, so it is rebuilt when the guild reports chunked or the cache outgrows it.
+    """
+
+    def __init__(self):
+        self._guilds: dict[int, GuildNameIndex] = {}
+
+    def for_guild(self, guild: discord.Guild) -> GuildNameIndex:
+        index = self._guilds.get(guild.id)
+        if index is None or (not index.complete and (guild.chunked or len(guild.members) > len(index))):
+            index = self._guilds[guild.id] = GuildNameIndex(guild.members, complete=guild.chunked)
+        return index
+
+    def update(self, member: discord.Member) -> None:
+        index = self._guilds.get(member.guild.id)
+        if index is not None:
+            index.add(member)
+
+    def remove(self, guild_id: int, member_id: int) -> None:
+        index = self._guilds.get(guild_id)
+        if index is not None:
+            index.remove(member_id)
+
+    def update_user(self, bot, user: discord.User) -> None:
+        """A username changed, so refresh that user in every guild that is indexed."""
+        for guild_id in self._guilds:
+            guild = bot.get_guild(guild_id)
+            member = guild.get_member(user.id) if guild else None
+            if member is not None:
+                self._guilds[guild_id].add(member)
+
+    def drop_guild(self, guild_id: int) -> None:
+        self._guilds.pop(guild_id, None)
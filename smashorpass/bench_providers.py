@@ -0,0 +1,139 @@
+"""
+Measure SmashOrPass remote draws per second against a local stub of the provider APIs.
+
+    python smashorpass/bench_providers.py --draws 300 --latency 40
+
+A small aiohttp server stands in for Last.fm, TMDB, Wikipedia and the superhero
+API, answering every request after --latency ms. Draws rotate through the
+Singers, Actors and Superheroes categories:
+  - "live, cold" clears the caches before every draw, so each draw pays for the
+    chart page, thumbnail and id lookups it needs.
+  - "live, cached" fetches with the TTL caches warm.
+  - "ready queue" draws the way /smashorpass does, from the prefetched
+    candidates, with --gap ms between draws for the refill to keep up.
+Needs aiohttp; nothing leaves localhost.
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from aiohttp import web
+
+if __package__:
+    from . import providers
+else:  # run as a script, without the package __init__ (which loads the cog)
+    import providers
+
+ROWS_PER_PAGE = 50
+
+
+def make_app(latency: float) -> web.Application:
+    async def delay():
+        await asyncio.sleep(latency)
+
+    async def lastfm(request: web.Request) -> web.Response:
+        await delay()
+        page = request.query.get("page", "1")
+        return web.json_response({"artists": {"artist": [{"name": f"Artist {page}-{i}"} for i in range(ROWS_PER_PAGE)]}})
+
+    async def tmdb(request: web.Request) -> web.Response:
+        await delay()
+        page = request.query.get("page", "1")
+        return web.json_response({"results": [
+            {"name": f"Actor {page}-{i}", "profile_path": f"/{page}-{i}.jpg"} for i in range(ROWS_PER_PAGE)
+        ]})
+
+    async def wiki(request: web.Request) -> web.Response:
+        await delay()
+        title = request.match_info["title"]
+        return web.json_response({"thumbnail": {"source": f"https://upload.example/{title}.jpg"}})
+
+    async def hero(request: web.Request) -> web.Response:
+        await delay()
+        hero_id = request.match_info["hero_id"]
+        return web.json_response({"response": "success", "name": f"Hero {hero_id}", "url": f"https://hero.example/{hero_id}.jpg"})
+
+    app = web.Application()
+    app.router.add_get("/lastfm", lastfm)
+    app.router.add_get("/tmdb", tmdb)
+    app.router.add_get("/wiki/{title}", wiki)
+    app.router.add_get("/hero/{key}/{hero_id}/image", hero)
+    return app
+
+
+def point_at(base: str) -> None:
+    """Send the provider URLs to the stub server."""
+    providers.SINGER_LIST_URL = base + "/lastfm?page={page_number}&api_key={key}"
+    providers.ACTOR_LIST_URL = base + "/tmdb?page={page_number}"
+    providers.WIKI_SUMMARY_URL = base + "/wiki/{title}"
+    providers.SUPERHERO_URL = base + "/hero/{key}/{character_id}/image"
+
+
+def _clear(p: providers.SmashProviders) -> None:
+    p.chart_pages.clear()
+    p.thumbs.clear()
+    p.heroes.clear()
+
+
+async def _rate(p: providers.SmashProviders, draws: int, call, gap: float = 0.0) -> float:
+    """Draws per second, not counting the --gap pauses."""
+    spent = 0.0
+    for i in range(draws):
+        category = providers.REMOTE_CATEGORIES[i % len(providers.REMOTE_CATEGORIES)]
+        t0 = time.perf_counter()
+        name, image = await call(category)
+        spent += time.perf_counter() - t0
+        if not (name and image):
+            raise RuntimeError(f"{category} draw failed: {name!r}")
+        if gap:
+            await asyncio.sleep(gap)
+    return draws / spent
+
+
+async def run(args) -> None:
+    runner = web.AppRunner(make_app(args.latency / 1000.0))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    point_at(f"http://127.0.0.1:{port}")
+
+    with tempfile.TemporaryDirectory() as folder:
+        key_file = os.path.join(folder, "api_keys.json")
+        with open(key_file, "w", encoding="utf-8") as f:
+            json.dump({"lastfm": "bench", "tmdb": "bench", "superhero": "bench"}, f)
+
+        p = providers.SmashProviders(key_file, lambda user_id, category, name: False)
+        try:
+            async def cold(category):
+                _clear(p)
+                return await p.fetch(category)
+
+            print(f"live, cold    {await _rate(p, args.draws, cold):8.1f} draws/s")
+            print(f"live, cached  {await _rate(p, args.draws, p.fetch):8.1f} draws/s")
+
+            p.warm()
+            await asyncio.gather(*p._refilling.values())
+            rate = await _rate(p, args.draws, p.draw, gap=args.gap / 1000.0)
+            print(f"ready queue   {rate:8.1f} draws/s")
+            print("provider stats:", p.stats())
+        finally:
+            await p.close()
+            await runner.cleanup()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--draws", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=40.0, help="stub response delay, ms")
+    parser.add_argument("--gap", type=float, default=250.0, help="pause between ready-queue draws, ms")
+    args = parser.parse_args(argv)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
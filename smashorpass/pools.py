@@ -0,0 +1,152 @@
+from __future__ import annotations
+import json
+import os
+import random
+from bisect import bisect_right
+
+
+def _mtime(path: str) -> float | None:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+class BlacklistService:
+    """
+    user_blacklists.json as {user_id: {category: set(names)}}, reloaded only when the
+    file's mtime changes. `version` bumps on every change so callers can cache
+    anything derived from a user's list.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._mtime: float | None = None
+        self.data: dict[str, dict[str, set[str]]] = {}
+        self.version = 0
+
+    def _refresh(self) -> None:
+        mtime = _mtime(self.path)
+        if mtime == self._mtime:
+            return
+        data: dict[str, dict[str, set[str]]] = {}
+        if mtime is not None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    raw = json.load(f)
+                data = {uid: {cat: set(names) for cat, names in cats.items()} for uid, cats in raw.items()}
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"User blacklist load error: {e}")
+        self.data = data
+        self._mtime = mtime
+        self.version += 1
+
+    def names(self, user_id: int, category: str) -> set[str]:
+        self._refresh()
+        return self.data.get(str(user_id), {}).get(category, set())
+
+    def is_blocked(self, user_id: int, category: str, name: str) -> bool:
+        return name in self.names(user_id, category)
+
+    def add(self, user_id: int, category: str, name: str) -> bool:
+        self._refresh()
+        names = self.data.setdefault(str(user_id), {}).setdefault(category, set())
+        if name in names:
+            return False
+        names.add(name)
+        self._save()
+        return True
+
+    def _save(self) -> None:
+        raw = {uid: {cat: sorted(names) for cat, names in cats.items()} for uid, cats in self.data.items()}
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(raw, f, indent=4)
+        self._mtime = _mtime(self.path)
+        self.version += 1
+
+
+class CandidatePool:
+    """
+    A JSON list of {"name", "image", ...} entries held as parallel arrays, reloaded
+    when the file changes, with each name's positions indexed for exclusion.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._mtime: float | None = None
+        self.names: list[str] = []
+        self.images: list[str] = []
+        self.positions: dict[str, list[int]] = {}
+        self.version = 0
+
+    def refresh(self) -> bool:
+        """Reload if needed. False when the file doesn't exist."""
+        mtime = _mtime(self.path)
+        if mtime is None:
+            self._mtime, self.names, self.images, self.positions = None, [], [], {}
+            return False
+        if mtime == self._mtime:
+            return True
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Candidate pool load error ({os.path.basename(self.path)}): {e}")
+            data = []
+        if not isinstance(data, list):
+            data = []
+        self.names = [entry["name"] for entry in data]
+        self.images = [entry.get("image") for entry in data]
+        self.positions = {}
+        for i, name in enumerate(self.names):
+            self.positions.setdefault(name, []).append(i)
+        self._mtime = mtime
+        self.version += 1
+        return True
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class PoolSampler:
+    """
+    Uniform draws from a pool minus one user's blacklist, without retries.
+
+    The user's excluded positions are kept sorted (cached until either the pool or
+    the blacklist changes); a draw picks r in [0, n - k) and steps r past every
+    excluded position at or below it.
+    """
+
+    def __init__(self, blacklists: BlacklistService):
+        self.blacklists = blacklists
+        self._excluded: dict[tuple, tuple[tuple[int, int], list[int]]] = {}
+
+    def _excluded_for(self, pool: CandidatePool, user_id: int, category: str) -> list[int]:
+        blocked = self.blacklists.names(user_id, category)
+        stamp = (pool.version, self.blacklists.version)
+        key = (id(pool), user_id, category)
+        hit = self._excluded.get(key)
+        if hit is not None and hit[0] == stamp:
+            return hit[1]
+        excluded = sorted(i for name in blocked for i in pool.positions.get(name, ()))
+        self._excluded[key] = (stamp, excluded)
+        return excluded
+
+    def draw(self, pool: CandidatePool, category: str, user_id: int | None = None) -> tuple[str, str] | None:
+        n = len(pool)
+        if not n:
+            return None
+        excluded = self._excluded_for(pool, user_id, category) if user_id else []
+        allowed = n - len(excluded)
+        if allowed <= 0:
+            return None
+        r = random.randrange(allowed)
+        # each excluded slot at or before the target pushes it one further along
+        lo = 0
+        while True:
+            k = bisect_right(excluded, r + lo)
+            if k == lo:
+                break
+            lo = k
+        i = r + lo
+        return pool.names[i], pool.images[i]
@@ -0,0 +1,276 @@
+from __future__ import annotations
+import asyncio
+import json
+import os
+import random
+import time
+import urllib.parse
+from collections import deque
+from typing import Any, Callable
+
+import aiohttp
+
+ACTOR_LIST_URL = "https://api.themoviedb.org/3/person/popular?language=en-Us&page={page_number}"
+SINGER_LIST_URL = "http://ws.audioscrobbler.com/2.0/?method=chart.gettopartists&page={page_number}&api_key={key}&format=json"
+WIKI_SUMMARY_URL = "https://en.wikipedia.org/api/rest_v1/page/summary/{title}"
+SUPERHERO_URL = "https://superheroapi.com/api/{key}/{character_id}/image"
+
+CHART_TTL = 6 * 3600        # Last.fm / TMDB chart pages barely move within a day
+THUMB_TTL = 24 * 3600       # Wikipedia thumbnails
+THUMB_MISS_TTL = 3600       # remember "no thumbnail" for a while too
+HERO_TTL = 7 * 24 * 3600    # superhero ids are static
+
+READY_TARGET = 8            # candidates kept ready per remote category
+READY_LOW = 3               # refill when a queue drops to this
+REMOTE_CATEGORIES = ("Singers", "Actors", "Superheroes")
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Small expiring dict; oldest entries are evicted past max_entries."""
+
+    def __init__(self, ttl: float, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._data: dict[Any, tuple[float, Any]] = {}
+
+    def get(self, key, default=_MISSING):
+        hit = self._data.get(key)
+        if hit is None:
+            return default
+        expires, value = hit
+        if expires < time.monotonic():
+            del self._data[key]
+            return default
+        return value
+
+    def set(self, key, value, ttl: float | None = None) -> None:
+        if len(self._data) >= self.max_entries and key not in self._data:
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ApiKeys:
+    """api_keys.json, re-read only when its mtime changes."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._mtime: float | None = None
+        self._keys: dict[str, str] = {}
+
+    def get(self, name: str) -> str | None:
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            self._mtime, self._keys = None, {}
+            return None
+        if mtime != self._mtime:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._keys = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"API key load error: {e}")
+                self._keys = {}
+            self._mtime = mtime
+        return self._keys.get(name)
+
+
+class SmashProviders:
+    """
+    Async fetchers for the remote categories (Singers, Actors, Superheroes).
+
+    One pooled aiohttp session is shared by every request; Last.fm/TMDB chart pages,
+    Wikipedia thumbnails and superhero lookups sit in TTL caches. A background refill
+    keeps a small queue of ready (name, image) candidates per category, so a draw is
+    normally just a pop that skips the user's blacklisted names.
+    """
+
+    def __init__(self, key_file: str, is_blocked: Callable[[int, str, str], bool]):
+        self.keys = ApiKeys(key_file)
+        self.is_blocked = is_blocked
+        self._session: aiohttp.ClientSession | None = None
+
+        self.chart_pages = TTLCache(CHART_TTL, max_entries=128)
+        self.thumbs = TTLCache(THUMB_TTL, max_entries=4096)
+        self.heroes = TTLCache(HERO_TTL, max_entries=1024)
+
+        self.ready: dict[str, deque[tuple[str, str]]] = {c: deque() for c in REMOTE_CATEGORIES}
+        self._refilling: dict[str, asyncio.Task] = {}
+        self.served_ready = 0
+        self.served_live = 0
+
+    # ---------- session ----------
+
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=10),
+                headers={"Connection": "keep-alive"},
+            )
+        return self._session
+
+    async def close(self) -> None:
+        for task in self._refilling.values():
+            task.cancel()
+        self._refilling.clear()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _get_json(self, url: str, headers: dict | None = None) -> Any:
+        try:
+            async with self.session().get(url, headers=headers) as resp:
+                if resp.status != 200:
+                    print(f"Fetch error {resp.status} for {url.split('?')[0]}")
+                    return None
+                return await resp.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            print(f"Fetch error for {url.split('?')[0]}: {e}")
+            return None
+
+    # ---------- cached lookups ----------
+
+    async def wikipedia_image(self, name: str) -> str | None:
+        hit = self.thumbs.get(name)
+        if hit is not _MISSING:
+            return hit
+        title = urllib.parse.quote(name.replace(" ", "_"), safe="")
+        data = await self._get_json(WIKI_SUMMARY_URL.format(title=title))
+        image = (data or {}).get("thumbnail", {}).get("source")
+        self.thumbs.set(name, image, None if image else THUMB_MISS_TTL)
+        return image
+
+    async def _chart_page(self, kind: str, page: int) -> list[dict]:
+        hit = self.chart_pages.get((kind, page))
+        if hit is not _MISSING:
+            return hit
+        if kind == "lastfm":
+            key = self.keys.get("lastfm")
+            data = await self._get_json(SINGER_LIST_URL.format(page_number=page, key=key))
+            rows = (data or {}).get("artists", {}).get("artist", [])
+        else:
+            headers = {"accept": "application/json", "Authorization": f"Bearer {self.keys.get('tmdb') or ''}"}
+            data = await self._get_json(ACTOR_LIST_URL.format(page_number=page), headers=headers)
+            rows = (data or {}).get("results", [])
+        if data is not None:
+            self.chart_pages.set((kind, page), rows)
+        return rows
+
+    # ---------- live fetchers ----------
+
+    async def fetch_singer(self, user_id: int | None = None) -> tuple[str | None, str | None]:
+        if not self.keys.get("lastfm"):
+            return "Key not found.", None
+        for _ in range(5):
+            page_number = random.randint(1, 6)
+            artists = await self._chart_page("lastfm", page_number)
+            if not artists:
+                continue
+            names = [a.get("name") for a in artists if a.get("name")]
+            random.shuffle(names)
+            for name in names:
+                if user_id and self.is_blocked(user_id, "Singers", name):
+                    continue
+                image_url = await self.wikipedia_image(name)
+                if image_url:
+                    return name, image_url
+        print("Application was unable to find a singer after multiple attempts.")
+        return None, None
+
+    async def fetch_actor(self, user_id: int | None = None) -> tuple[str | None, str | None]:
+        for _ in range(5):
+            actors = await self._chart_page("tmdb", random.randint(1, 50))
+            if not actors:
+                continue
+            actor = random.choice(actors)
+            name = actor.get("name", "Unknown Actor")
+            if user_id and self.is_blocked(user_id, "Actors", name):
+                continue
+            image = f"https://image.tmdb.org/t/p/original{actor['profile_path']}" if actor.get("profile_path") else None
+            return name, image
+        return "Failed to fetch actor", None
+
+    async def fetch_superhero(self, user_id: int | None = None) -> tuple[str | None, str | None]:
+        token = self.keys.get("superhero")
+        if not token:
+            return "API key missing", None
+        character_id = random.randint(1, 731)
+        hit = self.heroes.get(character_id)
+        if hit is _MISSING:
+            data = await self._get_json(SUPERHERO_URL.format(key=token, character_id=character_id))
+            if data is None:
+                return "Failed to fetch superhero", None
+            if data.get("response") != "success":
+                return "Superhero not found", None
+            hit = (data["name"], data["url"].replace("\\", ""))
+            self.heroes.set(character_id, hit)
+        return hit
+
+    async def fetch(self, category: str, user_id: int | None = None) -> tuple[str | None, str | None]:
+        if category == "Singers":
+            return await self.fetch_singer(user_id)
+        if category == "Actors":
+            return await self.fetch_actor(user_id)
+        return await self.fetch_superhero(user_id)
+
+    # ---------- ready queues ----------
+
+    def _schedule_refill(self, category: str) -> None:
+        task = self._refilling.get(category)
+        if task is not None and not task.done():
+            return
+        if len(self.ready[category]) > READY_LOW:
+            return
+        self._refilling[category] = asyncio.create_task(self._refill(category))
+
+    async def _refill(self, category: str) -> None:
+        queue = self.ready[category]
+        seen = {name for name, _ in queue}
+        misses = 0
+        while len(queue) < READY_TARGET and misses < READY_TARGET:
+            name, image = await self.fetch(category)
+            if not name or not image or "Failed" in name or name in seen:
+                misses += 1
+                continue
+            seen.add(name)
+            queue.append((name, image))
+
+    def warm(self) -> None:
+        """Start filling every remote category's queue in the background."""
+        for category in REMOTE_CATEGORIES:
+            self._schedule_refill(category)
+
+    async def draw(self, category: str, user_id: int | None = None) -> tuple[str | None, str | None]:
+        """A candidate for `user_id`, from the ready queue when one isn't blacklisted for them."""
+        queue = self.ready[category]
+        picked = None
+        for i, (name, image) in enumerate(queue):
+            if not (user_id and self.is_blocked(user_id, category, name)):
+                picked = (name, image)
+                del queue[i]
+                break
+        if picked is not None:
+            self.served_ready += 1
+        else:
+            self.served_live += 1
+            picked = await self.fetch(category, user_id)
+        self._schedule_refill(category)
+        return picked
+
+    def stats(self) -> dict:
+        return {
+            "ready": {c: len(q) for c, q in self.ready.items()},
+            "served_ready": self.served_ready,
+            "served_live": self.served_live,
+            "chart_pages": len(self.chart_pages),
+            "thumbs": len(self.thumbs),
+            "heroes": len(self.heroes),
+        }
@@ -1,4 +1,3 @@
-import requests
 import random
 import discord
 from discord.ext import commands
@@ -9,7 +8,9 @@ import os
 import json
 from discord import app_commands
 from datetime import datetime, timedelta, timezone
-import urllib.parse
+from .providers import SmashProviders
+from .vote_store import VoteStore
+from .pools import BlacklistService, CandidatePool, PoolSampler
 
 
 CUSTOM_FILE = os.path.join(os.path.dirname(__file__), "custom.json")
@@ -17,9 +18,6 @@ BLACKLIST_FILE = os.path.join(os.path.dirname(__file__), "blacklist.json")
 NSFW_FILE = os.path.join(os.path.dirname(__file__), "nsfw.json")
 MOD_CHANNEL_ID = 1287700985275355150
 
-ACTOR_LIST_URL = "https://api.themoviedb.org/3/person/popular?language=en-Us&page={page_number}"
-
-
 API_KEY_FILE = os.path.join(os.path.dirname(__file__), "api_keys.json")
 VALID_APIS = ["superhero", "tmdb", "lastfm"]
 
@@ -29,24 +27,10 @@ CATEGORIES = ["Custom", "Actors", "Star Wars", "Superheroes", "Singers", "NSFW"]
 REAL_CATEGORIES = ["Actors", "Singers"]
 
 VOTES_FILE = os.path.join(os.path.dirname(__file__), "votes.json")
+VOTES_DB = os.path.join(os.path.dirname(__file__), "votes.db")
 
 USER_BLACKLIST_FILE = os.path.join(os.path.dirname(__file__), "user_blacklists.json")
 
-def load_votes():
-    if not os.path.exists(VOTES_FILE):
-        with open(VOTES_FILE, "w", encoding="utf-8") as file:
-            json.dump({}, file, indent=4)
-
-    with open(VOTES_FILE, "r", encoding="utf-8") as file:
-        try:
-            return json.load(file)
-        except json.JSONDecodeError:
-            return {}
-
-def save_votes(votes):
-    with open(VOTES_FILE, "w", encoding="utf-8") as file:
-        json.dump(votes, file, indent=4)
-
 def load_api_keys():
     if os.path.exists(API_KEY_FILE):
         with open(API_KEY_FILE, "r", encoding="utf-8") as f:
@@ -57,116 +41,17 @@ def save_api_keys(data):
     with open(API_KEY_FILE, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=4)
 
-def load_user_blacklists():
-    if not os.path.exists(USER_BLACKLIST_FILE):
-        return {}
-    with open(USER_BLACKLIST_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-def save_user_blacklists(data):
-    with open(USER_BLACKLIST_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
+USER_BLACKLISTS = BlacklistService(USER_BLACKLIST_FILE)
+SAMPLER = PoolSampler(USER_BLACKLISTS)
+CUSTOM_POOL = CandidatePool(CUSTOM_FILE)
+NSFW_POOL = CandidatePool(NSFW_FILE)
+STARWARS_POOL = CandidatePool(os.path.join(os.path.dirname(os.path.abspath(__file__)), "starwars.json"))
 
 def add_to_user_blacklist(user_id:int, category: str, name: str):
-    data = load_user_blacklists()
-    user_str = str(user_id)
-    if user_str not in data:
-        data[user_str] = {}
-    if category not in data[user_str]:
-        data[user_str][category] = []
-    if name not in data[user_str][category]:
-        data[user_str][category].append(name)
-        save_user_blacklists(data)
-        return True
-    return False
+    return USER_BLACKLISTS.add(user_id, category, name)
 
 def is_blacklisted_for_user(user_id: int, category: str, name: str):
-    data = load_user_blacklists()
-    return name in data.get(str(user_id), {}).get(category, [])
-
-def get_wikipedia_image(artist_name):
-    url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{artist_name.replace(' ', '_')}"
-    response = requests.get(url)
-    if response.status_code == 200:
-        data = response.json()
-        return data.get("thumbnail", {}).get("source")
-    return None
-
-def get_random_singer(user_id=None):
-    keys = load_api_keys()
-    API_TOKEN = keys.get("lastfm")
-    if not API_TOKEN:
-        return "Key not found.", None
-
-    for _ in range(5):
-        page_number = random.randint(1, 6)
-        SINGER_LIST_URL = f"http://ws.audioscrobbler.com/2.0/?method=chart.gettopartists&page={page_number}&api_key={API_TOKEN}&format=json"
-        response = requests.get(SINGER_LIST_URL)
-
-        if response.status_code != 200:
-            print(f"Error fetching singer list: {response.status_code}")
-            continue
-
-        try:
-            artists = response.json().get("artists", {}).get("artist", [])
-            if not artists:
-                print("No artists found on this page.")
-                continue
-            for _ in range(len(artists)):
-                singer = random.choice(artists)
-                name = singer.get("name")
-
-                if user_id and is_blacklisted_for_user(user_id, "Singers", name):
-                    continue
-
-                image_url = get_wikipedia_image(name)
-
-                if image_url:
-                    return name, image_url
-
-            print(f"All artists on page {page_number} lacked a medium-sized image.")
-        except (ValueError, KeyError) as e:
-            print(f"Error processing JSON response: {e}")
-
-    print("Application was unable to find a singer after multiple attempts.")
-    return None, None
-
-
-
-
-def get_random_actor(user_id = None):
-
-    keys = load_api_keys()
-    HEADERS = {
-        "accept": "application/json",
-        "Authorization": f"Bearer {keys.get('tmdb', '')}"
-    }
-
-    for attempt in range(5):
-        page_number = random.randint(1, 50)
-        try:
-            response = requests.get(ACTOR_LIST_URL.format(page_number=page_number), headers=HEADERS, timeout=10)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            print(f"TMDB fetch error: {e}")
-            continue
-
-        actors = response.json().get("results", [])
-        if not actors:
-            continue
-
-        actor = random.choice(actors)
-        name = actor.get("name", "Unknown Actor")
-        if user_id and is_blacklisted_for_user(user_id, "Actors", name):
-            continue
-
-        image = f"https://image.tmdb.org/t/p/original{actor['profile_path']}" if actor.get("profile_path") else None
-
-        return name, image
-
-    return "Failed to fetch actor", None
-
-
+    return USER_BLACKLISTS.is_blocked(user_id, category, name)
 
 def load_json(file_path, default):
     if not os.path.exists(file_path):
@@ -231,36 +116,13 @@ def save_custom_entry(name, image_url, user_id, nsfw_bool):
         return name
     
 def get_random_custom(user_id=None, nsfw_bool=False):
-    """Gets a random character from custom.json"""
-    if not nsfw_bool:
-        if not os.path.exists(CUSTOM_FILE):
-            return "No custom characters added yet!", None
-        
-        with open(CUSTOM_FILE, "r", encoding="utf-8") as file:
-            data = json.load(file)
-
-        if not data:
-            return "No custom characters found.", None
-        for _ in range(5):
-            character = random.choice(data)
-            if user_id and is_blacklisted_for_user(user_id, "Custom", name=character["name"]):
-                continue
-
-            return character["name"], character["image"]
-        
-        return None, None
-    if nsfw_bool:
-        data = load_json(NSFW_FILE, [])
-        if not data:
-            return "No custom characters found.", None
-        for _ in range(5):
-            character = random.choice(data)
-            if user_id and is_blacklisted_for_user(user_id, "NSFW", name=character["name"]):
-                continue
-
-            return character["name"], character["image"]
-        
-        return None, None
+    """Gets a random character from custom.json (or nsfw.json) that the user hasn't blacklisted."""
+    pool, category = (NSFW_POOL, "NSFW") if nsfw_bool else (CUSTOM_POOL, "Custom")
+    if not pool.refresh() and not nsfw_bool:
+        return "No custom characters added yet!", None
+    if not len(pool):
+        return "No custom characters found.", None
+    return SAMPLER.draw(pool, category, user_id) or (None, None)
 
 
 def is_blacklisted(user_id):
@@ -274,53 +136,15 @@ def is_blacklisted(user_id):
 
 def get_random_starwarscharacter(user_id=None):
     try:
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        filename = os.path.join(script_dir, "starwars.json")
-
-        if not os.path.exists(filename):
+        if not STARWARS_POOL.refresh():
             return "Missing Star Wars data", None
-
-        with open(filename, "r", encoding="utf-8") as file:
-            json_data = json.load(file)
-
-        for _ in range(5):
-            character = random.choice(json_data)
-            name = character["name"]
-            if user_id and is_blacklisted_for_user(user_id, "Star Wars", name):
-                continue
-
-            image_url = character["image"]
-            return name, image_url
-        return None, None
+        return SAMPLER.draw(STARWARS_POOL, "Star Wars", user_id) or (None, None)
     except Exception as e:
         print(f"Star Wars load error: {e}")
         return "Failed to load Star Wars character", None
 
 
 
-def get_random_superhero():
-    keys = load_api_keys()
-    token = keys.get("superhero")
-    if not token:
-        return "API key missing", None
-
-    character_id = random.randint(1, 731)
-    try:
-        response = requests.get(f"https://superheroapi.com/api/{token}/{character_id}/image", timeout=10)
-        response.raise_for_status()
-    except requests.RequestException as e:
-        print(f"Superhero API error: {e}")
-        return "Failed to fetch superhero", None
-
-    data = response.json()
-    if data.get("response") != "success":
-        return "Superhero not found", None
-
-    name = data["name"]
-    image_url = data["url"].replace("\\", "")
-    return name, image_url
-
-
 class UserUploadsView(discord.ui.View):
     def __init__(self, interaction, entries, target: discord.User):
         super().__init__(timeout=60.0)
@@ -348,36 +172,37 @@ class UserUploadsView(discord.ui.View):
         await self.update_message()
 
 class LeaderboardView(discord.ui.View):
-    def __init__(self, type, interaction, sorted_data, category: str = "All"):
+    def __init__(self, type, interaction, store: VoteStore, category: str = None):
         super().__init__(timeout=60)
         self.interaction = interaction
-        self.sorted_data = sorted_data
+        self.store = store
         self.index = 0
-        self.category = category
+        self.category = category or "All"
+        self.board = category  # None = the combined board
         self.type = type
         self.message = None
+
+    def _step(self, delta: int):
+        size = self.store.board_size(self.board) or 1
+        self.index = (self.index + delta) % size
     
     async def update_message(self):
-        entry = self.sorted_data[self.index]
+        char = self.store.ranked(self.board, self.index, losers=(self.type == "Loser"))
+        if char is None:
+            return
         rank = self.index + 1
-
-        votes = load_votes()
-        char_category = "Unknown"
-        for cat, characters in votes.items():
-            if entry[0] in characters:
-                char_category = cat
-                break
-        uploader = f"<@{entry[1]['user_id']}>" if entry[1].get("user_id") else "Default Category"
+        data = char.as_dict()
+        uploader = f"<@{data['user_id']}>" if data.get("user_id") else "Default Category"
 
         embed = discord.Embed(title=f"🏆 Smash or Pass {self.type}board 🏆")
-        embed.add_field(name="Name", value=entry[0])
+        embed.add_field(name="Name", value=char.name)
         embed.add_field(name="Rank", value=f"#{rank}", inline=True)
-        embed.add_field(name="Votes", value=f"💖{entry[1].get('super-smashes', 0)} | 🔥 {entry[1]['smashes']} | 👋 {entry[1].get('hangouts', 0)} | ❌ {entry[1]['passes']}", inline=True)
+        embed.add_field(name="Votes", value=f"💖{data.get('super-smashes', 0)} | 🔥 {data['smashes']} | 👋 {data.get('hangouts', 0)} | ❌ {data['passes']}", inline=True)
         if uploader != "Default Category" and self.category != "All":
             embed.add_field(name="Uploader", value=uploader, inline=True)
         elif self.category == "All":
-            embed.add_field(name="Category", value=f"{char_category}")
-        image_url = entry[1].get("image")
+            embed.add_field(name="Category", value=f"{char.category}")
+        image_url = data.get("image")
         try:
             embed.set_image(url=image_url)
         except discord.HTTPException:
@@ -389,13 +214,13 @@ class LeaderboardView(discord.ui.View):
     @discord.ui.button(label="⬅️ Previous", style=discord.ButtonStyle.gray)
     async def previous(self, interaction:discord.Interaction, button:discord.ui.Button):
         await interaction.response.defer()
-        self.index = (self.index - 1) % len(self.sorted_data)
+        self._step(-1)
         await self.update_message()
     
     @discord.ui.button(label="➡️ Next", style=discord.ButtonStyle.gray)
     async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.defer()
-        self.index = (self.index + 1) % len(self.sorted_data)
+        self._step(1)
         await self.update_message()
     
     async def on_timeout(self):
@@ -410,21 +235,16 @@ class LeaderboardView(discord.ui.View):
             print(f"LeaderboardView timeout error: {e}")
 
 class SupersmashesView(discord.ui.View):
-    def __init__(self, cog: commands.Cog, results: list[tuple[str,int]], timeout: int = 60):
+    def __init__(self, cog: commands.Cog, results: list, timeout: int = 60):
         super().__init__(timeout=timeout)
         self.cog = cog
-        self.results = results          # List of (name, count)
+        self.results = results          # Characters from VoteStore.super_smashes_by
         self.index = 0
         self.message: discord.Message = None
 
     async def update_message(self):
-        name, count = self.results[self.index]
-        votes = load_votes()            # your helper
-        # Find the category & image URL
-        for cat, chars in votes.items():
-            if name in chars:
-                image_url = chars[name].get("image", "")
-                break
+        char = self.results[self.index]
+        name, count, image_url = char.name, char.counts["super-smashes"], char.image
         embed = discord.Embed(
             title=f"💖 Super Smash #{self.index+1} of {len(self.results)}",
             description=f"**{name}** — used **{count}** time{'s' if count>1 else ''}"
@@ -514,9 +334,9 @@ class SmashPassView(discord.ui.View):
                 "Now that's special!"
             )
         else:
-            super_time = self.cog.daily_super_smash.get(interaction.user.id)
+            available_at = self.cog.votes.super_smash_available_at(interaction.user.id)
             now = datetime.now(timezone.utc)
-            difference = (super_time + timedelta(days=1)) - now
+            difference = max((available_at or now) - now, timedelta(0))
             hours, remainder = divmod(difference.total_seconds(), 3600)
             minutes, _ = divmod(remainder, 60)
             await interaction.response.send_message(
@@ -582,60 +402,21 @@ class SmashOrPass(commands.Cog):
         self.config.register_member(
             category=["All"]
         )
-        self.daily_super_smash = {}
+        self.votes = VoteStore(VOTES_DB, VOTES_FILE)
+        self.providers = SmashProviders(API_KEY_FILE, is_blacklisted_for_user)
+
+    async def cog_load(self):
+        self.providers.warm()
+
+    async def cog_unload(self):
+        await self.providers.close()
+        self.votes.close()
     
     sop = app_commands.Group(name="sop", description="Smash or Pass commands.")
 
     async def update_votes(self, category, character_name, vote_type, user_id, image):
         """Update smash/pass/super-smash count and prevent duplicate votes."""
-        votes = load_votes()
-
-        if category not in votes:
-            votes[category] = {}
-
-        if character_name not in votes[category]:
-            votes[category][character_name] = {
-                "smashes": 0,
-                "passes": 0,
-                "super-smashes": 0,
-                "hangouts": 0,
-                "voters": [],
-                "super-smashers": [],
-                "image": ""
-            }
-
-        # Ensure all expected keys exist in case it's an old record
-        char_data = votes[category][character_name]
-        char_data.setdefault("smashes", 0)
-        char_data.setdefault("passes", 0)
-        char_data.setdefault("super-smashes", 0)
-        char_data.setdefault("hangouts", 0)
-        char_data.setdefault("voters", [])
-        char_data.setdefault("super-smashers", [])
-        char_data.setdefault("image", "")
-
-        if vote_type == "super-smashes":
-            last_time = self.daily_super_smash.get(user_id)
-            now = datetime.now(timezone.utc)
-            if last_time and (now - last_time < timedelta(days=1)):
-                return False  # Already used super smash today
-
-            self.daily_super_smash[user_id] = now
-
-            if user_id not in char_data["super-smashers"]:
-                char_data["super-smashes"] += 1
-                char_data["super-smashers"].append(user_id)
-
-        else:
-            if user_id in char_data["voters"]:
-                return False  # Already smashed or passed
-
-            char_data[vote_type] += 1
-            char_data["voters"].append(user_id)
-
-        char_data["image"] = image
-        save_votes(votes)
-        return True
+        return self.votes.record(category, character_name, vote_type, user_id, image)
 
 
     @sop.command(name="apikeyuplad", description="Upload or update an API key.")
@@ -664,21 +445,14 @@ class SmashOrPass(commands.Cog):
     @app_commands.describe(user="Person to see the supersmashes of.")
     async def supersmashes(self, interaction: discord.Interaction, user:discord.Member=None):
         await interaction.response.defer()
-        votes = load_votes()
         user = user or interaction.user
         user_id = user.id
-        channel = interaction.channel()
+        channel = interaction.channel
         if not channel.is_nsfw():
             await interaction.followup.send("For now supersmashes is not supported outside of nsfw channels. Just because I was too lazy to filter out for now.", ephemeral=True)
             return
 
-        # Gather results
-        results = [
-            (name, data["super-smashes"])
-            for chars in votes.values()
-            for name, data in chars.items()
-            if user_id in data.get("super-smashers", [])
-        ]
+        results = self.votes.super_smashes_by(user_id)
         if not results:
             return await interaction.followup.send(
                 f"💔 {user.display_name} hasn't used Super-Smash yet!", ephemeral=True
@@ -758,93 +532,30 @@ class SmashOrPass(commands.Cog):
     @app_commands.choices(category=[app_commands.Choice(name=cat, value=cat) for cat in CATEGORIES])
     async def leaderboard(self, interaction: discord.Interaction, category: str=None):
         """Displays the leaderboard with a slideshow format."""
-        await interaction.response.defer()
-        
-        votes = load_votes()
-        
-        
-        leaderboard_channel = interaction.channel()
-        if not leaderboard_channel.is_nsfw() and category == "NSFW":
-            await interaction.followup.send("You can't look at nsfw leaderboards in a non-nsfw channel.", ephemeral=True)
-            return
-        elif category:
-            if category not in votes:
-                await interaction.followup.send(f"❌ No votes recorded for **{category}**!", ephemeral=True)
-                return
-            category_data = votes[category]
-        else:
-            category_data = {name: data for cat in votes.values() for name, data in cat.items() if cat is not "NSFW"}
-        
-        if not category_data:
-            await interaction.followup.send("❌ No characters have been voted on yet!", ephemeral=True)
-            return
-        
-        sorted_data = sorted(
-            category_data.items(),
-            key=lambda x: (
-                2 * x[1].get("super-smashes", 0)
-                + 1 * x[1].get("smashes", 0)
-                + 0.5 * x[1].get("hangouts", 0)
-                - 1 * x[1].get("passes", 0)
-            ),
-            reverse=True
-        )
-
-
-        if category:
-            view = LeaderboardView("Leader", interaction, sorted_data, category)
-        else:
-            view = LeaderboardView("Leader", interaction, sorted_data)
-        
-        msg = await interaction.followup.send("📊 Loading leaderboard...", view=view)
-
-        view.message = msg
-
-        await view.update_message()
+        await self._show_board(interaction, "Leader", category)
     
     @sop.command(name="loserboard", description="View the Smash or Pass loserboard!")
     @app_commands.choices(category=[app_commands.Choice(name=cat, value=cat) for cat in CATEGORIES])
     async def loserboard(self, interaction: discord.Interaction, category: str=None):
         """Displays the loserboard with a slideshow format."""
-        votes = load_votes()
-        
+        await self._show_board(interaction, "Loser", category)
+
+    async def _show_board(self, interaction: discord.Interaction, type: str, category: str = None):
         await interaction.response.defer()
         
-        leaderboard_channel = interaction.channel()
+        leaderboard_channel = interaction.channel
         if not leaderboard_channel.is_nsfw() and category == "NSFW":
             await interaction.followup.send("You can't look at nsfw leaderboards in a non-nsfw channel.", ephemeral=True)
             return
-        elif category:
-            if category not in votes:
-                await interaction.response.send_message(f"❌ No votes recorded for **{category}**!", ephemeral=True)
-                return
-            category_data = votes[category]
-        else:
-            category_data = {name: data for cat in votes.values() for name, data in cat.items()}
-        
-        if not category_data:
-            await interaction.response.send_message("❌ No characters have been voted on yet!", ephemeral=True)
+        if category and not self.votes.board_size(category):
+            await interaction.followup.send(f"❌ No votes recorded for **{category}**!", ephemeral=True)
+            return
+        if not self.votes.board_size(category):
+            await interaction.followup.send("❌ No characters have been voted on yet!", ephemeral=True)
             return
-        
-        sorted_data = sorted(
-            category_data.items(),
-            key=lambda x: (
-                -2 * x[1].get("super-smashes", 0)
-                - 1 * x[1].get("smashes", 0)
-                - 0.5 * x[1].get("hangouts", 0)
-                + 1 * x[1].get("passes", 0)
-            ),
-            reverse=True
-        )
-
-
-        if category:
-            view = LeaderboardView("Loser", interaction, sorted_data, category)
-        else:
-            view = LeaderboardView("Loser", interaction, sorted_data)
-
-        await interaction.followup.send("📊 Loading loserboard...", view=view)
 
+        view = LeaderboardView(type, interaction, self.votes, category)
+        view.message = await interaction.followup.send(f"📊 Loading {type.lower()}board...", view=view)
         await view.update_message()
 
     
@@ -1001,16 +712,12 @@ class SmashOrPass(commands.Cog):
             name, image = get_random_starwarscharacter(user_id=user_id)
         elif category == "Custom":
             name, image = get_random_custom(user_id=user_id, nsfw_bool=False)
-        elif category == "Actors":
-            name, image = get_random_actor(user_id=user_id)
-        elif category == "Singers":
-            name, image = get_random_singer(user_id=user_id)
         elif category == "NSFW":
             name, image = get_random_custom(user_id=user_id, nsfw_bool=True)
         else:
-            name, image = get_random_superhero()
+            name, image = await self.providers.draw(category, user_id=user_id)
 
-        if not image or "Failed" in name or name is None:
+        if name is None or not image or "Failed" in name:
             await ctx.send(f"Error fetching character from **{category}**. Try again or continue switching categories!")
             return
         
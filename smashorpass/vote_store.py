@@ -0,0 +1,234 @@
+from __future__ import annotations
+import json
+import os
+import sqlite3
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, timezone
+
+VOTE_TYPES = ("smashes", "passes", "super-smashes", "hangouts")
+SUPER_SMASH_COOLDOWN = timedelta(days=1)
+# Categories left out of the combined ("All") boards.
+HIDDEN_FROM_ALL = {"NSFW"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS characters (
+    category TEXT NOT NULL,
+    name TEXT NOT NULL,
+    image TEXT NOT NULL DEFAULT '',
+    uploader INTEGER,
+    smashes INTEGER NOT NULL DEFAULT 0,
+    passes INTEGER NOT NULL DEFAULT 0,
+    super_smashes INTEGER NOT NULL DEFAULT 0,
+    hangouts INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (category, name)
+);
+CREATE TABLE IF NOT EXISTS voters (
+    category TEXT NOT NULL,
+    name TEXT NOT NULL,
+    user_id INTEGER NOT NULL,
+    super INTEGER NOT NULL,
+    PRIMARY KEY (category, name, user_id, super)
+);
+CREATE TABLE IF NOT EXISTS super_smash_limits (
+    user_id INTEGER PRIMARY KEY,
+    last_used TEXT NOT NULL
+);
+"""
+
+_COLUMNS = {"smashes": "smashes", "passes": "passes", "super-smashes": "super_smashes", "hangouts": "hangouts"}
+
+
+class Character:
+    __slots__ = ("category", "name", "image", "uploader", "counts", "voters", "super_smashers")
+
+    def __init__(self, category: str, name: str, image: str = "", uploader: int | None = None):
+        self.category = category
+        self.name = name
+        self.image = image
+        self.uploader = uploader
+        self.counts = dict.fromkeys(VOTE_TYPES, 0)
+        self.voters: set[int] = set()
+        self.super_smashers: set[int] = set()
+
+    def score(self) -> int:
+        """Leaderboard score, doubled to stay integral: 2·super + smash + ½·hangout − pass."""
+        c = self.counts
+        return 4 * c["super-smashes"] + 2 * c["smashes"] + c["hangouts"] - 2 * c["passes"]
+
+    def as_dict(self) -> dict:
+        """The shape votes.json used to hold, for the views."""
+        out = dict(self.counts)
+        out["image"] = self.image
+        if self.uploader:
+            out["user_id"] = self.uploader
+        return out
+
+
+class VoteStore:
+    """
+    SmashOrPass votes in SQLite with everything the commands read kept in memory.
+
+    Each character holds its counters plus voter sets, so duplicate checks are set
+    lookups. Every vote is one small transaction. Leaderboards are sorted key lists
+    per category (and one for "All") that are updated by bisect on each vote, so
+    pages are index lookups instead of a re-sort. Daily super-smash times are stored
+    too and survive restarts. votes.json is imported once if the database is empty.
+    """
+
+    def __init__(self, db_path: str, legacy_json: str | None = None):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode = WAL;")
+        self.conn.execute("PRAGMA synchronous = NORMAL;")
+        self.conn.executescript(_SCHEMA)
+
+        self.chars: dict[tuple[str, str], Character] = {}
+        self.boards: dict[str | None, list[tuple[int, str, str]]] = {None: []}
+        self.super_by_user: dict[int, list[Character]] = {}
+        self.super_last: dict[int, datetime] = {}
+
+        if legacy_json and self._is_empty() and os.path.exists(legacy_json):
+            self._import_json(legacy_json)
+        self._load()
+
+    # ---------- loading ----------
+
+    def _is_empty(self) -> bool:
+        return self.conn.execute("SELECT 1 FROM characters LIMIT 1").fetchone() is None
+
+    def _import_json(self, path: str) -> None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                votes = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Vote import error: {e}")
+            return
+        chars, voters = [], []
+        for category, characters in (votes or {}).items():
+            for name, data in characters.items():
+                chars.append((
+                    category, name, data.get("image") or "", data.get("user_id"),
+                    data.get("smashes", 0), data.get("passes", 0),
+                    data.get("super-smashes", 0), data.get("hangouts", 0),
+                ))
+                voters.extend((category, name, int(u), 0) for u in data.get("voters", []))
+                voters.extend((category, name, int(u), 1) for u in data.get("super-smashers", []))
+        with self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO characters VALUES (?,?,?,?,?,?,?,?)", chars)
+            self.conn.executemany("INSERT OR IGNORE INTO voters VALUES (?,?,?,?)", voters)
+        print(f"Imported {len(chars)} characters from {os.path.basename(path)}.")
+
+    def _load(self) -> None:
+        for row in self.conn.execute(
+            "SELECT category, name, image, uploader, smashes, passes, super_smashes, hangouts FROM characters"
+        ):
+            ch = self._new(row[0], row[1], row[2], row[3])
+            ch.counts.update(zip(VOTE_TYPES, row[4:8]))
+        for category, name, user_id, sup in self.conn.execute("SELECT category, name, user_id, super FROM voters"):
+            ch = self.chars.get((category, name))
+            if ch is None:
+                continue
+            if sup:
+                ch.super_smashers.add(user_id)
+                self.super_by_user.setdefault(user_id, []).append(ch)
+            else:
+                ch.voters.add(user_id)
+        for user_id, last_used in self.conn.execute("SELECT user_id, last_used FROM super_smash_limits"):
+            self.super_last[user_id] = datetime.fromisoformat(last_used)
+
+        for ch in self.chars.values():
+            self._rank(ch, None)
+
+    def _new(self, category: str, name: str, image: str = "", uploader: int | None = None) -> Character:
+        ch = Character(category, name, image, uploader)
+        self.chars[(category, name)] = ch
+        self.boards.setdefault(category, [])
+        return ch
+
+    # ---------- ranked index ----------
+
+    @staticmethod
+    def _key(ch: Character, score: int) -> tuple[int, str, str]:
+        return (-score, ch.name, ch.category)
+
+    def _rank(self, ch: Character, old_score: int | None) -> None:
+        boards = [self.boards[ch.category]]
+        if ch.category not in HIDDEN_FROM_ALL:
+            boards.append(self.boards[None])
+        new_key = self._key(ch, ch.score())
+        for board in boards:
+            if old_score is not None:
+                old_key = self._key(ch, old_score)
+                i = bisect_left(board, old_key)
+                if i < len(board) and board[i] == old_key:
+                    del board[i]
+            insort(board, new_key)
+
+    def board_size(self, category: str | None) -> int:
+        return len(self.boards.get(category, ()))
+
+    def ranked(self, category: str | None, index: int, losers: bool = False) -> Character | None:
+        """The character at `index` on a leaderboard (or, with `losers`, the loserboard)."""
+        board = self.boards.get(category) or []
+        if not board:
+            return None
+        index %= len(board)
+        _, name, cat = board[-1 - index] if losers else board[index]
+        return self.chars[(cat, name)]
+
+    # ---------- votes ----------
+
+    def super_smash_available_at(self, user_id: int) -> datetime | None:
+        last = self.super_last.get(user_id)
+        return last + SUPER_SMASH_COOLDOWN if last else None
+
+    def record(self, category: str, name: str, vote_type: str, user_id: int, image: str) -> bool:
+        """Apply a vote. False for a repeat vote or a super-smash still on cooldown."""
+        ch = self.chars.get((category, name))
+        is_new = ch is None
+        if is_new:
+            ch = self._new(category, name)
+        old_score = ch.score()
+        stmts: list[tuple[str, tuple]] = []
+
+        if vote_type == "super-smashes":
+            now = datetime.now(timezone.utc)
+            last = self.super_last.get(user_id)
+            if last and now - last < SUPER_SMASH_COOLDOWN:
+                return False
+            self.super_last[user_id] = now
+            stmts.append(("INSERT OR REPLACE INTO super_smash_limits VALUES (?,?)", (user_id, now.isoformat())))
+            if user_id not in ch.super_smashers:
+                ch.super_smashers.add(user_id)
+                ch.counts[vote_type] += 1
+                self.super_by_user.setdefault(user_id, []).append(ch)
+                stmts.append(("INSERT OR IGNORE INTO voters VALUES (?,?,?,1)", (category, name, user_id)))
+        else:
+            if user_id in ch.voters:
+                return False
+            ch.voters.add(user_id)
+            ch.counts[vote_type] += 1
+            stmts.append(("INSERT OR IGNORE INTO voters VALUES (?,?,?,0)", (category, name, user_id)))
+
+        ch.image = image
+        col = _COLUMNS[vote_type]
+        stmts.append((
+            f"""INSERT INTO characters (category, name, image, {col}) VALUES (?,?,?,?)
+                ON CONFLICT(category, name) DO UPDATE SET image = excluded.image, {col} = ?""",
+            (category, name, image, ch.counts[vote_type], ch.counts[vote_type]),
+        ))
+        with self.conn:
+            for sql, params in stmts:
+                self.conn.execute(sql, params)
+
+        if is_new:
+            self._rank(ch, None)
+        elif ch.score() != old_score:
+            self._rank(ch, old_score)
+        return True
+
+    def super_smashes_by(self, user_id: int) -> list[Character]:
+        return list(self.super_by_user.get(user_id, ()))
+
+    def close(self) -> None:
+        self.conn.close()
@@ -5,6 +5,7 @@ from discord import app_commands
 from discord.ext import tasks
 from matplotlib import lines
 from redbot.core import commands, bank
+from redbot.core.data_manager import cog_data_path
 import json
 import os
 from datetime import datetime, UTC, timedelta, timezone
@@ -15,14 +16,21 @@ import re
 import random
 from dataclasses import dataclass, asdict
 import time, uuid
+import tempfile
+import shutil
 from typing import Optional
 from discord import AllowedMentions
 
+from .message_router import RoutedChannels, get_router, release_router
+from .steno_journal import StenoJournal
+
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 COURT_FILE = os.path.join(BASE_DIR, 'courts.json')
 SYSTEM_FILE = os.path.join(BASE_DIR, 'system.json')
+# Steno journals used to live in the package folder, which a cog update replaces.
+LEGACY_STENO_DIR = os.path.join(BASE_DIR, 'steno')
 
 SUPREME_COURT_CHANNEL_ID = 1302331990829174896
 FIRST_CIRCUIT_CHANNEL_ID = 1400567992726716583
@@ -956,11 +964,34 @@ class SpideyCourts(commands.Cog):
         self.show_applicants.start()
         self.show_cases.start()
         self.steno_is_listening = 5
+        self.router = get_router(bot)
+        self.router.register("steno", self.handle_steno_message)
+        # channel_id -> session dict; the router only sends messages from these channels
+        self._steno_sessions = RoutedChannels(self.router, "steno")
+        self.data_dir = str(cog_data_path(self))
+        steno_dir = os.path.join(self.data_dir, "steno")
+        if os.path.isdir(LEGACY_STENO_DIR) and not os.path.exists(steno_dir):
+            # same layout underneath, so "steno/closed/..." paths in _transcripts stay valid
+            shutil.move(LEGACY_STENO_DIR, steno_dir)
+        self.steno_journal = StenoJournal(steno_dir)
+        for sess in self.steno_journal.replay():
+            self._steno_sessions[sess["channel_id"]] = sess
+        self.steno_sync.start()
     
     def cog_unload(self):
         """Stop the daily task when the cog is unloaded."""
         self.show_applicants.cancel()
         self.show_cases.cancel()
+        self.steno_sync.cancel()
+        self.steno_journal.close()
+        release_router(self.bot, "steno")
+
+    @tasks.loop(seconds=2)
+    async def steno_sync(self):
+        """Push captured steno lines to disk in batches."""
+        fds = self.steno_journal.flush()
+        if fds:
+            await asyncio.to_thread(self.steno_journal.fsync, fds)
     
     @tasks.loop(hours=24)
     async def show_applicants(self):
@@ -3284,11 +3315,6 @@ class SpideyCourts(commands.Cog):
         save_json(COURT_FILE, self.court_data)
         await interaction.followup.send(f"✅ Appeal filed to **{target_court.name}**. New case: `{new_case_number}`.", ephemeral=True)
 
-    def _init_steno_store(self):
-        if not hasattr(self, "_steno_sessions"):
-            # channel_id -> session dict
-            self._steno_sessions = {}
-
     def _steno_now(self):
         return datetime.now(UTC).isoformat()
     
@@ -3355,17 +3381,18 @@ class SpideyCourts(commands.Cog):
             "role": parsed["role"],  # Q/A/O or None
             "text": parsed["text"],
         }
-        sess["lines"].append(entry)
+        self.steno_journal.append(sess, entry)
         return True
 
-    def _steno_format_export(self, sess):
+    def _steno_export_file(self, sess) -> tempfile.SpooledTemporaryFile:
+        """The transcript as a file ready to attach, written line by line from the journal."""
         header = []
         header.append("=== TRANSCRIPT ===")
         if sess.get("title"):
             header.append(f"Proceeding: {sess['title']}")  # <-- NEW
         if sess.get("case_number"):
             header.append(f"Case: {sess['case_number']}")
-        header.append(f"Channel: #{getattr(sess.get('channel'), 'name', 'unknown')}")
+        header.append(f"Channel: #{getattr(sess.get('channel'), 'name', None) or sess.get('channel_name') or 'unknown'}")
         header.append(f"Mode: {sess.get('mode','hearing')}")
         header.append(f"Locked: {bool(sess.get('locked'))}")
         time_formatting = datetime.fromisoformat(sess.get("started_at")).strftime("%B %d, %Y at %I:%M %p %Z") if sess.get("started_at") else "unknown"
@@ -3375,24 +3402,25 @@ class SpideyCourts(commands.Cog):
         header.append("")
 
 
-        body = []
-        for i, ln in enumerate(sess.get("lines", []), start=1):
-            stamp = ln["ts"]
-            who = ln["speaker"]
-            if sess.get("mode") == "depo" and ln["role"] in ("Q","A","O"):
-                body.append(f"{ln['role']}: {ln['text']}")
+        out = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+        out.write("\n".join(header).encode("utf-8"))
+        depo = sess.get("mode") == "depo"
+        for ln in self.steno_journal.lines(sess):
+            if depo and ln["role"] in ("Q","A","O"):
+                out.write(f"\n{ln['role']}: {ln['text']}".encode("utf-8"))
             else:
-                body.append(f"{who}: {ln['text']}")
-        text = "\n".join(header + body)
-        return text
+                out.write(f"\n{ln['speaker']}: {ln['text']}".encode("utf-8"))
+        out.seek(0)
+        return out
 
     # ---------- STENO: listener ----------
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        self._init_steno_store()
+    async def handle_steno_message(self, message: discord.Message):
+        """Routed here for messages in channels with a running steno session."""
         sess = self._steno_sessions.get(getattr(message.channel, "id", None))
         if not sess:
             return
+        if sess.get("channel") is None:
+            sess["channel"] = message.channel  # sessions replayed from the journal start without it
         if not self._steno_can_capture(sess, message):
             return
 
@@ -3490,7 +3518,6 @@ class SpideyCourts(commands.Cog):
         """Start capturing. Example:
         [p]steno start hearing 1:25-cv-000001-SS true title:Oral Argument on MSJ
         [p]steno start depo 25cv1 true title:Deposition of John Doe"""
-        self._init_steno_store()
         ch = ctx.channel
         if ch.id in self._steno_sessions:
             return await ctx.send("❌ Already running in this channel. Use `[p]steno stop` first.")
@@ -3519,12 +3546,13 @@ class SpideyCourts(commands.Cog):
             "locked": bool(lock),
             "allowed_users": set(),
             "aliases": {},
-            "lines": [],
+            "channel_name": getattr(ch, "name", None),
             "started_at": self._steno_now(),
             "started_by": ctx.author.id,
             "starter_name": ctx.author.display_name,
             "case_number": case_number,
         }
+        self.steno_journal.start(sess)
         self._steno_sessions[ch.id] = sess
         case_yes = " for" + f" {case_number}" if case_number else ""
         await ctx.send(f"🟢 The {title} has begun{case_yes}, and the stenographer has **started** recording in {ch.mention} (mode=`{mode}`, locked={'`on`' if lock else '`off`'}).")
@@ -3533,14 +3561,14 @@ class SpideyCourts(commands.Cog):
     @steno.command(name="stop", aliases=("finalize", "end"))
     async def steno_stop(self, ctx: commands.Context, *, filename: str = None):
         """Stop capturing in this channel and immediately export the transcript."""
-        self._init_steno_store()
         ch_id = ctx.channel.id
         sess = self._steno_sessions.get(ch_id)
         if not sess:
             return await ctx.send("❌ No active steno session here.")
 
-        # 1) Build the export text BEFORE we tear anything down
-        text = self._steno_format_export(sess)
+        # 1) Build the export BEFORE we tear anything down
+        self.steno_journal.flush_session(sess)
+        fp = await asyncio.to_thread(self._steno_export_file, sess)
         ts = datetime.now(UTC).strftime("%Y-%m-%d_%H-%M-%S")
         def _slug(s: str) -> str:
             return re.sub(r'[^A-Za-z0-9._-]+', '_', (s or '').strip())[:60] or 'session'
@@ -3548,7 +3576,9 @@ class SpideyCourts(commands.Cog):
         default_name = f"transcript_{t_slug}_{(sess.get('case_number') or 'N_A')}_{ts}.txt".replace(":", "-")
         fname = (filename or default_name).strip() or default_name
 
-        # 2) Persist a snapshot to COURT_FILE (for audit/history)
+        # 2) Remove the live session, close the journal and record it in COURT_FILE (for audit/history)
+        self._steno_sessions.pop(ch_id, None)
+        journal = self.steno_journal.stop(sess)
         root = self.court_data
         tx = root.setdefault("_transcripts", [])
         tx.append({
@@ -3559,33 +3589,34 @@ class SpideyCourts(commands.Cog):
             "locked": sess.get("locked"),
             "started_at": sess.get("started_at"),
             "stopped_at": self._steno_now(),
-            "lines": list(sess.get("lines", [])),  # copy for safety
+            "line_count": sess.get("line_count", 0),
+            "journal": os.path.relpath(journal, self.data_dir),
         })
         save_json(COURT_FILE, root)
 
-        # 3) Send the file to the channel
-        fp = io.BytesIO(text.encode("utf-8"))
-        await ctx.send("🔴 Steno **stopped**. Transcript attached.", file=discord.File(fp, filename=fname))
-
-        # 4) Finally, remove the live session
-        self._steno_sessions.pop(ch_id, None)
+        # 3) Send the file to the channel; the journal stays in closed/ if it can't be attached
+        try:
+            await ctx.send("🔴 Steno **stopped**. Transcript attached.", file=discord.File(fp, filename=fname))
+        except discord.HTTPException as e:
+            await ctx.send(
+                f"🔴 Steno **stopped**, but the transcript couldn't be attached ({e.status}). "
+                f"The journal was kept as `{os.path.relpath(journal, self.data_dir)}`."
+            )
 
 
     @steno.command(name="status")
     async def steno_status(self, ctx: commands.Context):
-        self._init_steno_store()
         sess = self._steno_sessions.get(ctx.channel.id)
         if not sess:
             return await ctx.send("ℹ️ No active steno session in this channel.")
-        lines = sess.get("lines", [])
         preview = "\n".join(
             f"• {ln['speaker']}: {ln['text'][:60]}{'…' if len(ln['text'])>60 else ''}"
-            for ln in lines[-5:]
+            for ln in sess["recent"]
         ) or "(no lines yet)"
         await ctx.send(
             f"📋 **Steno status**\n"
             f"Title: `{sess.get('title','(untitled)')}`\n"
-            f"Mode: `{sess['mode']}` | Locked: `{sess['locked']}` | Lines: `{len(lines)}`\n"
+            f"Mode: `{sess['mode']}` | Locked: `{sess['locked']}` | Lines: `{sess['line_count']}`\n"
             f"Case: `{sess.get('case_number') or 'N/A'}` | Started: `{sess['started_at']}`\n"
             f"Recent:\n{preview}"
         )
@@ -3599,7 +3630,6 @@ class SpideyCourts(commands.Cog):
         [p]steno alias Witness -> WITNESS   (normalizes case)
         [p]steno alias Pl. Counsel ->       (removes)
         """
-        self._init_steno_store()
         sess = self._steno_sessions.get(ctx.channel.id)
         if not sess:
             return await ctx.send("❌ No active steno session.")
@@ -3609,9 +3639,11 @@ class SpideyCourts(commands.Cog):
         key = left.lower()
         if right:
             sess["aliases"][key] = right
+            self.steno_journal.note(sess)
             await ctx.send(f"✅ Alias set: **{left}** → **{right}**")
         else:
             sess["aliases"].pop(key, None)
+            self.steno_journal.note(sess)
             await ctx.send(f"🗑️ Alias removed: **{left}**")
 
     @steno.command(name="allow")
@@ -3620,7 +3652,6 @@ class SpideyCourts(commands.Cog):
         Toggle per-user allowlist. If any users are added, only those users' messages are eligible for capture.
         Use again on the same user to remove them. Use with 0 args to show the list.
         """
-        self._init_steno_store()
         sess = self._steno_sessions.get(ctx.channel.id)
         if not sess:
             return await ctx.send("❌ No active steno session.")
@@ -3635,25 +3666,26 @@ class SpideyCourts(commands.Cog):
             return await ctx.send("Allowed users: " + ", ".join(names))
         if member.id in allowed:
             allowed.remove(member.id)
+            self.steno_journal.note(sess)
             return await ctx.send(f"➖ Removed **{member.display_name}** from allowlist.")
         allowed.add(member.id)
+        self.steno_journal.note(sess)
         await ctx.send(f"➕ Added **{member.display_name}** to allowlist.")
 
     @steno.command(name="export")
     async def steno_export(self, ctx: commands.Context, *, filename: str = None):
         """Export the current transcript without stopping."""
-        self._init_steno_store()
         sess = self._steno_sessions.get(ctx.channel.id)
         if not sess:
             return await ctx.send("❌ No active steno session.")
-        text = self._steno_format_export(sess)
+        self.steno_journal.flush_session(sess)
+        fp = await asyncio.to_thread(self._steno_export_file, sess)
         ts = datetime.now(UTC).strftime("%Y-%m-%d_%H-%M-%S")
         def _slug( s: str) -> str:
             return re.sub(r'[^A-Za-z0-9._-]+', '_', (s or '').strip())[:60] or 'session'
         t_slug = _slug(sess.get("title") or "")
         default_name = f"transcript_{t_slug}_{(sess.get('case_number') or 'N_A')}_SNAP_{ts}.txt".replace(":", "-")
         fname = (filename or default_name).strip() or default_name
-        fp = io.BytesIO(text.encode("utf-8"))
         await ctx.send("📄 Snapshot exported (session still running).", file=discord.File(fp, filename=fname))
 
     @judge.command(name="appeal_disposition", description="Enter a disposition in an appellate case, optionally with remand.")
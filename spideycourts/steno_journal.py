@@ -0,0 +1,187 @@
+from __future__ import annotations
+import json
+import os
+import time
+from collections import deque
+from typing import IO, Iterator
+
+# Lines kept in memory per session, for [p]steno status.
+RECENT_LINES = 5
+# Session fields written in a journal's first record and restored on replay.
+HEADER_FIELDS = (
+    "channel_id", "guild_id", "channel_name", "mode", "title", "locked",
+    "started_at", "started_by", "starter_name", "case_number",
+)
+
+
+def _dump(record) -> str:
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+
+def _entry(row: list) -> dict:
+    ts, msg_id, user_id, speaker, role, text = row
+    return {"ts": ts, "msg_id": msg_id, "user_id": user_id, "speaker": speaker, "role": role, "text": text}
+
+
+class StenoJournal:
+    """
+    One append-only JSON-lines file per live steno session.
+
+    The first record holds the session header. Each captured line is one compact
+    array after it, and alias/allowlist changes are small "set" records. Writes go
+    through the file buffer; `flush` (run on a short timer by the cog) pushes them
+    to the OS and hands back descriptors to fsync off the event loop. On load,
+    `replay` rebuilds every live session from its file. Sessions only keep a line
+    count and the last few lines in memory; export reads the file back.
+    Stopped sessions are moved to closed/.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.archive = os.path.join(root, "closed")
+        os.makedirs(self.archive, exist_ok=True)
+        self._files: dict[int, IO[str]] = {}
+        self._dirty: set[int] = set()
+
+    # ---------- writing ----------
+
+    def start(self, sess: dict) -> None:
+        channel_id = sess["channel_id"]
+        path = os.path.join(self.root, f"{channel_id}_{int(time.time())}.jsonl")
+        sess["journal"] = path
+        sess["line_count"] = 0
+        sess["recent"] = deque(maxlen=RECENT_LINES)
+        f = open(path, "a", encoding="utf-8")
+        header = {field: sess.get(field) for field in HEADER_FIELDS}
+        header["op"] = "start"
+        f.write(_dump(header))
+        f.flush()
+        os.fsync(f.fileno())
+        self._files[channel_id] = f
+
+    def append(self, sess: dict, entry: dict) -> None:
+        channel_id = sess["channel_id"]
+        self._files[channel_id].write(_dump([
+            entry["ts"], entry["msg_id"], entry["user_id"], entry["speaker"], entry["role"], entry["text"],
+        ]))
+        self._dirty.add(channel_id)
+        sess["line_count"] += 1
+        sess["recent"].append(entry)
+
+    def note(self, sess: dict) -> None:
+        """Record the session's current aliases and allowlist."""
+        channel_id = sess["channel_id"]
+        self._files[channel_id].write(_dump({
+            "op": "set",
+            "aliases": sess.get("aliases", {}),
+            "allowed_users": sorted(sess.get("allowed_users", ())),
+        }))
+        self._dirty.add(channel_id)
+
+    def flush(self) -> list[int]:
+        """Flush buffered records; returns the descriptors that still need an fsync."""
+        fds = []
+        for channel_id in self._dirty:
+            f = self._files.get(channel_id)
+            if f is not None and not f.closed:
+                f.flush()
+                fds.append(f.fileno())
+        self._dirty.clear()
+        return fds
+
+    def flush_session(self, sess: dict) -> None:
+        """Flush one session's buffered records, so a reader off the loop sees them."""
+        f = self._files.get(sess["channel_id"])
+        if f is not None and not f.closed:
+            f.flush()
+
+    @staticmethod
+    def fsync(fds: list[int]) -> None:
+        for fd in fds:
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass  # closed by a stop in the meantime; close() already synced it
+
+    def stop(self, sess: dict) -> str:
+        """Close a session's journal and move it to closed/; returns the new path."""
+        f = self._files.pop(sess["channel_id"], None)
+        self._dirty.discard(sess["channel_id"])
+        if f is not None:
+            f.flush()
+            os.fsync(f.fileno())
+            f.close()
+        path = sess["journal"]
+        archived = os.path.join(self.archive, os.path.basename(path))
+        os.replace(path, archived)
+        sess["journal"] = archived
+        return archived
+
+    def close(self) -> None:
+        """Flush and close every file on unload; the sessions replay on the next load."""
+        self.fsync(self.flush())
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+
+    # ---------- reading ----------
+
+    def lines(self, sess: dict) -> Iterator[dict]:
+        """
+        Every captured line of a session, read back from its journal. Safe to run
+        in a thread: call `flush_session` on the loop first, and a record still
+        being written at the tail is left out.
+        """
+        with open(sess["journal"], "r", encoding="utf-8") as src:
+            for raw in src:
+                if raw.startswith("[") and raw.endswith("\n"):
+                    yield _entry(json.loads(raw))
+
+    def replay(self) -> list[dict]:
+        """Sessions for every journal still in the live folder, reopened for appending."""
+        sessions = []
+        for name in sorted(os.listdir(self.root)):
+            path = os.path.join(self.root, name)
+            if not name.endswith(".jsonl") or not os.path.isfile(path):
+                continue
+            try:
+                sess = self._replay_file(path)
+            except (OSError, ValueError) as e:
+                print(f"Steno journal replay error ({name}): {e}")
+                continue
+            if sess is None:
+                continue
+            self._files[sess["channel_id"]] = open(path, "a", encoding="utf-8")
+            sessions.append(sess)
+        return sessions
+
+    @staticmethod
+    def _replay_file(path: str) -> dict | None:
+        sess = None
+        good = 0
+        with open(path, "rb") as f:
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # torn write at the tail
+                try:
+                    record = json.loads(raw)
+                except json.JSONDecodeError:
+                    break
+                good += len(raw)
+                if isinstance(record, list):
+                    if sess is not None:
+                        sess["line_count"] += 1
+                        sess["recent"].append(_entry(record))
+                elif record.get("op") == "start":
+                    sess = {field: record.get(field) for field in HEADER_FIELDS}
+                    sess.update(
+                        channel=None, aliases={}, allowed_users=set(), journal=path,
+                        line_count=0, recent=deque(maxlen=RECENT_LINES),
+                    )
+                elif record.get("op") == "set" and sess is not None:
+                    sess["aliases"] = dict(record.get("aliases") or {})
+                    sess["allowed_users"] = set(record.get("allowed_users") or ())
+        if os.path.getsize(path) != good:
+            with open(path, "r+b") as f:
+                f.truncate(good)
+        return sess
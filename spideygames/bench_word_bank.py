@@ -0,0 +1,108 @@
+"""
+Time the anagram word bank: opening data/words.bin and drawing a word per difficulty.
+
+    python spideygames/bench_word_bank.py --draws 100000 --baseline --import-time
+
+--baseline also times the old per-game path (score the whole web2 list with
+wordfreq, then pick from the filtered list); it needs wordfreq plus nltk's words
+corpus or the english-words package. --import-time runs `python -X importtime`
+on the cog in a fresh interpreter and needs Red installed; it also reports
+whether nltk or wordfreq got imported, which they shouldn't.
+"""
+from __future__ import annotations
+import argparse
+import os
+import random
+import subprocess
+import sys
+import time
+
+if __package__:
+    from .word_bank import DEFAULT_DIFFICULTY, DIFFICULTY_SETTINGS, WordBank, _in_bucket, _source_words
+else:  # run as a script, without the package __init__ (which loads the cog)
+    from word_bank import DEFAULT_DIFFICULTY, DIFFICULTY_SETTINGS, WordBank, _in_bucket, _source_words
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BANK_PATH = os.path.join(HERE, "data", "words.bin")
+
+
+def bench_open(opens: int) -> float:
+    """Mean milliseconds to open (mmap and parse the header of) the bank."""
+    t0 = time.perf_counter()
+    for _ in range(opens):
+        WordBank(BANK_PATH).close()
+    return (time.perf_counter() - t0) / opens * 1000.0
+
+
+def bench_choice(bank: WordBank, draws: int, rng: random.Random) -> dict[str, float]:
+    """Mean microseconds per choice() for each difficulty."""
+    results = {}
+    for difficulty in DIFFICULTY_SETTINGS:
+        t0 = time.perf_counter()
+        for _ in range(draws):
+            bank.choice(difficulty, rng)
+        results[difficulty] = (time.perf_counter() - t0) / draws * 1e6
+    return results
+
+
+def bench_baseline(difficulty: str, rng: random.Random) -> float:
+    """Seconds for one game start the old way: filter the whole word list, then pick."""
+    import wordfreq
+
+    settings = DIFFICULTY_SETTINGS[difficulty]
+    t0 = time.perf_counter()
+    words = _source_words()
+    kept = [w for w in words if _in_bucket(w, wordfreq.word_frequency(w, "en"), settings)]
+    rng.choice(kept)
+    return time.perf_counter() - t0
+
+
+def bench_import() -> None:
+    """Print the cumulative import time of the cog module from `-X importtime`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import spideygames.spideygames"],
+        cwd=os.path.dirname(HERE), capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        print("import failed (is Red installed?):", proc.stderr.strip().splitlines()[-1])
+        return
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self_us, cum_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if cum_us.isdigit():
+            cumulative[name] = int(cum_us)
+    for name in ("spideygames.word_bank", "spideygames.spideygames", "spideygames"):
+        if name in cumulative:
+            print(f"import {name}: {cumulative[name] / 1000.0:.1f} ms cumulative")
+    heavy = sorted(name for name in cumulative if name.split(".")[0] in ("nltk", "wordfreq"))
+    print("nltk/wordfreq imported:", ", ".join(heavy) if heavy else "no")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--opens", type=int, default=200)
+    parser.add_argument("--draws", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--baseline", action="store_true")
+    parser.add_argument("--import-time", action="store_true")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    print(f"open words.bin: {bench_open(args.opens):.3f} ms")
+    bank = WordBank(BANK_PATH)
+    try:
+        for difficulty, us in bench_choice(bank, args.draws, rng).items():
+            print(f"choice {difficulty:<10} {bank.size(difficulty):>6} words  {us:.2f} us")
+    finally:
+        bank.close()
+
+    if args.baseline:
+        print(f"old path ({DEFAULT_DIFFICULTY}): {bench_baseline(DEFAULT_DIFFICULTY, rng):.2f} s per game start")
+    if args.import_time:
+        bench_import()
+
+
+if __name__ == "__main__":
+    main()
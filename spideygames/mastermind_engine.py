@@ -0,0 +1,155 @@
+from __future__ import annotations
+import threading
+from itertools import permutations, product
+
+import numpy as np
+
+# Code spaces up to this size keep a full guess x code feedback table (4096^2 bytes = 16 MB).
+TABLE_MAX_CODES = 4096
+# Guesses scored per block when a row isn't in a table, to bound the temporaries.
+BLOCK_GUESSES = 128
+
+
+class MastermindEngine:
+    """
+    Every possible code for one Mastermind setup, as an (n, length) uint8 array of
+    colour numbers in lexicographic order, so a code is identified by its row.
+
+    Feedback (exact, misplaced) is packed into one small integer. Scoring a guess
+    against any set of codes is a couple of array operations, and narrowing the
+    possible codes after a guess is one comparison. Small code spaces also keep
+    the full feedback table.
+    """
+
+    def __init__(self, length: int, colors: int, duplicates: bool):
+        self.length = length
+        self.colors = colors
+        self.duplicates = duplicates
+        if duplicates:
+            rows = list(product(range(colors), repeat=length))
+        else:
+            rows = list(permutations(range(colors), length))
+        self.codes = np.array(rows, dtype=np.uint8).reshape(len(rows), length)
+        self.counts = np.stack([(self.codes == c).sum(axis=1) for c in range(colors)], axis=1).astype(np.uint8)
+        self.keys = (self.codes.astype(np.int64) * colors ** np.arange(length - 1, -1, -1)).sum(axis=1)
+        self.base = length + 1
+        self.outcomes = self.base * self.base
+        self.everything = np.arange(len(self.codes))
+        self.table = None  # score() checks it while the table is being built
+        self.table = self.score(self.everything) if len(self.codes) <= TABLE_MAX_CODES else None
+        self._opening = None
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    # ---------- codes ----------
+
+    def index(self, digits) -> int:
+        key = 0
+        for d in digits:
+            key = key * self.colors + d
+        i = int(np.searchsorted(self.keys, key))
+        if i >= len(self.keys) or self.keys[i] != key:
+            raise ValueError("That code is not possible in this game.")
+        return i
+
+    def code(self, i: int) -> tuple[int, ...]:
+        return tuple(int(d) for d in self.codes[i])
+
+    def feedback(self, exact: int, misplaced: int) -> int:
+        return exact * self.base + misplaced
+
+    # ---------- scoring ----------
+
+    def score(self, guesses: np.ndarray, codes: np.ndarray | None = None) -> np.ndarray:
+        """Feedback of each guess (rows) against each code (columns), by row number."""
+        codes = self.everything if codes is None else codes
+        if self.table is not None:
+            return self.table[np.ix_(guesses, codes)]
+        out = np.empty((len(guesses), len(codes)), dtype=np.uint8)
+        c_codes, c_counts = self.codes[codes], self.counts[codes]
+        for start in range(0, len(guesses), BLOCK_GUESSES):
+            g = guesses[start:start + BLOCK_GUESSES]
+            exact = (self.codes[g][:, None, :] == c_codes[None, :, :]).sum(axis=2, dtype=np.uint8)
+            common = np.minimum(self.counts[g][:, None, :], c_counts[None, :, :]).sum(axis=2, dtype=np.uint8)
+            out[start:start + len(g)] = exact * self.base + (common - exact)
+        return out
+
+    def narrow(self, candidates: np.ndarray, guess: int, feedback: int) -> np.ndarray:
+        """The candidates that would have given `feedback` to `guess`."""
+        return candidates[self.score(np.array([guess]), candidates)[0] == feedback]
+
+    def candidates(self, history) -> np.ndarray:
+        """Codes still possible after [(guess row, feedback), ...]."""
+        candidates = self.everything
+        for guess, feedback in history:
+            candidates = self.narrow(candidates, guess, feedback)
+        return candidates
+
+    # ---------- solving ----------
+
+    def best_guess(self, candidates: np.ndarray) -> int:
+        """
+        Minimax (Knuth): the guess whose worst-case reply leaves the fewest codes,
+        preferring a guess that could itself be the answer, then the lowest row.
+        """
+        if len(candidates) <= 2:
+            return int(candidates[0])
+        if len(candidates) == len(self.codes):
+            if self._opening is None:
+                self._opening = self._best_of(self._canonical(), candidates)
+            return self._opening
+        return self._best_of(self.everything, candidates)
+
+    def _best_of(self, guesses: np.ndarray, candidates: np.ndarray) -> int:
+        worst = np.empty(len(guesses), dtype=np.int64)
+        for start in range(0, len(guesses), BLOCK_GUESSES):
+            g = guesses[start:start + BLOCK_GUESSES]
+            replies = self.score(g, candidates).astype(np.int64)
+            replies += np.arange(len(g))[:, None] * self.outcomes
+            sizes = np.bincount(replies.ravel(), minlength=len(g) * self.outcomes)
+            worst[start:start + len(g)] = sizes.reshape(len(g), self.outcomes).max(axis=1)
+        possible = np.isin(guesses, candidates)
+        # Smallest worst case, then codes that could be the answer, then lowest row.
+        order = np.lexsort((guesses, ~possible, worst))
+        return int(guesses[order[0]])
+
+    def _canonical(self) -> np.ndarray:
+        """
+        With every code still possible, guesses that only rename colours are
+        equivalent, so only codes introducing colours in order (0, 0 1, 0 1 2...) count.
+        """
+        seen = np.zeros(len(self.codes), dtype=np.int16)
+        ok = np.ones(len(self.codes), dtype=bool)
+        for pos in range(self.length):
+            col = self.codes[:, pos].astype(np.int16)
+            ok &= col <= seen
+            seen = np.maximum(seen, col + 1)
+        return self.everything[ok]
+
+    def solve(self, secret: int, max_guesses: int = 20) -> list[int]:
+        """The guesses the minimax solver makes to find `secret`."""
+        candidates = self.everything
+        guesses = []
+        while len(guesses) < max_guesses:
+            guess = self.best_guess(candidates)
+            guesses.append(guess)
+            if guess == secret:
+                break
+            feedback = int(self.score(np.array([guess]), np.array([secret]))[0, 0])
+            candidates = self.narrow(candidates, guess, feedback)
+        return guesses
+
+
+_engines: dict[tuple[int, int, bool], MastermindEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def engine_for(length: int, colors: int, duplicates: bool) -> MastermindEngine:
+    """The shared engine for a setup, built on first use (call off the event loop)."""
+    key = (length, colors, duplicates)
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = _engines[key] = MastermindEngine(length, colors, duplicates)
+    return engine
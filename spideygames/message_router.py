@@ -0,0 +1,269 @@
+from __future__ import annotations
+import asyncio
+import hashlib
+import time
+from collections import deque
+from typing import Awaitable, Callable
+
+import discord
+from redbot.core import commands
+
+# Red installs each cog on its own, so every cog that handles messages ships a copy of
+# this file (spideygames, spideycourts, identitytheft). Keep them byte-identical: edit
+# one, copy it over the others, and run `python tools/check_shared_copies.py`.
+# Cogs only share a router when their copies match: the bot attribute is keyed by a
+# hash of this file, so a stale copy gets a router of its own instead of a mismatched one.
+with open(__file__, "rb") as _source:
+    ROUTER_REVISION = hashlib.blake2b(_source.read(), digest_size=6).hexdigest()
+_ATTR_PREFIX = "_spidey_message_router_"
+# Attribute on the bot holding the one router every message-handling cog shares.
+_BOT_ATTR = _ATTR_PREFIX + ROUTER_REVISION
+EVENTS = ("on_message", "on_message_without_command")
+
+Handler = Callable[[discord.Message], Awaitable[None]]
+
+
+class _Route:
+    __slots__ = ("name", "fn", "event", "bit", "calls", "errors", "total", "slowest", "latencies")
+
+    def __init__(self, name: str, fn: Handler, event: str, bit: int):
+        self.name = name
+        self.fn = fn
+        self.event = event
+        self.bit = bit
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.slowest = 0.0
+        self.latencies: deque[float] = deque(maxlen=512)
+
+    async def run(self, message: discord.Message) -> None:
+        start = time.perf_counter()
+        try:
+            await self.fn(message)
+        except Exception as e:
+            self.errors += 1
+            print(f"Message handler {self.name} error: {e}")
+        finally:
+            elapsed = time.perf_counter() - start
+            self.calls += 1
+            self.total += elapsed
+            self.slowest = max(self.slowest, elapsed)
+            self.latencies.append(elapsed)
+
+
+class MessageRouter:
+    """
+    One on_message / on_message_without_command listener for every cog that needs one.
+
+    Handlers say where they want messages: specific channels (a steno session, an Uno
+    table) or whole guilds (a per-guild toggle). Each handler owns a bit; the router
+    keeps channel id -> bits and guild id -> bits per event, so a message nobody wants
+    is dropped after two dict lookups without awaiting anything.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.revision = ROUTER_REVISION
+        self.users = 0
+        self.routes: dict[str, _Route] = {}
+        self._channel_bits: dict[str, dict[int, int]] = {event: {} for event in EVENTS}
+        self._guild_bits: dict[str, dict[int, int]] = {event: {} for event in EVENTS}
+        self.seen = dict.fromkeys(EVENTS, 0)
+        self.dropped = dict.fromkeys(EVENTS, 0)
+        self._owns_command = False
+        bot.add_listener(self.on_message, "on_message")
+        bot.add_listener(self.on_message_without_command, "on_message_without_command")
+        self.claim_command()
+
+    def claim_command(self) -> None:
+        """Register [p]msgrouter unless another router already has; it lives as long as a router does."""
+        if self.bot.get_command(msgrouter.name) is None:
+            self.bot.add_command(msgrouter)
+            self._owns_command = True
+
+    def close(self) -> None:
+        self.bot.remove_listener(self.on_message, "on_message")
+        self.bot.remove_listener(self.on_message_without_command, "on_message_without_command")
+        if self._owns_command:
+            self.bot.remove_command(msgrouter.name)
+            self._owns_command = False
+            for other in all_routers(self.bot):
+                if other is not self:
+                    other.claim_command()
+                    break
+
+    # ---------- registration ----------
+
+    def register(self, name: str, fn: Handler, *, without_command: bool = False) -> None:
+        """Add (or replace, on cog reload) a named handler. It gets nothing until watched/enabled."""
+        self.unregister(name)
+        used = 0
+        for route in self.routes.values():
+            used |= route.bit
+        bit = 1
+        while used & bit:
+            bit <<= 1
+        event = "on_message_without_command" if without_command else "on_message"
+        self.routes[name] = _Route(name, fn, event, bit)
+
+    def unregister(self, name: str) -> None:
+        route = self.routes.pop(name, None)
+        if route is None:
+            return
+        for table in (self._channel_bits[route.event], self._guild_bits[route.event]):
+            for key in [k for k, bits in table.items() if bits & route.bit]:
+                self._clear(table, key, route.bit)
+
+    @staticmethod
+    def _clear(table: dict[int, int], key: int, bit: int) -> None:
+        bits = table.get(key, 0) & ~bit
+        if bits:
+            table[key] = bits
+        else:
+            table.pop(key, None)
+
+    def watch_channel(self, name: str, channel_id: int) -> None:
+        route = self.routes[name]
+        table = self._channel_bits[route.event]
+        table[channel_id] = table.get(channel_id, 0) | route.bit
+
+    def unwatch_channel(self, name: str, channel_id: int) -> None:
+        route = self.routes.get(name)
+        if route is not None:
+            self._clear(self._channel_bits[route.event], channel_id, route.bit)
+
+    def enable_guild(self, name: str, guild_id: int, enabled: bool = True) -> None:
+        route = self.routes[name]
+        table = self._guild_bits[route.event]
+        if enabled:
+            table[guild_id] = table.get(guild_id, 0) | route.bit
+        else:
+            self._clear(table, guild_id, route.bit)
+
+    # ---------- dispatch ----------
+
+    async def _dispatch(self, event: str, message: discord.Message) -> None:
+        self.seen[event] += 1
+        bits = self._channel_bits[event].get(message.channel.id, 0)
+        if message.guild is not None:
+            bits |= self._guild_bits[event].get(message.guild.id, 0)
+        if not bits or message.author.bot:
+            self.dropped[event] += 1
+            return
+        routes = [route for route in self.routes.values() if route.event == event and route.bit & bits]
+        if len(routes) == 1:
+            await routes[0].run(message)
+        else:
+            await asyncio.gather(*(route.run(message) for route in routes))
+
+    async def on_message(self, message: discord.Message) -> None:
+        await self._dispatch("on_message", message)
+
+    async def on_message_without_command(self, message: discord.Message) -> None:
+        await self._dispatch("on_message_without_command", message)
+
+    # ---------- stats ----------
+
+    def stats(self) -> dict:
+        def pct(lat: list[float], p: float) -> float:
+            if not lat:
+                return 0.0
+            return round(lat[min(len(lat) - 1, int(p * len(lat)))] * 1000.0, 2)
+
+        handlers = {}
+        for name, route in self.routes.items():
+            lat = sorted(route.latencies)
+            handlers[name] = {
+                "calls": route.calls,
+                "errors": route.errors,
+                "channels": sum(1 for bits in self._channel_bits[route.event].values() if bits & route.bit),
+                "guilds": sum(1 for bits in self._guild_bits[route.event].values() if bits & route.bit),
+                "avg_ms": round(route.total / route.calls * 1000.0, 2) if route.calls else 0.0,
+                "p99_ms": pct(lat, 0.99),
+                "max_ms": round(route.slowest * 1000.0, 2),
+            }
+        return {"seen": dict(self.seen), "dropped": dict(self.dropped), "handlers": handlers}
+
+
+class RoutedChannels(dict):
+    """
+    {channel id: state} that keeps a router handler watching exactly the channels it
+    holds, so adding a steno session or Uno table is all it takes to start routing.
+    """
+
+    def __init__(self, router: MessageRouter, name: str):
+        super().__init__()
+        self.router = router
+        self.name = name
+
+    def __setitem__(self, channel_id: int, value) -> None:
+        super().__setitem__(channel_id, value)
+        self.router.watch_channel(self.name, channel_id)
+
+    def __delitem__(self, channel_id: int) -> None:
+        super().__delitem__(channel_id)
+        self.router.unwatch_channel(self.name, channel_id)
+
+    def pop(self, channel_id: int, *default):
+        value = super().pop(channel_id, *default)
+        self.router.unwatch_channel(self.name, channel_id)
+        return value
+
+    def clear(self) -> None:
+        for channel_id in list(self):
+            self.router.unwatch_channel(self.name, channel_id)
+        super().clear()
+
+
+def all_routers(bot) -> list:
+    """Every router on the bot; more than one means the cogs ship different copies of this file."""
+    return [value for key, value in vars(bot).items() if key.startswith(_ATTR_PREFIX)]
+
+
+@commands.command(name="msgrouter")
+@commands.is_owner()
+async def msgrouter(ctx: commands.Context):
+    """Show how the shared message listener is spending its time."""
+    lines = []
+    routers = all_routers(ctx.bot)
+    for router in routers:
+        stats = router.stats()
+        if len(routers) > 1:
+            lines.append(f"router {router.revision} ({router.users} cogs)")
+        lines += [
+            f"on_message: {stats['seen']['on_message']} seen, {stats['dropped']['on_message']} dropped",
+            f"on_message_without_command: {stats['seen']['on_message_without_command']} seen, "
+            f"{stats['dropped']['on_message_without_command']} dropped",
+            "",
+        ]
+        for name, h in stats["handlers"].items():
+            lines.append(
+                f"{name}: {h['calls']} calls, {h['errors']} errors, {h['channels']} channels, {h['guilds']} guilds, "
+                f"avg {h['avg_ms']} ms, p99 {h['p99_ms']} ms, max {h['max_ms']} ms"
+            )
+        lines.append("")
+    await ctx.send("```\n" + ("\n".join(lines).strip() or "No routers.") + "\n```")
+
+
+def get_router(bot) -> MessageRouter:
+    """The bot-wide router; each cog that handles messages takes a reference on load."""
+    router = getattr(bot, _BOT_ATTR, None)
+    if router is None:
+        router = MessageRouter(bot)
+        setattr(bot, _BOT_ATTR, router)
+    router.users += 1
+    return router
+
+
+def release_router(bot, *names: str) -> None:
+    """Drop a cog's handlers and its reference; the listeners go with the last one."""
+    router = getattr(bot, _BOT_ATTR, None)
+    if router is None:
+        return
+    for name in names:
+        router.unregister(name)
+    router.users -= 1
+    if router.users <= 0:
+        router.close()
+        delattr(bot, _BOT_ATTR)
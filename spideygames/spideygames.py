@@ -6,25 +6,39 @@ import asyncio
 from discord.ext import commands
 from redbot.core.bot import Red
 from redbot.core import commands, Config
-import wordfreq
-import nltk
-from nltk.corpus import words
+from redbot.core.data_manager import bundled_data_path
 import os
 import re
-from dataclasses import dataclass
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, List, Tuple
 
 from collections import Counter
 
-nltk.download("words")
-
-all_words = words.words()
+from .message_router import RoutedChannels, get_router, release_router
+from .mastermind_engine import MastermindEngine, engine_for
+from .table_renderer import TableRenderer
+from .uno_game import (
+    CPU_CATCH_UNO_CHANCE,
+    CPU_CATCH_UNO_DELAY_RANGE,
+    CPU_SELF_UNO_CHANCE,
+    CPU_SELF_UNO_DELAY_RANGE,
+    CPU_TURN_LIMIT,
+    UnoGame,
+    normalize_notation,
+    parse_move,
+)
+from .word_bank import WordBank
 
 active_games = {}
 
 
+_idioms: tuple[str, ...] | None = None
+
+
 def get_idioms():
     """Scrapes common idioms from this website."""
+    global _idioms
+    if _idioms is not None:
+        return _idioms
     script_dir = os.path.dirname(os.path.abspath(__file__))
     filename = os.path.join(script_dir, "idioms.txt")
     idioms = []
@@ -36,28 +50,8 @@ def get_idioms():
                 idiom = line.split(":")[0]
                 idioms.append(idiom.lower())
 
-    return idioms
-
-def get_filtered_words(difficulty: str):
-    """Filters words based on difficulty using word frequency."""
-    difficulty_settings = {
-        "novice": {"freq": .0001, "min_length": 4, "max_length": 6},
-        "easy": {"freq": 0.00001, "min_length": 4, "max_length": 8},
-        "medium": {"freq": 0.000001, "min_length": 4, "max_length": 10},
-        "hard": {"freq": 0.0000001, "min_length": 6, "max_length": 12},
-        "expert": {"freq": 0.00000001, "min_length": 6, "max_length": 20},
-        "impossible": {"freq": 0.000000001, "min_length": 8, "max_length": None}  # No upper limit
-    }
-
-    settings = difficulty_settings.get(difficulty, difficulty_settings["medium"])
-    min_length, max_length = settings["min_length"], settings["max_length"]
-    frequency_threshold = settings["freq"]
-    return [
-        word.lower() for word in words.words()
-        if wordfreq.word_frequency(word, "en") >= frequency_threshold
-        and len(word) >= min_length
-        and (max_length is None or len(word) <= max_length)
-    ]
+    _idioms = tuple(idioms)
+    return _idioms
 
 def get_timeout(word: str):
     """Calculates timeout based on word length."""
@@ -65,717 +59,9 @@ def get_timeout(word: str):
     extra_time_per_letter = 5  # Additional seconds per letter after 6 letters
     return min(120, base_time + max(0, (len(word) - 6) * extra_time_per_letter))  # Cap at 120 sec
 
-COLOR_NAMES = {
-    "R": "Red",
-    "G": "Green",
-    "B": "Blue",
-    "Y": "Yellow",
-    "W": "Wild",
-}
-
-COLOR_EMOJIS = {
-    "R": "🔴",
-    "G": "🟢",
-    "B": "🔵",
-    "Y": "🟡",
-    "W": "🌈",
-}
-
-COLOR_WORDS = {
-    "RED": "R",
-    "GREEN": "G",
-    "BLUE": "B",
-    "YELLOW": "Y",
-}
-
-ACTION_ALIASES = {
-    "S": "SKIP",
-    "SKIP": "SKIP",
-    "REV": "REVERSE",
-    "REVERSE": "REVERSE",
-    "+2": "DRAW2",
-    "D2": "DRAW2",
-    "DRAW2": "DRAW2",
-    "DRAWTWO": "DRAW2",
-    "DRAW_TWO": "DRAW2",
-}
-
-VALUE_LABELS = {
-    "SKIP": "Skip",
-    "REVERSE": "Reverse",
-    "DRAW2": "+2",
-    "WILD": "Wild",
-    "WILD4": "+4",
-}
-
-VALUE_SORT = {
-    "0": 0,
-    "1": 1,
-    "2": 2,
-    "3": 3,
-    "4": 4,
-    "5": 5,
-    "6": 6,
-    "7": 7,
-    "8": 8,
-    "9": 9,
-    "SKIP": 10,
-    "REVERSE": 11,
-    "DRAW2": 12,
-    "WILD": 13,
-    "WILD4": 14,
-}
-
-UNO_PENALTY_CARDS = 2
-CPU_SELF_UNO_CHANCE = 0.90
-CPU_CATCH_UNO_CHANCE = 0.60
-CPU_SELF_UNO_DELAY_RANGE = (0.8, 1.3)
-CPU_CATCH_UNO_DELAY_RANGE = (1.2, 2.0)
-
-@dataclass(frozen=True)
-class UnoCard:
-    color: str
-    value: str
-
-    @property
-    def is_wild(self) -> bool:
-        return self.color == "W"
-
-    @property
-    def is_draw_two(self) -> bool:
-        return self.value == "DRAW2"
-
-    @property
-    def is_wild_draw_four(self) -> bool:
-        return self.value == "WILD4"
-
-    def short(self) -> str:
-        emoji = COLOR_EMOJIS.get(self.color, "")
-        label = VALUE_LABELS.get(self.value, self.value)
-        if self.color == "W":
-            return f"{emoji}{label}"
-        return f"{emoji}{label}"
-
-    def long(self) -> str:
-        if self.color == "W":
-            return VALUE_LABELS.get(self.value, self.value)
-        return f"{COLOR_NAMES[self.color]} {VALUE_LABELS.get(self.value, self.value)}"
-
-
-def build_deck() -> List[UnoCard]:
-    deck: List[UnoCard] = []
-    for color in ["R", "G", "B", "Y"]:
-        deck.append(UnoCard(color, "0"))
-        for value in ["1", "2", "3", "4", "5", "6", "7", "8", "9"]:
-            deck.append(UnoCard(color, value))
-            deck.append(UnoCard(color, value))
-        for action in ["SKIP", "REVERSE", "DRAW2"]:
-            deck.append(UnoCard(color, action))
-            deck.append(UnoCard(color, action))
-    for _ in range(4):
-        deck.append(UnoCard("W", "WILD"))
-        deck.append(UnoCard("W", "WILD4"))
-    random.shuffle(deck)
-    return deck
-
-@dataclass
-class ParsedMove:
-    exact_color: Optional[str] = None
-    exact_value: Optional[str] = None
-    broad_color: Optional[str] = None
-    broad_value: Optional[str] = None
-    wild_value: Optional[str] = None
-    chosen_color: Optional[str] = None
-
-
-class UnoGame:
-    def __init__(self, channel_id: int, host_id: int):
-        self.channel_id = channel_id
-        self.host_id = host_id
-        self.players: List[int] = [host_id]
-        self.hands: Dict[int, List[UnoCard]] = {}
-        self.deck: List[UnoCard] = []
-        self.discard: List[UnoCard] = []
-        self.started = False
-        self.current_index = 0
-        self.direction = 1
-        self.current_color: Optional[str] = None
-        self.pending_draw_amount = 0
-        self.pending_draw_type: Optional[str] = None
-        self.last_action = "Game created. Waiting for players."
-        self.table_message_id: Optional[int] = None
-        self.next_cpu_number = 1
-        self.pending_uno_player: Optional[int] = None
-
-    def add_player(self, user_id: int) -> None:
-        if self.started:
-            raise ValueError("This game has already started.")
-        if user_id in self.players:
-            raise ValueError("You are already in this game.")
-        if len(self.players) >= 10:
-            raise ValueError("Uno supports up to 10 players.")
-        self.players.append(user_id)
-
-    def remove_player(self, user_id: int) -> None:
-        if self.started:
-            raise ValueError("You cannot leave after the game has started.")
-        if user_id not in self.players:
-            raise ValueError("You are not in this game.")
-        self.players.remove(user_id)
-        if self.host_id == user_id and self.players:
-            self.host_id = self.players[0]
-    
-    def is_cpu(self, player_id: int) -> bool:
-        return player_id < 0
-
-    def player_display(self, player_id: int) -> str:
-        if self.is_cpu(player_id):
-            return f"CPU {abs(player_id)}"
-        return f"<@{player_id}>"
-    
-    def pending_uno_is_valid(self) -> bool:
-        return (
-            self.pending_uno_player in self.players
-            and len(self.hands.get(self.pending_uno_player, [])) == 1
-        )
-
-    def clear_pending_uno(self) -> None:
-        self.pending_uno_player = None
-
-    def begin_player_action(self, actor_id: int) -> None:
-        """
-        Once the next player begins acting, the chance to catch the previous UNO failure expires.
-        """
-        if self.pending_uno_player is not None and self.pending_uno_player != actor_id:
-            self.clear_pending_uno()
-
-    def call_uno(self, caller_id: int) -> Tuple[bool, str]:
-        """
-        If the pending player says UNO, they are safe.
-        If someone else in the game says UNO first, the pending player draws 2.
-        """
-        if caller_id not in self.players:
-            return False, "You are not in this Uno game."
-
-        if not self.pending_uno_is_valid():
-            self.clear_pending_uno()
-            return False, "No one currently needs to say UNO."
-
-        target_id = self.pending_uno_player
-        caller_name = self.player_display(caller_id)
-        target_name = self.player_display(target_id)
-
-        if caller_id == target_id:
-            self.clear_pending_uno()
-            self.last_action = f"{target_name} said UNO!"
-            return True, f"{target_name} said UNO!"
-
-        self.draw_cards(target_id, UNO_PENALTY_CARDS)
-        self.clear_pending_uno()
-        self.last_action = (
-            f"{caller_name} caught {target_name} failing to say UNO! "
-            f"{target_name} drew {UNO_PENALTY_CARDS} cards."
-        )
-        return True, self.last_action
-
-    def add_cpu(self) -> int:
-        if self.started:
-            raise ValueError("You cannot add a CPU after the game has started.")
-        if len(self.players) >= 10:
-            raise ValueError("Uno supports up to 10 players total.")
-
-        cpu_id = -self.next_cpu_number
-        self.next_cpu_number += 1
-        self.players.append(cpu_id)
-        self.last_action = f"{self.player_display(cpu_id)} joined the game."
-        return cpu_id
-
-    def remove_cpu(self) -> int:
-        if self.started:
-            raise ValueError("You cannot remove a CPU after the game has started.")
-
-        cpu_players = [pid for pid in self.players if self.is_cpu(pid)]
-
-        if not cpu_players:
-            raise ValueError("There are no CPU players to remove.")
-
-        cpu_id = cpu_players[-1]
-        self.players.remove(cpu_id)
-        self.last_action = f"{self.player_display(cpu_id)} left the lobby."
-        return cpu_id
-
-    def choose_cpu_card(self, player_id: int) -> Optional[UnoCard]:
-        legal = self.legal_cards(player_id)
-
-        if not legal:
-            return None
-
-        def cpu_priority(card: UnoCard):
-            # Basic idiot-brain CPU:
-            # 1. Prefer non-wilds.
-            # 2. Prefer action cards before numbers.
-            # 3. Use wilds last.
-            is_wild = 1 if card.color == "W" else 0
-            action_priority = {
-                "DRAW2": 0,
-                "SKIP": 1,
-                "REVERSE": 2,
-                "9": 3,
-                "8": 4,
-                "7": 5,
-                "6": 6,
-                "5": 7,
-                "4": 8,
-                "3": 9,
-                "2": 10,
-                "1": 11,
-                "0": 12,
-                "WILD": 13,
-                "WILD4": 14,
-            }
-            return (is_wild, action_priority.get(card.value, 99), card.color)
-
-        legal.sort(key=cpu_priority)
-        return legal[0]
-
-    def play_cpu_turn(self) -> Tuple[bool, str]:
-        player_id = self.current_player_id
-
-        if not self.is_cpu(player_id):
-            raise ValueError("It is not a CPU's turn.")
-
-        cpu_name = self.player_display(player_id)
-        card = self.choose_cpu_card(player_id)
-
-        if card:
-            chosen_color = None
-
-            if card.color == "W":
-                chosen_color = self.choose_default_wild_color(player_id)
-
-            won, message = self.play_card(player_id, card, chosen_color)
-            return won, message
-
-        won, private_msg = self.draw_until_playable(player_id)
-        self.last_action = f"{cpu_name} drew until playable. {self.last_action}"
-        return won, private_msg
-
-    def start(self) -> None:
-        if self.started:
-            raise ValueError("This game has already started.")
-        if len(self.players) < 2:
-            raise ValueError("You need at least 2 players to start Uno.")
-
-        self.deck = build_deck()
-        self.hands = {pid: [] for pid in self.players}
-
-        for _ in range(7):
-            for pid in self.players:
-                self.hands[pid].append(self._draw_one())
-
-        starter_index = next(
-            (i for i, card in enumerate(self.deck) if card.color != "W" and card.value.isdigit()),
-            None,
-        )
-
-        if starter_index is None:
-            raise ValueError("Could not find a valid starter card. Try again.")
-
-        starter = self.deck.pop(starter_index)
-        self.discard.append(starter)
-        self.current_color = starter.color
-        self.started = True
-        self.current_index = 0
-        self.direction = 1
-        self.last_action = f"The starting card is {starter.short()}."
-
-    @property
-    def current_player_id(self) -> int:
-        return self.players[self.current_index]
-
-    @property
-    def top_card(self) -> UnoCard:
-        return self.discard[-1]
-
-    def next_index_from(self, index: int, steps: int = 1) -> int:
-        return (index + self.direction * steps) % len(self.players)
-
-    def _draw_one(self) -> UnoCard:
-        if not self.deck:
-            self._reshuffle_discard_into_deck()
-        if not self.deck:
-            raise ValueError("No cards are available to draw.")
-        return self.deck.pop()
-
-    def _reshuffle_discard_into_deck(self) -> None:
-        if len(self.discard) <= 1:
-            return
-
-        top = self.discard[-1]
-        rest = self.discard[:-1]
-        random.shuffle(rest)
-        self.deck = rest
-        self.discard = [top]
-
-    def sort_hand(self, player_id: int) -> None:
-        color_order = {"R": 0, "G": 1, "B": 2, "Y": 3, "W": 4}
-        self.hands[player_id].sort(
-            key=lambda c: (color_order.get(c.color, 9), VALUE_SORT.get(c.value, 99))
-        )
-
-    def draw_cards(self, player_id: int, amount: int) -> List[UnoCard]:
-        drawn = []
-        for _ in range(amount):
-            drawn.append(self._draw_one())
-        self.hands[player_id].extend(drawn)
-        self.sort_hand(player_id)
-        return drawn
-
-    def is_legal(self, card: UnoCard) -> bool:
-        if self.pending_draw_amount > 0:
-            return card.value == "DRAW2"
-
-        if card.color == "W":
-            return True
-
-        return card.color == self.current_color or card.value == self.top_card.value
-
-    def legal_cards(self, player_id: int) -> List[UnoCard]:
-        return [card for card in self.hands[player_id] if self.is_legal(card)]
-
-    def choose_default_wild_color(self, player_id: int) -> str:
-        counts = {"R": 0, "G": 0, "B": 0, "Y": 0}
-        for card in self.hands[player_id]:
-            if card.color in counts:
-                counts[card.color] += 1
-        return max(counts, key=counts.get)
-
-    def find_card(self, player_id: int, parsed: ParsedMove) -> Tuple[Optional[UnoCard], Optional[str]]:
-        hand = self.hands[player_id]
-        legal = self.legal_cards(player_id)
-
-        if parsed.wild_value:
-            candidates = [card for card in legal if card.value == parsed.wild_value]
-
-        elif parsed.exact_color and parsed.exact_value:
-            owned = [
-                card for card in hand
-                if card.color == parsed.exact_color and card.value == parsed.exact_value
-            ]
-
-            if not owned:
-                return None, "You do not have that card."
-
-            candidates = [card for card in owned if self.is_legal(card)]
-
-        elif parsed.broad_color:
-            candidates = [card for card in legal if card.color == parsed.broad_color]
-
-        elif parsed.broad_value:
-            candidates = [card for card in legal if card.value == parsed.broad_value]
-
-        else:
-            return None, "I could not understand that card notation."
-
-        if not candidates:
-            return None, "That move is not legal right now."
-
-        candidates.sort(key=lambda c: (VALUE_SORT.get(c.value, 99), c.color))
-        return candidates[0], None
-
-    def play_card(self, player_id: int, card: UnoCard, chosen_color: Optional[str]) -> Tuple[bool, str]:
-        if player_id != self.current_player_id:
-            raise ValueError("It is not your turn.")
-        if card not in self.hands[player_id]:
-            raise ValueError("You do not have that card.")
-        if not self.is_legal(card):
-            raise ValueError("That card is not legal right now.")
-
-        self.begin_player_action(player_id)
-
-        player_name = self.player_display(player_id)
-
-        self.hands[player_id].remove(card)
-        self.discard.append(card)
-
-        if card.color == "W":
-            if chosen_color not in {"R", "G", "B", "Y"}:
-                chosen_color = self.choose_default_wild_color(player_id)
-            self.current_color = chosen_color
-        else:
-            self.current_color = card.color
-
-        if not self.hands[player_id]:
-            self.clear_pending_uno()
-            self.last_action = f"{player_name} played {card.short()} and won the game!"
-            return True, self.last_action
-
-        uno_note = ""
-        if len(self.hands[player_id]) == 1:
-            self.pending_uno_player = player_id
-
-        play_index = self.current_index
-
-        if card.value == "DRAW2":
-            self.pending_draw_amount += 2
-            self.pending_draw_type = "DRAW2"
-            self.current_index = self.next_index_from(play_index, 1)
-            self.last_action = (
-                f"{player_name} played {card.short()}."
-                f"{uno_note} Draw stack is now +{self.pending_draw_amount}."
-            )
-
-        elif card.value == "WILD4":
-            victim_index = self.next_index_from(play_index, 1)
-            victim_id = self.players[victim_index]
-            victim_name = self.player_display(victim_id)
-
-            self.draw_cards(victim_id, 4)
-            self.current_index = self.next_index_from(play_index, 2)
-            self.last_action = (
-                f"{player_name} played {card.short()} and chose {COLOR_NAMES[self.current_color]}."
-                f"{uno_note} {victim_name} drew 4 and was skipped."
-            )
-
-        elif card.value == "SKIP":
-            skipped_id = self.players[self.next_index_from(play_index, 1)]
-            skipped_name = self.player_display(skipped_id)
-
-            self.current_index = self.next_index_from(play_index, 2)
-            self.last_action = f"{player_name} played {card.short()}.{uno_note} {skipped_name} was skipped."
-
-        elif card.value == "REVERSE":
-            self.direction *= -1
-
-            if len(self.players) == 2:
-                self.current_index = play_index
-                self.last_action = (
-                    f"{player_name} played {card.short()}."
-                    f"{uno_note} Reverse acts like a skip with 2 players."
-                )
-            else:
-                self.current_index = self.next_index_from(play_index, 1)
-                self.last_action = f"{player_name} played {card.short()}.{uno_note} Turn order reversed."
-
-        else:
-            self.current_index = self.next_index_from(play_index, 1)
-
-            if card.color == "W":
-                self.last_action = (
-                    f"{player_name} played {card.short()} and chose "
-                    f"{COLOR_NAMES[self.current_color]}.{uno_note}"
-                )
-            else:
-                self.last_action = f"{player_name} played {card.short()}.{uno_note}"
-
-        return False, self.last_action
-
-    def take_draw_action(self, player_id: int) -> str:
-        if player_id != self.current_player_id:
-            raise ValueError("It is not your turn.")
-
-        player_name = self.player_display(player_id)
-
-        if self.pending_draw_amount > 0:
-            amount = self.pending_draw_amount
-            self.draw_cards(player_id, amount)
-            self.pending_draw_amount = 0
-            self.pending_draw_type = None
-            self.current_index = self.next_index_from(self.current_index, 1)
-            self.last_action = f"{player_name} drew {amount} cards from the +2 stack and was skipped."
-            return self.last_action
-
-        drawn = self.draw_cards(player_id, 1)[0]
-        self.current_index = self.next_index_from(self.current_index, 1)
-        self.last_action = f"{player_name} drew 1 card and passed."
-        return f"You drew {drawn.short()}. Turn passed."
-
-    def draw_until_playable(self, player_id: int) -> Tuple[bool, str]:
-        if player_id != self.current_player_id:
-            raise ValueError("It is not your turn.")
-        self.begin_player_action(player_id)
-        
-        if self.pending_draw_amount > 0:
-            amount = self.pending_draw_amount
-            self.draw_cards(player_id, amount)
-            self.pending_draw_amount = 0
-            self.pending_draw_type = None
-            self.current_index = self.next_index_from(self.current_index, 1)
-            player_name = self.player_display(player_id)
-            self.last_action = f"{player_name} drew {amount} cards from the +2 stack and was skipped."
-            return False, f"You drew {amount} cards from the +2 stack. Your turn was skipped."
-
-        drawn_cards: List[UnoCard] = []
-        playable_card: Optional[UnoCard] = None
-
-        while playable_card is None:
-            drawn = self.draw_cards(player_id, 1)[0]
-            drawn_cards.append(drawn)
-
-            if self.is_legal(drawn):
-                playable_card = drawn
-
-        chosen_color = None
-        if playable_card.color == "W":
-            chosen_color = self.choose_default_wild_color(player_id)
-
-        won, _message = self.play_card(player_id, playable_card, chosen_color)
-
-        if len(drawn_cards) == 1:
-            private_msg = f"You drew {playable_card.short()} and automatically played it."
-        else:
-            drawn_text = ", ".join(card.short() for card in drawn_cards)
-            private_msg = (
-                f"You drew {len(drawn_cards)} cards until you found a playable card: {drawn_text}\n"
-                f"Automatically played {playable_card.short()}."
-            )
-
-        return won, private_msg
-    
-    def hand_text(self, player_id: int) -> str:
-        hand = self.hands.get(player_id, [])
-
-        if not hand:
-            return "Your hand is empty."
-
-        groups = {"R": [], "G": [], "B": [], "Y": [], "W": []}
-
-        for card in hand:
-            groups[card.color].append(card.short())
-
-        lines = []
-
-        for color in ["R", "G", "B", "Y", "W"]:
-            if groups[color]:
-                lines.append(f"**{COLOR_NAMES[color]}:** " + ", ".join(groups[color]))
-
-        lines.append("")
-        lines.append("Examples: `G1`, `R7`, `B+2`, `YS`, `GREV`, `W:G`, `W4:B`, `G`, `1`, `+2`, `S`, `REV`, `DRAW`.")
-        lines.append("Note: `R` means Red. Use `REV` for Reverse.")
-        lines.append("If you have 1 card left, click **Say UNO** or type `uno` in chat.")
-
-        return "\n".join(lines)
-
-    def status_embed(self) -> discord.Embed:
-        embed = discord.Embed(title="Uno", color=discord.Color.blurple())
-
-        if not self.started:
-            names = "\n".join(self.player_display(pid) for pid in self.players)
-            embed.description = self.last_action
-            embed.add_field(name="Players", value=names or "None", inline=False)
-            return embed
-
-        direction = "clockwise" if self.direction == 1 else "counter-clockwise"
-        current_color = COLOR_NAMES.get(self.current_color or "", "Unknown")
-
-        embed.description = self.last_action
-        embed.add_field(
-            name="Top Card",
-            value=f"{self.top_card.short()} | Current color: **{current_color}**",
-            inline=False,
-        )
-        embed.add_field(name="Turn", value=self.player_display(self.current_player_id), inline=True)
-        embed.add_field(name="Direction", value=direction, inline=True)
-
-        if self.pending_draw_amount > 0:
-            embed.add_field(
-                name="Draw Stack",
-                value=f"+{self.pending_draw_amount} — play a +2 or draw.",
-                inline=False,
-            )
-
-        player_lines = []
-
-        for idx, pid in enumerate(self.players):
-            marker = "➡️ " if idx == self.current_index else ""
-            count = len(self.hands.get(pid, []))
-            plural = "card" if count == 1 else "cards"
-            player_lines.append(f"{marker}{self.player_display(pid)} — {count} {plural}")
-
-        embed.add_field(name="Players", value="\n".join(player_lines), inline=False)
-        return embed
-
-
-def normalize_notation(raw: str) -> str:
-    text = raw.upper().strip()
-    text = text.replace(" ", "")
-    text = text.replace("-", "")
-    text = text.replace("_", "")
-    text = text.replace("WILDDRAWFOUR", "W4")
-    text = text.replace("WILDDRAW4", "W4")
-    text = text.replace("DRAWFOUR", "W4")
-    text = text.replace("DRAW4", "W4")
-    text = text.replace("WILD4", "W4")
-    text = text.replace("+FOUR", "+4")
-    return text
-
-
-def parse_color_token(token: str) -> Optional[str]:
-    if token in {"R", "G", "B", "Y"}:
-        return token
-    return COLOR_WORDS.get(token)
-
-
-def parse_value_token(token: str) -> Optional[str]:
-    if token.isdigit() and token in {str(i) for i in range(10)}:
-        return token
-    return ACTION_ALIASES.get(token)
-
-
-def parse_move(raw: str) -> ParsedMove:
-    text = normalize_notation(raw)
-
-    if text in {"DRAW", "D", "PASS"}:
-        return ParsedMove()
-
-    colon_match = re.fullmatch(r"(W|WC|WILD|W4|\+4):?([RGBY]|RED|GREEN|BLUE|YELLOW)", text)
-    if colon_match:
-        wild_part, color_part = colon_match.groups()
-        chosen = parse_color_token(color_part)
-        wild_value = "WILD4" if wild_part in {"W4", "+4"} else "WILD"
-        return ParsedMove(wild_value=wild_value, chosen_color=chosen)
-
-    word_wild_match = re.fullmatch(r"(WILD|WC|W)(RED|GREEN|BLUE|YELLOW)", text)
-    if word_wild_match:
-        chosen = parse_color_token(word_wild_match.group(2))
-        return ParsedMove(wild_value="WILD", chosen_color=chosen)
-
-    compact_wild_match = re.fullmatch(r"(W4|\+4|WILD4)([RGBY])", text)
-    if compact_wild_match:
-        chosen = parse_color_token(compact_wild_match.group(2))
-        return ParsedMove(wild_value="WILD4", chosen_color=chosen)
-
-    if text in {"W", "WC", "WILD"}:
-        return ParsedMove(wild_value="WILD")
-
-    if text in {"W4", "+4"}:
-        return ParsedMove(wild_value="WILD4")
-
-    color = parse_color_token(text)
-    if color:
-        return ParsedMove(broad_color=color)
-
-    value = parse_value_token(text)
-    if value:
-        return ParsedMove(broad_value=value)
-
-    for color_word, color_letter in sorted(COLOR_WORDS.items(), key=lambda item: len(item[0]), reverse=True):
-        if text.startswith(color_word):
-            value_part = text[len(color_word):]
-            value = parse_value_token(value_part)
-
-            if value:
-                return ParsedMove(exact_color=color_letter, exact_value=value)
-
-    if text and text[0] in {"R", "G", "B", "Y"}:
-        color_letter = text[0]
-        value_part = text[1:]
-        value = parse_value_token(value_part)
-
-        if value:
-            return ParsedMove(exact_color=color_letter, exact_value=value)
-
-    return ParsedMove()
+# Seconds of changes folded into one edit of the table message.
+UNO_TABLE_DELAY = 1.5
+MASTERMIND_TABLE_DELAY = 0.5
 
 class UnoPlayModal(discord.ui.Modal):
     def __init__(self, cog, channel_id: int):
@@ -883,6 +169,7 @@ class UnoLobbyView(discord.ui.View):
 
         if not game.players:
             self.cog.uno_games.pop(game.channel_id, None)
+            self.cog.tables.detach(("uno", game.channel_id))
             await interaction.response.edit_message(content="Uno lobby closed.", embed=None, view=None)
             return
 
@@ -925,6 +212,7 @@ class UnoLobbyView(discord.ui.View):
             return
 
         self.cog.uno_games.pop(game.channel_id, None)
+        self.cog.tables.detach(("uno", game.channel_id))
         await interaction.response.edit_message(content="Uno lobby cancelled.", embed=None, view=None)
 
     @discord.ui.button(label="Add CPU", style=discord.ButtonStyle.secondary, row=1)
@@ -1084,6 +372,7 @@ class UnoGameView(discord.ui.View):
             return
 
         self.cog.uno_games.pop(game.channel_id, None)
+        self.cog.tables.detach(("uno", game.channel_id))
         await interaction.response.edit_message(content="Uno game ended.", embed=None, view=None)
 
 
@@ -1141,6 +430,8 @@ class MastermindGame:
         self.message_id: Optional[int] = None
         self.finished = False
         self.result_text = "Choose colors to build your guess."
+        self.hints_used = 0
+        self.solver_guesses: Optional[int] = None
 
     def player_display(self) -> str:
         return f"<@{self.player_id}>"
@@ -1219,6 +510,28 @@ class MastermindGame:
         self.result_text = f"Guess submitted: ✅ {exact} exact, 🔁 {misplaced} misplaced."
         return None
 
+    def engine(self) -> MastermindEngine:
+        return engine_for(self.code_length, len(self.available_colors), self.allow_duplicates)
+
+    def _row(self, engine: MastermindEngine, colors: List[str]) -> int:
+        return engine.index([self.available_colors.index(color) for color in colors])
+
+    def hint(self, guesses: List[Tuple[List[str], int, int]]) -> Tuple[List[str], int]:
+        """
+        The solver's next guess after `guesses` and how many codes are still possible.
+        Run it in a thread on a copy of self.guesses taken on the loop; it changes nothing.
+        """
+        engine = self.engine()
+        history = [(self._row(engine, guess), engine.feedback(exact, misplaced)) for guess, exact, misplaced in guesses]
+        candidates = engine.candidates(history)
+        best = engine.best_guess(candidates)
+        return [self.available_colors[d] for d in engine.code(best)], len(candidates)
+
+    def solve(self) -> int:
+        """How many guesses the solver needs for this code. Run it in a thread; the caller stores it."""
+        engine = self.engine()
+        return len(engine.solve(self._row(engine, self.secret_code)))
+
     def current_guess_text(self) -> str:
         blanks_needed = self.code_length - len(self.current_guess)
         return " ".join(self.current_guess + ["⬜"] * blanks_needed)
@@ -1260,6 +573,12 @@ class MastermindGame:
             value=self.history_text(),
             inline=False,
         )
+        if self.finished and self.solver_guesses is not None:
+            embed.add_field(
+                name="Optimal Guesses",
+                value=f"The solver needs {self.solver_guesses}. Hints used: {self.hints_used}.",
+                inline=False,
+            )
         embed.set_footer(text="✅ = correct color in the correct spot | 🔁 = correct color in the wrong spot")
 
         return embed
@@ -1288,7 +607,7 @@ class MastermindColorButton(discord.ui.Button):
             await interaction.response.send_message(error, ephemeral=True)
             return
 
-        await interaction.response.edit_message(embed=game.status_embed(), view=MastermindView(view.cog, game.channel_id))
+        await view.cog._answer_mastermind(interaction, game)
 
 
 class MastermindView(discord.ui.View):
@@ -1334,7 +653,7 @@ class MastermindBackspaceButton(discord.ui.Button):
             await interaction.response.send_message(error, ephemeral=True)
             return
 
-        await interaction.response.edit_message(embed=game.status_embed(), view=MastermindView(view.cog, game.channel_id))
+        await view.cog._answer_mastermind(interaction, game)
 
 
 class MastermindClearButton(discord.ui.Button):
@@ -1359,7 +678,7 @@ class MastermindClearButton(discord.ui.Button):
             await interaction.response.send_message(error, ephemeral=True)
             return
 
-        await interaction.response.edit_message(embed=game.status_embed(), view=MastermindView(view.cog, game.channel_id))
+        await view.cog._answer_mastermind(interaction, game)
 
 
 class MastermindSubmitButton(discord.ui.Button):
@@ -1386,10 +705,12 @@ class MastermindSubmitButton(discord.ui.Button):
 
         if game.finished:
             view.cog.mastermind_games.pop(game.channel_id, None)
+            view.cog.tables.detach(("mastermind", game.channel_id))
             await interaction.response.edit_message(embed=game.status_embed(), view=None)
+            await view.cog._add_mastermind_solver_stat(interaction, game)
             return
 
-        await interaction.response.edit_message(embed=game.status_embed(), view=MastermindView(view.cog, game.channel_id))
+        await view.cog._answer_mastermind(interaction, game)
 
 
 class MastermindEndButton(discord.ui.Button):
@@ -1412,13 +733,16 @@ class MastermindEndButton(discord.ui.Button):
             return
 
         view.cog.mastermind_games.pop(game.channel_id, None)
+        view.cog.tables.detach(("mastermind", game.channel_id))
         await interaction.response.edit_message(content="Mastermind game ended.", embed=None, view=None)
 
 class SpideyGames(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.active_games = {}
-        self.uno_games = {}
+        self.router = get_router(bot)
+        self.router.register("uno", self.handle_uno_message)
+        self.uno_games = RoutedChannels(self.router, "uno")
         self.mastermind_games = {}
         self.config = Config.get_conf(self, identifier=13904817238971)
         self.config.register_member(
@@ -1432,6 +756,25 @@ class SpideyGames(commands.Cog):
             phrase_toggle = False
         )
         self.config.register_guild(difficulty="medium")
+        self.word_bank: WordBank | None = None
+        self._word_bank_lock = asyncio.Lock()
+        self.tables = TableRenderer()
+
+    def cog_unload(self):
+        release_router(self.bot, "uno")
+        self.tables.shutdown()
+        if self.word_bank is not None:
+            self.word_bank.close()
+
+    async def get_word_bank(self) -> WordBank:
+        """The anagram word bank (the prebuilt data/words.bin shipped with the cog), opened on first use."""
+        async with self._word_bank_lock:
+            if self.word_bank is None:
+                self.word_bank = await asyncio.to_thread(self._open_word_bank)
+        return self.word_bank
+
+    def _open_word_bank(self) -> WordBank:
+        return WordBank(str(bundled_data_path(self) / "words.bin"))
     
     @commands.group(name="spideygameset", aliases=["sgs"])
     async def spideygameset(self, ctx: commands.Context):
@@ -1461,8 +804,13 @@ class SpideyGames(commands.Cog):
             scrambled = await self.scramble_phrase(base)
         else:
             player_difficulty = await self.config.member(ctx.author).difficulty()
-            word_list = get_filtered_words(player_difficulty)
-            base = random.choice(word_list)
+            try:
+                word_bank = await self.get_word_bank()
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Word bank load error: {e}")
+                await ctx.send("The anagram word list is missing or damaged. The bot owner should reinstall or update this cog.")
+                return
+            base = word_bank.choice(player_difficulty)
             scrambled = await self.scrambler(base)
 
         self.active_games[ctx.channel.id] = {"word": base, "hint_level": 0}
@@ -1669,20 +1017,22 @@ class SpideyGames(commands.Cog):
     def _uno_view_for(self, game: UnoGame) -> discord.ui.View:
         return UnoGameView(self) if game.started else UnoLobbyView(self)
 
-    async def _refresh_uno_table(self, game: UnoGame):
-        """Edits the original Uno table message instead of spamming a new embed."""
-        channel = self.bot.get_channel(game.channel_id)
-
-        if channel is None or game.table_message_id is None:
-            return False
+    def _uno_table(self, game: UnoGame) -> dict:
+        return {"embed": game.status_embed(), "view": self._uno_view_for(game)}
 
-        try:
-            message = await channel.fetch_message(game.table_message_id)
-        except (discord.NotFound, discord.Forbidden, discord.HTTPException):
-            return False
+    def _attach_uno_table(self, game: UnoGame, message: discord.Message):
+        game.table_message_id = message.id
+        self.tables.attach(("uno", game.channel_id), message.channel, message.id, lambda: self._uno_table(game), UNO_TABLE_DELAY)
 
-        await message.edit(embed=game.status_embed(), view=self._uno_view_for(game))
-        return True
+    async def _refresh_uno_table(self, game: UnoGame):
+        """Queues an edit of the original Uno table message instead of spamming a new embed."""
+        return self.tables.schedule(("uno", game.channel_id))
+
+    async def _show_uno_table(self, ctx: commands.Context, game: UnoGame):
+        """Edits the Uno table now, or posts a new one if it was deleted (or never posted)."""
+        if not await self.tables.flush(("uno", game.channel_id)):
+            message = await ctx.send(**self._uno_table(game))
+            self._attach_uno_table(game, message)
     
     async def _handle_cpu_uno_window(self, game: UnoGame):
         """
@@ -1732,7 +1082,7 @@ class SpideyGames(commands.Cog):
         await self._handle_cpu_uno_window(game)
 
         while game.channel_id in self.uno_games and game.started and game.is_cpu(game.current_player_id):
-            if turns_processed >= 30:
+            if turns_processed >= CPU_TURN_LIMIT:
                 game.last_action = "CPU safety stop triggered. Something got weird, so I stopped auto-playing."
                 await self._refresh_uno_table(game)
                 return False
@@ -1767,24 +1117,46 @@ class SpideyGames(commands.Cog):
 
     async def _close_uno_table(self, game: UnoGame):
         """Leaves the final game state visible but removes the buttons."""
-        channel = self.bot.get_channel(game.channel_id)
-
-        if channel is None or game.table_message_id is None:
-            return False
+        return await self.tables.close(("uno", game.channel_id), lambda: {"embed": game.status_embed(), "view": None})
 
-        try:
-            message = await channel.fetch_message(game.table_message_id)
-        except (discord.NotFound, discord.Forbidden, discord.HTTPException):
-            return False
+    def _mastermind_table(self, game: MastermindGame) -> dict:
+        return {"embed": game.status_embed(), "view": MastermindView(self, game.channel_id)}
 
-        await message.edit(embed=game.status_embed(), view=None)
-        return True
-    
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        if message.author.bot:
+    async def _answer_mastermind(self, interaction: discord.Interaction, game: MastermindGame):
+        """
+        Answers a board click with the board itself, unless an edit went out moments
+        ago; clicks in that window are folded into one queued edit.
+        """
+        key = ("mastermind", game.channel_id)
+        if key in self.tables and not self.tables.idle(key):
+            self.tables.schedule(key)
+            await interaction.response.defer()
             return
+        fields = self._mastermind_table(game)
+        await interaction.response.edit_message(**fields)
+        self.tables.mark_shown(key, fields)
 
+    async def _add_mastermind_solver_stat(self, interaction: discord.Interaction, game: MastermindGame):
+        """Adds the solver's guess count to a finished board."""
+        try:
+            game.solver_guesses = await asyncio.to_thread(game.solve)
+            await interaction.edit_original_response(embed=game.status_embed())
+        except (ValueError, discord.HTTPException) as e:
+            print(f"Mastermind solver stat error: {e}")
+
+    @commands.command(name="tablestats")
+    @commands.is_owner()
+    async def tablestats(self, ctx: commands.Context):
+        """Show how often game table messages are being edited."""
+        st = self.tables.stats()
+        await ctx.send(
+            f"```\n{st['tables']} tables tracked\n"
+            f"{st['edits']} edits ({st['edits_per_min']}/min), {st['coalesced']} changes coalesced, "
+            f"{st['unchanged']} skipped as unchanged, {st['failed']} failed\n```"
+        )
+    
+    async def handle_uno_message(self, message: discord.Message):
+        """Routed here for messages in channels with an Uno game, to catch players calling Uno."""
         if not message.guild:
             return
 
@@ -1818,13 +1190,13 @@ class SpideyGames(commands.Cog):
             await ctx.send("No Uno game is running here. Use `[p]uno create` to start a lobby.")
             return
 
-        refreshed = await self._refresh_uno_table(game)
+        refreshed = await self.tables.flush(("uno", game.channel_id))
 
         if refreshed:
             await ctx.send("Uno table refreshed.", delete_after=5)
         else:
-            message = await ctx.send(embed=game.status_embed(), view=self._uno_view_for(game))
-            game.table_message_id = message.id
+            message = await ctx.send(**self._uno_table(game))
+            self._attach_uno_table(game, message)
 
     @uno.command(name="create", aliases=["c"])
     async def uno_create(self, ctx: commands.Context):
@@ -1835,8 +1207,8 @@ class SpideyGames(commands.Cog):
 
         game = UnoGame(ctx.channel.id, ctx.author.id)
         self.uno_games[ctx.channel.id] = game
-        message = await ctx.send(embed=game.status_embed(), view=UnoLobbyView(self))
-        game.table_message_id = message.id
+        message = await ctx.send(**self._uno_table(game))
+        self._attach_uno_table(game, message)
 
     @uno.command(name="join", aliases=["j"])
     async def uno_join(self, ctx: commands.Context):
@@ -1846,8 +1218,7 @@ class SpideyGames(commands.Cog):
             game.add_player(ctx.author.id)
             game.last_action = f"{ctx.author.mention} joined the game."
 
-            if not await self._refresh_uno_table(game):
-                await ctx.send(embed=game.status_embed(), view=self._uno_view_for(game))
+            await self._show_uno_table(ctx, game)
 
         except ValueError as e:
             await ctx.send(str(e))
@@ -1867,8 +1238,7 @@ class SpideyGames(commands.Cog):
 
             game.last_action = f"{ctx.author.mention} left the lobby."
 
-            if not await self._refresh_uno_table(game):
-                await ctx.send(embed=game.status_embed(), view=self._uno_view_for(game))
+            await self._show_uno_table(ctx, game)
 
         except ValueError as e:
             await ctx.send(str(e))
@@ -1885,9 +1255,7 @@ class SpideyGames(commands.Cog):
 
             game.start()
 
-            if not await self._refresh_uno_table(game):
-                message = await ctx.send(embed=game.status_embed(), view=UnoGameView(self))
-                game.table_message_id = message.id
+            await self._show_uno_table(ctx, game)
 
             await self._process_cpu_turns(game)
 
@@ -1948,8 +1316,7 @@ class SpideyGames(commands.Cog):
                     del self.uno_games[ctx.channel.id]
                     return
 
-                if not await self._refresh_uno_table(game):
-                    await ctx.send(embed=game.status_embed(), view=self._uno_view_for(game))
+                await self._show_uno_table(ctx, game)
                 await self._process_cpu_turns(game)
                 return
 
@@ -1977,8 +1344,7 @@ class SpideyGames(commands.Cog):
                 "Updated Uno hand:\n" + game.hand_text(ctx.author.id),
             )
 
-            if not await self._refresh_uno_table(game):
-                await ctx.send(embed=game.status_embed(), view=self._uno_view_for(game))
+            await self._show_uno_table(ctx, game)
             await self._process_cpu_turns(game)
         except ValueError as e:
             await ctx.send(str(e))
@@ -2014,8 +1380,7 @@ class SpideyGames(commands.Cog):
                 del self.uno_games[ctx.channel.id]
                 return
 
-            if not await self._refresh_uno_table(game):
-                await ctx.send(embed=game.status_embed(), view=self._uno_view_for(game))
+            await self._show_uno_table(ctx, game)
 
             await self._process_cpu_turns(game)
 
@@ -2030,11 +1395,11 @@ class SpideyGames(commands.Cog):
         try:
             game = self._get_uno_game(ctx.channel.id)
 
-            if await self._refresh_uno_table(game):
+            if await self.tables.flush(("uno", game.channel_id)):
                 await ctx.send("Uno table refreshed.", delete_after=5)
             else:
-                message = await ctx.send(embed=game.status_embed(), view=self._uno_view_for(game))
-                game.table_message_id = message.id
+                message = await ctx.send(**self._uno_table(game))
+                self._attach_uno_table(game, message)
 
         except ValueError as e:
             await ctx.send(str(e))
@@ -2083,7 +1448,8 @@ class SpideyGames(commands.Cog):
             )
             return
 
-        await ctx.send(embed=game.status_embed(), view=MastermindView(self, ctx.channel.id))
+        message = await ctx.send(**self._mastermind_table(game))
+        self.tables.attach(("mastermind", ctx.channel.id), ctx.channel, message.id, lambda: self._mastermind_table(game), MASTERMIND_TABLE_DELAY)
 
     @mastermind.command(name="start", aliases=["s"])
     async def mastermind_start(self, ctx: commands.Context, difficulty: str = "normal"):
@@ -2101,8 +1467,27 @@ class SpideyGames(commands.Cog):
         game = MastermindGame(ctx.channel.id, ctx.author.id, difficulty)
         self.mastermind_games[ctx.channel.id] = game
 
-        message = await ctx.send(embed=game.status_embed(), view=MastermindView(self, ctx.channel.id))
+        message = await ctx.send(**self._mastermind_table(game))
         game.message_id = message.id
+        self.tables.attach(("mastermind", ctx.channel.id), ctx.channel, message.id, lambda: self._mastermind_table(game), MASTERMIND_TABLE_DELAY)
+
+    @mastermind.command(name="hint", aliases=["h"])
+    async def mastermind_hint(self, ctx: commands.Context):
+        """Suggest the best next guess for the current Mastermind game."""
+        game = self.mastermind_games.get(ctx.channel.id)
+
+        if not game:
+            await ctx.send("There is no Mastermind game in this channel.")
+            return
+
+        if ctx.author.id != game.player_id:
+            await ctx.send("This is not your Mastermind game.")
+            return
+
+        guess, remaining = await asyncio.to_thread(game.hint, list(game.guesses))
+        game.hints_used += 1
+        codes = "code is" if remaining == 1 else "codes are"
+        await ctx.send(f"💡 Try {' '.join(guess)} — {remaining} {codes} still possible.")
 
     @mastermind.command(name="end", aliases=["stop"])
     async def mastermind_end(self, ctx: commands.Context):
@@ -2118,4 +1503,5 @@ class SpideyGames(commands.Cog):
             return
 
         del self.mastermind_games[ctx.channel.id]
+        self.tables.detach(("mastermind", ctx.channel.id))
         await ctx.send("Mastermind game ended.")
\ No newline at end of file
@@ -0,0 +1,162 @@
+from __future__ import annotations
+import asyncio
+import json
+import time
+from typing import Callable, Hashable
+
+import discord
+
+# Returns the message.edit kwargs for a table's current state (embed/view/content).
+Render = Callable[[], dict]
+
+
+def _state_key(fields: dict) -> str:
+    """What an edit would show, as a string: the embed's dict and the view's buttons."""
+    key = {}
+    for name, value in fields.items():
+        if isinstance(value, discord.Embed):
+            value = value.to_dict()
+        elif isinstance(value, discord.ui.View):
+            value = [
+                [type(item).__name__, getattr(item, "label", None), getattr(item, "disabled", None)]
+                for item in value.children
+            ]
+        key[name] = value
+    return json.dumps(key, sort_keys=True, default=str)
+
+
+class _Table:
+    __slots__ = ("message", "render", "delay", "shown", "edited", "task")
+
+    def __init__(self, message: discord.PartialMessage, render: Render, delay: float):
+        self.message = message
+        self.render = render
+        self.delay = delay
+        self.shown: str | None = None
+        self.edited = 0.0
+        self.task: asyncio.Task | None = None
+
+
+class TableRenderer:
+    """
+    Keeps game table messages (Uno, Mastermind) up to date with as few edits as possible.
+
+    Each table holds a PartialMessage, so an edit never needs a fetch first.
+    `schedule` marks a table changed: the first change opens a short window and
+    everything that happens inside it lands in one edit when it closes. Edits
+    that would show exactly what the message already shows are skipped.
+
+    A button click on an idle table can answer with the table itself (an
+    interaction edit) and report it through `mark_shown`; only clicks that land
+    within `delay` of that are queued.
+    """
+
+    def __init__(self):
+        self._tables: dict[Hashable, _Table] = {}
+        self.started = time.monotonic()
+        self.edits = 0
+        self.coalesced = 0
+        self.unchanged = 0
+        self.failed = 0
+
+    def attach(self, key: Hashable, channel, message_id: int, render: Render, delay: float = 1.0) -> None:
+        """Track a table message that was just sent with `render()`'s current output."""
+        self.detach(key)
+        table = _Table(channel.get_partial_message(message_id), render, delay)
+        table.shown = _state_key(render())
+        self._tables[key] = table
+
+    def detach(self, key: Hashable) -> None:
+        table = self._tables.pop(key, None)
+        if table is not None and table.task is not None:
+            table.task.cancel()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._tables
+
+    def idle(self, key: Hashable) -> bool:
+        """True if the table has no queued edit and wasn't edited within its delay."""
+        table = self._tables.get(key)
+        return table is not None and table.task is None and time.monotonic() - table.edited >= table.delay
+
+    def mark_shown(self, key: Hashable, fields: dict) -> None:
+        """Record an edit made some other way (e.g. an interaction response) as what the table shows."""
+        table = self._tables.get(key)
+        if table is None:
+            return
+        table.shown = _state_key(fields)
+        table.edited = time.monotonic()
+        self.edits += 1
+
+    def schedule(self, key: Hashable) -> bool:
+        """Queue an edit for the table; False if there is no table to edit."""
+        table = self._tables.get(key)
+        if table is None:
+            return False
+        if table.task is not None:
+            self.coalesced += 1
+        else:
+            table.task = asyncio.create_task(self._edit_later(key, table))
+        return True
+
+    async def _edit_later(self, key: Hashable, table: _Table) -> None:
+        await asyncio.sleep(table.delay)
+        table.task = None  # changes from here on need an edit of their own
+        await self._edit(key, table)
+
+    async def flush(self, key: Hashable) -> bool:
+        """Edit the table now, taking the place of any queued edit."""
+        table = self._tables.get(key)
+        if table is None:
+            return False
+        if table.task is not None:
+            table.task.cancel()
+            table.task = None
+        return await self._edit(key, table)
+
+    async def close(self, key: Hashable, render: Render | None = None) -> bool:
+        """Make a final edit (with `render` if given) and stop tracking the table."""
+        table = self._tables.get(key)
+        if table is None:
+            return False
+        self.detach(key)
+        if render is not None:
+            table.render = render
+        return await self._edit(key, table)
+
+    async def _edit(self, key: Hashable, table: _Table) -> bool:
+        fields = table.render()
+        shown = _state_key(fields)
+        if shown == table.shown:
+            self.unchanged += 1
+            return True
+        try:
+            await table.message.edit(**fields)
+        except (discord.NotFound, discord.Forbidden):
+            self.failed += 1
+            if self._tables.get(key) is table:
+                del self._tables[key]  # gone for good; the next refresh will post a new table
+            return False
+        except discord.HTTPException as e:
+            self.failed += 1
+            print(f"Table edit error: {e}")
+            return False
+        table.shown = shown
+        table.edited = time.monotonic()
+        self.edits += 1
+        return True
+
+    def shutdown(self) -> None:
+        for key in list(self._tables):
+            self.detach(key)
+
+    def stats(self) -> dict:
+        minutes = max((time.monotonic() - self.started) / 60.0, 1 / 60.0)
+        return {
+            "tables": len(self._tables),
+            "edits": self.edits,
+            "coalesced": self.coalesced,
+            "unchanged": self.unchanged,
+            "failed": self.failed,
+            "edits_per_min": round(self.edits / minutes, 2),
+        }
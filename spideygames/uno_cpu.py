@@ -0,0 +1,80 @@
+from __future__ import annotations
+import importlib
+from abc import ABC, abstractmethod
+
+# Lower plays first: actions before high numbers before low numbers, wilds last.
+BASIC_PRIORITY = {
+    "DRAW2": 0,
+    "SKIP": 1,
+    "REVERSE": 2,
+    "9": 3,
+    "8": 4,
+    "7": 5,
+    "6": 6,
+    "5": 7,
+    "4": 8,
+    "3": 9,
+    "2": 10,
+    "1": 11,
+    "0": 12,
+    "WILD": 13,
+    "WILD4": 14,
+}
+
+
+class CpuStrategy(ABC):
+    """
+    How a CPU seat plays Uno. `choose_card` gets the game and the seat's player id
+    and returns one of `game.legal_cards(player_id)`, or None to draw instead.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def choose_card(self, game, player_id: int):
+        """The card to play, or None to draw."""
+
+    def choose_color(self, game, player_id: int) -> str:
+        """Colour to call after playing a wild."""
+        return game.choose_default_wild_color(player_id)
+
+
+class BasicCpu(CpuStrategy):
+    """The shipped CPU: prefer non-wilds, actions before numbers, wilds last."""
+
+    name = "basic"
+
+    def choose_card(self, game, player_id: int):
+        legal = game.legal_cards(player_id)
+
+        if not legal:
+            return None
+
+        return min(legal, key=lambda card: (card.color == "W", BASIC_PRIORITY.get(card.value, 99), card.color))
+
+
+class RandomCpu(CpuStrategy):
+    """Any legal card; a floor for comparing strategies against."""
+
+    name = "random"
+
+    def choose_card(self, game, player_id: int):
+        legal = game.legal_cards(player_id)
+        return game.rng.choice(legal) if legal else None
+
+
+CPU_STRATEGIES = {cls.name: cls for cls in (BasicCpu, RandomCpu)}
+DEFAULT_CPU = BasicCpu()
+
+
+def load_strategy(spec: str) -> CpuStrategy:
+    """A strategy by registered name, or any CpuStrategy subclass as "module:Class"."""
+    if spec in CPU_STRATEGIES:
+        return CPU_STRATEGIES[spec]()
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"Unknown CPU strategy {spec!r}. Known: {', '.join(CPU_STRATEGIES)}")
+    cls = getattr(importlib.import_module(module_name), attr)
+    if not (isinstance(cls, type) and issubclass(cls, CpuStrategy)):
+        raise ValueError(f"{spec} is not a CpuStrategy")
+    return cls()
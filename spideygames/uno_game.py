@@ -0,0 +1,710 @@
+"""
+Uno rules, cards and move notation, with no discord or Red imports, so the cog
+and the headless simulator (uno_sim.py) play the exact same game.
+"""
+from __future__ import annotations
+import random
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+try:
+    from .uno_cpu import DEFAULT_CPU, CpuStrategy
+except ImportError:  # loaded as a top-level module by `python uno_sim.py`
+    from uno_cpu import DEFAULT_CPU, CpuStrategy
+
+if TYPE_CHECKING:
+    import discord
+
+
+COLOR_NAMES = {
+    "R": "Red",
+    "G": "Green",
+    "B": "Blue",
+    "Y": "Yellow",
+    "W": "Wild",
+}
+
+COLOR_EMOJIS = {
+    "R": "🔴",
+    "G": "🟢",
+    "B": "🔵",
+    "Y": "🟡",
+    "W": "🌈",
+}
+
+COLOR_WORDS = {
+    "RED": "R",
+    "GREEN": "G",
+    "BLUE": "B",
+    "YELLOW": "Y",
+}
+
+ACTION_ALIASES = {
+    "S": "SKIP",
+    "SKIP": "SKIP",
+    "REV": "REVERSE",
+    "REVERSE": "REVERSE",
+    "+2": "DRAW2",
+    "D2": "DRAW2",
+    "DRAW2": "DRAW2",
+    "DRAWTWO": "DRAW2",
+    "DRAW_TWO": "DRAW2",
+}
+
+VALUE_LABELS = {
+    "SKIP": "Skip",
+    "REVERSE": "Reverse",
+    "DRAW2": "+2",
+    "WILD": "Wild",
+    "WILD4": "+4",
+}
+
+VALUE_SORT = {
+    "0": 0,
+    "1": 1,
+    "2": 2,
+    "3": 3,
+    "4": 4,
+    "5": 5,
+    "6": 6,
+    "7": 7,
+    "8": 8,
+    "9": 9,
+    "SKIP": 10,
+    "REVERSE": 11,
+    "DRAW2": 12,
+    "WILD": 13,
+    "WILD4": 14,
+}
+
+UNO_PENALTY_CARDS = 2
+CPU_SELF_UNO_CHANCE = 0.90
+CPU_CATCH_UNO_CHANCE = 0.60
+CPU_SELF_UNO_DELAY_RANGE = (0.8, 1.3)
+CPU_CATCH_UNO_DELAY_RANGE = (1.2, 2.0)
+# CPU turns played in a row before auto-play gives up.
+CPU_TURN_LIMIT = 30
+
+@dataclass(frozen=True)
+class UnoCard:
+    color: str
+    value: str
+
+    @property
+    def is_wild(self) -> bool:
+        return self.color == "W"
+
+    @property
+    def is_draw_two(self) -> bool:
+        return self.value == "DRAW2"
+
+    @property
+    def is_wild_draw_four(self) -> bool:
+        return self.value == "WILD4"
+
+    def short(self) -> str:
+        emoji = COLOR_EMOJIS.get(self.color, "")
+        label = VALUE_LABELS.get(self.value, self.value)
+        if self.color == "W":
+            return f"{emoji}{label}"
+        return f"{emoji}{label}"
+
+    def long(self) -> str:
+        if self.color == "W":
+            return VALUE_LABELS.get(self.value, self.value)
+        return f"{COLOR_NAMES[self.color]} {VALUE_LABELS.get(self.value, self.value)}"
+
+
+def build_deck(rng=random) -> List[UnoCard]:
+    deck: List[UnoCard] = []
+    for color in ["R", "G", "B", "Y"]:
+        deck.append(UnoCard(color, "0"))
+        for value in ["1", "2", "3", "4", "5", "6", "7", "8", "9"]:
+            deck.append(UnoCard(color, value))
+            deck.append(UnoCard(color, value))
+        for action in ["SKIP", "REVERSE", "DRAW2"]:
+            deck.append(UnoCard(color, action))
+            deck.append(UnoCard(color, action))
+    for _ in range(4):
+        deck.append(UnoCard("W", "WILD"))
+        deck.append(UnoCard("W", "WILD4"))
+    rng.shuffle(deck)
+    return deck
+
+@dataclass
+class ParsedMove:
+    exact_color: Optional[str] = None
+    exact_value: Optional[str] = None
+    broad_color: Optional[str] = None
+    broad_value: Optional[str] = None
+    wild_value: Optional[str] = None
+    chosen_color: Optional[str] = None
+
+
+class UnoGame:
+    def __init__(self, channel_id: int, host_id: int, rng=random):
+        self.channel_id = channel_id
+        self.host_id = host_id
+        self.players: List[int] = [host_id]
+        self.hands: Dict[int, List[UnoCard]] = {}
+        self.deck: List[UnoCard] = []
+        self.discard: List[UnoCard] = []
+        self.started = False
+        self.current_index = 0
+        self.direction = 1
+        self.current_color: Optional[str] = None
+        self.pending_draw_amount = 0
+        self.pending_draw_type: Optional[str] = None
+        self.last_action = "Game created. Waiting for players."
+        self.table_message_id: Optional[int] = None
+        self.next_cpu_number = 1
+        self.pending_uno_player: Optional[int] = None
+        self.rng = rng
+        self.cpu_strategies: Dict[int, CpuStrategy] = {}
+        self.reshuffles = 0
+
+    def add_player(self, user_id: int) -> None:
+        if self.started:
+            raise ValueError("This game has already started.")
+        if user_id in self.players:
+            raise ValueError("You are already in this game.")
+        if len(self.players) >= 10:
+            raise ValueError("Uno supports up to 10 players.")
+        self.players.append(user_id)
+
+    def remove_player(self, user_id: int) -> None:
+        if self.started:
+            raise ValueError("You cannot leave after the game has started.")
+        if user_id not in self.players:
+            raise ValueError("You are not in this game.")
+        self.players.remove(user_id)
+        if self.host_id == user_id and self.players:
+            self.host_id = self.players[0]
+    
+    def is_cpu(self, player_id: int) -> bool:
+        return player_id < 0
+
+    def player_display(self, player_id: int) -> str:
+        if self.is_cpu(player_id):
+            return f"CPU {abs(player_id)}"
+        return f"<@{player_id}>"
+    
+    def pending_uno_is_valid(self) -> bool:
+        return (
+            self.pending_uno_player in self.players
+            and len(self.hands.get(self.pending_uno_player, [])) == 1
+        )
+
+    def clear_pending_uno(self) -> None:
+        self.pending_uno_player = None
+
+    def begin_player_action(self, actor_id: int) -> None:
+        """
+        Once the next player begins acting, the chance to catch the previous UNO failure expires.
+        """
+        if self.pending_uno_player is not None and self.pending_uno_player != actor_id:
+            self.clear_pending_uno()
+
+    def call_uno(self, caller_id: int) -> Tuple[bool, str]:
+        """
+        If the pending player says UNO, they are safe.
+        If someone else in the game says UNO first, the pending player draws 2.
+        """
+        if caller_id not in self.players:
+            return False, "You are not in this Uno game."
+
+        if not self.pending_uno_is_valid():
+            self.clear_pending_uno()
+            return False, "No one currently needs to say UNO."
+
+        target_id = self.pending_uno_player
+        caller_name = self.player_display(caller_id)
+        target_name = self.player_display(target_id)
+
+        if caller_id == target_id:
+            self.clear_pending_uno()
+            self.last_action = f"{target_name} said UNO!"
+            return True, f"{target_name} said UNO!"
+
+        self.draw_cards(target_id, UNO_PENALTY_CARDS)
+        self.clear_pending_uno()
+        self.last_action = (
+            f"{caller_name} caught {target_name} failing to say UNO! "
+            f"{target_name} drew {UNO_PENALTY_CARDS} cards."
+        )
+        return True, self.last_action
+
+    def add_cpu(self) -> int:
+        if self.started:
+            raise ValueError("You cannot add a CPU after the game has started.")
+        if len(self.players) >= 10:
+            raise ValueError("Uno supports up to 10 players total.")
+
+        cpu_id = -self.next_cpu_number
+        self.next_cpu_number += 1
+        self.players.append(cpu_id)
+        self.last_action = f"{self.player_display(cpu_id)} joined the game."
+        return cpu_id
+
+    def remove_cpu(self) -> int:
+        if self.started:
+            raise ValueError("You cannot remove a CPU after the game has started.")
+
+        cpu_players = [pid for pid in self.players if self.is_cpu(pid)]
+
+        if not cpu_players:
+            raise ValueError("There are no CPU players to remove.")
+
+        cpu_id = cpu_players[-1]
+        self.players.remove(cpu_id)
+        self.last_action = f"{self.player_display(cpu_id)} left the lobby."
+        return cpu_id
+
+    def cpu_strategy(self, player_id: int) -> CpuStrategy:
+        return self.cpu_strategies.get(player_id, DEFAULT_CPU)
+
+    def choose_cpu_card(self, player_id: int) -> Optional[UnoCard]:
+        return self.cpu_strategy(player_id).choose_card(self, player_id)
+
+    def play_cpu_turn(self) -> Tuple[bool, str]:
+        player_id = self.current_player_id
+
+        if not self.is_cpu(player_id):
+            raise ValueError("It is not a CPU's turn.")
+
+        cpu_name = self.player_display(player_id)
+        card = self.choose_cpu_card(player_id)
+
+        if card:
+            chosen_color = None
+
+            if card.color == "W":
+                chosen_color = self.cpu_strategy(player_id).choose_color(self, player_id)
+
+            won, message = self.play_card(player_id, card, chosen_color)
+            return won, message
+
+        won, private_msg = self.draw_until_playable(player_id)
+        self.last_action = f"{cpu_name} drew until playable. {self.last_action}"
+        return won, private_msg
+
+    def start(self) -> None:
+        if self.started:
+            raise ValueError("This game has already started.")
+        if len(self.players) < 2:
+            raise ValueError("You need at least 2 players to start Uno.")
+
+        self.deck = build_deck(self.rng)
+        self.hands = {pid: [] for pid in self.players}
+
+        for _ in range(7):
+            for pid in self.players:
+                self.hands[pid].append(self._draw_one())
+
+        starter_index = next(
+            (i for i, card in enumerate(self.deck) if card.color != "W" and card.value.isdigit()),
+            None,
+        )
+
+        if starter_index is None:
+            raise ValueError("Could not find a valid starter card. Try again.")
+
+        starter = self.deck.pop(starter_index)
+        self.discard.append(starter)
+        self.current_color = starter.color
+        self.started = True
+        self.current_index = 0
+        self.direction = 1
+        self.last_action = f"The starting card is {starter.short()}."
+
+    @property
+    def current_player_id(self) -> int:
+        return self.players[self.current_index]
+
+    @property
+    def top_card(self) -> UnoCard:
+        return self.discard[-1]
+
+    def next_index_from(self, index: int, steps: int = 1) -> int:
+        return (index + self.direction * steps) % len(self.players)
+
+    def _draw_one(self) -> UnoCard:
+        if not self.deck:
+            self._reshuffle_discard_into_deck()
+        if not self.deck:
+            raise ValueError("No cards are available to draw.")
+        return self.deck.pop()
+
+    def _reshuffle_discard_into_deck(self) -> None:
+        if len(self.discard) <= 1:
+            return
+
+        top = self.discard[-1]
+        rest = self.discard[:-1]
+        self.rng.shuffle(rest)
+        self.deck = rest
+        self.discard = [top]
+        self.reshuffles += 1
+
+    def sort_hand(self, player_id: int) -> None:
+        color_order = {"R": 0, "G": 1, "B": 2, "Y": 3, "W": 4}
+        self.hands[player_id].sort(
+            key=lambda c: (color_order.get(c.color, 9), VALUE_SORT.get(c.value, 99))
+        )
+
+    def draw_cards(self, player_id: int, amount: int) -> List[UnoCard]:
+        drawn = []
+        for _ in range(amount):
+            drawn.append(self._draw_one())
+        self.hands[player_id].extend(drawn)
+        self.sort_hand(player_id)
+        return drawn
+
+    def is_legal(self, card: UnoCard) -> bool:
+        if self.pending_draw_amount > 0:
+            return card.value == "DRAW2"
+
+        if card.color == "W":
+            return True
+
+        return card.color == self.current_color or card.value == self.top_card.value
+
+    def legal_cards(self, player_id: int) -> List[UnoCard]:
+        return [card for card in self.hands[player_id] if self.is_legal(card)]
+
+    def choose_default_wild_color(self, player_id: int) -> str:
+        counts = {"R": 0, "G": 0, "B": 0, "Y": 0}
+        for card in self.hands[player_id]:
+            if card.color in counts:
+                counts[card.color] += 1
+        return max(counts, key=counts.get)
+
+    def find_card(self, player_id: int, parsed: ParsedMove) -> Tuple[Optional[UnoCard], Optional[str]]:
+        hand = self.hands[player_id]
+        legal = self.legal_cards(player_id)
+
+        if parsed.wild_value:
+            candidates = [card for card in legal if card.value == parsed.wild_value]
+
+        elif parsed.exact_color and parsed.exact_value:
+            owned = [
+                card for card in hand
+                if card.color == parsed.exact_color and card.value == parsed.exact_value
+            ]
+
+            if not owned:
+                return None, "You do not have that card."
+
+            candidates = [card for card in owned if self.is_legal(card)]
+
+        elif parsed.broad_color:
+            candidates = [card for card in legal if card.color == parsed.broad_color]
+
+        elif parsed.broad_value:
+            candidates = [card for card in legal if card.value == parsed.broad_value]
+
+        else:
+            return None, "I could not understand that card notation."
+
+        if not candidates:
+            return None, "That move is not legal right now."
+
+        candidates.sort(key=lambda c: (VALUE_SORT.get(c.value, 99), c.color))
+        return candidates[0], None
+
+    def play_card(self, player_id: int, card: UnoCard, chosen_color: Optional[str]) -> Tuple[bool, str]:
+        if player_id != self.current_player_id:
+            raise ValueError("It is not your turn.")
+        if card not in self.hands[player_id]:
+            raise ValueError("You do not have that card.")
+        if not self.is_legal(card):
+            raise ValueError("That card is not legal right now.")
+
+        self.begin_player_action(player_id)
+
+        player_name = self.player_display(player_id)
+
+        self.hands[player_id].remove(card)
+        self.discard.append(card)
+
+        if card.color == "W":
+            if chosen_color not in {"R", "G", "B", "Y"}:
+                chosen_color = self.choose_default_wild_color(player_id)
+            self.current_color = chosen_color
+        else:
+            self.current_color = card.color
+
+        if not self.hands[player_id]:
+            self.clear_pending_uno()
+            self.last_action = f"{player_name} played {card.short()} and won the game!"
+            return True, self.last_action
+
+        uno_note = ""
+        if len(self.hands[player_id]) == 1:
+            self.pending_uno_player = player_id
+
+        play_index = self.current_index
+
+        if card.value == "DRAW2":
+            self.pending_draw_amount += 2
+            self.pending_draw_type = "DRAW2"
+            self.current_index = self.next_index_from(play_index, 1)
+            self.last_action = (
+                f"{player_name} played {card.short()}."
+                f"{uno_note} Draw stack is now +{self.pending_draw_amount}."
+            )
+
+        elif card.value == "WILD4":
+            victim_index = self.next_index_from(play_index, 1)
+            victim_id = self.players[victim_index]
+            victim_name = self.player_display(victim_id)
+
+            self.draw_cards(victim_id, 4)
+            self.current_index = self.next_index_from(play_index, 2)
+            self.last_action = (
+                f"{player_name} played {card.short()} and chose {COLOR_NAMES[self.current_color]}."
+                f"{uno_note} {victim_name} drew 4 and was skipped."
+            )
+
+        elif card.value == "SKIP":
+            skipped_id = self.players[self.next_index_from(play_index, 1)]
+            skipped_name = self.player_display(skipped_id)
+
+            self.current_index = self.next_index_from(play_index, 2)
+            self.last_action = f"{player_name} played {card.short()}.{uno_note} {skipped_name} was skipped."
+
+        elif card.value == "REVERSE":
+            self.direction *= -1
+
+            if len(self.players) == 2:
+                self.current_index = play_index
+                self.last_action = (
+                    f"{player_name} played {card.short()}."
+                    f"{uno_note} Reverse acts like a skip with 2 players."
+                )
+            else:
+                self.current_index = self.next_index_from(play_index, 1)
+                self.last_action = f"{player_name} played {card.short()}.{uno_note} Turn order reversed."
+
+        else:
+            self.current_index = self.next_index_from(play_index, 1)
+
+            if card.color == "W":
+                self.last_action = (
+                    f"{player_name} played {card.short()} and chose "
+                    f"{COLOR_NAMES[self.current_color]}.{uno_note}"
+                )
+            else:
+                self.last_action = f"{player_name} played {card.short()}.{uno_note}"
+
+        return False, self.last_action
+
+    def take_draw_action(self, player_id: int) -> str:
+        if player_id != self.current_player_id:
+            raise ValueError("It is not your turn.")
+
+        player_name = self.player_display(player_id)
+
+        if self.pending_draw_amount > 0:
+            amount = self.pending_draw_amount
+            self.draw_cards(player_id, amount)
+            self.pending_draw_amount = 0
+            self.pending_draw_type = None
+            self.current_index = self.next_index_from(self.current_index, 1)
+            self.last_action = f"{player_name} drew {amount} cards from the +2 stack and was skipped."
+            return self.last_action
+
+        drawn = self.draw_cards(player_id, 1)[0]
+        self.current_index = self.next_index_from(self.current_index, 1)
+        self.last_action = f"{player_name} drew 1 card and passed."
+        return f"You drew {drawn.short()}. Turn passed."
+
+    def draw_until_playable(self, player_id: int) -> Tuple[bool, str]:
+        if player_id != self.current_player_id:
+            raise ValueError("It is not your turn.")
+        self.begin_player_action(player_id)
+        
+        if self.pending_draw_amount > 0:
+            amount = self.pending_draw_amount
+            self.draw_cards(player_id, amount)
+            self.pending_draw_amount = 0
+            self.pending_draw_type = None
+            self.current_index = self.next_index_from(self.current_index, 1)
+            player_name = self.player_display(player_id)
+            self.last_action = f"{player_name} drew {amount} cards from the +2 stack and was skipped."
+            return False, f"You drew {amount} cards from the +2 stack. Your turn was skipped."
+
+        drawn_cards: List[UnoCard] = []
+        playable_card: Optional[UnoCard] = None
+
+        while playable_card is None:
+            drawn = self.draw_cards(player_id, 1)[0]
+            drawn_cards.append(drawn)
+
+            if self.is_legal(drawn):
+                playable_card = drawn
+
+        chosen_color = None
+        if playable_card.color == "W":
+            chosen_color = self.choose_default_wild_color(player_id)
+
+        won, _message = self.play_card(player_id, playable_card, chosen_color)
+
+        if len(drawn_cards) == 1:
+            private_msg = f"You drew {playable_card.short()} and automatically played it."
+        else:
+            drawn_text = ", ".join(card.short() for card in drawn_cards)
+            private_msg = (
+                f"You drew {len(drawn_cards)} cards until you found a playable card: {drawn_text}\n"
+                f"Automatically played {playable_card.short()}."
+            )
+
+        return won, private_msg
+    
+    def hand_text(self, player_id: int) -> str:
+        hand = self.hands.get(player_id, [])
+
+        if not hand:
+            return "Your hand is empty."
+
+        groups = {"R": [], "G": [], "B": [], "Y": [], "W": []}
+
+        for card in hand:
+            groups[card.color].append(card.short())
+
+        lines = []
+
+        for color in ["R", "G", "B", "Y", "W"]:
+            if groups[color]:
+                lines.append(f"**{COLOR_NAMES[color]}:** " + ", ".join(groups[color]))
+
+        lines.append("")
+        lines.append("Examples: `G1`, `R7`, `B+2`, `YS`, `GREV`, `W:G`, `W4:B`, `G`, `1`, `+2`, `S`, `REV`, `DRAW`.")
+        lines.append("Note: `R` means Red. Use `REV` for Reverse.")
+        lines.append("If you have 1 card left, click **Say UNO** or type `uno` in chat.")
+
+        return "\n".join(lines)
+
+    def status_embed(self) -> discord.Embed:
+        import discord  # only the cog draws tables; the simulator never needs discord
+
+        embed = discord.Embed(title="Uno", color=discord.Color.blurple())
+
+        if not self.started:
+            names = "\n".join(self.player_display(pid) for pid in self.players)
+            embed.description = self.last_action
+            embed.add_field(name="Players", value=names or "None", inline=False)
+            return embed
+
+        direction = "clockwise" if self.direction == 1 else "counter-clockwise"
+        current_color = COLOR_NAMES.get(self.current_color or "", "Unknown")
+
+        embed.description = self.last_action
+        embed.add_field(
+            name="Top Card",
+            value=f"{self.top_card.short()} | Current color: **{current_color}**",
+            inline=False,
+        )
+        embed.add_field(name="Turn", value=self.player_display(self.current_player_id), inline=True)
+        embed.add_field(name="Direction", value=direction, inline=True)
+
+        if self.pending_draw_amount > 0:
+            embed.add_field(
+                name="Draw Stack",
+                value=f"+{self.pending_draw_amount} — play a +2 or draw.",
+                inline=False,
+            )
+
+        player_lines = []
+
+        for idx, pid in enumerate(self.players):
+            marker = "➡️ " if idx == self.current_index else ""
+            count = len(self.hands.get(pid, []))
+            plural = "card" if count == 1 else "cards"
+            player_lines.append(f"{marker}{self.player_display(pid)} — {count} {plural}")
+
+        embed.add_field(name="Players", value="\n".join(player_lines), inline=False)
+        return embed
+
+
+def normalize_notation(raw: str) -> str:
+    text = raw.upper().strip()
+    text = text.replace(" ", "")
+    text = text.replace("-", "")
+    text = text.replace("_", "")
+    text = text.replace("WILDDRAWFOUR", "W4")
+    text = text.replace("WILDDRAW4", "W4")
+    text = text.replace("DRAWFOUR", "W4")
+    text = text.replace("DRAW4", "W4")
+    text = text.replace("WILD4", "W4")
+    text = text.replace("+FOUR", "+4")
+    return text
+
+
+def parse_color_token(token: str) -> Optional[str]:
+    if token in {"R", "G", "B", "Y"}:
+        return token
+    return COLOR_WORDS.get(token)
+
+
+def parse_value_token(token: str) -> Optional[str]:
+    if token.isdigit() and token in {str(i) for i in range(10)}:
+        return token
+    return ACTION_ALIASES.get(token)
+
+
+def parse_move(raw: str) -> ParsedMove:
+    text = normalize_notation(raw)
+
+    if text in {"DRAW", "D", "PASS"}:
+        return ParsedMove()
+
+    colon_match = re.fullmatch(r"(W|WC|WILD|W4|\+4):?([RGBY]|RED|GREEN|BLUE|YELLOW)", text)
+    if colon_match:
+        wild_part, color_part = colon_match.groups()
+        chosen = parse_color_token(color_part)
+        wild_value = "WILD4" if wild_part in {"W4", "+4"} else "WILD"
+        return ParsedMove(wild_value=wild_value, chosen_color=chosen)
+
+    word_wild_match = re.fullmatch(r"(WILD|WC|W)(RED|GREEN|BLUE|YELLOW)", text)
+    if word_wild_match:
+        chosen = parse_color_token(word_wild_match.group(2))
+        return ParsedMove(wild_value="WILD", chosen_color=chosen)
+
+    compact_wild_match = re.fullmatch(r"(W4|\+4|WILD4)([RGBY])", text)
+    if compact_wild_match:
+        chosen = parse_color_token(compact_wild_match.group(2))
+        return ParsedMove(wild_value="WILD4", chosen_color=chosen)
+
+    if text in {"W", "WC", "WILD"}:
+        return ParsedMove(wild_value="WILD")
+
+    if text in {"W4", "+4"}:
+        return ParsedMove(wild_value="WILD4")
+
+    color = parse_color_token(text)
+    if color:
+        return ParsedMove(broad_color=color)
+
+    value = parse_value_token(text)
+    if value:
+        return ParsedMove(broad_value=value)
+
+    for color_word, color_letter in sorted(COLOR_WORDS.items(), key=lambda item: len(item[0]), reverse=True):
+        if text.startswith(color_word):
+            value_part = text[len(color_word):]
+            value = parse_value_token(value_part)
+
+            if value:
+                return ParsedMove(exact_color=color_letter, exact_value=value)
+
+    if text and text[0] in {"R", "G", "B", "Y"}:
+        color_letter = text[0]
+        value_part = text[1:]
+        value = parse_value_token(value_part)
+
+        if value:
+            return ParsedMove(exact_color=color_letter, exact_value=value)
+
+    return ParsedMove()
@@ -0,0 +1,152 @@
+"""
+Headless all-CPU Uno games, for comparing CPU strategies and timing the game logic.
+
+    python spideygames/uno_sim.py --games 5000 --players 4 --cpu basic --cpu random
+
+Run it as a script: it only needs uno_game.py and uno_cpu.py, not Red or discord.py
+(`python -m spideygames.uno_sim` also works where Red is installed).
+
+Seats take the given strategies in turn, rotated every game so no strategy keeps
+the first seat. Every game is seeded from --seed, so a run can be repeated exactly.
+"""
+from __future__ import annotations
+import argparse
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+if __package__:
+    from .uno_cpu import CpuStrategy, load_strategy
+    from .uno_game import CPU_CATCH_UNO_CHANCE, CPU_SELF_UNO_CHANCE, CPU_TURN_LIMIT, UnoGame
+else:  # run as a script, without the package __init__ (which loads the cog)
+    from uno_cpu import CpuStrategy, load_strategy
+    from uno_game import CPU_CATCH_UNO_CHANCE, CPU_SELF_UNO_CHANCE, CPU_TURN_LIMIT, UnoGame
+
+# Games still going after this many turns are counted as unfinished.
+SIM_TURN_CAP = 2000
+
+
+def _uno_window(game: UnoGame) -> None:
+    """The cog's CPU UNO window without the delays: say UNO, else maybe get caught."""
+    if not game.pending_uno_is_valid():
+        game.clear_pending_uno()
+        return
+    target_id = game.pending_uno_player
+    if game.rng.random() < CPU_SELF_UNO_CHANCE:
+        game.call_uno(target_id)
+        return
+    watchers = [pid for pid in game.players if pid != target_id]
+    if watchers and game.rng.random() < CPU_CATCH_UNO_CHANCE:
+        game.call_uno(game.rng.choice(watchers))
+
+
+def play_game(seed: int, players: int, specs: list[str], strategies: dict[str, CpuStrategy]) -> dict:
+    """One all-CPU game from `seed`; returns its turns, reshuffles and winning strategy."""
+    game = UnoGame(0, -1, rng=random.Random(seed))
+    game.next_cpu_number = 2
+    for _ in range(players - 1):
+        game.add_cpu()
+    seats = {}
+    for i, pid in enumerate(game.players):
+        seats[pid] = specs[(i + seed) % len(specs)]
+        game.cpu_strategies[pid] = strategies[seats[pid]]
+    game.start()
+
+    turns = 0
+    while turns < SIM_TURN_CAP:
+        player_id = game.current_player_id
+        game.begin_player_action(player_id)
+        won, _message = game.play_cpu_turn()
+        turns += 1
+        if won:
+            return {"turns": turns, "reshuffles": game.reshuffles, "winner": seats[player_id], "seats": seats}
+        _uno_window(game)
+    return {"turns": turns, "reshuffles": game.reshuffles, "winner": None, "seats": seats}
+
+
+def _run_chunk(args: tuple) -> dict:
+    seeds, players, specs = args
+    strategies = {spec: load_strategy(spec) for spec in specs}
+    out = {
+        "games": 0, "turns": 0, "max_turns": 0, "reshuffles": 0, "over_limit": 0,
+        "unfinished": 0, "errors": 0, "wins": Counter(), "seats": Counter(),
+    }
+    for seed in seeds:
+        try:
+            result = play_game(seed, players, specs, strategies)
+        except ValueError as e:
+            out["errors"] += 1
+            print(f"Uno sim game {seed} error: {e}")
+            continue
+        out["games"] += 1
+        out["turns"] += result["turns"]
+        out["max_turns"] = max(out["max_turns"], result["turns"])
+        out["reshuffles"] += result["reshuffles"]
+        out["over_limit"] += result["turns"] > CPU_TURN_LIMIT
+        out["seats"].update(result["seats"].values())
+        if result["winner"] is None:
+            out["unfinished"] += 1
+        else:
+            out["wins"][result["winner"]] += 1
+    return out
+
+
+def simulate(games: int, players: int, specs: list[str], seed: int = 0, workers: int | None = None) -> dict:
+    """Play `games` seeded games across a process pool and total up the results."""
+    for spec in specs:
+        load_strategy(spec)  # fail here rather than in every worker
+    workers = workers or os.cpu_count() or 1
+    seeds = range(seed, seed + games)
+    size = max(1, games // (workers * 4))
+    chunks = [(seeds[i:i + size], players, specs) for i in range(0, games, size)]
+
+    total = {
+        "games": 0, "turns": 0, "max_turns": 0, "reshuffles": 0, "over_limit": 0,
+        "unfinished": 0, "errors": 0, "wins": Counter(), "seats": Counter(),
+    }
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for out in pool.map(_run_chunk, chunks):
+            for key in ("games", "turns", "reshuffles", "over_limit", "unfinished", "errors"):
+                total[key] += out[key]
+            total["max_turns"] = max(total["max_turns"], out["max_turns"])
+            total["wins"].update(out["wins"])
+            total["seats"].update(out["seats"])
+    total["seconds"] = time.perf_counter() - start
+    return total
+
+
+def report(total: dict, players: int) -> str:
+    games = max(total["games"], 1)
+    lines = [
+        f"{total['games']} games in {total['seconds']:.2f}s ({total['games'] / total['seconds']:.0f} games/sec)",
+        f"avg turns {total['turns'] / games:.1f}, max {total['max_turns']}, "
+        f"avg reshuffles {total['reshuffles'] / games:.2f}",
+        f"over the {CPU_TURN_LIMIT}-turn CPU limit: {total['over_limit'] / games:.1%}, "
+        f"unfinished after {SIM_TURN_CAP}: {total['unfinished']}, errors: {total['errors']}",
+    ]
+    for spec, seats in sorted(total["seats"].items()):
+        wins = total["wins"][spec]
+        lines.append(f"{spec}: {wins} wins, {wins / seats:.1%} per seat (even share {1 / players:.1%})")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--cpu", action="append", dest="cpus",
+                        help="strategy name or module:Class; repeat to seat several")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+    if not 2 <= args.players <= 10:
+        parser.error("Uno needs 2 to 10 players.")
+    total = simulate(args.games, args.players, args.cpus or ["basic"], args.seed, args.workers)
+    print(report(total, args.players))
+
+
+if __name__ == "__main__":
+    main()
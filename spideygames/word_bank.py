@@ -0,0 +1,159 @@
+from __future__ import annotations
+import json
+import mmap
+import os
+import random
+import sys
+from array import array
+
+# Anagram difficulties: minimum wordfreq frequency and word length bounds (None = no upper limit).
+DIFFICULTY_SETTINGS = {
+    "novice": {"freq": .0001, "min_length": 4, "max_length": 6},
+    "easy": {"freq": 0.00001, "min_length": 4, "max_length": 8},
+    "medium": {"freq": 0.000001, "min_length": 4, "max_length": 10},
+    "hard": {"freq": 0.0000001, "min_length": 6, "max_length": 12},
+    "expert": {"freq": 0.00000001, "min_length": 6, "max_length": 20},
+    "impossible": {"freq": 0.000000001, "min_length": 8, "max_length": None},
+}
+DEFAULT_DIFFICULTY = "medium"
+
+_MAGIC = b"SGWORDS1\n"
+
+
+def _in_bucket(word: str, freq: float, settings: dict) -> bool:
+    max_length = settings["max_length"]
+    return (
+        freq >= settings["freq"]
+        and len(word) >= settings["min_length"]
+        and (max_length is None or len(word) <= max_length)
+    )
+
+
+def _source_words() -> list[str]:
+    """
+    The nltk `words` corpus (Webster's 2nd, web2). Offline hosts can use the same
+    list from the english-words package instead (`pip install english-words`).
+    """
+    try:
+        from nltk.corpus import words
+
+        return words.words()
+    except (ImportError, LookupError):
+        from english_words import get_english_words_set
+
+        return sorted(get_english_words_set(["web2"], lower=True, alpha=True))
+
+
+def build(path: str) -> None:
+    """
+    Score the web2 word list with wordfreq once and write the bank to `path`.
+    Only this offline step needs wordfreq (plus nltk's `words` corpus or the
+    english-words package); run `python word_bank.py data/words.bin` to refresh
+    the copy shipped with the cog. The cog itself never builds a bank.
+
+    Layout: magic line, JSON header line (padded to 4 bytes), word offsets
+    (uint32, words + 1), one uint32 array of word numbers per difficulty, then
+    the words as one utf-8 blob.
+    """
+    import wordfreq
+
+    scored = {}
+    for word in _source_words():
+        word = word.lower()
+        if word not in scored:
+            scored[word] = wordfreq.word_frequency(word, "en")
+    floor = min(s["freq"] for s in DIFFICULTY_SETTINGS.values())
+    kept = sorted(word for word, freq in scored.items() if freq >= floor)
+
+    offsets = array("I", [0])
+    blob = bytearray()
+    for word in kept:
+        blob += word.encode("utf-8")
+        offsets.append(len(blob))
+    buckets = {
+        name: array("I", (i for i, word in enumerate(kept) if _in_bucket(word, scored[word], settings)))
+        for name, settings in DIFFICULTY_SETTINGS.items()
+    }
+
+    header = json.dumps({
+        "byteorder": sys.byteorder,
+        "words": len(kept),
+        "buckets": {name: len(bucket) for name, bucket in buckets.items()},
+    }).encode("utf-8")
+    header += b" " * (-(len(_MAGIC) + len(header) + 1) % 4) + b"\n"
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_MAGIC)
+        f.write(header)
+        offsets.tofile(f)
+        for bucket in buckets.values():
+            bucket.tofile(f)
+        f.write(blob)
+    os.replace(tmp, path)
+
+
+class WordBank:
+    """
+    A built word bank, memory-mapped. Picking a word is one random index into a
+    difficulty's array plus a slice of the blob; nothing is scanned or scored.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._parse()
+        except Exception:
+            self.close()
+            raise
+
+    def _parse(self) -> None:
+        view = memoryview(self._map)
+        if bytes(view[:len(_MAGIC)]) != _MAGIC:
+            raise ValueError("not a word bank")
+        end = self._map.find(b"\n", len(_MAGIC)) + 1
+        header = json.loads(bytes(view[len(_MAGIC):end]))
+        swap = header["byteorder"] != sys.byteorder
+        pos = end
+        count = header["words"] + 1
+        self._offsets = self._uint32s(view[pos:pos + 4 * count], swap)
+        pos += 4 * count
+        self._buckets = {}
+        for name, count in header["buckets"].items():
+            self._buckets[name] = self._uint32s(view[pos:pos + 4 * count], swap)
+            pos += 4 * count
+        self._blob = view[pos:]
+        self._view = view
+
+    @staticmethod
+    def _uint32s(chunk: memoryview, swap: bool):
+        """The chunk as uint32s; a copy, byte-swapped, if the bank was built on the other byte order."""
+        if not swap:
+            return chunk.cast("I")
+        values = array("I", bytes(chunk))
+        values.byteswap()
+        return memoryview(values)
+
+    def word(self, n: int) -> str:
+        return bytes(self._blob[self._offsets[n]:self._offsets[n + 1]]).decode("utf-8")
+
+    def choice(self, difficulty: str, rng: random.Random = random) -> str:
+        """A random word for `difficulty` (unknown difficulties play as medium)."""
+        bucket = self._buckets.get(difficulty) or self._buckets[DEFAULT_DIFFICULTY]
+        return self.word(bucket[rng.randrange(len(bucket))])
+
+    def size(self, difficulty: str) -> int:
+        return len(self._buckets.get(difficulty, ()))
+
+    def close(self) -> None:
+        for view in (*getattr(self, "_buckets", {}).values(), getattr(self, "_offsets", None),
+                     getattr(self, "_blob", None), getattr(self, "_view", None)):
+            if view is not None:
+                view.release()
+        self._buckets = {}
+        self._map.close()
+
+
+if __name__ == "__main__":
+    build(sys.argv[1] if len(sys.argv) > 1 else "words.bin")
@@ -0,0 +1,133 @@
+"""
+Time one indexed lookup through the pooled connection against connect-per-call.
+
+    python spideygov/bench_db_pool.py --rows 50000 --queries 5000
+
+"connect+init" is what the USC search did before the pool: open a connection,
+run the CREATE script, query, close. "connect" drops the CREATE script, and
+"pooled" reuses this thread's WAL connection and its statement cache. "pooled,
+threaded" pushes each query through SQLitePool.run from an event loop, the way
+the cog's commands do. Runs on a temporary database; needs nothing beyond the stdlib.
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+
+if __package__:
+    from .db_pool import SQLitePool
+else:  # run as a script, without the package __init__ (which loads the cog)
+    from db_pool import SQLitePool
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS usc_sections (
+  id          INTEGER PRIMARY KEY,
+  title_num   INTEGER NOT NULL,
+  section_num TEXT NOT NULL,
+  heading     TEXT,
+  body_text   TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_usc_sections_num ON usc_sections(title_num, section_num);
+CREATE VIRTUAL TABLE IF NOT EXISTS usc_sections_fts USING fts5(title_num, section_num, heading, body_text);
+"""
+QUERY = "SELECT id, heading, body_text FROM usc_sections WHERE title_num=? AND section_num=?"
+
+
+def populate(path: str, rows: int) -> None:
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.executemany(
+        "INSERT INTO usc_sections(title_num, section_num, heading, body_text) VALUES(?,?,?,?)",
+        ((n % 54 + 1, str(n), f"Section {n}", "Lorem ipsum " * 40) for n in range(rows)),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _key(rng: random.Random, rows: int) -> tuple[int, str]:
+    n = rng.randrange(rows)
+    return n % 54 + 1, str(n)
+
+
+def bench_connect(path: str, rows: int, queries: int, init: bool) -> list[float]:
+    rng = random.Random(1)
+    timings = []
+    for _ in range(queries):
+        t0 = time.perf_counter()
+        conn = sqlite3.connect(path)
+        try:
+            if init:
+                conn.executescript(SCHEMA)
+            conn.execute(QUERY, _key(rng, rows)).fetchone()
+        finally:
+            conn.close()
+        timings.append((time.perf_counter() - t0) * 1e6)
+    return timings
+
+
+def bench_pooled(pool: SQLitePool, rows: int, queries: int) -> list[float]:
+    rng = random.Random(1)
+    pool.ensure_schema("bench", lambda conn: conn.executescript(SCHEMA))
+    timings = []
+    for _ in range(queries):
+        t0 = time.perf_counter()
+        conn = pool.connect()
+        try:
+            conn.execute(QUERY, _key(rng, rows)).fetchone()
+        finally:
+            conn.close()
+        timings.append((time.perf_counter() - t0) * 1e6)
+    return timings
+
+
+async def bench_threaded(pool: SQLitePool, rows: int, queries: int) -> list[float]:
+    rng = random.Random(1)
+
+    def lookup(key):
+        conn = pool.connect()
+        try:
+            return conn.execute(QUERY, key).fetchone()
+        finally:
+            conn.close()
+
+    timings = []
+    for _ in range(queries):
+        t0 = time.perf_counter()
+        await pool.run(lookup, _key(rng, rows))
+        timings.append((time.perf_counter() - t0) * 1e6)
+    return timings
+
+
+def _summary(timings: list[float]) -> str:
+    ordered = sorted(timings)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f"p50 {statistics.median(ordered):8.1f} us  p99 {p99:8.1f} us"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=5_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "usc.sqlite3")
+        populate(path, args.rows)
+        pool = SQLitePool(path)
+        try:
+            print(f"connect+init      {_summary(bench_connect(path, args.rows, args.queries, init=True))}")
+            print(f"connect           {_summary(bench_connect(path, args.rows, args.queries, init=False))}")
+            print(f"pooled            {_summary(bench_pooled(pool, args.rows, args.queries))}")
+            print(f"pooled, threaded  {_summary(asyncio.run(bench_threaded(pool, args.rows, args.queries)))}")
+            print("pool stats:", pool.stats())
+        finally:
+            pool.close_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Time a registry save through the journal against the old full-file rewrite, by registry size.
+
+    python spideygov/bench_registry_journal.py --sizes 1000 10000 50000 --saves 50
+
+Each save changes one record (a vote on one bill), which is what most of the
+registry's save sites do. The old path is what save_federal_registry did before
+the journal: copy the live file to a .bak, dump the whole registry with indent=2
+and fsync it. Runs in a temporary folder; needs nothing beyond the stdlib.
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+if __package__:
+    from .registry_journal import RegistryJournal
+else:  # run as a script, without the package __init__ (which loads the cog)
+    from registry_journal import RegistryJournal
+
+
+def make_registry(bills: int) -> dict:
+    """A registry shaped like the real one, with `bills` bills carrying a short history each."""
+    return {
+        "bills": {
+            f"HR-{n}": {
+                "title": f"A bill to amend title {n % 54} of the U.S. Code",
+                "status": "In Committee",
+                "sponsor": str(100000000000000000 + n),
+                "votes": {"yea": [], "nay": [], "abstain": []},
+                "history": [{"ts": 1700000000 + n, "event": "Introduced"}],
+            }
+            for n in range(bills)
+        },
+        "residency": {},
+        "elections": {},
+    }
+
+
+def _mutate(data: dict, i: int) -> None:
+    bill = data["bills"][f"HR-{i % len(data['bills'])}"]
+    bill["votes"]["yea"].append(str(200000000000000000 + i))
+
+
+def bench_journal(folder: str, data: dict, saves: int) -> list[float]:
+    journal = RegistryJournal(os.path.join(folder, "registry.json"))
+    journal.compact(data)
+    timings = []
+    for i in range(saves):
+        _mutate(data, i)
+        t0 = time.perf_counter()
+        journal.save(data)
+        timings.append((time.perf_counter() - t0) * 1000.0)
+    return timings
+
+
+def bench_rewrite(folder: str, data: dict, saves: int) -> list[float]:
+    path = os.path.join(folder, "registry_old.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    timings = []
+    for i in range(saves):
+        _mutate(data, i)
+        t0 = time.perf_counter()
+        shutil.copy2(path, f"{path}.{i}.bak")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        timings.append((time.perf_counter() - t0) * 1000.0)
+    return timings
+
+
+def _summary(timings: list[float]) -> str:
+    ordered = sorted(timings)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f"p50 {statistics.median(ordered):8.2f} ms  p99 {p99:8.2f} ms"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--saves", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    for bills in args.sizes:
+        with tempfile.TemporaryDirectory() as folder:
+            size = len(json.dumps(make_registry(bills), indent=2)) / 1e6
+            print(f"{bills} bills ({size:.1f} MB)")
+            print(f"  journal  {_summary(bench_journal(folder, make_registry(bills), args.saves))}")
+            print(f"  rewrite  {_summary(bench_rewrite(folder, make_registry(bills), args.saves))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Time the streaming USC importer on synthetic USLM titles: sections/sec and peak RSS.
+
+    python spideygov/bench_usc_import.py --sections 20000 --titles 4 --workers 4
+
+Writes each synthetic title to a temporary folder, then parses it into a staging
+DB the way [p]usc import does, one title per worker process so every peak RSS
+figure belongs to a single title. Covers the parse/staging phase only; merging
+needs the live USC schema from the cog. Needs nothing beyond the stdlib.
+"""
+from __future__ import annotations
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+if __package__:
+    from .usc_import import parse_title_file
+else:  # run as a script, without the package __init__ (which loads the cog)
+    from usc_import import parse_title_file
+
+USLM_NS = "http://xml.house.gov/schemas/uslm/1.0"
+SECTIONS_PER_CHAPTER = 50
+FILLER = (
+    "The Secretary shall prescribe such regulations as may be necessary to carry out "
+    "this section, including standards for the submission and review of applications."
+)
+
+
+def write_title(path: str, title_num: int, sections: int) -> int:
+    """Write a USLM title with `sections` sections (three subsections each); returns its size in bytes."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<uscDoc xmlns="{USLM_NS}">')
+        f.write(f"<meta><docNumber>{title_num}</docNumber><created>2024-01-01T00:00:00</created></meta>")
+        f.write(f'<main><title identifier="/us/usc/t{title_num}"><num value="{title_num}">Title {title_num}—</num>')
+        f.write(f"<heading>Synthetic Title {title_num}</heading>")
+        for s in range(1, sections + 1):
+            if s % SECTIONS_PER_CHAPTER == 1:
+                if s > 1:
+                    f.write("</chapter>")
+                ch = s // SECTIONS_PER_CHAPTER + 1
+                f.write(
+                    f'<chapter identifier="/us/usc/t{title_num}/ch{ch}"><num value="{ch}">CHAPTER {ch}—</num>'
+                    f"<heading>Chapter {ch}</heading>"
+                )
+            f.write(
+                f'<section identifier="/us/usc/t{title_num}/s{s}"><num value="{s}">§ {s}.</num>'
+                f"<heading>Section {s}</heading>"
+            )
+            for letter in "abc":
+                f.write(
+                    f'<subsection identifier="/us/usc/t{title_num}/s{s}/{letter}"><num value="{letter}">({letter})</num>'
+                    f"<content>{FILLER}</content></subsection>"
+                )
+            f.write(
+                "<notes><note><heading>Amendments</heading>"
+                f'<section identifier="/us/usc/t{title_num}/s{s}/note"><content>{FILLER}</content></section>'
+                "</note></notes></section>"
+            )
+        f.write("</chapter></title></main></uscDoc>\n")
+    return os.path.getsize(path)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--sections", type=int, default=20000, help="sections per title")
+    parser.add_argument("--titles", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as folder:
+        jobs = []
+        for n in range(1, args.titles + 1):
+            xml_path = os.path.join(folder, f"usc{n:02d}.xml")
+            size = write_title(xml_path, n, args.sections)
+            jobs.append((xml_path, os.path.join(folder, f"usc{n:02d}.stage.sqlite")))
+        print(f"{args.titles} title(s), {args.sections} sections each, {size / 1e6:.1f} MB per title")
+
+        t0 = time.perf_counter()
+        # one title per worker process so ru_maxrss reflects that title alone
+        with ProcessPoolExecutor(max_workers=args.workers, max_tasks_per_child=1) as pool:
+            results = list(pool.map(parse_title_file, *zip(*jobs)))
+        wall = time.perf_counter() - t0
+
+    for r in results:
+        print(
+            f"  title {r['title_num']}: {r['sections']} sections, {r['chapters']} chapters, "
+            f"{r['sections'] / r['parse_seconds']:.0f} sections/s, peak RSS {r['peak_rss_kb'] / 1024:.1f} MB"
+        )
+    total = sum(r["sections"] for r in results)
+    print(f"all titles: {total / wall:.0f} sections/s over {wall:.2f} s wall ({args.workers} workers)")
+
+
+if __name__ == "__main__":
+    main()
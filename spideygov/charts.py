@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from matplotlib.figure import Figure
+
+from .chart_renderer import figure_png
+
+
+# ---------- render functions (run in the pool) ----------
+
+def render_pie(labels: list[str], sizes: list[int], title: str) -> bytes:
+    """Pie chart with the legend to the right (used for the budget breakdown)."""
+    fig = Figure(figsize=(8, 5), dpi=160)
+    ax = fig.add_subplot()
+    wedges, _ = ax.pie(sizes, startangle=90)  # default colors are fine
+    ax.axis("equal")
+    ax.set_title(title)
+    ax.legend(
+        wedges,
+        labels,
+        loc="center left",
+        bbox_to_anchor=(1.02, 0.5),
+        frameon=False,
+    )
+    return figure_png(fig, bbox_inches="tight")
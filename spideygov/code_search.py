@@ -0,0 +1,275 @@
+from __future__ import annotations
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+# Ranked section ids kept per query; cursors page through these without re-running bm25.
+SEARCH_MAX_SECTIONS = 500
+SEARCH_MAX_CHAPTERS = 10
+SEARCH_CACHE_ENTRIES = 128
+# Re-check titles' source_sha256 at most this often, in case the DB changed behind our back.
+GENERATION_TTL = 60.0
+
+_HL_ON = "(char(27) || '[1;33m')"
+_HL_OFF = "(char(27) || '[0m')"
+
+
+def normalize_query(query: str) -> str:
+    return re.sub(r"\s+", " ", (query or "").strip()).lower()
+
+
+class _ResultSet:
+    __slots__ = ("fts_query", "section_ids", "chapters", "sections", "title_headings", "created")
+
+    def __init__(self, fts_query: str, section_ids: list[int], chapters: list[dict]):
+        self.fts_query = fts_query
+        self.section_ids = section_ids
+        self.chapters = chapters
+        self.sections: dict[int, dict] = {}
+        self.title_headings: dict[int, str] = {}
+        self.created = time.monotonic()
+
+
+class CodeSearchService:
+    """
+    Cached, cursor-paged FTS search over the USC or SRC tables (`prefix` = "usc" / "src").
+
+    A search runs the bm25 ranking once and keeps the ordered section ids, keyed by
+    (normalized query, title filter). Pages are cut from that list by offset and only
+    the rows on the page get their snippets computed. Everything is dropped when a
+    title's source_sha256 changes (or `invalidate()` is called after an import).
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        connect: Callable[[], Any],
+        make_fts_query: Callable[[str], str],
+        *,
+        max_entries: int = SEARCH_CACHE_ENTRIES,
+    ):
+        self.prefix = prefix
+        self._connect = connect
+        self._make_fts_query = make_fts_query
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._results: OrderedDict[tuple, _ResultSet] = OrderedDict()
+        self._memo: OrderedDict[tuple, Any] = OrderedDict()
+        self._generation: str | None = None
+        self._generation_checked = 0.0
+
+        self.hits = 0
+        self.misses = 0
+        self.memo_hits = 0
+        self.memo_misses = 0
+        self.invalidations = 0
+
+    # ---------- invalidation ----------
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self._memo.clear()
+            self._generation = None
+            self._generation_checked = 0.0
+            self.invalidations += 1
+
+    def _check_generation(self, conn) -> None:
+        now = time.monotonic()
+        if self._generation is not None and now - self._generation_checked < GENERATION_TTL:
+            return
+        rows = conn.execute(
+            f"SELECT title_num, COALESCE(source_sha256,'') AS sha FROM {self.prefix}_titles ORDER BY title_num"
+        ).fetchall()
+        gen = "|".join(f"{r['title_num']}:{r['sha']}" for r in rows)
+        with self._lock:
+            if self._generation is not None and gen != self._generation:
+                self._results.clear()
+                self._memo.clear()
+                self.invalidations += 1
+            self._generation = gen
+            self._generation_checked = now
+
+    # ---------- ranking ----------
+
+    def _rank(self, conn, fts_query: str, title: int | None) -> _ResultSet:
+        p = self.prefix
+        sec_sql = f"""
+        SELECT s.id
+        FROM {p}_sections_fts
+        JOIN {p}_sections s ON s.id = {p}_sections_fts.rowid
+        WHERE {p}_sections_fts MATCH ?
+        """
+        params: list = [fts_query]
+        if title is not None:
+            sec_sql += " AND s.title_num = ?"
+            params.append(int(title))
+        sec_sql += f" ORDER BY bm25({p}_sections_fts, 0.0, 0.0, 6.0, 1.0) LIMIT ?"
+        params.append(SEARCH_MAX_SECTIONS)
+        section_ids = [int(r[0]) for r in conn.execute(sec_sql, params).fetchall()]
+
+        ch_sql = f"""
+        SELECT
+          n.title_num,
+          COALESCE(n.num,'') AS num,
+          COALESCE(n.heading,'') AS heading,
+          snippet({p}_nodes_fts, 3, {_HL_ON}, {_HL_OFF}, '…', 16) AS snip
+        FROM {p}_nodes_fts
+        JOIN {p}_nodes n ON n.id = {p}_nodes_fts.rowid
+        WHERE {p}_nodes_fts MATCH ?
+          AND n.node_type='chapter'
+        """
+        params = [fts_query]
+        if title is not None:
+            ch_sql += " AND n.title_num = ?"
+            params.append(int(title))
+        ch_sql += f" ORDER BY bm25({p}_nodes_fts, 0.0, 0.0, 0.0, 1.0) LIMIT ?"
+        params.append(SEARCH_MAX_CHAPTERS)
+        chapters = [
+            {"title_num": int(r["title_num"]), "num": r["num"], "heading": r["heading"], "snip": r["snip"] or r["heading"]}
+            for r in conn.execute(ch_sql, params).fetchall()
+        ]
+        return _ResultSet(fts_query, section_ids, chapters)
+
+    def _result_set(self, conn, query: str, title: int | None) -> _ResultSet | None:
+        key = (normalize_query(query), title)
+        with self._lock:
+            rs = self._results.get(key)
+            if rs is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return rs
+
+        fts_query = self._make_fts_query(query)
+        if not fts_query:
+            return None
+        rs = self._rank(conn, fts_query, title)
+        with self._lock:
+            self.misses += 1
+            self._results[key] = rs
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+        return rs
+
+    # ---------- pages ----------
+
+    def _fill_page(self, conn, rs: _ResultSet, ids: list[int]) -> None:
+        p = self.prefix
+        missing = [i for i in ids if i not in rs.sections]
+        if missing:
+            qmarks = ",".join("?" for _ in missing)
+            sql = f"""
+            SELECT
+              s.id,
+              s.title_num,
+              s.section_num,
+              COALESCE(s.heading,'') AS heading,
+              COALESCE(n.num,'') AS chapter_num,
+              COALESCE(n.heading,'') AS chapter_heading,
+              snippet({p}_sections_fts, 2, {_HL_ON}, {_HL_OFF}, '…', 12) AS hsnip,
+              snippet({p}_sections_fts, 3, {_HL_ON}, {_HL_OFF}, '…', 24) AS bsnip
+            FROM {p}_sections_fts
+            JOIN {p}_sections s ON s.id = {p}_sections_fts.rowid
+            LEFT JOIN {p}_nodes n ON n.id = s.node_id
+            WHERE {p}_sections_fts MATCH ? AND {p}_sections_fts.rowid IN ({qmarks})
+            """
+            for r in conn.execute(sql, [rs.fts_query, *missing]).fetchall():
+                rs.sections[int(r["id"])] = {
+                    "title_num": int(r["title_num"]),
+                    "chapter_num": r["chapter_num"],
+                    "chapter_heading": r["chapter_heading"],
+                    "section_num": r["section_num"],
+                    "heading": r["heading"],
+                    "hsnip": r["hsnip"] or r["heading"],
+                    "bsnip": r["bsnip"] or "",
+                }
+
+        need = {rs.sections[i]["title_num"] for i in ids if i in rs.sections}
+        need |= {c["title_num"] for c in rs.chapters}
+        need -= rs.title_headings.keys()
+        if need:
+            qmarks = ",".join("?" for _ in need)
+            for r in conn.execute(f"SELECT title_num, heading FROM {p}_titles WHERE title_num IN ({qmarks})", sorted(need)):
+                rs.title_headings[int(r["title_num"])] = r["heading"]
+
+    def search(self, query: str, title: int | None, offset: int = 0, limit: int = 25) -> dict:
+        """
+        One page of results, grouped the way the search commands render them:
+          {"titles": {n: {"title_heading", "chapters", "sections"}}, "counts": {...},
+           "offset", "next_offset" (None at the end), "total"}
+        Chapter hits are only included on the first page.
+        """
+        conn = self._connect()
+        try:
+            self._check_generation(conn)
+            rs = self._result_set(conn, query, title)
+            if rs is None:
+                return {"titles": {}, "counts": {"sections": 0, "chapters": 0}, "offset": 0, "next_offset": None, "total": 0}
+
+            offset = max(0, int(offset))
+            ids = rs.section_ids[offset:offset + limit]
+            self._fill_page(conn, rs, ids)
+        finally:
+            conn.close()
+
+        chapters = rs.chapters if offset == 0 else []
+        grouped: dict[int, dict] = {}
+
+        def bucket(tnum: int) -> dict:
+            if tnum not in grouped:
+                grouped[tnum] = {"title_heading": rs.title_headings.get(tnum, ""), "chapters": [], "sections": []}
+            return grouped[tnum]
+
+        for c in chapters:
+            bucket(c["title_num"])["chapters"].append({"num": c["num"], "heading": c["heading"], "snip": c["snip"]})
+        for i in ids:
+            sec = rs.sections.get(i)
+            if sec:
+                bucket(sec["title_num"])["sections"].append(sec)
+
+        end = offset + len(ids)
+        return {
+            "titles": grouped,
+            "counts": {"sections": len(rs.section_ids), "chapters": len(rs.chapters)},
+            "offset": offset,
+            "next_offset": end if end < len(rs.section_ids) else None,
+            "total": len(rs.section_ids),
+        }
+
+    # ---------- memoised lookups ----------
+
+    def cached(self, key: tuple, fn: Callable, *args) -> Any:
+        """Memoise a read (e.g. a section row for /compare) under the same invalidation rules."""
+        conn = self._connect()
+        try:
+            self._check_generation(conn)
+        finally:
+            conn.close()
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                self.memo_hits += 1
+                return self._memo[key]
+        val = fn(*args)
+        with self._lock:
+            self.memo_misses += 1
+            self._memo[key] = val
+            while len(self._memo) > self.max_entries * 4:
+                self._memo.popitem(last=False)
+        return val
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        mtotal = self.memo_hits + self.memo_misses
+        return {
+            "entries": len(self._results),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits / total) if total else 0.0,
+            "memo_entries": len(self._memo),
+            "memo_hit_ratio": (self.memo_hits / mtotal) if mtotal else 0.0,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,219 @@
+from __future__ import annotations
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable
+
+# sqlite3's per-connection prepared statement cache; long-lived connections make it pay off
+STATEMENT_CACHE_SIZE = 256
+
+_PRAGMAS = (
+    "PRAGMA foreign_keys = ON;",
+    "PRAGMA journal_mode = WAL;",
+    "PRAGMA synchronous = NORMAL;",
+)
+
+
+class _Counters:
+    __slots__ = ("queries", "seconds", "slowest", "connects", "checkouts")
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+        self.slowest = 0.0
+        self.connects = 0
+        self.checkouts = 0
+
+
+class PooledConnection:
+    """
+    Thin wrapper over a thread-owned sqlite3.Connection. Existing call sites keep their
+    `conn = connect(); try: ... finally: conn.close()` shape: close() only hands the
+    connection back (rolling back anything left uncommitted, as a real close would).
+    """
+
+    __slots__ = ("_conn", "_pool", "_depth")
+
+    def __init__(self, conn: sqlite3.Connection, pool: "SQLitePool"):
+        self._conn = conn
+        self._pool = pool
+        self._depth = 0
+
+    def _timed(self, fn: Callable, *args) -> Any:
+        t0 = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self._pool._record(time.perf_counter() - t0)
+
+    def execute(self, sql: str, params: Any = ()) -> sqlite3.Cursor:
+        return self._timed(self._conn.execute, sql, params)
+
+    def executemany(self, sql: str, seq: Any) -> sqlite3.Cursor:
+        return self._timed(self._conn.executemany, sql, seq)
+
+    def executescript(self, script: str) -> sqlite3.Cursor:
+        return self._timed(self._conn.executescript, script)
+
+    def cursor(self) -> "PooledCursor":
+        return PooledCursor(self._conn.cursor(), self._pool)
+
+    def close(self) -> None:
+        self._depth -= 1
+        if self._depth <= 0:
+            self._depth = 0
+            if self._conn.in_transaction:
+                self._conn.rollback()
+
+    def __enter__(self):
+        return self._conn.__enter__()
+
+    def __exit__(self, *exc):
+        return self._conn.__exit__(*exc)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+
+class PooledCursor:
+    __slots__ = ("_cur", "_pool")
+
+    def __init__(self, cur: sqlite3.Cursor, pool: "SQLitePool"):
+        self._cur = cur
+        self._pool = pool
+
+    def execute(self, sql: str, params: Any = ()) -> "PooledCursor":
+        t0 = time.perf_counter()
+        try:
+            self._cur.execute(sql, params)
+        finally:
+            self._pool._record(time.perf_counter() - t0)
+        return self
+
+    def executemany(self, sql: str, seq: Any) -> "PooledCursor":
+        t0 = time.perf_counter()
+        try:
+            self._cur.executemany(sql, seq)
+        finally:
+            self._pool._record(time.perf_counter() - t0)
+        return self
+
+    def __iter__(self):
+        return iter(self._cur)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cur, name)
+
+
+class SQLitePool:
+    """
+    One long-lived WAL connection per (database, thread), created on first use.
+    Schema setup runs once per process via `ensure_schema`, and `run()` pushes the
+    blocking work onto a worker thread so the event loop never waits on disk.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._lock = threading.RLock()
+        self._schema_done: set[str] = set()
+        self._all: list[sqlite3.Connection] = []
+        self.counters = _Counters()
+
+    def _record(self, seconds: float) -> None:
+        c = self.counters
+        c.queries += 1
+        c.seconds += seconds
+        if seconds > c.slowest:
+            c.slowest = seconds
+
+    def _open(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        # each connection stays on its creating thread; the flag only lets close_all() run from anywhere
+        conn = sqlite3.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for p in _PRAGMAS:
+            conn.execute(p)
+        return conn
+
+    def connect(self) -> PooledConnection:
+        pc = getattr(self._local, "conn", None)
+        if pc is None:
+            raw = self._open()
+            pc = PooledConnection(raw, self)
+            self._local.conn = pc
+            with self._lock:
+                self._all.append(raw)
+                self.counters.connects += 1
+        pc._depth += 1
+        self.counters.checkouts += 1
+        return pc
+
+    def dedicated(self) -> sqlite3.Connection:
+        """A private, unpooled connection for bulk jobs that change pragmas or ATTACH databases."""
+        return self._open()
+
+    def ensure_schema(self, key: str, init: Callable[[PooledConnection], None]) -> None:
+        if key in self._schema_done:
+            return
+        with self._lock:
+            if key in self._schema_done:
+                return
+            conn = self.connect()
+            try:
+                init(conn)
+            finally:
+                conn.close()
+            self._schema_done.add(key)
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    def close_all(self) -> None:
+        with self._lock:
+            for raw in self._all:
+                try:
+                    raw.close()
+                except Exception:
+                    pass
+            self._all.clear()
+        self._local = threading.local()
+        self._schema_done.clear()
+
+    def stats(self) -> dict:
+        c = self.counters
+        return {
+            "connections": c.connects,
+            "checkouts": c.checkouts,
+            "queries": c.queries,
+            "total_ms": round(c.seconds * 1000.0, 2),
+            "avg_ms": round((c.seconds / c.queries) * 1000.0, 3) if c.queries else 0.0,
+            "slowest_ms": round(c.slowest * 1000.0, 2),
+        }
+
+
+_POOLS: dict[str, SQLitePool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(db_path: str) -> SQLitePool:
+    """Process-wide pool per database file."""
+    key = os.path.abspath(db_path)
+    pool = _POOLS.get(key)
+    if pool is None:
+        with _POOLS_LOCK:
+            pool = _POOLS.setdefault(key, SQLitePool(key))
+    return pool
+
+
+def all_pools() -> dict[str, SQLitePool]:
+    return dict(_POOLS)
+
+
+def close_all_pools() -> None:
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            pool.close_all()
+        _POOLS.clear()
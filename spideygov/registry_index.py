@@ -0,0 +1,376 @@
+from __future__ import annotations
+from bisect import bisect_left, insort
+from itertools import count
+from typing import Any, Callable, Hashable, Iterable, Iterator
+
+# Substring lookups go through an n-gram map; queries longer than this intersect grams.
+GRAM_LEN = 3
+# Below this many candidates we sort the matches; above it we walk the ordered keys.
+_SORT_THRESHOLD = 256
+
+
+def _grams(text: str) -> set[str]:
+    out = set()
+    n = len(text)
+    for size in range(1, GRAM_LEN + 1):
+        for i in range(n - size + 1):
+            out.add(text[i:i + size])
+    return out
+
+
+class LabelIndex:
+    """
+    Ordered key -> label map with an n-gram index so `cur in label.lower()` style
+    autocomplete doesn't scan (or re-lowercase) every label per keystroke.
+    Keys are kept ordered by `rank` (defaults to insertion order).
+    """
+
+    def __init__(self):
+        self._labels: dict[Hashable, str] = {}
+        self._lower: dict[Hashable, str] = {}
+        self._rank: dict[Hashable, tuple] = {}
+        self._ordered: list[tuple] = []
+        self._grams: dict[str, set] = {}
+        self._seq = count()
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._labels
+
+    def label(self, key: Hashable) -> str | None:
+        return self._labels.get(key)
+
+    def put(self, key: Hashable, label: str, *, search_text: str | None = None, rank: Any = None) -> None:
+        lower = (search_text if search_text is not None else label).lower()
+        old_rank = self._rank.get(key)
+        if old_rank is not None and self._labels[key] == label and self._lower[key] == lower \
+                and (rank is None or old_rank[0] == rank):
+            return
+
+        if old_rank is not None:
+            self._drop_grams(key, self._lower[key])
+            if rank is not None and old_rank[0] != rank:
+                self._ordered.pop(bisect_left(self._ordered, old_rank + (key,)))
+                old_rank = None
+
+        if old_rank is None:
+            seq = next(self._seq)
+            r = (rank if rank is not None else seq, seq)
+            self._rank[key] = r
+            insort(self._ordered, r + (key,))
+
+        self._labels[key] = label
+        self._lower[key] = lower
+        for g in _grams(lower):
+            self._grams.setdefault(g, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        r = self._rank.pop(key, None)
+        if r is None:
+            return
+        self._ordered.pop(bisect_left(self._ordered, r + (key,)))
+        self._drop_grams(key, self._lower.pop(key))
+        del self._labels[key]
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def _drop_grams(self, key: Hashable, lower: str) -> None:
+        for g in _grams(lower):
+            bucket = self._grams.get(g)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._grams[g]
+
+    def _candidates(self, cur: str) -> set | None:
+        if len(cur) <= GRAM_LEN:
+            return self._grams.get(cur, set())
+        sets = [self._grams.get(cur[i:i + GRAM_LEN]) for i in range(len(cur) - GRAM_LEN + 1)]
+        if any(s is None for s in sets):
+            return set()
+        sets.sort(key=len)
+        hits = set(sets[0])
+        for s in sets[1:]:
+            hits &= s
+            if not hits:
+                break
+        return {k for k in hits if cur in self._lower[k]}
+
+    def keys(self, *, reverse: bool = False) -> Iterator[Hashable]:
+        seq = reversed(self._ordered) if reverse else self._ordered
+        return (entry[-1] for entry in seq)
+
+    def search(self, current: str | None, limit: int = 25, *, reverse: bool = False) -> list[Hashable]:
+        cur = (current or "").lower()
+        if not cur:
+            out = []
+            for k in self.keys(reverse=reverse):
+                out.append(k)
+                if len(out) >= limit:
+                    break
+            return out
+
+        hits = self._candidates(cur)
+        if not hits:
+            return []
+        if len(hits) <= _SORT_THRESHOLD:
+            return sorted(hits, key=lambda k: self._rank[k], reverse=reverse)[:limit]
+        out = []
+        for k in self.keys(reverse=reverse):
+            if k in hits:
+                out.append(k)
+                if len(out) >= limit:
+                    break
+        return out
+
+
+class _Section:
+    """
+    One registry section (e.g. reg["bills"]["items"]) mirrored into a LabelIndex plus
+    secondary `field -> value -> {keys}` indexes. Kept in step from journal op paths.
+    """
+
+    root: tuple[str, ...] = ()
+    facets: tuple[str, ...] = ()
+
+    def __init__(self):
+        self.labels = LabelIndex()
+        self.by: dict[str, dict[Any, set]] = {f: {} for f in self.facets}
+        self._facet_vals: dict[Hashable, dict[str, Any]] = {}
+
+    # --- overridables ---
+    def label_for(self, key: str, item: dict) -> str:
+        return f"{key} — {item.get('title', '')}"
+
+    def facet_values(self, key: str, item: dict) -> dict[str, Any]:
+        return {f: item.get(f) for f in self.facets}
+
+    # --- plumbing ---
+    def items_of(self, reg: dict) -> dict:
+        node: Any = reg
+        for p in self.root:
+            node = node.get(p) if isinstance(node, dict) else None
+            if node is None:
+                return {}
+        return node if isinstance(node, dict) else {}
+
+    def rebuild(self, reg: dict) -> None:
+        self.labels.clear()
+        self.by = {f: {} for f in self.facets}
+        self._facet_vals.clear()
+        for key, item in self.items_of(reg).items():
+            self.refresh(key, item)
+
+    def refresh(self, key: str, item: Any) -> None:
+        self._unfacet(key)
+        if not isinstance(item, dict):
+            self.labels.remove(key)
+            return
+        self.labels.put(key, self.label_for(key, item))
+        vals = self.facet_values(key, item)
+        self._facet_vals[key] = vals
+        for f, v in vals.items():
+            self.by[f].setdefault(v, set()).add(key)
+
+    def _unfacet(self, key: str) -> None:
+        vals = self._facet_vals.pop(key, None)
+        if not vals:
+            return
+        for f, v in vals.items():
+            bucket = self.by[f].get(v)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self.by[f][v]
+
+    def touched(self, reg: dict, path: list) -> None:
+        n = len(self.root)
+        if len(path) <= n:
+            if tuple(path) == self.root[:len(path)]:
+                self.rebuild(reg)
+            return
+        if tuple(path[:n]) != self.root:
+            return
+        key = path[n]
+        self.refresh(key, self.items_of(reg).get(key))
+
+    def counts(self, facet: str) -> dict[Any, int]:
+        return {v: len(ks) for v, ks in self.by[facet].items()}
+
+    def keys_where(self, facet: str, value: Any) -> set:
+        return self.by[facet].get(value, set())
+
+
+class BillsSection(_Section):
+    root = ("bills", "items")
+    facets = ("status", "chamber")
+
+    def facet_values(self, key: str, item: dict) -> dict[str, Any]:
+        return {"status": item.get("status", "DRAFT"), "chamber": item.get("chamber")}
+
+
+class ContestsSection(_Section):
+    root = ("elections", "contests")
+    facets = ("status", "category")
+
+    def label_for(self, key: str, item: dict) -> str:
+        return f"{key} — {(item.get('office') or item.get('kind') or '?').title()} ({item.get('category','?')})"
+
+
+class ExecutiveOrdersSection(_Section):
+    root = ("executive_orders", "items")
+    facets = ("status", "year")
+
+    def facet_values(self, key: str, item: dict) -> dict[str, Any]:
+        parts = str(key).split("-")
+        year = parts[1] if len(parts) > 2 else None
+        return {"status": item.get("status"), "year": year}
+
+
+class CommitteesSection(_Section):
+    """
+    One LabelIndex per chamber holding both committees ("key") and subcommittees
+    ("key::sub"), in the same sorted parent → children order the autocomplete used.
+    A touch anywhere under a chamber rebuilds just that chamber (committees change rarely).
+    """
+
+    root = ("committees",)
+    chambers = ("senate", "house", "joint")
+
+    def __init__(self):
+        super().__init__()
+        self.per_chamber: dict[str, LabelIndex] = {c: LabelIndex() for c in self.chambers}
+
+    def rebuild(self, reg: dict) -> None:
+        for ch in self.chambers:
+            self._rebuild_chamber(reg, ch)
+
+    def _rebuild_chamber(self, reg: dict, chamber: str) -> None:
+        idx = self.per_chamber.setdefault(chamber, LabelIndex())
+        idx.clear()
+        bucket = self.items_of(reg).get(chamber) or {}
+        if not isinstance(bucket, dict):
+            return
+        for key, data in sorted(bucket.items(), key=lambda kv: kv[0]):
+            if not isinstance(data, dict):
+                continue
+            label = (data.get("name") or key.replace("_", " ").title()).strip()
+            idx.put(key, label)
+            subs = data.get("sub_committees") or {}
+            for sk, sv in sorted(subs.items(), key=lambda kv: kv[0]):
+                if not isinstance(sv, dict):
+                    continue
+                slabel = (sv.get("name") or sk.replace("_", " ").title()).strip()
+                idx.put(f"{key}::{sk}", f"{label} → {slabel}")
+
+    def touched(self, reg: dict, path: list) -> None:
+        if not path or path[0] != "committees":
+            return
+        if len(path) == 1:
+            self.rebuild(reg)
+        elif path[1] in self.per_chamber or path[1] in self.chambers:
+            self._rebuild_chamber(reg, path[1])
+
+    def search(self, chamber: str, current: str | None, limit: int = 25) -> list[tuple[str, str]]:
+        idx = self.per_chamber.get(chamber)
+        if idx is None:
+            return []
+        return [(k, idx.label(k)) for k in idx.search(current, limit)]
+
+
+class ApplicantIndex:
+    """
+    Per-guild index of members holding the pending-resident / applicant roles,
+    searchable by display name, username and global name. Fed by member events.
+    """
+
+    def __init__(self, tag_for: Callable[[Any], str | None]):
+        self._tag_for = tag_for
+        self._guilds: dict[int, LabelIndex] = {}
+        self.by_tag: dict[int, dict[str, set]] = {}
+        self._tags: dict[tuple[int, int], str] = {}
+
+    def ready(self, guild_id: int) -> bool:
+        return guild_id in self._guilds
+
+    def build(self, guild_id: int, members: Iterable[Any]) -> None:
+        self._guilds[guild_id] = LabelIndex()
+        self.by_tag[guild_id] = {}
+        for k in [k for k in self._tags if k[0] == guild_id]:
+            del self._tags[k]
+        for m in members:
+            self.update(guild_id, m)
+
+    def update(self, guild_id: int, member: Any) -> None:
+        idx = self._guilds.get(guild_id)
+        if idx is None:
+            return
+        self._untag(guild_id, member.id)
+        tag = None if getattr(member, "bot", False) else self._tag_for(member)
+        if not tag:
+            idx.remove(member.id)
+            return
+        display = member.display_name or member.name
+        names = "\n".join([
+            (member.display_name or ""),
+            (member.name or ""),
+            (getattr(member, "global_name", "") or ""),
+        ])
+        idx.put(member.id, f"{display} ({tag})", search_text=names, rank=display.lower())
+        self._tags[(guild_id, member.id)] = tag
+        self.by_tag[guild_id].setdefault(tag, set()).add(member.id)
+
+    def remove(self, guild_id: int, member_id: int) -> None:
+        idx = self._guilds.get(guild_id)
+        if idx is None:
+            return
+        self._untag(guild_id, member_id)
+        idx.remove(member_id)
+
+    def _untag(self, guild_id: int, member_id: int) -> None:
+        tag = self._tags.pop((guild_id, member_id), None)
+        if tag is not None:
+            self.by_tag[guild_id].get(tag, set()).discard(member_id)
+
+    def search(self, guild_id: int, current: str | None, limit: int = 25) -> list[tuple[int, str]]:
+        idx = self._guilds.get(guild_id)
+        if idx is None:
+            return []
+        return [(k, idx.label(k)) for k in idx.search(current, limit)]
+
+
+class RegistryIndex:
+    """
+    Typed, indexed view over the federal registry dict: one section object per area
+    (bills, elections, executive orders, committees). The registry dict stays the
+    source of truth; `apply_ops` keeps the indexes in step with each journaled save.
+    """
+
+    def __init__(self):
+        self.bills = BillsSection()
+        self.contests = ContestsSection()
+        self.executive_orders = ExecutiveOrdersSection()
+        self.committees = CommitteesSection()
+        self._sections = (self.bills, self.contests, self.executive_orders, self.committees)
+
+    def rebuild(self, reg: dict) -> None:
+        for s in self._sections:
+            s.rebuild(reg)
+
+    def apply_ops(self, reg: dict, ops: list) -> None:
+        seen = set()
+        for op in ops:
+            path = op[1]
+            if not path:
+                self.rebuild(reg)
+                return
+            # several ops under one item (history append + status change) need one refresh
+            head = tuple(path[:3])
+            if head in seen:
+                continue
+            seen.add(head)
+            for s in self._sections:
+                s.touched(reg, list(head))
@@ -0,0 +1,331 @@
+from __future__ import annotations
+import glob
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Callable
+
+# Compact the journal into a fresh snapshot once it grows past either limit.
+JOURNAL_COMPACT_BYTES = 2_000_000
+JOURNAL_COMPACT_RECORDS = 500
+# How many rotated snapshot backups (<registry>.<timestamp>.bak) to keep around.
+BACKUP_RETENTION = 12
+
+_MISSING = object()
+
+
+def _json_key(k: Any) -> str:
+    """Mirror how json.dump stringifies dict keys so live and shadow keys compare equal."""
+    if isinstance(k, str):
+        return k
+    if k is True:
+        return "true"
+    if k is False:
+        return "false"
+    if k is None:
+        return "null"
+    return str(k)
+
+
+def _diff(old: Any, new: Any, path: list, ops: list) -> None:
+    """
+    Append the ops that turn `old` (the JSON-normalised shadow) into `new` (the live dict).
+      ["set", path, value]        replace/insert a value
+      ["del", path]               drop a dict key
+      ["ext", path, start, items] list grew: keep [:start] and append items
+      ["trunc", path, length]     list shrank
+    """
+    if isinstance(new, dict) and isinstance(old, dict):
+        if old == new:
+            # C-level compare; most of the tree is untouched between saves
+            return
+        seen = set()
+        for k, v in new.items():
+            sk = _json_key(k)
+            seen.add(sk)
+            ov = old.get(sk, _MISSING)
+            if ov is _MISSING:
+                ops.append(["set", path + [sk], v])
+            else:
+                _diff(ov, v, path + [sk], ops)
+        for sk in old.keys() - seen:
+            ops.append(["del", path + [sk]])
+        return
+
+    if isinstance(new, (list, tuple)) and isinstance(old, list):
+        if old == new:
+            return
+        n_old, n_new = len(old), len(new)
+        for i in range(min(n_old, n_new)):
+            _diff(old[i], new[i], path + [i], ops)
+        if n_new > n_old:
+            ops.append(["ext", path, n_old, list(new[n_old:])])
+        elif n_new < n_old:
+            ops.append(["trunc", path, n_new])
+        return
+
+    # leaves; type check keeps True/1 and 1/1.0 from hiding a change
+    if type(old) is not type(new) or old != new:
+        ops.append(["set", path, new])
+
+
+def _walk(root: Any, path: list) -> Any:
+    node = root
+    for p in path:
+        if isinstance(node, dict):
+            node = node.get(p, _MISSING)
+        elif isinstance(node, list) and isinstance(p, int) and p < len(node):
+            node = node[p]
+        else:
+            return _MISSING
+        if node is _MISSING:
+            return _MISSING
+    return node
+
+
+def _apply_op(root: dict, op: list) -> dict:
+    """Apply one journal op in place. Ops are absolute, so replaying them twice is harmless."""
+    kind, path = op[0], op[1]
+    if kind == "set" and not path:
+        return op[2] if isinstance(op[2], dict) else root
+
+    if kind in ("set", "del"):
+        parent = _walk(root, path[:-1])
+        last = path[-1]
+        if isinstance(parent, dict):
+            if kind == "set":
+                parent[last] = op[2]
+            else:
+                parent.pop(last, None)
+        elif isinstance(parent, list) and isinstance(last, int):
+            if kind == "set" and last < len(parent):
+                parent[last] = op[2]
+            elif kind == "set" and last == len(parent):
+                parent.append(op[2])
+        return root
+
+    target = _walk(root, path)
+    if not isinstance(target, list):
+        return root
+    if kind == "ext":
+        start, items = op[2], op[3]
+        del target[start:]
+        target.extend(items)
+    elif kind == "trunc":
+        del target[op[2]:]
+    return root
+
+
+class RegistryJournal:
+    """
+    Write-ahead persistence for the federal registry.
+
+    The registry lives on disk as a JSON snapshot plus an append-only journal of
+    small delta records. `save()` diffs the live dict against a shadow copy of the
+    last persisted state and appends only what changed; `compact()` folds the journal
+    back into a new snapshot and rotates the old one into a bounded set of backups.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        compact_bytes: int = JOURNAL_COMPACT_BYTES,
+        compact_records: int = JOURNAL_COMPACT_RECORDS,
+        backup_retention: int = BACKUP_RETENTION,
+    ):
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.compact_bytes = compact_bytes
+        self.compact_records = compact_records
+        self.backup_retention = backup_retention
+
+        self._shadow: dict | None = None
+        # called as fn(data, ops) after each save so in-memory indexes can follow the deltas
+        self.listeners: list[Callable[[dict, list], None]] = []
+        self._journal_bytes = 0
+        self._journal_records = 0
+
+        self.saves = 0
+        self.noop_saves = 0
+        self.compactions = 0
+        self.last_save_ms = 0.0
+        self.last_compact_ms = 0.0
+        self.last_ops = 0
+
+    # ---------- reading ----------
+
+    def _read_journal(self) -> tuple[list[list], int]:
+        """Return (records, byte_length_of_valid_prefix). A torn final line is ignored."""
+        records: list[list] = []
+        good = 0
+        try:
+            with open(self.journal_path, "rb") as fh:
+                for raw in fh:
+                    if not raw.endswith(b"\n"):
+                        break
+                    try:
+                        rec = json.loads(raw)
+                    except ValueError:
+                        break
+                    records.append(rec.get("ops") or [])
+                    good += len(raw)
+        except FileNotFoundError:
+            pass
+        return records, good
+
+    def load(self, snapshot_path: str | None = None, *, replay: bool = True) -> dict:
+        """
+        Read snapshot + replay journal. Raises on a corrupt snapshot; never writes.
+
+        The journal only holds diffs against the current snapshot, so restoring a
+        rotated backup must pass replay=False (and compact right after).
+        """
+        src = snapshot_path or self.path
+        if os.path.exists(src):
+            with open(src, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        else:
+            data = {}
+        if not isinstance(data, dict):
+            raise ValueError("registry snapshot is not a JSON object")
+
+        records, good = self._read_journal() if replay else ([], 0)
+        for ops in records:
+            for op in ops:
+                data = _apply_op(data, op)
+
+        self._journal_records = len(records)
+        self._journal_bytes = good
+        # independent copy so in-place edits to `data` show up as diffs
+        self._shadow = json.loads(json.dumps(data, ensure_ascii=False))
+        return data
+
+    # ---------- writing ----------
+
+    def _append(self, ops: list) -> None:
+        line = json.dumps({"ts": round(time.time(), 3), "ops": ops}, ensure_ascii=False, separators=(",", ":"))
+        blob = (line + "\n").encode("utf-8")
+        fd = os.open(self.journal_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            if os.fstat(fd).st_size != self._journal_bytes:
+                # drop a torn tail left by a crash before appending after it
+                os.ftruncate(fd, self._journal_bytes)
+            os.write(fd, blob)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        self._journal_bytes += len(blob)
+        self._journal_records += 1
+
+        # keep the shadow in step using the decoded record (deep copy + key normalisation)
+        for op in json.loads(line)["ops"]:
+            self._shadow = _apply_op(self._shadow, op)
+
+    def save(self, data: dict) -> int:
+        """Journal whatever changed since the last save. Returns the number of ops written."""
+        t0 = time.perf_counter()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+        if self._shadow is None:
+            # never loaded (fresh file or caller built the dict itself): start from a snapshot
+            self.compact(data)
+            self.last_ops = 0
+            ops = [["set", [], None]]
+        else:
+            ops = []
+            _diff(self._shadow, data, [], ops)
+            self.last_ops = len(ops)
+            if ops:
+                self._append(ops)
+            else:
+                self.noop_saves += 1
+            if self._journal_bytes >= self.compact_bytes or self._journal_records >= self.compact_records:
+                self.compact(data)
+
+        self.saves += 1
+        self.last_save_ms = (time.perf_counter() - t0) * 1000.0
+
+        if ops:
+            for fn in self.listeners:
+                try:
+                    fn(data, ops)
+                except Exception:
+                    pass
+        return self.last_ops
+
+    def compact(self, data: dict) -> None:
+        """Write `data` as the new snapshot, rotate the previous one, and reset the journal."""
+        t0 = time.perf_counter()
+        folder = os.path.dirname(self.path) or "."
+        os.makedirs(folder, exist_ok=True)
+
+        fd, tmp = tempfile.mkstemp(prefix="freg_", suffix=".json", dir=folder)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(data, fh, ensure_ascii=False, indent=2)
+                fh.flush()
+                os.fsync(fh.fileno())
+
+            # the live file stays in place until the atomic swap below
+            if os.path.exists(self.path):
+                ts = time.strftime("%Y%m%d-%H%M%S")
+                try:
+                    shutil.copy2(self.path, f"{self.path}.{ts}.bak")
+                except Exception:
+                    pass  # best effort
+            os.replace(tmp, self.path)
+        finally:
+            try:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            except Exception:
+                pass
+
+        # journal ops are idempotent, so a crash before this truncate only means a harmless replay
+        with open(self.journal_path, "wb") as jf:
+            jf.flush()
+            os.fsync(jf.fileno())
+
+        self._journal_bytes = 0
+        self._journal_records = 0
+        with open(self.path, "r", encoding="utf-8") as f:
+            self._shadow = json.load(f)
+
+        self._prune_backups()
+        self.compactions += 1
+        self.last_compact_ms = (time.perf_counter() - t0) * 1000.0
+
+    def backups(self) -> list[str]:
+        """Rotated backups, newest first."""
+        found = glob.glob(glob.escape(self.path) + ".*.bak")
+        legacy = self.path + ".bak"
+        if os.path.exists(legacy):
+            found.append(legacy)
+        return sorted(found, key=lambda p: os.path.getmtime(p), reverse=True)
+
+    def _prune_backups(self) -> None:
+        for old in self.backups()[self.backup_retention:]:
+            try:
+                os.remove(old)
+            except Exception:
+                pass
+
+    def pending(self) -> bool:
+        return self._journal_records > 0
+
+    def stats(self) -> dict:
+        return {
+            "snapshot_bytes": os.path.getsize(self.path) if os.path.exists(self.path) else 0,
+            "journal_bytes": self._journal_bytes,
+            "journal_records": self._journal_records,
+            "backups": len(self.backups()),
+            "saves": self.saves,
+            "noop_saves": self.noop_saves,
+            "compactions": self.compactions,
+            "last_ops": self.last_ops,
+            "last_save_ms": round(self.last_save_ms, 3),
+            "last_compact_ms": round(self.last_compact_ms, 3),
+        }
@@ -18,14 +18,29 @@ import time
 from pathlib import Path
 import io
 import tempfile
-import xml.etree.ElementTree as ET
 import hashlib
 import sqlite3
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+import zipfile
+import multiprocessing
+import site
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 
+from .registry_journal import RegistryJournal
+from .registry_index import RegistryIndex, ApplicantIndex
+from .db_pool import get_pool, all_pools, close_all_pools
+from .code_search import CodeSearchService
+from .chart_renderer import get_renderer, release_renderer
+from .charts import render_pie
+from .usc_import import (
+    _usc_sha256_file,
+    _peak_rss_kb,
+    parse_title_to_staging,
+    parse_title_file,
+    merge_staging,
+    title_counts,
+)
+
 try:
     import docx  # python-docx
 except Exception:
@@ -41,6 +56,7 @@ REGISTRY_SUSPENDED = True
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 FED_REGISTRY_FILE = os.path.join(BASE_DIR, "federal_registry.json")
+_REGISTRY_JOURNAL = RegistryJournal(FED_REGISTRY_FILE)
 
 
 
@@ -126,16 +142,11 @@ def _utcnow_iso() -> str:
 class DraftsDB:
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self.pool = get_pool(db_path)
         self.init()
 
     def _connect(self) -> sqlite3.Connection:
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON;")
-        conn.execute("PRAGMA journal_mode = WAL;")
-        conn.execute("PRAGMA synchronous = NORMAL;")
-        return conn
+        return self.pool.connect()
 
     def init(self) -> None:
         conn = self._connect()
@@ -826,16 +837,11 @@ def _social_validate_username(username: str) -> str:
 class SocialAccountsDB:
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self.pool = get_pool(db_path)
         self.init()
 
     def _connect(self) -> sqlite3.Connection:
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON;")
-        conn.execute("PRAGMA journal_mode = WAL;")
-        conn.execute("PRAGMA synchronous = NORMAL;")
-        return conn
+        return self.pool.connect()
 
     def init(self) -> None:
         conn = self._connect()
@@ -1051,50 +1057,11 @@ class SocialAccountsDB:
             conn.close()
 
 USLM_NS = "http://xml.house.gov/schemas/uslm/1.0"
-STRUCT_TAGS = {"subsection", "paragraph", "subparagraph", "clause", "subclause"}
-
-_indent_re = re.compile(r"indent(\d+)")
 _cite_re = re.compile(
     r"^\s*(?P<title>\d+)\s*(?:U\.?\s*S\.?\s*C\.?|USC)\s*(?:§+)?\s*(?P<section>[\w\.\-]+)\s*$",
     re.IGNORECASE,
 )
 
-def _usc_local(tag: str) -> str:
-    return tag.split("}", 1)[1] if "}" in tag else tag
-
-def _usc_norm_ws(s: str | None) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip()
-
-def _usc_fix_heading_brackets(s: str | None) -> str:
-    s = _usc_norm_ws(s)
-    # Heuristic: some converters omit the leading '[' but keep the trailing ']'
-    if s.endswith("]") and not s.startswith("[") and s.count("]") == 1:
-        return "[" + s
-    return s
-
-def _usc_num_text(num_elem: ET.Element) -> str:
-    """
-    Prefer visible text, but fall back to @value when text is empty.
-    If @value looks like a bare token (a, 1, A, i), wrap it as (token).
-    """
-    raw = _usc_norm_ws("".join(num_elem.itertext()))
-    if raw:
-        return raw
-
-    v = _usc_norm_ws(num_elem.get("value"))
-    if not v:
-        return ""
-
-    # If it's already formatted, leave it.
-    if v.startswith("(") or v.startswith("“(") or v.startswith("§"):
-        return v
-
-    # Most USLM @value for paragraph markers is bare (a, b, 1, A, i)
-    return f"({v})"
-
-def _usc_sha256(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
-
 NEWS_BANNERS = {
     "politics": {
         "white_house_1": "https://media.architecturaldigest.com/photos/6559735fb796d428bef00d25/16:9/w_2560%2Cc_limit/GettyImages-1731443210.jpg",
@@ -1183,13 +1150,8 @@ NEWS_BANNERS = {
 
 
 def _usc_db_connect(db_path: str) -> sqlite3.Connection:
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON;")
-    conn.execute("PRAGMA journal_mode = WAL;")
-    conn.execute("PRAGMA synchronous = NORMAL;")
-    return conn
+    # per-thread long-lived connection; close() just hands it back
+    return get_pool(db_path).connect()
 
 SRC_DB_FILE = os.path.join(BASE_DIR, "src.sqlite3")
 
@@ -1207,67 +1169,62 @@ def _src_sha256(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 def _src_db_connect(db_path: str) -> sqlite3.Connection:
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON;")
-    conn.execute("PRAGMA journal_mode = WAL;")
-    conn.execute("PRAGMA synchronous = NORMAL;")
-    return conn
+    # per-thread long-lived connection; close() just hands it back
+    return get_pool(db_path).connect()
+
+def _src_db_create_schema(conn) -> None:
+    conn.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS src_titles (
+          title_num      INTEGER PRIMARY KEY,
+          heading        TEXT NOT NULL,
+          imported_at    TEXT,
+          source_sha256  TEXT
+        );
+
+        CREATE TABLE IF NOT EXISTS src_nodes (
+          id         INTEGER PRIMARY KEY AUTOINCREMENT,
+          title_num  INTEGER NOT NULL,
+          node_type  TEXT NOT NULL,         -- "chapter" (for now)
+          num        TEXT,
+          heading    TEXT,
+          parent_id  INTEGER,
+          ord        INTEGER,
+          FOREIGN KEY(title_num) REFERENCES src_titles(title_num)
+        );
+
+        CREATE TABLE IF NOT EXISTS src_sections (
+          id          INTEGER PRIMARY KEY AUTOINCREMENT,
+          title_num   INTEGER NOT NULL,
+          node_id     INTEGER,
+          section_num TEXT NOT NULL,        -- "551", "552a", etc
+          heading     TEXT,                 -- short title
+          body_text   TEXT,
+          ord         INTEGER,
+          UNIQUE(title_num, section_num),
+          FOREIGN KEY(title_num) REFERENCES src_titles(title_num),
+          FOREIGN KEY(node_id) REFERENCES src_nodes(id)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_src_nodes_title_ord
+          ON src_nodes(title_num, ord);
+
+        CREATE INDEX IF NOT EXISTS idx_src_sections_title_node_ord
+          ON src_sections(title_num, node_id, ord);
+
+        -- FTS (matches USC approach; helpful later for search/compare)
+        CREATE VIRTUAL TABLE IF NOT EXISTS src_sections_fts
+        USING fts5(title_num UNINDEXED, section_num UNINDEXED, heading, body_text);
+
+        CREATE VIRTUAL TABLE IF NOT EXISTS src_nodes_fts
+        USING fts5(title_num UNINDEXED, node_type UNINDEXED, num UNINDEXED, heading);
+        """
+    )
+    conn.commit()
 
 def _src_db_init(db_path: str) -> None:
-    conn = _src_db_connect(db_path)
-    try:
-        conn.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS src_titles (
-              title_num      INTEGER PRIMARY KEY,
-              heading        TEXT NOT NULL,
-              imported_at    TEXT,
-              source_sha256  TEXT
-            );
-
-            CREATE TABLE IF NOT EXISTS src_nodes (
-              id         INTEGER PRIMARY KEY AUTOINCREMENT,
-              title_num  INTEGER NOT NULL,
-              node_type  TEXT NOT NULL,         -- "chapter" (for now)
-              num        TEXT,
-              heading    TEXT,
-              parent_id  INTEGER,
-              ord        INTEGER,
-              FOREIGN KEY(title_num) REFERENCES src_titles(title_num)
-            );
-
-            CREATE TABLE IF NOT EXISTS src_sections (
-              id          INTEGER PRIMARY KEY AUTOINCREMENT,
-              title_num   INTEGER NOT NULL,
-              node_id     INTEGER,
-              section_num TEXT NOT NULL,        -- "551", "552a", etc
-              heading     TEXT,                 -- short title
-              body_text   TEXT,
-              ord         INTEGER,
-              UNIQUE(title_num, section_num),
-              FOREIGN KEY(title_num) REFERENCES src_titles(title_num),
-              FOREIGN KEY(node_id) REFERENCES src_nodes(id)
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_src_nodes_title_ord
-              ON src_nodes(title_num, ord);
-
-            CREATE INDEX IF NOT EXISTS idx_src_sections_title_node_ord
-              ON src_sections(title_num, node_id, ord);
-
-            -- FTS (matches USC approach; helpful later for search/compare)
-            CREATE VIRTUAL TABLE IF NOT EXISTS src_sections_fts
-            USING fts5(title_num UNINDEXED, section_num UNINDEXED, heading, body_text);
-
-            CREATE VIRTUAL TABLE IF NOT EXISTS src_nodes_fts
-            USING fts5(title_num UNINDEXED, node_type UNINDEXED, num UNINDEXED, heading);
-            """
-        )
-        conn.commit()
-    finally:
-        conn.close()
+    # runs the CREATE script once per process; later calls are a set lookup
+    get_pool(db_path).ensure_schema("src", _src_db_create_schema)
 
 def _src_sort_key_chapter(k: str):
     k = str(k)
@@ -1640,88 +1597,6 @@ def _src_import_json_bytes(db_path: str, json_bytes: bytes, force: bool = False)
     finally:
         conn.close()
 
-def _src_db_search(db_path: str, query: str, title: int | None, limit_sections: int = 25, limit_chapters: int = 10):
-    conn = _src_db_connect(db_path)
-    try:
-        q = _usc_make_fts_query(query)  # reuse your existing helper
-        if not q:
-            return {"titles": {}, "counts": {"sections": 0, "chapters": 0}}
-
-        # Sections (heading weighted higher than body)
-        sec_sql = """
-        SELECT
-          s.id,
-          s.title_num,
-          s.section_num,
-          COALESCE(s.heading,'') AS heading,
-          COALESCE(n.num,'') AS chapter_num,
-          COALESCE(n.heading,'') AS chapter_heading,
-          bm25(src_sections_fts, 0.0, 0.0, 6.0, 1.0) AS rank,
-          snippet(src_sections_fts, 2, (char(27) || '[1;33m'), (char(27) || '[0m'), '…', 12) AS hsnip,
-          snippet(src_sections_fts, 3, (char(27) || '[1;33m'), (char(27) || '[0m'), '…', 24) AS bsnip
-        FROM src_sections_fts
-        JOIN src_sections s ON s.id = src_sections_fts.rowid
-        LEFT JOIN src_nodes n ON n.id = s.node_id
-        WHERE src_sections_fts MATCH ?
-        """
-        params = [q]
-        if title is not None:
-            sec_sql += " AND s.title_num = ?"
-            params.append(int(title))
-        sec_sql += " ORDER BY rank LIMIT ?"
-        params.append(int(limit_sections))
-        sec_rows = conn.execute(sec_sql, params).fetchall()
-
-        # Chapter headings
-        ch_sql = """
-        SELECT
-          n.id,
-          n.title_num,
-          COALESCE(n.num,'') AS num,
-          COALESCE(n.heading,'') AS heading,
-          bm25(src_nodes_fts, 0.0, 0.0, 0.0, 1.0) AS rank,
-          snippet(src_nodes_fts, 3, (char(27) || '[1;33m'), (char(27) || '[0m'), '…', 16) AS snip
-        FROM src_nodes_fts
-        JOIN src_nodes n ON n.id = src_nodes_fts.rowid
-        WHERE src_nodes_fts MATCH ?
-          AND n.node_type='chapter'
-        """
-        params = [q]
-        if title is not None:
-            ch_sql += " AND n.title_num = ?"
-            params.append(int(title))
-        ch_sql += " ORDER BY rank LIMIT ?"
-        params.append(int(limit_chapters))
-        ch_rows = conn.execute(ch_sql, params).fetchall()
-
-        title_nums = sorted({r["title_num"] for r in sec_rows} | {r["title_num"] for r in ch_rows})
-        title_map = {}
-        if title_nums:
-            qmarks = ",".join("?" for _ in title_nums)
-            for r in conn.execute(f"SELECT title_num, heading FROM src_titles WHERE title_num IN ({qmarks})", title_nums):
-                title_map[int(r["title_num"])] = r["heading"]
-
-        grouped = {tn: {"title_heading": title_map.get(tn, ""), "chapters": [], "sections": []} for tn in title_nums}
-
-        for r in ch_rows:
-            grouped[int(r["title_num"])]["chapters"].append({
-                "num": r["num"],
-                "snip": r["snip"] or r["heading"],
-            })
-
-        for r in sec_rows:
-            grouped[int(r["title_num"])]["sections"].append({
-                "chapter_num": r["chapter_num"],
-                "chapter_heading": r["chapter_heading"],
-                "section_num": r["section_num"],
-                "hsnip": r["hsnip"] or r["heading"],
-                "bsnip": r["bsnip"] or "",
-            })
-
-        return {"titles": grouped, "counts": {"sections": len(sec_rows), "chapters": len(ch_rows)}}
-    finally:
-        conn.close()
-
 def _src_db_reindex_fts(db_path: str) -> dict:
     conn = _src_db_connect(db_path)
     try:
@@ -1964,421 +1839,181 @@ def _usc_fmt_dt(s: str | None) -> str:
 
     return dt.strftime("%b %-d, %Y")
 
-def _usc_db_init(db_path: str) -> None:
-    conn = _usc_db_connect(db_path)
-    try:
-        conn.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS usc_titles (
-              title_num      INTEGER PRIMARY KEY,
-              heading        TEXT NOT NULL,
-              created_at     TEXT,
-              imported_at    TEXT,
-              source_sha256  TEXT
-            );
-
-            CREATE TABLE IF NOT EXISTS usc_nodes (
-              id         INTEGER PRIMARY KEY AUTOINCREMENT,
-              title_num  INTEGER NOT NULL,
-              node_type  TEXT NOT NULL,
-              num        TEXT,
-              heading    TEXT,
-              identifier TEXT,
-              parent_id  INTEGER,
-              ord        INTEGER,
-              FOREIGN KEY(title_num) REFERENCES usc_titles(title_num)
-            );
-
-            CREATE TABLE IF NOT EXISTS usc_sections (
-              id          INTEGER PRIMARY KEY AUTOINCREMENT,
-              title_num   INTEGER NOT NULL,
-              node_id     INTEGER,
-              section_num TEXT NOT NULL,
-              heading     TEXT,
-              identifier  TEXT,
-              body_text   TEXT,
-              ord         INTEGER,
-              UNIQUE(title_num, section_num),
-              FOREIGN KEY(title_num) REFERENCES usc_titles(title_num),
-              FOREIGN KEY(node_id) REFERENCES usc_nodes(id)
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_usc_nodes_title_ord
-              ON usc_nodes(title_num, ord);
-
-            CREATE INDEX IF NOT EXISTS idx_usc_sections_title_node_ord
-              ON usc_sections(title_num, node_id, ord);
-
-            -- simple FTS for later (not required for the basic commands, but cheap to add now)
-            CREATE VIRTUAL TABLE IF NOT EXISTS usc_sections_fts
-            USING fts5(title_num UNINDEXED, section_num UNINDEXED, heading, body_text);
-
-            CREATE VIRTUAL TABLE IF NOT EXISTS usc_nodes_fts
-            USING fts5(title_num UNINDEXED, node_type UNINDEXED, num UNINDEXED, heading);
-            """
-        )
-        conn.commit()
-    finally:
-        conn.close()
-
-def _usc_render_struct(elem: ET.Element, depth: int = 0) -> list[str]:
-    """
-    Render subsection/paragraph/etc. recursively with indentation.
-    """
-    lines: list[str] = []
-
-    num_text = ""
-    heading_text = ""
-    content_text = ""
-
-    for ch in list(elem):
-        lt = _usc_local(ch.tag)
-
-        if lt == "num" and not num_text:
-            num_text = _usc_num_text(ch)
-
-        elif lt == "heading" and not heading_text:
-            heading_text = _usc_norm_ws("".join(ch.itertext()))
-            heading_text = _usc_fix_heading_brackets(heading_text)
-
-        elif lt in {"content", "chapeau", "text"} and not content_text:
-            content_text = _usc_norm_ws("".join(ch.itertext()))
-
-    # Build the line for this node
-    parts = []
-    if num_text:
-        parts.append(num_text)
-    if heading_text:
-        parts.append(heading_text)
-    if content_text:
-        parts.append(content_text)
-
-    head = " ".join([p for p in parts if p])
-    if head:
-        lines.append(("    " * depth) + head)
-
-    # Recurse into children
-    for ch in list(elem):
-        if _usc_local(ch.tag) in STRUCT_TAGS:
-            lines.extend(_usc_render_struct(ch, depth + 1))
+def _usc_db_create_schema(conn) -> None:
+    conn.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS usc_titles (
+          title_num      INTEGER PRIMARY KEY,
+          heading        TEXT NOT NULL,
+          created_at     TEXT,
+          imported_at    TEXT,
+          source_sha256  TEXT
+        );
+
+        CREATE TABLE IF NOT EXISTS usc_nodes (
+          id         INTEGER PRIMARY KEY AUTOINCREMENT,
+          title_num  INTEGER NOT NULL,
+          node_type  TEXT NOT NULL,
+          num        TEXT,
+          heading    TEXT,
+          identifier TEXT,
+          parent_id  INTEGER,
+          ord        INTEGER,
+          FOREIGN KEY(title_num) REFERENCES usc_titles(title_num)
+        );
+
+        CREATE TABLE IF NOT EXISTS usc_sections (
+          id          INTEGER PRIMARY KEY AUTOINCREMENT,
+          title_num   INTEGER NOT NULL,
+          node_id     INTEGER,
+          section_num TEXT NOT NULL,
+          heading     TEXT,
+          identifier  TEXT,
+          body_text   TEXT,
+          ord         INTEGER,
+          UNIQUE(title_num, section_num),
+          FOREIGN KEY(title_num) REFERENCES usc_titles(title_num),
+          FOREIGN KEY(node_id) REFERENCES usc_nodes(id)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_usc_nodes_title_ord
+          ON usc_nodes(title_num, ord);
+
+        CREATE INDEX IF NOT EXISTS idx_usc_sections_title_node_ord
+          ON usc_sections(title_num, node_id, ord);
+
+        -- simple FTS for later (not required for the basic commands, but cheap to add now)
+        CREATE VIRTUAL TABLE IF NOT EXISTS usc_sections_fts
+        USING fts5(title_num UNINDEXED, section_num UNINDEXED, heading, body_text);
+
+        CREATE VIRTUAL TABLE IF NOT EXISTS usc_nodes_fts
+        USING fts5(title_num UNINDEXED, node_type UNINDEXED, num UNINDEXED, heading);
+        """
+    )
+    conn.commit()
 
-    return lines
+def _usc_db_init(db_path: str) -> None:
+    # runs the CREATE script once per process; later calls are a set lookup
+    get_pool(db_path).ensure_schema("usc", _usc_db_create_schema)
+
+USC_IMPORT_MAX_WORKERS = 4
+
+def _usc_import_summary(results: list[dict], started: float, peak_rss_kb: int) -> dict:
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    parsed = sum(r.get("parsed_sections", 0) for r in results)
+    return {
+        "titles": results,
+        "seconds": elapsed,
+        "sections_per_sec": parsed / elapsed,
+        "peak_rss_mb": peak_rss_kb / 1024.0,
+    }
 
-def _usc_render_section_body(section_elem: ET.Element) -> str:
+def _usc_import_xml_file(db_path: str, fh, force: bool = False) -> dict:
     """
-    Render statute text only (skip notes/sourceCredit).
-    Handles:
-      - <content><p class="indent1"> ... </p></content>
-      - direct <subsection>/<paragraph>/... trees
+    Import one Title XML from a seekable file object (e.g. a spooled attachment).
+    Parses into a staging DB, then merges + bulk-indexes into the live DB.
     """
-    lines: list[str] = []
-
-    # 1) section-level <content> (common)
-    for ch in list(section_elem):
-        lt = _usc_local(ch.tag)
-        if lt != "content":
-            continue
-
-        ps = [c for c in list(ch) if _usc_local(c.tag) == "p"]
-        if ps:
-            for p in ps:
-                cls = p.get("class") or ""
-                m = _indent_re.search(cls)
-                indent = int(m.group(1)) if m else 0
-                txt = _usc_norm_ws("".join(p.itertext()))
-                if txt:
-                    lines.append(("    " * indent) + txt)
-        else:
-            txt = _usc_norm_ws("".join(ch.itertext()))
-            if txt:
-                lines.append(txt)
-
-    # 2) structural children (subsections, etc.)
-    for ch in list(section_elem):
-        if _usc_local(ch.tag) in STRUCT_TAGS:
-            lines.extend(_usc_render_struct(ch, 0))
-
-    return "\n".join(lines).strip()
-
-_USC_SEC_ID_RE = re.compile(r"^/us/usc/t(?P<title>\d+)/s(?P<section>[^/]+)$")
-
-def _usc_is_real_usc_section(identifier: str | None, title_num: int | None) -> bool:
-    if not identifier or not title_num:
-        return False
-    m = _USC_SEC_ID_RE.match(identifier)
-    return bool(m and int(m.group("title")) == int(title_num))
-
-_HEADING_NOISE_RE = re.compile(r"\s+\d+\s+So in original\..*$", re.IGNORECASE)
+    started = time.perf_counter()
+    _usc_db_init(db_path)
+    sha = _usc_sha256_file(fh)
 
-def _usc_clean_section_heading(h: str | None) -> str:
-    h = _usc_fix_heading_brackets(_usc_norm_ws(h))
-    # remove “11 So in original...” style junk
-    h = re.sub(_HEADING_NOISE_RE, "", h).strip()
-    # remove trailing lone footnote numbers (e.g., "Judicial Review 1")
-    h = re.sub(r"\s+\d+$", "", h).strip()
-    return h
+    # bulk import tweaks pragmas and ATTACHes staging DBs: keep that off the pooled connections
+    conn = get_pool(db_path).dedicated()
+    try:
+        row = conn.execute(
+            "SELECT title_num, heading, created_at, source_sha256 FROM usc_titles WHERE source_sha256=?",
+            (sha,),
+        ).fetchone()
+        if row and not force:
+            # same bytes already imported: skip parsing entirely
+            res = {
+                "status": "already_imported",
+                "title_num": row["title_num"],
+                "heading": row["heading"],
+                "created_at": row["created_at"],
+                **title_counts(conn, row["title_num"]),
+                "sha256": sha,
+                "parsed_sections": 0,
+            }
+            return _usc_import_summary([res], started, _peak_rss_kb())
+
+        with tempfile.TemporaryDirectory(prefix="usc_stage_") as tmp:
+            stage = os.path.join(tmp, "stage.sqlite3")
+            parsed = parse_title_to_staging(fh, stage)
+            res = merge_staging(conn, stage, sha, discord.utils.utcnow().isoformat(), force)
+            res["parsed_sections"] = parsed["sections"]
+        return _usc_import_summary([res], started, parsed["peak_rss_kb"])
+    finally:
+        conn.close()
 
-def _usc_import_xml_bytes(db_path: str, xml_bytes: bytes, force: bool = False) -> dict:
+def _usc_import_zip_file(db_path: str, fh, force: bool = False, max_workers: int = USC_IMPORT_MAX_WORKERS) -> dict:
     """
-    Parse one Title XML (USLM), store:
-      - title number
-      - title heading
-      - created date (meta)
-      - chapters (as nodes)
-      - sections (statute text only; no notes)
-    Returns a summary dict.
+    Import every *.xml Title inside a zip. Titles are parsed in a process pool
+    (one staging DB each), then merged into the live DB one at a time.
     """
+    started = time.perf_counter()
     _usc_db_init(db_path)
-    sha = _usc_sha256(xml_bytes)
-
-    conn = _usc_db_connect(db_path)
-    cur = conn.cursor()
-
-    title_num: int | None = None
-    title_heading: str | None = None
-    created_at: str | None = None
-    prepared = False
-    updated_existing = False
-
-    chapter_ord = 0
-    section_ord = 0
+    results: list[dict] = []
+    peak = _peak_rss_kb()
 
-    chapter_stack: list[dict] = []
-
-    def prepare_if_ready() -> None:
-        nonlocal prepared, updated_existing
-        if prepared:
-            return
-        if title_num is None or not title_heading:
-            return
-
-        row = cur.execute(
-            "SELECT title_num, heading, created_at, imported_at, source_sha256 FROM usc_titles WHERE title_num=?",
-            (title_num,),
-        ).fetchone()
-
-        if row and (row["source_sha256"] == sha) and not force:
-            raise StopIteration
-
-        if row:
-            # replace existing title content
-            updated_existing = True
-            cur.execute("DELETE FROM usc_sections_fts WHERE title_num=?", (title_num,))
-            cur.execute("DELETE FROM usc_sections WHERE title_num=?", (title_num,))
-            cur.execute("DELETE FROM usc_nodes WHERE title_num=?", (title_num,))
-
-        cur.execute(
-            """
-            INSERT INTO usc_titles(title_num, heading, created_at, imported_at, source_sha256)
-            VALUES(?,?,?,?,?)
-            ON CONFLICT(title_num) DO UPDATE SET
-              heading=excluded.heading,
-              created_at=excluded.created_at,
-              imported_at=excluded.imported_at,
-              source_sha256=excluded.source_sha256
-            """,
-            (
-                title_num,
-                title_heading,
-                created_at,
-                discord.utils.utcnow().isoformat(),
-                sha,
-            ),
-        )
-        prepared = True
+    with tempfile.TemporaryDirectory(prefix="usc_zip_") as tmp, zipfile.ZipFile(fh) as zf:
+        members = [m for m in zf.infolist() if not m.is_dir() and m.filename.lower().endswith(".xml")]
+        if not members:
+            raise ValueError("zip contains no .xml titles")
 
-    try:
-        it = ET.iterparse(io.BytesIO(xml_bytes), events=("start", "end"))
-        stack: list[str] = []
-
-        for ev, el in it:
-            t = _usc_local(el.tag)
-
-            if ev == "start":
-                stack.append(t)
-                if t == "chapter":
-                    chapter_ord += 1
-                    parent_ctx = chapter_stack[-1] if chapter_stack else None
-                    chapter_stack.append({
-                        "identifier": el.get("identifier"),
-                        "num": None,
-                        "heading": None,
-                        "ord": chapter_ord,
-                        "node_id": None,
-                        "_inserted": False,
-                        "parent_ctx": parent_ctx,
+        jobs: list[tuple[str, str, str, str]] = []  # (name, xml_path, stage_path, sha)
+        conn = get_pool(db_path).dedicated()
+        try:
+            for i, m in enumerate(members):
+                xml_path = os.path.join(tmp, f"title_{i}.xml")
+                with zf.open(m) as src, open(xml_path, "wb") as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+                with open(xml_path, "rb") as xf:
+                    sha = _usc_sha256_file(xf)
+                row = conn.execute(
+                    "SELECT title_num, heading, created_at FROM usc_titles WHERE source_sha256=?", (sha,)
+                ).fetchone()
+                if row and not force:
+                    results.append({
+                        "status": "already_imported",
+                        "title_num": row["title_num"],
+                        "heading": row["heading"],
+                        "created_at": row["created_at"],
+                        **title_counts(conn, row["title_num"]),
+                        "sha256": sha,
+                        "parsed_sections": 0,
                     })
-
+                    continue
+                jobs.append((m.filename, xml_path, os.path.join(tmp, f"stage_{i}.sqlite3"), sha))
+
+            parsed: dict[str, dict] = {}
+            # Several titles parse in worker processes. forkserver/spawn rather than fork, which
+            # would copy the bot's loop and threads; workers put the cogs folder on sys.path to import usc_import.
+            if len(jobs) > 1:
+                method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                with ProcessPoolExecutor(
+                    max_workers=min(max_workers, len(jobs), os.cpu_count() or 1),
+                    mp_context=multiprocessing.get_context(method),
+                    initializer=site.addsitedir,
+                    initargs=(os.path.dirname(BASE_DIR),),
+                ) as pool:
+                    futs = {name: pool.submit(parse_title_file, xml_path, stage) for name, xml_path, stage, _ in jobs}
+                    for name, fut in futs.items():
+                        parsed[name] = fut.result()
             else:
-                parent = stack[-2] if len(stack) >= 2 else None
-
-                # meta/title basics
-                if t == "docNumber" and parent == "meta" and title_num is None:
-                    try:
-                        title_num = int(_usc_norm_ws(el.text))
-                    except Exception:
-                        title_num = None
-
-                if t == "created" and parent == "meta" and created_at is None:
-                    created_at = _usc_norm_ws(el.text)
-
-                if t == "heading" and parent == "title" and title_heading is None:
-                    title_heading = _usc_norm_ws("".join(el.itertext()))
-
-                # once we have title_num + title_heading we can check dedupe/replace
-                try:
-                    prepare_if_ready()
-                except StopIteration:
-                    # already imported, stop parsing
-                    raise
-
-                # chapter details + insert node (supports nested chapters)
-                if chapter_stack:
-                    top = chapter_stack[-1]
-
-                    if t == "num" and parent == "chapter" and top["num"] is None:
-                        # chapters usually want the @value token (e.g., 1) not "CHAPTER 1—"
-                        v = el.get("value") or _usc_norm_ws("".join(el.itertext()))
-                        top["num"] = _usc_norm_ws(v)
-
-                    if t == "heading" and parent == "chapter" and top["heading"] is None:
-                        top["heading"] = _usc_fix_heading_brackets(_usc_norm_ws("".join(el.itertext())))
-
-                    if prepared and top["num"] and top["heading"] and not top["_inserted"]:
-                        parent_id = None
-                        if top["parent_ctx"] is not None:
-                            parent_id = top["parent_ctx"]["node_id"]
-
-                        cur.execute(
-                            """
-                            INSERT INTO usc_nodes(title_num, node_type, num, heading, identifier, parent_id, ord)
-                            VALUES(?, 'chapter', ?, ?, ?, ?, ?)
-                            """,
-                            (
-                                title_num,
-                                str(top["num"]),
-                                top["heading"],
-                                top["identifier"],
-                                parent_id,
-                                top["ord"],
-                            ),
-                        )
-                        top["node_id"] = cur.lastrowid
-                        top["_inserted"] = True
-
-                # section end: insert section row + fts row
-                if t == "section":
-                    ident = el.get("identifier")
-
-                    # Skip “sections” that live inside notes or aren’t true USC sections
-                    if "notes" in stack or not _usc_is_real_usc_section(ident, title_num):
-                        el.clear()
-                        stack.pop()
-                        continue
-
-
-                    if not prepared:
-                        # defensive; should not happen in valid files
-                        el.clear()
-                        stack.pop()
-                        continue
-
-                    
-
-                    section_ord += 1
-
-                    sec_num = None
-                    sec_head = None
-                    for c in list(el):
-                        lt = _usc_local(c.tag)
-                        if lt == "num" and sec_num is None:
-                            sec_num = _usc_norm_ws(c.get("value") or "".join(c.itertext()))
-                        elif lt == "heading" and sec_head is None:
-                            sec_head = _usc_norm_ws("".join(c.itertext()))
-                            sec_head = _usc_clean_section_heading(sec_head)
-
-                    body = _usc_render_section_body(el)
-                    node_id = chapter_stack[-1]["node_id"] if (chapter_stack and chapter_stack[-1]["node_id"]) else None
-
-                    cur.execute(
-                        """
-                        INSERT OR REPLACE INTO usc_sections(title_num, node_id, section_num, heading, identifier, body_text, ord)
-                        VALUES(?,?,?,?,?,?,?)
-                        """,
-                        (
-                            title_num,
-                            node_id,
-                            str(sec_num or ""),
-                            sec_head,
-                            el.get("identifier"),
-                            body,
-                            section_ord,
-                        ),
-                    )
-                    sec_id = cur.lastrowid
-                    cur.execute(
-                        "INSERT INTO usc_sections_fts(rowid, title_num, section_num, heading, body_text) VALUES(?,?,?,?,?)",
-                        (sec_id, title_num, str(sec_num or ""), sec_head or "", body or ""),
-                    )
-
-                    el.clear()
-
-                if t == "chapter":
-                    if chapter_stack:
-                        chapter_stack.pop()
-                    el.clear()
-
-                stack.pop()
-
-        conn.commit()
-
-        # counts
-        ch_ct = cur.execute(
-            "SELECT COUNT(*) AS n FROM usc_nodes WHERE title_num=? AND node_type='chapter'",
-            (title_num,),
-        ).fetchone()["n"]
-        sec_ct = cur.execute(
-            "SELECT COUNT(*) AS n FROM usc_sections WHERE title_num=?",
-            (title_num,),
-        ).fetchone()["n"]
-
-        return {
-            "status": "updated" if updated_existing else "imported",
-            "title_num": title_num,
-            "heading": title_heading,
-            "created_at": created_at,
-            "chapters": int(ch_ct),
-            "sections": int(sec_ct),
-            "sha256": sha,
-        }
+                for name, xml_path, stage, _ in jobs:
+                    parsed[name] = parse_title_file(xml_path, stage)
+
+            imported_at = discord.utils.utcnow().isoformat()
+            for name, _, stage, sha in jobs:
+                res = merge_staging(conn, stage, sha, imported_at, force)
+                res["parsed_sections"] = parsed[name]["sections"]
+                results.append(res)
+                peak = max(peak, parsed[name]["peak_rss_kb"])
+        finally:
+            conn.close()
 
-    except StopIteration:
-        # already imported
-        row = cur.execute(
-            "SELECT title_num, heading, created_at, imported_at, source_sha256 FROM usc_titles WHERE title_num=?",
-            (title_num,),
-        ).fetchone()
-        return {
-            "status": "already_imported",
-            "title_num": row["title_num"] if row else title_num,
-            "heading": row["heading"] if row else title_heading,
-            "created_at": row["created_at"] if row else created_at,
-            "chapters": int(
-                cur.execute(
-                    "SELECT COUNT(*) AS n FROM usc_nodes WHERE title_num=? AND node_type='chapter'",
-                    (title_num,),
-                ).fetchone()["n"]
-            ) if title_num else 0,
-            "sections": int(
-                cur.execute(
-                    "SELECT COUNT(*) AS n FROM usc_sections WHERE title_num=?",
-                    (title_num,),
-                ).fetchone()["n"]
-            ) if title_num else 0,
-            "sha256": row["source_sha256"] if row else sha,
-        }
-    finally:
-        conn.close()
+    return _usc_import_summary(results, started, peak)
 
 
 def _usc_chunk_lines(lines: list[str], limit: int = 1700) -> list[str]:
@@ -2491,6 +2126,82 @@ class USCTextPaginator(discord.ui.View):
         self.stop()
         await interaction.response.edit_message(view=None)
 
+def _code_search_lines(data: dict) -> list[str]:
+    """Render one page from CodeSearchService.search() in the usual grouped search layout."""
+    lines: list[str] = []
+    grouped = data["titles"]
+    for tnum in sorted(grouped.keys()):
+        th = grouped[tnum]["title_heading"]
+        lines.append(f"Title {tnum} — {th}".rstrip())
+        lines.append("-" * 28)
+
+        for ch in grouped[tnum]["chapters"]:
+            lines.append(f"CHAPTER {ch['num']} — {ch['snip']}")
+
+        if grouped[tnum]["chapters"]:
+            lines.append("")
+
+        for s in grouped[tnum]["sections"]:
+            lines.append(f"§ {s['section_num']} — {s['hsnip']}")
+            # heading didn't light up -> show where the body matched
+            if "\x1b[" not in (s["hsnip"] or "") and s["bsnip"]:
+                lines.append(f"    … {s['bsnip']}")
+        lines.append("")
+        lines.append("")
+    return lines
+
+
+class CodeSearchPaginator(USCTextPaginator):
+    """
+    USCTextPaginator that keeps a cursor into the cached result set: paging past the
+    last rendered page pulls the next batch of ranked sections instead of stopping at 25.
+    """
+
+    def __init__(self, title: str, pages: list[str], service: CodeSearchService, query: str,
+                 search_title: int | None, next_offset: int | None, limit: int = 1700,
+                 meta: str | None = None, page_size: int = 25):
+        self.service = service
+        self.query = query
+        self.search_title = search_title
+        self.next_offset = next_offset
+        self.limit = limit
+        self.page_size = page_size
+        super().__init__(title=title, pages=pages, meta=meta)
+
+    def _sync(self):
+        self.prev.disabled = (self.i <= 0)
+        self.next.disabled = (self.i >= len(self.pages) - 1 and self.next_offset is None)
+
+    def make_content(self) -> str:
+        meta_part = f"\n{self.meta}" if self.meta else ""
+        more = "+" if self.next_offset is not None else ""
+        return (
+            f"**{self.title}**\n"
+            f"```ansi\n{self.pages[self.i]}\n```\n"
+            f"`Page {self.i+1}/{len(self.pages)}{more}`{meta_part}"
+        )
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary)
+    async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.i >= len(self.pages) - 1 and self.next_offset is not None:
+            try:
+                data = await asyncio.to_thread(
+                    self.service.search, self.query, self.search_title, self.next_offset, self.page_size
+                )
+            except Exception as e:
+                print(f"Code search paging error: {e}")
+                data = None
+            if data:
+                self.next_offset = data["next_offset"]
+                lines = _code_search_lines(data)
+                if lines:
+                    self.pages.extend(_usc_chunk_lines(lines, limit=self.limit))
+            else:
+                self.next_offset = None
+        self.i = min(len(self.pages) - 1, self.i + 1)
+        self._sync()
+        await interaction.response.edit_message(content=self.make_content(), view=self)
+
 def _usc_db_list_titles(db_path: str) -> list[sqlite3.Row]:
     _usc_db_init(db_path)
     conn = _usc_db_connect(db_path)
@@ -2691,38 +2402,50 @@ def _ensure_registry_schema(reg: dict) -> dict:
         reg["recent_citizenship_change"] = []
     return reg
 
+def _quarantine_registry(path: str, bad: str) -> None:
+    """Move a corrupt snapshot, and the journal written against it, out of the way."""
+    if os.path.exists(path):
+        os.replace(path, bad)
+    if os.path.exists(_REGISTRY_JOURNAL.journal_path):
+        os.replace(_REGISTRY_JOURNAL.journal_path, bad + ".journal")
+
 def load_federal_registry():
     """
     Load registry with auto-recovery:
-      1) try main file
-      2) fall back to .bak
+      1) try main snapshot + journal replay
+      2) fall back to the newest rotated .bak; the journal was written against the
+         corrupt snapshot, so it is set aside with it and changes since the backup are lost
       3) if corrupt, quarantine bad file and return {}
     """
     path = FED_REGISTRY_FILE
-    bak  = path + ".bak"
 
-    if not os.path.exists(path):
+    if not os.path.exists(path) and not os.path.exists(_REGISTRY_JOURNAL.journal_path):
         return {}
 
     # First, try the main file
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            reg = json.load(f)
-            reg = _ensure_registry_schema(reg)
-            return reg
-
-    except json.JSONDecodeError:
-        # Try backup
-        try:
-            if os.path.exists(bak):
-                with open(bak, "r", encoding="utf-8") as bf:
-                    return json.load(bf)
-        except Exception:
-            pass
+        reg = _REGISTRY_JOURNAL.load()
+        reg = _ensure_registry_schema(reg)
+        return reg
+
+    except (json.JSONDecodeError, ValueError):
+        bad = f"{path}.corrupt-{int(time.time())}.json"
+        # Try backups, newest first
+        for bak in _REGISTRY_JOURNAL.backups():
+            try:
+                reg = _REGISTRY_JOURNAL.load(bak, replay=False)
+            except Exception:
+                continue
+            print(
+                f"Federal registry snapshot is corrupt; restored {os.path.basename(bak)}. "
+                f"Changes journaled since that backup were not replayed and are kept in {os.path.basename(bad)}.journal."
+            )
+            _quarantine_registry(path, bad)
+            _REGISTRY_JOURNAL.compact(reg)
+            return _ensure_registry_schema(reg)
         # Quarantine the bad file so we can boot
         try:
-            bad = f"{path}.corrupt-{int(time.time())}.json"
-            os.replace(path, bad)  # keeps the evidence for manual salvage if you want
+            _quarantine_registry(path, bad)  # keeps the evidence for manual salvage if you want
         finally:
             return {}
     except Exception:
@@ -2730,31 +2453,13 @@ def load_federal_registry():
         return {}
 
 def save_federal_registry(data: dict) -> None:
-    # never write half a file again
-    os.makedirs(os.path.dirname(FED_REGISTRY_FILE), exist_ok=True)
-    # pre-save backup
-    if os.path.exists(FED_REGISTRY_FILE):
-        ts = time.strftime("%Y%m%d-%H%M%S")
-        bak = f"{FED_REGISTRY_FILE}.{ts}.bak"
-        try:
-            os.replace(FED_REGISTRY_FILE, bak)
-        except Exception:
-            pass  # best effort
+    # only the delta since the last save hits the disk; the journal compacts itself when it grows
+    _REGISTRY_JOURNAL.save(data)
 
-    # write atomically
-    fd, tmp = tempfile.mkstemp(prefix="freg_", suffix=".json", dir=os.path.dirname(FED_REGISTRY_FILE))
-    try:
-        with os.fdopen(fd, "w", encoding="utf-8") as fh:
-            json.dump(data, fh, ensure_ascii=False, indent=2)
-            fh.flush()
-            os.fsync(fh.fileno())
-        os.replace(tmp, FED_REGISTRY_FILE)
-    finally:
-        try:
-            if os.path.exists(tmp):
-                os.remove(tmp)
-        except Exception:
-            pass
+
+def compact_federal_registry(data: dict) -> None:
+    """Fold the journal into a full snapshot on disk (rotating the old one into .bak)."""
+    _REGISTRY_JOURNAL.compact(data)
 
 
 def _elections_root(reg: dict) -> dict:
@@ -3618,15 +3323,10 @@ async def _fetch_vote_counts(interaction: discord.Interaction, b: dict) -> tuple
 def probe_federal_registry():
     """
     Return (data, None) if OK, (None, exc) if JSON is corrupt.
-    Does NOT rename or modify files. Pure read.
+    Replays the journal on top of the snapshot. Does NOT rename or modify files.
     """
-    path = FED_REGISTRY_FILE
-    p = Path(path)
-    if not p.exists():
-        return {}, None
     try:
-        with p.open("r", encoding="utf-8") as f:
-            return json.load(f), None
+        return _REGISTRY_JOURNAL.load(), None
     except Exception as e:
         return None, e
 
@@ -3977,7 +3677,7 @@ class DraftEditModal(discord.ui.Modal):
         self.add_item(self.body)
 
     async def on_submit(self, interaction: discord.Interaction):
-        draft = self.cog.drafts_db.get_draft(self.draft_id)
+        draft = await asyncio.to_thread(self.cog.drafts_db.get_draft, self.draft_id)
         if not draft:
             return await interaction.response.send_message("Draft not found.", ephemeral=True)
 
@@ -3987,7 +3687,8 @@ class DraftEditModal(discord.ui.Modal):
                 ephemeral=True,
             )
 
-        ok = self.cog.drafts_db.edit_bin(
+        ok = await asyncio.to_thread(
+            self.cog.drafts_db.edit_bin,
             self.draft_id,
             interaction.user.id,
             self.bin_key,
@@ -4035,7 +3736,7 @@ class DraftSubbinModal(discord.ui.Modal):
         self.add_item(self.entry_body)
 
     async def on_submit(self, interaction: discord.Interaction):
-        draft = self.cog.drafts_db.get_draft(self.draft_id)
+        draft = await asyncio.to_thread(self.cog.drafts_db.get_draft, self.draft_id)
         if not draft:
             return await interaction.response.send_message("Draft not found.", ephemeral=True)
 
@@ -4046,7 +3747,8 @@ class DraftSubbinModal(discord.ui.Modal):
             )
 
         if self.mode == "add":
-            subbin_id = self.cog.drafts_db.add_subbin(
+            subbin_id = await asyncio.to_thread(
+                self.cog.drafts_db.add_subbin,
                 self.draft_id,
                 interaction.user.id,
                 self.bin_key,
@@ -4060,7 +3762,8 @@ class DraftSubbinModal(discord.ui.Modal):
                 ephemeral=True,
             )
 
-        ok = self.cog.drafts_db.edit_subbin(
+        ok = await asyncio.to_thread(
+            self.cog.drafts_db.edit_subbin,
             self.draft_id,
             int(self.subbin_id),
             interaction.user.id,
@@ -4403,6 +4106,7 @@ class SpideyGov(commands.Cog):
         global REGISTRY_SUSPENDED
 
         self.bot = bot
+        self.charts = get_renderer(bot)
         self.registry_readonly = REGISTRY_SUSPENDED
         data, err = probe_federal_registry()
         if err is None:
@@ -4412,6 +4116,7 @@ class SpideyGov(commands.Cog):
             try:
                 self.bill_poll_sweeper.start()
                 self.bill_status_ticker.start()
+                self.registry_compactor.start()
             except Exception:
                 pass
         else:
@@ -4424,6 +4129,12 @@ class SpideyGov(commands.Cog):
         normalize_registry_order(self.federal_registry)
         self.registry_lock = asyncio.Lock()
 
+        # indexed view for autocompletes/status; follows every journaled save
+        self.registry_index = RegistryIndex()
+        self.registry_index.rebuild(self.federal_registry)
+        _REGISTRY_JOURNAL.listeners.append(self._on_registry_saved)
+        self.applicant_index = ApplicantIndex(self._applicant_tag)
+
         self.SPEAKER_OF_THE_HOUSE = None
         self.SENATE_MAJORITY_LEADER = None
 
@@ -4433,6 +4144,7 @@ class SpideyGov(commands.Cog):
             print(f"USC DB init error: {e}")
         
         self.usc_lock = asyncio.Lock()
+        self.usc_index = CodeSearchService("usc", lambda: _usc_db_connect(USC_DB_FILE), _usc_make_fts_query)
 
         # --- SRC database init ---
         try:
@@ -4441,6 +4153,7 @@ class SpideyGov(commands.Cog):
             print(f"SRC DB init error: {e}")
 
         self.src_lock = asyncio.Lock()
+        self.src_index = CodeSearchService("src", lambda: _src_db_connect(SRC_DB_FILE), _usc_make_fts_query)
 
                 # --- Bills database init ---
         self.drafts_db = DraftsDB(DRAFTS_DB_FILE)
@@ -4458,15 +4171,50 @@ class SpideyGov(commands.Cog):
         except Exception: pass
         try: self.bill_status_ticker.cancel()
         except Exception: pass
+        try: self.registry_compactor.cancel()
+        except Exception: pass
+        try: _REGISTRY_JOURNAL.listeners.remove(self._on_registry_saved)
+        except ValueError: pass
+        try: close_all_pools()
+        except Exception: pass
+        try: release_renderer(self.bot)
+        except Exception: pass
 
         # Skip saving if we were in read-only
         if getattr(self, "registry_readonly", False):
             return
         try:
             save_federal_registry(self.federal_registry)
+            compact_federal_registry(self.federal_registry)
         except Exception:
             pass
     
+    def _on_registry_saved(self, data: dict, ops: list) -> None:
+        if data is self.federal_registry:
+            self.registry_index.apply_ops(data, ops)
+
+    @staticmethod
+    def _applicant_tag(member: discord.Member) -> str | None:
+        if member.get_role(PENDING_RESIDENT):
+            return "Pending Resident"
+        if member.get_role(CITIZENSHIP_APPLICANT):
+            return "Citizenship Applicant"
+        return None
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if (
+            before.roles != after.roles
+            or before.display_name != after.display_name
+            or before.name != after.name
+            or getattr(before, "global_name", None) != getattr(after, "global_name", None)
+        ):
+            self.applicant_index.update(after.guild.id, after)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self.applicant_index.remove(member.guild.id, member.id)
+
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
         """Give PENDING role and open an intake thread with a residency question."""
@@ -4527,15 +4275,8 @@ class SpideyGov(commands.Cog):
         await state_dep.send(f"New member {member.mention} joined. Residency intake thread opened: {thread.mention}")
 
     async def elections_contest_autocomplete(self, interaction: discord.Interaction, current: str):
-        reg = self.federal_registry
-        contests = _elections_root(reg)["contests"]
-        cur = (current or "").lower()
-        out = []
-        for cid, c in contests.items():
-            label = f"{cid} — {(c.get('office') or c.get('kind') or '?').title()} ({c.get('category','?')})"
-            if not cur or cur in label.lower():
-                out.append(app_commands.Choice(name=label[:100], value=cid))
-        return out[:25]
+        idx = self.registry_index.contests.labels
+        return [app_commands.Choice(name=idx.label(cid)[:100], value=cid) for cid in idx.search(current)]
 
     async def category_autocomplete(self, interaction: discord.Interaction, current: str):
         cur = (current or "").lower()
@@ -4632,11 +4373,8 @@ class SpideyGov(commands.Cog):
             pass
     
     def _compose_bill_status_embed(self, reg: dict) -> discord.Embed:
-        items = (reg.get("bills") or {}).get("items") or {}
-        # group by status
-        buckets = {}
-        for b in items.values():
-            buckets.setdefault(b.get("status","DRAFT"), []).append(b)
+        # per-status buckets come straight from the registry index
+        bills = self.registry_index.bills
 
         # show a compact summary + top few IDs per bucket
         e = discord.Embed(
@@ -4646,10 +4384,10 @@ class SpideyGov(commands.Cog):
         )
         order = ["DRAFT","INTRODUCED","FLOOR VOTE OPEN","PASSED","FAILED","SENT_TO_OTHER","RECEIVED_OTHER","ENROLLED","PRESENTED","ENACTED","VETOED"]
         for key in order:
-            arr = buckets.get(key, [])
+            arr = bills.keys_where("status", key)
             if not arr: continue
             # list first 8 bills in this status
-            ids = ", ".join(sorted((b["id"] for b in arr))[:8])
+            ids = ", ".join(sorted(arr)[:8])
             e.add_field(name=f"{key.title()} ({len(arr)})", value=(ids or "—"), inline=False)
         return e
     
@@ -4711,6 +4449,21 @@ class SpideyGov(commands.Cog):
     async def _wait_ready_status(self):
         await self.bot.wait_until_ready()
 
+    @tasks.loop(hours=6.0)
+    async def registry_compactor(self):
+        """Every 6h: fold the registry journal into a fresh snapshot."""
+        if self.registry_readonly or not _REGISTRY_JOURNAL.pending():
+            return
+        try:
+            async with self.registry_lock:
+                compact_federal_registry(self.federal_registry)
+        except Exception as e:
+            print(f"Registry compaction error: {e}")
+
+    @registry_compactor.before_loop
+    async def _wait_ready_compactor(self):
+        await self.bot.wait_until_ready()
+
     
 
     government = app_commands.Group(name="government", description="Government-related commands")
@@ -5726,8 +5479,8 @@ class SpideyGov(commands.Cog):
 
         # Atomic write of the new data
         try:
-            # if you already have save_federal_registry() with atomic replace, use it:
-            save_federal_registry(data)
+            # full snapshot (not a journal delta) so the file on disk is the upload itself
+            compact_federal_registry(data)
         except Exception as e:
             REGISTRY_SUSPENDED = getattr(self, "registry_readonly", False)
             return await interaction.followup.send(f"❌ Failed to write new registry: {e}", ephemeral=True)
@@ -5736,6 +5489,7 @@ class SpideyGov(commands.Cog):
         try:
             with open(base, "r", encoding="utf-8") as f:
                 self.federal_registry = json.load(f)
+            self.registry_index.rebuild(self.federal_registry)
         except Exception as e:
             return await interaction.followup.send(
                 f"⚠️ Wrote file, but reload failed: {e}\n"
@@ -5752,6 +5506,8 @@ class SpideyGov(commands.Cog):
                 self.bill_poll_sweeper.start()
             if hasattr(self, "bill_status_ticker") and not self.bill_status_ticker.is_running():
                 self.bill_status_ticker.start()
+            if hasattr(self, "registry_compactor") and not self.registry_compactor.is_running():
+                self.registry_compactor.start()
         except Exception:
             pass
 
@@ -5783,11 +5539,19 @@ class SpideyGov(commands.Cog):
         base = Path(FED_REGISTRY_FILE)
         paths: list[tuple[str, Path]] = []
 
+        if which in ("live", "all") and not self.registry_readonly and _REGISTRY_JOURNAL.pending():
+            # fold pending journal records in so the snapshot we send is current
+            try:
+                compact_federal_registry(self.federal_registry)
+            except Exception:
+                pass
+
         if which in ("live", "all"):
             paths.append((base.name, base))
         if which in ("bak", "all"):
-            bak = Path(str(base) + ".bak")
-            if bak.exists():
+            baks = _REGISTRY_JOURNAL.backups()
+            if baks:
+                bak = Path(baks[0])
                 paths.append((bak.name, bak))
         if which in ("salvaged", "all"):
             salv = base.with_suffix(".salvaged.json")
@@ -5816,6 +5580,29 @@ class SpideyGov(commands.Cog):
 
         await interaction.followup.send(content=msg, files=files, ephemeral=True)
 
+    @registry.command(
+        name="journal",
+        description="Show registry journal stats and optionally compact it into a fresh snapshot."
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.describe(compact="Fold pending journal records into the snapshot now")
+    async def registry_journal(self, interaction: discord.Interaction, compact: bool = False):
+        if compact:
+            if self.registry_readonly:
+                return await interaction.response.send_message("❌ Registry is read-only right now.", ephemeral=True)
+            async with self.registry_lock:
+                compact_federal_registry(self.federal_registry)
+
+        st = _REGISTRY_JOURNAL.stats()
+        lines = [
+            f"Snapshot: {st['snapshot_bytes']:,} bytes",
+            f"Journal: {st['journal_records']} records / {st['journal_bytes']:,} bytes",
+            f"Backups kept: {st['backups']}",
+            f"Saves: {st['saves']} ({st['noop_saves']} no-op) • Compactions: {st['compactions']}",
+            f"Last save: {st['last_save_ms']} ms ({st['last_ops']} ops) • Last compaction: {st['last_compact_ms']} ms",
+        ]
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
 
     @bill.command(name="propose_legislation", description="Propose new legislation")
     @app_commands.checks.has_any_role(SENATORS, REPRESENTATIVES)
@@ -6491,45 +6278,36 @@ class SpideyGov(commands.Cog):
         if not guild:
             return []
 
-        cur = (current or "").lower()
-
-        # Prefer role.members over guild.members (lighter & more reliable in autocomplete)
-        pending_role   = guild.get_role(PENDING_RESIDENT)
-        applicant_role = guild.get_role(CITIZENSHIP_APPLICANT)
+        if not self.applicant_index.ready(guild.id):
+            # Prefer role.members over guild.members (lighter & more reliable in autocomplete)
+            pending_role   = guild.get_role(PENDING_RESIDENT)
+            applicant_role = guild.get_role(CITIZENSHIP_APPLICANT)
 
-        candidates = set()
-        if pending_role:
-            candidates.update(pending_role.members)
-        if applicant_role:
-            candidates.update(applicant_role.members)
+            candidates = set()
+            if pending_role:
+                candidates.update(pending_role.members)
+            if applicant_role:
+                candidates.update(applicant_role.members)
 
-        # If empty, try to populate cache once
-        if not candidates and not guild.chunked:
-            try:
-                await guild.chunk()  # hydrate member cache
-                if pending_role:
-                    candidates.update(pending_role.members)
-                if applicant_role:
-                    candidates.update(applicant_role.members)
-            except Exception:
-                pass
+            # If empty, try to populate cache once
+            if not candidates and not guild.chunked:
+                try:
+                    await guild.chunk()  # hydrate member cache
+                    if pending_role:
+                        candidates.update(pending_role.members)
+                    if applicant_role:
+                        candidates.update(applicant_role.members)
+                except Exception:
+                    pass
 
-        out = []
-        for m in sorted(candidates, key=lambda x: (x.display_name or x.name).lower()):
-            tag = "Pending Resident" if (pending_role and pending_role in m.roles) else "Citizenship Applicant"
-            label = f"{m.display_name} ({tag})"
-            # match display, username, or global name
-            names = [
-                (m.display_name or "").lower(),
-                (m.name or "").lower(),
-                (getattr(m, "global_name", "") or "").lower(),
-            ]
-            if not cur or any(cur in n for n in names):
-                out.append(app_commands.Choice(name=label[:100], value=str(m.id)))
-            if len(out) >= 25:
-                break
+            # member join/update/remove events keep it current from here on
+            self.applicant_index.build(guild.id, candidates)
 
-        return out
+        # matches display, username, or global name
+        return [
+            app_commands.Choice(name=label[:100], value=str(mid))
+            for mid, label in self.applicant_index.search(guild.id, current)
+        ]
 
 
 
@@ -6937,15 +6715,9 @@ class SpideyGov(commands.Cog):
         await interaction.response.send_modal(ConstitutionSetHeadingModal(path_label=path_label, node=target))
 
     async def bill_id_autocomplete(self, interaction: discord.Interaction, current: str):
-        current = (current or "").lower()
-        items = self.federal_registry.get("bills", {}).get("items", {})
-        out = []
-        for bid, b in items.items():
-            label = f"{bid} — {b.get('title','')}"
-            if current in label.lower():
-                out.append(app_commands.Choice(name=label[:100], value=bid))
-        out.reverse() # shows most recent first
-        return (out[:25])
+        idx = self.registry_index.bills.labels
+        # shows most recent first
+        return [app_commands.Choice(name=idx.label(bid)[:100], value=bid) for bid in idx.search(current, reverse=True)]
 
     @bill.command(name="view", description="View a bill/resolution draft")
     @app_commands.autocomplete(bill_id=bill_id_autocomplete)
@@ -7038,8 +6810,15 @@ class SpideyGov(commands.Cog):
     ])
     async def docket(self, interaction: discord.Interaction, chamber: str):
         items = self.federal_registry.get("bills", {}).get("items", {})
+        bills = self.registry_index.bills
         # show DRAFT/INTRODUCED/IN_COMMITTEE/FLOOR; hide PASSED/FAILED/ENACTED by default
-        active = [b for b in items.values() if b.get("chamber")==chamber and b.get("status") in {"DRAFT","INTRODUCED","IN_COMMITTEE","FLOOR"}]
+        in_chamber = bills.keys_where("chamber", chamber)
+        active = [
+            items[bid]
+            for st in ("DRAFT", "INTRODUCED", "IN_COMMITTEE", "FLOOR")
+            for bid in bills.keys_where("status", st) & in_chamber
+            if bid in items
+        ]
         if not active:
             return await interaction.response.send_message(f"No active items in the {chamber}.", ephemeral=True)
 
@@ -7079,23 +6858,20 @@ class SpideyGov(commands.Cog):
 
 
     async def eo_id_autocomplete(self, interaction: discord.Interaction, current: str):
-        current = (current or "").lower()
-        items = self.federal_registry.get("executive_orders", {}).get("items", {})
-        out = []
-        for k, v in items.items():
-            label = f"{k} — {v.get('title','')}"
-            if current in label.lower(): out.append(app_commands.Choice(name=label[:100], value=k))
-        return out[:25]
+        idx = self.registry_index.executive_orders.labels
+        return [app_commands.Choice(name=idx.label(k)[:100], value=k) for k in idx.search(current)]
 
     @executive.command(name="eo_list", description="List EOs (optionally by year/status)")
     @app_commands.describe(year="Year (e.g., 2025)", status="ACTIVE or RESCINDED")
     async def eo_list(self, interaction: discord.Interaction, year: int | None = None, status: str | None = None):
         items = self.federal_registry.get("executive_orders", {}).get("items", {})
+        eos = self.registry_index.executive_orders
+        keys = set(items.keys())
+        if year: keys &= eos.keys_where("year", str(year))
+        if status: keys &= eos.keys_where("status", status)
         rows = []
-        for k, v in sorted(items.items()):
-            if year and not k.startswith(f"EO-{year}-"): continue
-            if status and v.get("status") != status: continue
-            rows.append(f"**{k}** — {v.get('title','')}")
+        for k in sorted(keys):
+            rows.append(f"**{k}** — {items[k].get('title','')}")
         if not rows: return await interaction.response.send_message("No matching EOs.", ephemeral=True)
         await interaction.response.send_message("\n".join(rows[:30]), ephemeral=False)
 
@@ -7438,9 +7214,6 @@ class SpideyGov(commands.Cog):
         await interaction.response.send_message(embed=embed)
 
     async def committee_name_autocomplete(self, interaction: discord.Interaction, current: str):
-        reg = self.federal_registry
-        committees = _get_committees_root(reg)
-
         ns = interaction.namespace
         chamber = getattr(ns, "chamber", None)
         # FIX: actually unwrap if it's a Choice
@@ -7449,21 +7222,10 @@ class SpideyGov(commands.Cog):
         if chamber not in {"senate", "house", "joint"}:
             return []
 
-        cur = (current or "").lower()
-        out: list[app_commands.Choice[str]] = []
-        bucket = committees.get(chamber, {})
-
-        for key, data in sorted(bucket.items(), key=lambda kv: kv[0]):
-            label = (data.get("name") or key.replace("_", " ").title()).strip()
-            if not cur or cur in label.lower():
-                out.append(app_commands.Choice(name=label, value=key))
-            subs = data.get("sub_committees") or {}
-            for sk, sv in sorted(subs.items(), key=lambda kv: kv[0]):
-                slabel = (sv.get("name") or sk.replace("_", " ").title()).strip()
-                full = f"{label} → {slabel}"
-                if not cur or cur in full.lower():
-                    out.append(app_commands.Choice(name=full, value=f"{key}::{sk}"))
-        return out[:25]
+        return [
+            app_commands.Choice(name=label[:100], value=key)
+            for key, label in self.registry_index.committees.search(chamber, current)
+        ]
 
 
 
@@ -8313,35 +8075,58 @@ class SpideyGov(commands.Cog):
         await interaction.response.send_message(f"🚫 **{bill_id}** vetoed.", ephemeral=False)
 
 
-    @usc.command(name="import", description="Import a USC Title XML (stores title, created date, chapters, sections)")
+    @usc.command(name="import", description="Import a USC Title XML or a .zip of titles (stores title, created date, chapters, sections)")
     @app_commands.checks.has_permissions(administrator=True)
-    @app_commands.describe(file="Upload a USLM USC Title XML file (e.g., Title 1)")
+    @app_commands.describe(file="Upload a USLM USC Title XML file (e.g., Title 1), or a .zip of several")
     @app_commands.describe(force="Rebuild this title even if it's already imported with the same file")
     async def usc_import(self, interaction: discord.Interaction, file: discord.Attachment, force: bool = False):
         await interaction.response.defer(ephemeral=True, thinking=True)
 
-        if not file.filename.lower().endswith(".xml"):
-            return await interaction.followup.send("Upload must be an **.xml** file.", ephemeral=True)
-
-        try:
-            xml_bytes = await file.read()
-        except Exception:
-            return await interaction.followup.send("Couldn’t read that attachment.", ephemeral=True)
+        fname = file.filename.lower()
+        if not (fname.endswith(".xml") or fname.endswith(".zip")):
+            return await interaction.followup.send("Upload must be an **.xml** or **.zip** file.", ephemeral=True)
 
-        async with self.usc_lock:
+        # spool to disk past 8 MB instead of holding the whole attachment in memory
+        with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as spool:
             try:
-                summary = await asyncio.to_thread(_usc_import_xml_bytes, USC_DB_FILE, xml_bytes, force)
-            except Exception as e:
-                return await interaction.followup.send(f"Import failed: `{e}`", ephemeral=True)
+                await file.save(spool, seek_begin=True)
+            except Exception:
+                return await interaction.followup.send("Couldn’t read that attachment.", ephemeral=True)
 
-        emb = discord.Embed(
-            title=f"USC Title {summary.get('title_num')} — {summary.get('heading') or ''}".strip(),
-            description=f"**Status:** {summary.get('status')}\n"
-                        f"**Created:** {summary.get('created_at') or 'Unknown'}\n"
-                        f"**Chapters:** {summary.get('chapters')}\n"
-                        f"**Sections:** {summary.get('sections')}",
+            importer = _usc_import_zip_file if fname.endswith(".zip") else _usc_import_xml_file
+            async with self.usc_lock:
+                try:
+                    summary = await asyncio.to_thread(importer, USC_DB_FILE, spool, force)
+                except Exception as e:
+                    return await interaction.followup.send(f"Import failed: `{e}`", ephemeral=True)
+                finally:
+                    self.usc_index.invalidate()
+
+        stats = (
+            f"{summary['sections_per_sec']:,.0f} sections/sec • "
+            f"{summary['seconds']:.2f}s • peak RSS {summary['peak_rss_mb']:,.0f} MB"
         )
-        emb.set_footer(text=f"sha256: {summary.get('sha256')[:12]}…")
+        titles = summary["titles"]
+        if len(titles) == 1:
+            t = titles[0]
+            emb = discord.Embed(
+                title=f"USC Title {t.get('title_num')} — {t.get('heading') or ''}".strip(),
+                description=f"**Status:** {t.get('status')}\n"
+                            f"**Created:** {t.get('created_at') or 'Unknown'}\n"
+                            f"**Chapters:** {t.get('chapters')}\n"
+                            f"**Sections:** {t.get('sections')}",
+            )
+            emb.set_footer(text=f"sha256: {t.get('sha256')[:12]}… • {stats}")
+        else:
+            lines = [
+                f"**Title {t.get('title_num')}** — {t.get('status')} · {t.get('chapters')} ch · {t.get('sections')} §§"
+                for t in sorted(titles, key=lambda r: r.get("title_num") or 0)
+            ]
+            emb = discord.Embed(
+                title=f"USC import — {len(titles)} titles",
+                description="\n".join(lines)[:4000],
+            )
+            emb.set_footer(text=stats)
         await interaction.followup.send(embed=emb, ephemeral=True)
 
     @usc.command(name="titles", description="List imported USC titles")
@@ -8362,6 +8147,28 @@ class SpideyGov(commands.Cog):
         )
         await interaction.followup.send(embed=emb)
 
+    @usc.command(name="dbstats", description="Show connection and query timing counters for the legislative databases")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def usc_dbstats(self, interaction: discord.Interaction):
+        pools = all_pools()
+        if not pools:
+            return await interaction.response.send_message("No database connections opened yet.", ephemeral=True)
+        lines = []
+        for label, svc in (("USC search", self.usc_index), ("SRC search", self.src_index)):
+            st = svc.stats()
+            lines.append(
+                f"**{label}** — {st['entries']} cached queries • hit ratio {st['hit_ratio']*100:.0f}% "
+                f"({st['hits']}/{st['hits'] + st['misses']}) • section lookups {st['memo_hit_ratio']*100:.0f}% • "
+                f"{st['invalidations']} invalidations"
+            )
+        for path, pool in sorted(pools.items()):
+            st = pool.stats()
+            lines.append(
+                f"**{os.path.basename(path)}** — {st['queries']:,} queries • avg {st['avg_ms']} ms • "
+                f"slowest {st['slowest_ms']} ms • {st['connections']} conns / {st['checkouts']:,} checkouts"
+            )
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
     def _usc_db_get_title_meta(self, db_path: str, title_num: int) -> sqlite3.Row | None:
         _usc_db_init(db_path)
         conn = _usc_db_connect(db_path)
@@ -8542,6 +8349,8 @@ class SpideyGov(commands.Cog):
                 removed = await asyncio.to_thread(self._usc_db_cleanup_nonusc, USC_DB_FILE)
             except Exception as e:
                 return await interaction.followup.send(f"Cleanup failed: `{e}`", ephemeral=True)
+            finally:
+                self.usc_index.invalidate()
 
         await interaction.followup.send(f"Cleanup complete. Removed **{removed}** bad sections.", ephemeral=True)
     
@@ -8566,125 +8375,9 @@ class SpideyGov(commands.Cog):
         await interaction.response.defer(ephemeral=True, thinking=True)
         async with self.usc_lock:
             n = await asyncio.to_thread(self._usc_db_reindex_nodes_fts, USC_DB_FILE)
+            self.usc_index.invalidate()
         await interaction.followup.send(f"Reindexed chapter headings. Rows: **{n}**.", ephemeral=True)
     
-    def _usc_db_search(self, db_path: str, query: str, title: int | None, limit_sections: int = 25, limit_chapters: int = 10):
-        _usc_db_init(db_path)
-        conn = _usc_db_connect(db_path)
-        try:
-            q = _usc_make_fts_query(query)
-            if not q:
-                return {"titles": {}, "counts": {"sections": 0, "chapters": 0}}
-
-            # Sections
-            sec_sql = """
-            SELECT
-            s.id,
-            s.title_num,
-            s.section_num,
-            COALESCE(s.heading,'') AS heading,
-            COALESCE(n.num,'') AS chapter_num,
-            COALESCE(n.heading,'') AS chapter_heading,
-            bm25(usc_sections_fts, 0.0, 0.0, 6.0, 1.0) AS rank,
-            snippet(
-            usc_sections_fts,
-            2,
-            (char(27) || '[1;33m'),
-            (char(27) || '[0m'),
-            '…',
-            12
-            ) AS hsnip,
-
-            snippet(
-            usc_sections_fts,
-            3,
-            (char(27) || '[1;33m'),
-            (char(27) || '[0m'),
-            '…',
-            24
-            ) AS bsnip
-            FROM usc_sections_fts
-            JOIN usc_sections s ON s.id = usc_sections_fts.rowid
-            LEFT JOIN usc_nodes n ON n.id = s.node_id
-            WHERE usc_sections_fts MATCH ?
-            """
-            params = [q]
-            if title is not None:
-                sec_sql += " AND s.title_num = ?"
-                params.append(int(title))
-            sec_sql += " ORDER BY rank LIMIT ?"
-            params.append(int(limit_sections))
-            sec_rows = conn.execute(sec_sql, params).fetchall()
-
-            # Chapter headings (nodes)
-            ch_sql = """
-            SELECT
-            n.id,
-            n.title_num,
-            n.node_type,
-            COALESCE(n.num,'') AS num,
-            COALESCE(n.heading,'') AS heading,
-            bm25(usc_nodes_fts, 0.0, 0.0, 0.0, 1.0) AS rank,
-            snippet(
-            usc_nodes_fts,
-            3,
-            (char(27) || '[1;33m'),
-            (char(27) || '[0m'),
-            '…',
-            16
-            ) AS snip
-            FROM usc_nodes_fts
-            JOIN usc_nodes n ON n.id = usc_nodes_fts.rowid
-            WHERE usc_nodes_fts MATCH ?
-            AND n.node_type='chapter'
-            """
-            params = [q]
-            if title is not None:
-                ch_sql += " AND n.title_num = ?"
-                params.append(int(title))
-            ch_sql += " ORDER BY rank LIMIT ?"
-            params.append(int(limit_chapters))
-            ch_rows = conn.execute(ch_sql, params).fetchall()
-
-            # Title headings for display
-            title_nums = sorted({r["title_num"] for r in sec_rows} | {r["title_num"] for r in ch_rows})
-            title_map = {}
-            if title_nums:
-                qmarks = ",".join("?" for _ in title_nums)
-                for r in conn.execute(f"SELECT title_num, heading FROM usc_titles WHERE title_num IN ({qmarks})", title_nums):
-                    title_map[int(r["title_num"])] = r["heading"]
-
-            # Group results
-            grouped = {}
-            for tnum in title_nums:
-                grouped[tnum] = {"title_heading": title_map.get(tnum, ""), "chapters": [], "sections": []}
-
-            for r in ch_rows:
-                grouped[int(r["title_num"])]["chapters"].append({
-                    "num": r["num"],
-                    "heading": r["heading"],
-                    "snip": r["snip"] or r["heading"],
-                })
-
-            for r in sec_rows:
-                hsnip = r["hsnip"] or r["heading"]
-                bsnip = r["bsnip"] or ""
-                grouped[int(r["title_num"])]["sections"].append({
-                    "chapter_num": r["chapter_num"],
-                    "chapter_heading": r["chapter_heading"],
-                    "section_num": r["section_num"],
-                    "heading": r["heading"],
-                    "hsnip": hsnip,
-                    "bsnip": bsnip,
-                })
-
-            return {
-                "titles": grouped,
-                "counts": {"sections": len(sec_rows), "chapters": len(ch_rows)}
-            }
-        finally:
-            conn.close()
-    
     @usc.command(name="search", description="Search the USC (headings prioritized)")
     @app_commands.describe(
         query="Search terms (use quotes for an exact phrase)",
@@ -8693,9 +8386,8 @@ class SpideyGov(commands.Cog):
     async def usc_search(self, interaction: discord.Interaction, query: str, title: int | None = None):
         await interaction.response.defer(ephemeral=True, thinking=True)
 
-        data = await asyncio.to_thread(self._usc_db_search, USC_DB_FILE, query, title)
-        grouped = data["titles"]
-        if not grouped:
+        data = await asyncio.to_thread(self.usc_index.search, query, title)
+        if not data["titles"]:
             return await interaction.followup.send(f"Unable to find any results in the U.S.C. using `{query}`.{' Consider picking a different Title.' if title else ''}", ephemeral=False)
 
         # Build display lines
@@ -8707,30 +8399,13 @@ class SpideyGov(commands.Cog):
 
         lines.append(f"Showing {data['counts']['chapters']} chapter hits, {data['counts']['sections']} section hits (top results).")
         lines.append("")
-
-        for tnum in sorted(grouped.keys()):
-            th = grouped[tnum]["title_heading"]
-            lines.append(f"Title {tnum} — {th}".rstrip())
-            lines.append("-" * 28)
-
-            # chapter hits first (like your example)
-            for ch in grouped[tnum]["chapters"][:10]:
-                lines.append(f"CHAPTER {ch['num']} — {ch['snip']}")
-
-            if grouped[tnum]["chapters"]:
-                lines.append("")
-
-            for s in grouped[tnum]["sections"][:25]:
-                # Show section heading with highlights if present
-                lines.append(f"§ {s['section_num']} — {s['hsnip']}")
-                # If heading didn’t contain highlights, show a body snippet line
-                if "**" not in (s["hsnip"] or "") and s["bsnip"]:
-                    lines.append(f"    … {s['bsnip']}")
-            lines.append("")
-            lines.append("")
+        lines.extend(_code_search_lines(data))
 
         pages = _usc_chunk_lines(lines, limit=1700)
-        view = USCTextPaginator(title="USC Search Results", pages=pages)
+        view = CodeSearchPaginator(
+            title="USC Search Results", pages=pages, service=self.usc_index,
+            query=query, search_title=title, next_offset=data["next_offset"], limit=1700,
+        )
 
         if interaction.channel is None:
             await interaction.followup.send(content=view.make_content(), view=view, ephemeral=False)
@@ -8758,6 +8433,8 @@ class SpideyGov(commands.Cog):
                 summary = await asyncio.to_thread(_src_import_json_bytes, SRC_DB_FILE, raw, force)
             except Exception as e:
                 return await interaction.followup.send(f"SRC import failed: `{e}`", ephemeral=True)
+            finally:
+                self.src_index.invalidate()
 
         emb = discord.Embed(
             title="SRC Import Complete",
@@ -8893,6 +8570,7 @@ class SpideyGov(commands.Cog):
         await interaction.response.defer(ephemeral=True, thinking=True)
         async with self.src_lock:
             n = await asyncio.to_thread(self._src_db_reindent_all, SRC_DB_FILE)
+            self.src_index.invalidate()
         await interaction.followup.send(f"Re-indented **{n}** SRC sections.", ephemeral=True)
 
     @src.command(name="reindex", description="Rebuild SRC search indexes (chapters + sections)")
@@ -8901,6 +8579,7 @@ class SpideyGov(commands.Cog):
         await interaction.response.defer(ephemeral=True, thinking=True)
         async with self.src_lock:
             res = await asyncio.to_thread(_src_db_reindex_fts, SRC_DB_FILE)
+            self.src_index.invalidate()
         await interaction.followup.send(
             f"Reindexed SRC. Nodes: **{res['nodes']}**, Sections: **{res['sections']}**.",
             ephemeral=True
@@ -8911,9 +8590,8 @@ class SpideyGov(commands.Cog):
     async def src_search(self, interaction: discord.Interaction, query: str, title: int | None = None):
         await interaction.response.defer(ephemeral=True, thinking=True)
 
-        data = await asyncio.to_thread(_src_db_search, SRC_DB_FILE, query, title)
-        grouped = data["titles"]
-        if not grouped:
+        data = await asyncio.to_thread(self.src_index.search, query, title)
+        if not data["titles"]:
             return await interaction.followup.send("No matches found.", ephemeral=True)
 
         lines: list[str] = []
@@ -8924,27 +8602,13 @@ class SpideyGov(commands.Cog):
             lines.append(f"Results for: {query}")
         lines.append(f"Showing {data['counts']['chapters']} chapter hits, {data['counts']['sections']} section hits (top results).")
         lines.append("")
-
-        for tnum in sorted(grouped.keys()):
-            th = grouped[tnum]["title_heading"]
-            lines.append(f"Title {tnum} — {th}".rstrip())
-            lines.append("-" * 28)
-
-            for ch in grouped[tnum]["chapters"][:10]:
-                lines.append(f"CHAPTER {ch['num']} — {ch['snip']}")
-
-            if grouped[tnum]["chapters"]:
-                lines.append("")
-
-            for s in grouped[tnum]["sections"][:25]:
-                lines.append(f"§ {s['section_num']} — {s['hsnip']}")
-                if "\x1b[" not in (s["hsnip"] or "") and s["bsnip"]:
-                    lines.append(f"    … {s['bsnip']}")
-            lines.append("")
-            lines.append("")
+        lines.extend(_code_search_lines(data))
 
         pages = _usc_chunk_lines(lines, limit=1600)  # keep headroom; ANSI codes add chars
-        view = USCTextPaginator(title="SRC Search Results", pages=pages)
+        view = CodeSearchPaginator(
+            title="SRC Search Results", pages=pages, service=self.src_index,
+            query=query, search_title=title, next_offset=data["next_offset"], limit=1600,
+        )
 
         if interaction.channel is None:
             await interaction.followup.send(content=view.make_content(), view=view, ephemeral=False)
@@ -8976,12 +8640,17 @@ class SpideyGov(commands.Cog):
 
         # Lock order: USC then SRC (consistent; avoids deadlock risk)
         async with self.usc_lock:
-            usc_row = await asyncio.to_thread(_usc_db_get_section, USC_DB_FILE, int(usc_title), str(usc_section))
+            usc_row = await asyncio.to_thread(
+                self.usc_index.cached, ("section", int(usc_title), str(usc_section)),
+                _usc_db_get_section, USC_DB_FILE, int(usc_title), str(usc_section),
+            )
         if not usc_row:
             return await interaction.followup.send("USC section not found (is that title imported?).", ephemeral=True)
 
         async with self.src_lock:
-            src_row = await asyncio.to_thread(_src_db_get_section, SRC_DB_FILE, st, ss)
+            src_row = await asyncio.to_thread(
+                self.src_index.cached, ("section", st, ss), _src_db_get_section, SRC_DB_FILE, st, ss
+            )
         if not src_row:
             return await interaction.followup.send("SRC section not found (is that title imported?).", ephemeral=True)
 
@@ -9194,7 +8863,7 @@ class SpideyGov(commands.Cog):
         interaction: discord.Interaction,
         current: str,
     ) -> list[app_commands.Choice[str]]:
-        accounts = self.social_db.list_accounts_for_owner(interaction.user.id, current=current, limit=25)
+        accounts = await asyncio.to_thread(self.social_db.list_accounts_for_owner, interaction.user.id, current=current, limit=25)
         return [app_commands.Choice(name=a["username"], value=a["username"]) for a in accounts]
 
 
@@ -9203,7 +8872,7 @@ class SpideyGov(commands.Cog):
         interaction: discord.Interaction,
         current: str,
     ) -> list[app_commands.Choice[str]]:
-        accounts = self.social_db.search_accounts(current=current, limit=25)
+        accounts = await asyncio.to_thread(self.social_db.search_accounts, current=current, limit=25)
         return [app_commands.Choice(name=a["username"], value=a["username"]) for a in accounts]
 
 
@@ -9236,7 +8905,7 @@ class SpideyGov(commands.Cog):
             final_avatar = avatar_url.strip()
 
         async with self.social_lock:
-            created = self.social_db.create_account(interaction.user.id, clean_username, final_avatar)
+            created = await asyncio.to_thread(self.social_db.create_account, interaction.user.id, clean_username, final_avatar)
 
         if not created:
             return await interaction.followup.send("That username is already taken.", ephemeral=True)
@@ -9255,7 +8924,7 @@ class SpideyGov(commands.Cog):
     async def social_view_owner(self, interaction: discord.Interaction, username: str):
         await interaction.response.defer(ephemeral=True)
 
-        account = self.social_db.account_summary(username)
+        account = await asyncio.to_thread(self.social_db.account_summary, username)
         if not account:
             return await interaction.followup.send("That account was not found.", ephemeral=True)
 
@@ -9299,7 +8968,7 @@ class SpideyGov(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=True)
 
-        account = self.social_db.get_by_username(username)
+        account = await asyncio.to_thread(self.social_db.get_by_username, username)
         if not account or int(account["owner_id"]) != interaction.user.id:
             return await interaction.followup.send(
                 "That account was not found in your registered Spidder accounts.",
@@ -9366,7 +9035,8 @@ class SpideyGov(commands.Cog):
                 pass
 
         async with self.social_lock:
-            self.social_db.log_post(
+            await asyncio.to_thread(
+                self.social_db.log_post,
                 account_id=int(account["account_id"]),
                 owner_id=int(account["owner_id"]),
                 actor_id=interaction.user.id,
@@ -9389,29 +9059,9 @@ class SpideyGov(commands.Cog):
         out["Other"] = other_total
         return out
 
-    def _pie_png(self, data: dict[str, int], title: str) -> io.BytesIO:
+    async def _pie_png(self, data: dict[str, int], title: str) -> io.BytesIO:
         data = self._collapse_for_pie(data, max_slices=8)
-        labels = list(data.keys())
-        sizes = list(data.values())
-
-        fig, ax = plt.subplots(figsize=(8, 5), dpi=160)
-        wedges, _ = ax.pie(sizes, startangle=90)  # default colors are fine
-        ax.axis("equal")
-        ax.set_title(title)
-
-        ax.legend(
-            wedges,
-            labels,
-            loc="center left",
-            bbox_to_anchor=(1.02, 0.5),
-            frameon=False,
-        )
-
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", bbox_inches="tight")
-        plt.close(fig)
-        buf.seek(0)
-        return buf
+        return await self.charts.render_file(render_pie, list(data.keys()), list(data.values()), title)
     
     @budget.command(name="view", description="View a fiscal year's budget.")
     @app_commands.describe(year="Fiscal year (defaults to 2025).")
@@ -9451,7 +9101,7 @@ class SpideyGov(commands.Cog):
             f"• Net {net_label}: {fmt_credits(net)}",
         ]), inline=False)
 
-        chart = self._pie_png(outlays, f"FY{year} Spending Breakdown")
+        chart = await self._pie_png(outlays, f"FY{year} Spending Breakdown")
         file = discord.File(chart, filename="spending.png")
 
         e.set_image(url="attachment://spending.png")
@@ -9459,7 +9109,7 @@ class SpideyGov(commands.Cog):
         await interaction.followup.send(embed=e, file=file, ephemeral=False)
 
     async def draft_id_autocomplete(self, interaction: discord.Interaction, current: str):
-        drafts = self.drafts_db.search_drafts(current, limit=25)
+        drafts = await asyncio.to_thread(self.drafts_db.search_drafts, current, limit=25)
         out = []
         for d in drafts:
             label = f"{d['draft_id']} — {d['title']}"
@@ -9471,7 +9121,7 @@ class SpideyGov(commands.Cog):
         if not draft_id:
             return []
 
-        d = self.drafts_db.get_draft(draft_id)
+        d = await asyncio.to_thread(self.drafts_db.get_draft, draft_id)
         if not d:
             return []
 
@@ -9502,7 +9152,8 @@ class SpideyGov(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         async with self.drafts_lock:
-            draft_id = self.drafts_db.create_draft(
+            draft_id = await asyncio.to_thread(
+                self.drafts_db.create_draft,
                 owner_id=interaction.user.id,
                 title=title,
                 short_title=short_title,
@@ -9517,7 +9168,7 @@ class SpideyGov(commands.Cog):
     async def draft_view(self, interaction: discord.Interaction, draft_id: str):
         await interaction.response.defer(ephemeral=True)
 
-        d = self.drafts_db.get_draft(draft_id)
+        d = await asyncio.to_thread(self.drafts_db.get_draft, draft_id)
         if not d:
             return await interaction.followup.send("Draft not found.", ephemeral=True)
 
@@ -9561,7 +9212,7 @@ class SpideyGov(commands.Cog):
     @app_commands.describe(draft_id="Draft ID", section="Which part to edit")
     @app_commands.choices(section=[app_commands.Choice(name=v, value=k) for k, v in DRAFT_BINS.items()])
     async def draft_edit(self, interaction: discord.Interaction, draft_id: str, section: app_commands.Choice[str]):
-        d = self.drafts_db.get_draft(draft_id)
+        d = await asyncio.to_thread(self.drafts_db.get_draft, draft_id)
         if not d:
             return await interaction.response.send_message("Draft not found.", ephemeral=True)
 
@@ -9576,7 +9227,8 @@ class SpideyGov(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         async with self.drafts_lock:
-            new_id = self.drafts_db.fork_draft(
+            new_id = await asyncio.to_thread(
+                self.drafts_db.fork_draft,
                 source_draft_id=draft_id,
                 actor_id=interaction.user.id,
                 new_title=new_title,
@@ -9602,7 +9254,7 @@ class SpideyGov(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=True)
 
-        target = self.drafts_db.get_draft(target_draft_id)
+        target = await asyncio.to_thread(self.drafts_db.get_draft, target_draft_id)
         if not target:
             return await interaction.followup.send("Target draft not found.", ephemeral=True)
 
@@ -9612,7 +9264,7 @@ class SpideyGov(commands.Cog):
                 ephemeral=True,
             )
 
-        ok = self.drafts_db.adopt_draft(target_draft_id, source_draft_id, interaction.user.id)
+        ok = await asyncio.to_thread(self.drafts_db.adopt_draft, target_draft_id, source_draft_id, interaction.user.id)
         if not ok:
             return await interaction.followup.send("Adopt failed.", ephemeral=True)
 
@@ -9634,14 +9286,14 @@ class SpideyGov(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=True)
 
-        d = self.drafts_db.get_draft(draft_id)
+        d = await asyncio.to_thread(self.drafts_db.get_draft, draft_id)
         if not d:
             return await interaction.followup.send("Draft not found.", ephemeral=True)
 
         if d["owner_id"] != interaction.user.id and not interaction.user.guild_permissions.manage_guild:
             return await interaction.followup.send("Only the draft owner can rename it.", ephemeral=True)
 
-        ok = self.drafts_db.rename_draft(draft_id, interaction.user.id, title, short_title)
+        ok = await asyncio.to_thread(self.drafts_db.rename_draft, draft_id, interaction.user.id, title, short_title)
         if not ok:
             return await interaction.followup.send("Rename failed.", ephemeral=True)
 
@@ -9652,7 +9304,7 @@ class SpideyGov(commands.Cog):
     @app_commands.describe(draft_id="Draft ID", section="Which main bin gets the entry")
     @app_commands.choices(section=[app_commands.Choice(name=DRAFT_BINS[k], value=k) for k in DRAFT_SUBBIN_KEYS])
     async def draft_add_subbin(self, interaction: discord.Interaction, draft_id: str, section: app_commands.Choice[str]):
-        d = self.drafts_db.get_draft(draft_id)
+        d = await asyncio.to_thread(self.drafts_db.get_draft, draft_id)
         if not d:
             return await interaction.response.send_message("Draft not found.", ephemeral=True)
 
@@ -9664,11 +9316,11 @@ class SpideyGov(commands.Cog):
     @app_commands.autocomplete(draft_id=draft_id_autocomplete, subbin_id=draft_subbin_autocomplete)
     @app_commands.describe(draft_id="Draft ID", subbin_id="Subbin entry ID")
     async def draft_edit_subbin(self, interaction: discord.Interaction, draft_id: str, subbin_id: str):
-        d = self.drafts_db.get_draft(draft_id)
+        d = await asyncio.to_thread(self.drafts_db.get_draft, draft_id)
         if not d:
             return await interaction.response.send_message("Draft not found.", ephemeral=True)
 
-        sb = self.drafts_db.get_subbin(draft_id, int(subbin_id))
+        sb = await asyncio.to_thread(self.drafts_db.get_subbin, draft_id, int(subbin_id))
         if not sb:
             return await interaction.response.send_message("Subbin not found.", ephemeral=True)
 
@@ -9690,14 +9342,14 @@ class SpideyGov(commands.Cog):
     async def draft_delete_subbin(self, interaction: discord.Interaction, draft_id: str, subbin_id: str):
         await interaction.response.defer(ephemeral=True)
 
-        d = self.drafts_db.get_draft(draft_id)
+        d = await asyncio.to_thread(self.drafts_db.get_draft, draft_id)
         if not d:
             return await interaction.followup.send("Draft not found.", ephemeral=True)
 
         if d["owner_id"] != interaction.user.id and not interaction.user.guild_permissions.manage_guild:
             return await interaction.followup.send("Only the draft owner can delete entries.", ephemeral=True)
 
-        ok = self.drafts_db.delete_subbin(draft_id, int(subbin_id), interaction.user.id)
+        ok = await asyncio.to_thread(self.drafts_db.delete_subbin, draft_id, int(subbin_id), interaction.user.id)
         if not ok:
             return await interaction.followup.send("Delete failed.", ephemeral=True)
 
@@ -9715,14 +9367,14 @@ class SpideyGov(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=True)
 
-        d = self.drafts_db.get_draft(draft_id)
+        d = await asyncio.to_thread(self.drafts_db.get_draft, draft_id)
         if not d:
             return await interaction.followup.send("Draft not found.", ephemeral=True)
 
         if d["owner_id"] != interaction.user.id and not interaction.user.guild_permissions.manage_guild:
             return await interaction.followup.send("Only the draft owner can reorder entries.", ephemeral=True)
 
-        ok = self.drafts_db.move_subbin(draft_id, int(subbin_id), interaction.user.id, int(new_position))
+        ok = await asyncio.to_thread(self.drafts_db.move_subbin, draft_id, int(subbin_id), interaction.user.id, int(new_position))
         if not ok:
             return await interaction.followup.send("Move failed.", ephemeral=True)
 
@@ -9808,11 +9460,11 @@ class SpideyGov(commands.Cog):
     async def draft_view_subbin(self, interaction: discord.Interaction, draft_id: str, subbin_id: str):
         await interaction.response.defer(ephemeral=True)
 
-        d = self.drafts_db.get_draft(draft_id)
+        d = await asyncio.to_thread(self.drafts_db.get_draft, draft_id)
         if not d:
             return await interaction.followup.send("Draft not found.", ephemeral=True)
 
-        sb = self.drafts_db.get_subbin(draft_id, int(subbin_id))
+        sb = await asyncio.to_thread(self.drafts_db.get_subbin, draft_id, int(subbin_id))
         if not sb:
             return await interaction.followup.send("Subbin not found.", ephemeral=True)
 
@@ -9829,7 +9481,7 @@ class SpideyGov(commands.Cog):
     async def draft_view_full(self, interaction: discord.Interaction, draft_id: str):
         await interaction.response.defer(ephemeral=True)
 
-        d = self.drafts_db.get_draft(draft_id)
+        d = await asyncio.to_thread(self.drafts_db.get_draft, draft_id)
         if not d:
             return await interaction.followup.send("Draft not found.", ephemeral=True)
 
@@ -9857,7 +9509,7 @@ class SpideyGov(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=True)
 
-        d = self.drafts_db.get_draft(draft_id)
+        d = await asyncio.to_thread(self.drafts_db.get_draft, draft_id)
         if not d:
             return await interaction.followup.send("Draft not found.", ephemeral=True)
 
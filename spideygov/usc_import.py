@@ -0,0 +1,468 @@
+from __future__ import annotations
+import hashlib
+import re
+import resource
+import sqlite3
+import time
+import xml.etree.ElementTree as ET
+from typing import BinaryIO
+
+# Streaming USLM (USC XML) title importer.
+#
+# A title is parsed element-by-element into a throwaway *staging* SQLite file
+# (bulk executemany batches, no FTS, no fsync), then merged into the live USC
+# database in one transaction with the FTS tables filled in a single bulk pass.
+# Parsing has no bot/discord dependencies so it can run in worker processes.
+
+# rows buffered per executemany() call while parsing
+BATCH_ROWS = 500
+
+STAGING_SCHEMA = """
+CREATE TABLE IF NOT EXISTS title_meta (
+  title_num  INTEGER,
+  heading    TEXT,
+  created_at TEXT
+);
+CREATE TABLE IF NOT EXISTS usc_nodes (
+  id         INTEGER PRIMARY KEY,
+  node_type  TEXT NOT NULL,
+  num        TEXT,
+  heading    TEXT,
+  identifier TEXT,
+  parent_id  INTEGER,
+  ord        INTEGER
+);
+CREATE TABLE IF NOT EXISTS usc_sections (
+  id          INTEGER PRIMARY KEY,
+  node_id     INTEGER,
+  section_num TEXT NOT NULL,
+  heading     TEXT,
+  identifier  TEXT,
+  body_text   TEXT,
+  ord         INTEGER
+);
+"""
+
+STRUCT_TAGS = {"subsection", "paragraph", "subparagraph", "clause", "subclause"}
+
+_indent_re = re.compile(r"indent(\d+)")
+
+def _usc_local(tag: str) -> str:
+    return tag.split("}", 1)[1] if "}" in tag else tag
+
+def _usc_norm_ws(s: str | None) -> str:
+    return re.sub(r"\s+", " ", (s or "")).strip()
+
+def _usc_fix_heading_brackets(s: str | None) -> str:
+    s = _usc_norm_ws(s)
+    # Heuristic: some converters omit the leading '[' but keep the trailing ']'
+    if s.endswith("]") and not s.startswith("[") and s.count("]") == 1:
+        return "[" + s
+    return s
+
+def _usc_num_text(num_elem: ET.Element) -> str:
+    """
+    Prefer visible text, but fall back to @value when text is empty.
+    If @value looks like a bare token (a, 1, A, i), wrap it as (token).
+    """
+    raw = _usc_norm_ws("".join(num_elem.itertext()))
+    if raw:
+        return raw
+
+    v = _usc_norm_ws(num_elem.get("value"))
+    if not v:
+        return ""
+
+    # If it's already formatted, leave it.
+    if v.startswith("(") or v.startswith("“(") or v.startswith("§"):
+        return v
+
+    # Most USLM @value for paragraph markers is bare (a, b, 1, A, i)
+    return f"({v})"
+
+def _usc_sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _usc_render_struct(elem: ET.Element, depth: int = 0) -> list[str]:
+    """
+    Render subsection/paragraph/etc. recursively with indentation.
+    """
+    lines: list[str] = []
+
+    num_text = ""
+    heading_text = ""
+    content_text = ""
+
+    for ch in list(elem):
+        lt = _usc_local(ch.tag)
+
+        if lt == "num" and not num_text:
+            num_text = _usc_num_text(ch)
+
+        elif lt == "heading" and not heading_text:
+            heading_text = _usc_norm_ws("".join(ch.itertext()))
+            heading_text = _usc_fix_heading_brackets(heading_text)
+
+        elif lt in {"content", "chapeau", "text"} and not content_text:
+            content_text = _usc_norm_ws("".join(ch.itertext()))
+
+    # Build the line for this node
+    parts = []
+    if num_text:
+        parts.append(num_text)
+    if heading_text:
+        parts.append(heading_text)
+    if content_text:
+        parts.append(content_text)
+
+    head = " ".join([p for p in parts if p])
+    if head:
+        lines.append(("    " * depth) + head)
+
+    # Recurse into children
+    for ch in list(elem):
+        if _usc_local(ch.tag) in STRUCT_TAGS:
+            lines.extend(_usc_render_struct(ch, depth + 1))
+
+    return lines
+
+def _usc_render_section_body(section_elem: ET.Element) -> str:
+    """
+    Render statute text only (skip notes/sourceCredit).
+    Handles:
+      - <content><p class="indent1"> ... </p></content>
+      - direct <subsection>/<paragraph>/... trees
+    """
+    lines: list[str] = []
+
+    # 1) section-level <content> (common)
+    for ch in list(section_elem):
+        lt = _usc_local(ch.tag)
+        if lt != "content":
+            continue
+
+        ps = [c for c in list(ch) if _usc_local(c.tag) == "p"]
+        if ps:
+            for p in ps:
+                cls = p.get("class") or ""
+                m = _indent_re.search(cls)
+                indent = int(m.group(1)) if m else 0
+                txt = _usc_norm_ws("".join(p.itertext()))
+                if txt:
+                    lines.append(("    " * indent) + txt)
+        else:
+            txt = _usc_norm_ws("".join(ch.itertext()))
+            if txt:
+                lines.append(txt)
+
+    # 2) structural children (subsections, etc.)
+    for ch in list(section_elem):
+        if _usc_local(ch.tag) in STRUCT_TAGS:
+            lines.extend(_usc_render_struct(ch, 0))
+
+    return "\n".join(lines).strip()
+
+_USC_SEC_ID_RE = re.compile(r"^/us/usc/t(?P<title>\d+)/s(?P<section>[^/]+)$")
+
+def _usc_is_real_usc_section(identifier: str | None, title_num: int | None) -> bool:
+    if not identifier or not title_num:
+        return False
+    m = _USC_SEC_ID_RE.match(identifier)
+    return bool(m and int(m.group("title")) == int(title_num))
+
+_HEADING_NOISE_RE = re.compile(r"\s+\d+\s+So in original\..*$", re.IGNORECASE)
+
+def _usc_clean_section_heading(h: str | None) -> str:
+    h = _usc_fix_heading_brackets(_usc_norm_ws(h))
+    # remove “11 So in original...” style junk
+    h = re.sub(_HEADING_NOISE_RE, "", h).strip()
+    # remove trailing lone footnote numbers (e.g., "Judicial Review 1")
+    h = re.sub(r"\s+\d+$", "", h).strip()
+    return h
+
+
+def _usc_sha256_file(fh: BinaryIO, chunk: int = 1 << 20) -> str:
+    """sha256 of a seekable file object, read in chunks; leaves it rewound."""
+    h = hashlib.sha256()
+    fh.seek(0)
+    while True:
+        b = fh.read(chunk)
+        if not b:
+            break
+        h.update(b)
+    fh.seek(0)
+    return h.hexdigest()
+
+
+def _peak_rss_kb(children: bool = False) -> int:
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    return int(resource.getrusage(who).ru_maxrss)
+
+
+def parse_title_to_staging(xml_src: str | BinaryIO, staging_path: str) -> dict:
+    """
+    Stream one USLM Title into a staging DB at `staging_path`.
+    Stores the same things the live importer keeps: title number/heading/created
+    date, chapters (as nodes, nested chapters keep their parent), and sections
+    (statute text only; no notes). Elements are dropped as soon as nothing later
+    can need them, so memory stays at roughly one section subtree.
+    """
+    t0 = time.perf_counter()
+    conn = sqlite3.connect(staging_path)
+    conn.execute("PRAGMA journal_mode = OFF;")
+    conn.execute("PRAGMA synchronous = OFF;")
+    conn.executescript(STAGING_SCHEMA)
+
+    title_num: int | None = None
+    title_heading: str | None = None
+    created_at: str | None = None
+
+    chapter_ord = 0
+    section_ord = 0
+    next_node_id = 1
+    n_nodes = 0
+    n_sections = 0
+
+    chapter_stack: list[dict] = []
+    stack: list[str] = []
+    elems: list[ET.Element] = []
+    node_rows: list[tuple] = []
+    sec_rows: list[tuple] = []
+
+    def flush() -> None:
+        if node_rows:
+            conn.executemany(
+                "INSERT INTO usc_nodes(id, node_type, num, heading, identifier, parent_id, ord) VALUES(?, 'chapter', ?, ?, ?, ?, ?)",
+                node_rows,
+            )
+            node_rows.clear()
+        if sec_rows:
+            conn.executemany(
+                "INSERT INTO usc_sections(node_id, section_num, heading, identifier, body_text, ord) VALUES(?,?,?,?,?,?)",
+                sec_rows,
+            )
+            sec_rows.clear()
+
+    try:
+        for ev, el in ET.iterparse(xml_src, events=("start", "end")):
+            t = _usc_local(el.tag)
+
+            if ev == "start":
+                stack.append(t)
+                elems.append(el)
+                if t == "chapter":
+                    chapter_ord += 1
+                    parent_ctx = chapter_stack[-1] if chapter_stack else None
+                    chapter_stack.append({
+                        "identifier": el.get("identifier"),
+                        "num": None,
+                        "heading": None,
+                        "ord": chapter_ord,
+                        "node_id": None,
+                        "parent_ctx": parent_ctx,
+                    })
+                continue
+
+            parent = stack[-2] if len(stack) >= 2 else None
+
+            # meta/title basics
+            if t == "docNumber" and parent == "meta" and title_num is None:
+                try:
+                    title_num = int(_usc_norm_ws(el.text))
+                except Exception:
+                    title_num = None
+
+            if t == "created" and parent == "meta" and created_at is None:
+                created_at = _usc_norm_ws(el.text)
+
+            if t == "heading" and parent == "title" and title_heading is None:
+                title_heading = _usc_norm_ws("".join(el.itertext()))
+
+            # once we have title_num + title_heading, chapters/sections can be stored
+            prepared = title_num is not None and bool(title_heading)
+
+            # chapter details + node row (supports nested chapters)
+            if chapter_stack:
+                top = chapter_stack[-1]
+
+                if t == "num" and parent == "chapter" and top["num"] is None:
+                    # chapters usually want the @value token (e.g., 1) not "CHAPTER 1—"
+                    v = el.get("value") or _usc_norm_ws("".join(el.itertext()))
+                    top["num"] = _usc_norm_ws(v)
+
+                if t == "heading" and parent == "chapter" and top["heading"] is None:
+                    top["heading"] = _usc_fix_heading_brackets(_usc_norm_ws("".join(el.itertext())))
+
+                if prepared and top["num"] and top["heading"] and top["node_id"] is None:
+                    parent_id = top["parent_ctx"]["node_id"] if top["parent_ctx"] is not None else None
+                    top["node_id"] = next_node_id
+                    next_node_id += 1
+                    node_rows.append((top["node_id"], str(top["num"]), top["heading"], top["identifier"], parent_id, top["ord"]))
+                    n_nodes += 1
+
+            # section end: buffer section row (FTS is filled in bulk at merge time)
+            if t == "section":
+                ident = el.get("identifier")
+                # Skip “sections” that live inside notes or aren’t true USC sections
+                if prepared and "notes" not in stack and _usc_is_real_usc_section(ident, title_num):
+                    section_ord += 1
+
+                    sec_num = None
+                    sec_head = None
+                    for c in list(el):
+                        lt = _usc_local(c.tag)
+                        if lt == "num" and sec_num is None:
+                            sec_num = _usc_norm_ws(c.get("value") or "".join(c.itertext()))
+                        elif lt == "heading" and sec_head is None:
+                            sec_head = _usc_clean_section_heading(_usc_norm_ws("".join(c.itertext())))
+
+                    body = _usc_render_section_body(el)
+                    node_id = chapter_stack[-1]["node_id"] if chapter_stack else None
+                    sec_rows.append((node_id, str(sec_num or ""), sec_head, ident, body, section_ord))
+                    n_sections += 1
+
+            if t == "chapter" and chapter_stack:
+                chapter_stack.pop()
+
+            stack.pop()
+            elems.pop()
+            # outside a section nothing reads this subtree again: drop it so memory stays flat
+            if "section" not in stack:
+                el.clear()
+                if elems and len(elems[-1]) and elems[-1][-1] is el:
+                    del elems[-1][-1]
+
+            if len(node_rows) + len(sec_rows) >= BATCH_ROWS:
+                flush()
+
+        flush()
+        conn.execute(
+            "INSERT INTO title_meta(title_num, heading, created_at) VALUES(?,?,?)",
+            (title_num, title_heading, created_at),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    return {
+        "title_num": title_num,
+        "heading": title_heading,
+        "created_at": created_at,
+        "chapters": n_nodes,
+        "sections": n_sections,
+        "parse_seconds": time.perf_counter() - t0,
+        "peak_rss_kb": _peak_rss_kb(),
+    }
+
+
+def parse_title_file(xml_path: str, staging_path: str) -> dict:
+    """Process-pool entry point (picklable, path arguments only)."""
+    return parse_title_to_staging(xml_path, staging_path)
+
+
+def merge_staging(conn: sqlite3.Connection, staging_path: str, sha: str, imported_at: str, force: bool = False) -> dict:
+    """
+    Move one staged title into the live USC tables (already initialised on `conn`):
+    replace any previous copy, remap ids past the live max, and bulk-fill both FTS tables.
+    """
+    conn.execute("PRAGMA synchronous = OFF;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA cache_size = -65536;")
+    conn.execute("ATTACH DATABASE ? AS stg", (staging_path,))
+    try:
+        meta = conn.execute("SELECT title_num, heading, created_at FROM stg.title_meta").fetchone()
+        title_num = meta[0] if meta else None
+        if title_num is None:
+            raise ValueError("no USC title number (<meta><docNumber>) found in XML")
+        heading, created_at = meta[1], meta[2]
+
+        row = conn.execute(
+            "SELECT source_sha256 FROM usc_titles WHERE title_num=?", (title_num,)
+        ).fetchone()
+        if row and row[0] == sha and not force:
+            return {"status": "already_imported", **title_counts(conn, title_num), "title_num": title_num,
+                    "heading": heading, "created_at": created_at, "sha256": sha}
+
+        with conn:
+            if row:
+                # replace existing title content
+                conn.execute("DELETE FROM usc_sections_fts WHERE title_num=?", (title_num,))
+                conn.execute("DELETE FROM usc_nodes_fts WHERE title_num=?", (title_num,))
+                conn.execute("DELETE FROM usc_sections WHERE title_num=?", (title_num,))
+                conn.execute("DELETE FROM usc_nodes WHERE title_num=?", (title_num,))
+
+            conn.execute(
+                """
+                INSERT INTO usc_titles(title_num, heading, created_at, imported_at, source_sha256)
+                VALUES(?,?,?,?,?)
+                ON CONFLICT(title_num) DO UPDATE SET
+                  heading=excluded.heading,
+                  created_at=excluded.created_at,
+                  imported_at=excluded.imported_at,
+                  source_sha256=excluded.source_sha256
+                """,
+                (title_num, heading, created_at, imported_at, sha),
+            )
+
+            node_off = conn.execute("SELECT COALESCE(MAX(id), 0) FROM usc_nodes").fetchone()[0]
+            sec_off = conn.execute("SELECT COALESCE(MAX(id), 0) FROM usc_sections").fetchone()[0]
+
+            conn.execute(
+                """
+                INSERT INTO usc_nodes(id, title_num, node_type, num, heading, identifier, parent_id, ord)
+                SELECT id + ?, ?, node_type, num, heading, identifier,
+                       CASE WHEN parent_id IS NULL THEN NULL ELSE parent_id + ? END, ord
+                FROM stg.usc_nodes ORDER BY id
+                """,
+                (node_off, title_num, node_off),
+            )
+            # OR REPLACE keeps the old "last duplicate section number wins" behaviour
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO usc_sections(id, title_num, node_id, section_num, heading, identifier, body_text, ord)
+                SELECT id + ?, ?, CASE WHEN node_id IS NULL THEN NULL ELSE node_id + ? END,
+                       section_num, heading, identifier, body_text, ord
+                FROM stg.usc_sections ORDER BY id
+                """,
+                (sec_off, title_num, node_off),
+            )
+
+            # deferred bulk FTS population
+            conn.execute(
+                """
+                INSERT INTO usc_sections_fts(rowid, title_num, section_num, heading, body_text)
+                SELECT id, title_num, section_num, COALESCE(heading,''), COALESCE(body_text,'')
+                FROM usc_sections WHERE title_num=?
+                """,
+                (title_num,),
+            )
+            conn.execute(
+                """
+                INSERT INTO usc_nodes_fts(rowid, title_num, node_type, num, heading)
+                SELECT id, title_num, node_type, num, COALESCE(heading,'')
+                FROM usc_nodes WHERE title_num=?
+                """,
+                (title_num,),
+            )
+
+        return {
+            "status": "updated" if row else "imported",
+            "title_num": title_num,
+            "heading": heading,
+            "created_at": created_at,
+            **title_counts(conn, title_num),
+            "sha256": sha,
+        }
+    finally:
+        conn.execute("DETACH DATABASE stg")
+
+
+def title_counts(conn: sqlite3.Connection, title_num: int) -> dict:
+    ch_ct = conn.execute(
+        "SELECT COUNT(*) FROM usc_nodes WHERE title_num=? AND node_type='chapter'", (title_num,)
+    ).fetchone()[0]
+    sec_ct = conn.execute(
+        "SELECT COUNT(*) FROM usc_sections WHERE title_num=?", (title_num,)
+    ).fetchone()[0]
+    return {"chapters": int(ch_ct), "sections": int(sec_ct)}
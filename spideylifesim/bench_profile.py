@@ -0,0 +1,116 @@
+"""
+Count and time the Config driver calls behind one /gotowork: field-by-field reads
+against a ProfileCache snapshot.
+
+    python spideylifesim/bench_profile.py --members 200 --rounds 5
+
+Uses Red's own Config on a JSON driver in a temporary folder, with the cog's
+member fields registered. "per field" is what slscareers_gotowork used to do:
+twelve separate reads, then a set per changed field. "profile" loads the record
+once and writes the changed fields back in one grouped write at the end of the
+command. Needs Red installed; the members are plain objects with ids.
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from redbot.core.config import Config
+
+try:
+    from redbot.core._drivers import JsonDriver
+except ImportError:  # Red < 3.5
+    from redbot.core.drivers import JsonDriver
+
+if __package__:
+    from .profile import ProfileCache
+else:  # run as a script, without the package __init__ (which loads the cog)
+    from profile import ProfileCache
+
+# the fields slscareers_gotowork read one by one
+GOTOWORK_READS = (
+    "userjob", "careerfield", "careerprog", "careerlevel", "skillslist", "salary",
+    "usertraits", "username", "consechigheffort", "burnoutapplied", "grantedtraits", "alignment",
+)
+DEFAULTS = dict(
+    userinventory=[], username="None", userjob="Cashier", careerfield="Retail", careerlevel=1,
+    careerprog=0, salary=100, userpic="", usergender="Not set", usertraits=["Ambitious"],
+    skillslist={f"skill{n}": n for n in range(20)}, consechigheffort=0, burnoutapplied=None,
+    alignment=0, allymilestone="Neutral", grantedtraits=[], learnedskills={f"skill{n}": False for n in range(20)},
+    learnedstances={}, learnableabilities=[],
+)
+
+
+class CountingJsonDriver(JsonDriver):
+    """The JSON driver, counting the calls Config makes into it."""
+
+    calls = 0
+
+    async def get(self, identifier_data):
+        CountingJsonDriver.calls += 1
+        return await super().get(identifier_data)
+
+    async def set(self, identifier_data, value=None):
+        CountingJsonDriver.calls += 1
+        return await super().set(identifier_data, value=value)
+
+
+async def gotowork_per_field(config: Config, member) -> None:
+    group = config.member(member)
+    values = {field: await getattr(group, field)() for field in GOTOWORK_READS}
+    await group.careerprog.set(values["careerprog"] + 1)
+    await group.consechigheffort.set(values["consechigheffort"] + 1)
+    await group.alignment.set(values["alignment"] + 1)
+
+
+async def gotowork_profile(profiles: ProfileCache, member) -> None:
+    async with profiles.open(member) as profile:
+        profile.careerprog += 1
+        profile.consechigheffort += 1
+        profile.alignment += 1
+
+
+async def bench(label: str, members: list, rounds: int, step) -> None:
+    timings = []
+    CountingJsonDriver.calls = 0
+    for _ in range(rounds):
+        for member in members:
+            t0 = time.perf_counter()
+            await step(member)
+            timings.append((time.perf_counter() - t0) * 1000.0)
+    ordered = sorted(timings)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{label:<10} {CountingJsonDriver.calls / len(timings):5.1f} driver calls/command  "
+        f"p50 {statistics.median(ordered):7.3f} ms  p99 {p99:7.3f} ms"
+    )
+
+
+async def run(args) -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        driver = CountingJsonDriver("SpideyLifeSim", "bench", data_path_override=Path(folder))
+        config = Config("SpideyLifeSim", "bench", driver, force_registration=True)
+        config.register_member(**DEFAULTS)
+        guild = SimpleNamespace(id=1)
+        members = [SimpleNamespace(id=1000 + n, guild=guild, display_name=f"Member {n}") for n in range(args.members)]
+
+        await bench("per field", members, args.rounds, lambda m: gotowork_per_field(config, m))
+        # ttl=0 so every command reads Config again, as consecutive commands past the TTL would
+        profiles = ProfileCache(config, ttl=0)
+        await bench("profile", members, args.rounds, lambda m: gotowork_profile(profiles, m))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--members", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args(argv)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
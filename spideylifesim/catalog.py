@@ -0,0 +1,166 @@
+from __future__ import annotations
+from bisect import bisect_left
+from typing import Iterable
+
+from .jobs import ALLJOBS, CAREEROPPOSITE, SUBJOBS, CAREERLADDERS
+from .skills import SKILLSLIST
+from .traits import HINDRANCES, SOCIALTRAITS, VALUETRAITS, NATURETRAITS, INTERESTTRAITS
+
+
+class _Record:
+    """Read-only slotted record; fields are set once in __init__."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def _init(self, **fields) -> None:
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+
+class Position(_Record):
+    __slots__ = ("title", "description", "salary", "bonus", "level")
+
+    def __init__(self, title: str, row: list, level: int):
+        self._init(
+            title=title,
+            description=row[0],
+            salary=row[1],
+            bonus=row[2] if len(row) > 2 else 0,
+            level=level,
+        )
+
+
+class Career(_Record):
+    """
+    One career: the ALLJOBS/SUBJOBS row by field name plus its position ladder,
+    where `positions[level - 1]` is the job held at that level.
+    """
+
+    __slots__ = (
+        "name", "description", "image", "supervisor", "items", "skills", "supervisor_image",
+        "welcome", "farewell", "dismissal", "offer", "positions", "path", "opposite",
+    )
+
+    def __init__(self, name: str, row: list, ladder: dict, path: str, opposite: str | None = None):
+        row = list(row) + [""] * (10 - len(row))
+        self._init(
+            name=name,
+            description=row[0],
+            image=row[1],
+            supervisor=row[2],
+            items=tuple(row[3]),
+            skills=tuple(row[4]),
+            supervisor_image=row[5],
+            welcome=row[6],
+            farewell=row[7],
+            dismissal=row[8],
+            offer=row[9],
+            positions=tuple(Position(title, info, i + 1) for i, (title, info) in enumerate(ladder.items())),
+            path=path,
+            opposite=opposite,
+        )
+
+    @property
+    def max_level(self) -> int:
+        return len(self.positions)
+
+    def position(self, level: int) -> Position:
+        """The job at `level` (1-based), clamped to the ladder."""
+        return self.positions[min(max(level, 1), len(self.positions)) - 1]
+
+
+class Skill(_Record):
+    __slots__ = ("name", "boost_traits", "items")
+
+    def __init__(self, name: str, row: list):
+        self._init(
+            name=name,
+            boost_traits=tuple(row[2]) if len(row) > 2 else (),
+            items=tuple(row[3]) if len(row) > 3 else (),
+        )
+
+
+class Trait(_Record):
+    __slots__ = ("name", "category", "description", "conflicts")
+
+    def __init__(self, name: str, category: str, body: dict):
+        self._init(
+            name=name,
+            category=category,
+            description=body.get("description", ""),
+            conflicts=tuple(body.get("conflicts", ())),
+        )
+
+
+class NameIndex:
+    """
+    Case-insensitive prefix search over a fixed set of names. Every word start of a
+    name is indexed, including CamelCase ones, so "med" finds both "Medicine" and
+    "SocialMedia".
+    """
+
+    __slots__ = ("names", "_keys", "_values")
+
+    def __init__(self, names: Iterable[str]):
+        self.names = tuple(names)
+        entries = set()
+        for order, name in enumerate(self.names):
+            lowered = name.lower()
+            starts = {0}
+            for i in range(1, len(name)):
+                if lowered[i - 1] in " -_":
+                    starts.add(i)
+                elif name[i].isupper() and (name[i - 1].islower() or name[i + 1:i + 2].islower()):
+                    starts.add(i)  # SocialMedia, HTMLParser
+            for start in starts:
+                entries.add((lowered[start:], order))
+        ordered = sorted(entries)
+        self._keys = [key for key, _ in ordered]
+        self._values = [order for _, order in ordered]
+
+    def search(self, query: str, limit: int = 25) -> list[str]:
+        """Names with a word starting with `query`, in their catalog order."""
+        query = query.lower()
+        if not query:
+            return list(self.names[:limit])
+        hits: set[int] = set()
+        i = bisect_left(self._keys, query)
+        while i < len(self._keys) and self._keys[i].startswith(query):
+            hits.add(self._values[i])
+            i += 1
+        return [self.names[order] for order in sorted(hits)[:limit]]
+
+
+def _build_careers() -> dict[str, Career]:
+    careers: dict[str, Career] = {}
+    for name, row in ALLJOBS.items():
+        if row is not None:
+            careers[name] = Career(name, row, CAREERLADDERS[name], path=name)
+    for path, (good, evil) in CAREEROPPOSITE.items():
+        careers[good] = Career(good, SUBJOBS[good], CAREERLADDERS[good], path=path, opposite=evil)
+        careers[evil] = Career(evil, SUBJOBS[evil], CAREERLADDERS[evil], path=path, opposite=good)
+    return careers
+
+
+TRAIT_CATEGORIES = {
+    "hindrances": HINDRANCES,
+    "social": SOCIALTRAITS,
+    "values": VALUETRAITS,
+    "nature": NATURETRAITS,
+    "interests": INTERESTTRAITS,
+}
+
+# Every career with a ladder, top-level or one side of an aligned path.
+CAREERS: dict[str, Career] = _build_careers()
+# Aligned career paths (e.g. ForceUser) as (good, evil) career names.
+ALIGNED_PATHS: dict[str, tuple[str, str]] = {path: tuple(sides) for path, sides in CAREEROPPOSITE.items()}
+SKILLS: dict[str, Skill] = {name: Skill(name, row) for name, row in SKILLSLIST.items()}
+TRAITS: dict[str, Trait] = {
+    name: Trait(name, category, body) for category, table in TRAIT_CATEGORIES.items() for name, body in table.items()
+}
+
+CAREER_PATH_INDEX = NameIndex(ALLJOBS)
+SKILL_INDEX = NameIndex(SKILLSLIST)
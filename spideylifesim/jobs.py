@@ -10,20 +10,20 @@ ALLJOBS = {
     "Business": ["Starting from mailroom duties, you can climb the corporate ladder to lead entire companies. Business careers focus on management, sales, and innovative strategies that shape markets and industries.",
                 "https://www.ringcentral.com/gb/en/blog/wp-content/uploads/2021/05/business-people-working-in-the-office-scaled.jpg",
                 "Bill Rebates", ["Laptop"], ["Charisma"],
-                "https://www.itreseller.ch/imgserver/Artikel/Personen/2020/mid/Bill_Gates_200316_090318.jpg"
+                "https://www.itreseller.ch/imgserver/Artikel/Personen/2020/mid/Bill_Gates_200316_090318.jpg",
                 "Welcome to the business branch. Here's a company laptop so you can get started on your job work. I look forward to working with you.",
                 "No worries I get why you might've quit. Could I get the company laptop back though?"], 
     "Programming": ["Coders begin by troubleshooting simple issues and can evolve into industry-shaping innovators. This path emphasizes developing technical skills, creating software solutions, and transforming technology landscapes.",
                 "https://www.thoughtco.com/thmb/klcCYXsAm2NkBeYmjV-vAW_VwOU=/2120x1414/filters:no_upscale():max_bytes(150000):strip_icc()/GettyImages-755651077-5b3fedf646e0fb005bc0269e.jpg",
                 "Java Scriptson", ["Laptop"], ["Programming"],
                 "https://valenciacollege.edu/future-students/images/computer-programming-promising-portrait-day-5-2444.jpg",
-                "Hey! Weclome to the programming career! Let's get these bugs sorted out ASAP! Here's a laptop so you can get started on our code!"
+                "Hey! Weclome to the programming career! Let's get these bugs sorted out ASAP! Here's a laptop so you can get started on our code!",
                 "Aw man I guess I'll find someone else to help with these bugs. Could I get the laptop back?"], 
     "Medicine": ["From hands-on patient care as interns to leading medical breakthroughs, this career revolves around improving and saving lives. Medicine combines patient-centered care with pioneering research.",
                 "https://www.verywellhealth.com/thmb/CGcSSMzWLdk01zeVwqT1-A0vBBM=/5121x3414/filters:fill(87E3EF,1)/doctors-talking-to-patient-in-hospital-icu-493216255-583452e15f9b58d5b1b967c7.jpg",
                 "Dr. G. Home", ["Medical textbook"], ["Medicine"],
                 "https://images5.fanpop.com/image/photos/31900000/Dr-Gregory-House-dr-gregory-house-31945640-1920-2560.jpg",
-                "Look let's get a couple things straight! I am not your babysitter. I am not going to tolerate mediocrity. And everybody lies. Take this medical textbook and be ready for day one of your job or else."
+                "Look let's get a couple things straight! I am not your babysitter. I am not going to tolerate mediocrity. And everybody lies. Take this medical textbook and be ready for day one of your job or else.",
                 "I'd say I care, but I honestly don't. Enjoy your life. Or don't. Just give me that textbook back."],
     "LawEnforcement": ["Progressing from cadet training to overseeing public safety at a national level, this path emphasizes service, community protection, and justice. Law enforcement careers demand discipline, leadership, and integrity.",
                 "https://www.shutterstock.com/image-photo/busy-police-cops-enforcing-law-600nw-2207045183.jpg",
@@ -35,7 +35,7 @@ ALLJOBS = {
                 "https://babylontours.com/wp-content/uploads/2019/10/museum-of-modern-art-new-york-walking-tour-babylon-1200x799.jpg",
                 "Vincent van Dough", ["Easel"], ["Art"],
                 "https://ichef.bbci.co.uk/images/ic/896xn/p0217xyb.jpg",
-                "Well good day to you. Here's an extra easel I have so you can get started on your first masterpiece."
+                "Well good day to you. Here's an extra easel I have so you can get started on your first masterpiece.",
                 "I had fun painting with you my friend. I hope you had fun too."],
     "Film": ["Careers in film range from amateur performances to shaping culture through iconic works. This journey is about storytelling, artistic collaboration, and leaving a mark on the entertainment industry.",
             "https://www.lafilm.edu/wp-content/uploads/2017/03/SET.jpg",
@@ -85,7 +85,7 @@ ALLJOBS = {
             "https://www.umsl.edu/degrees/bachelors/images/overview-images/civil-engineering-umsl.jpg",
             "Hey! Welcome to engineering! Here's a toolbox and a science workstation to get you started! See you Monday!",
             "Dang I liked engineering with you. I'll take the tools back though."],
-    "Music": ["Musicians can rise from street performances to shaping global music culture. The focus is on creativity, connection, and transforming sounds into timeless art."
+    "Music": ["Musicians can rise from street performances to shaping global music culture. The focus is on creativity, connection, and transforming sounds into timeless art.",
             "https://www.rollingstone.com/wp-content/uploads/2020/09/black-promoters-collective.jpg",
             "Lana Del Reydio", ["Electric piano"], ["Piano"],
             "https://img.welt.de/img/kultur/mobile208236547/4592509717-ci102l-w1024/Lana-Del-Rey-visits-107-7-The-End-in-Seattle.jpg",
@@ -618,3 +618,38 @@ MurderDrone = {
     "Overseer": ["Control vast drone fleets, directing them to reshape the galaxy under your influence.", 2500, 6000],
     "Prime Directive Enforcer": ["Achieve ultimate authority, rewriting the rules of the Murder Drones and commanding unparalleled power.", 4000, 9000]
 }
+
+# Position ladder (title -> [description, salary, promotion bonus]) for each career.
+CAREERLADDERS = {
+    "Culinary": Culinary,
+    "Business": Business,
+    "Programming": Programming,
+    "Medicine": Medicine,
+    "LawEnforcement": LawEnforcement,
+    "Artist": Artist,
+    "Film": Film,
+    "Military": Military,
+    "Writing": Writing,
+    "SocialMedia": SocialMedia,
+    "Athletic": Athletic,
+    "Legal": Legal,
+    "Journalism": Journalism,
+    "Engineering": Engineering,
+    "Music": Music,
+    "Science": Science,
+    "Education": Education,
+    "Politics": Politics,
+    "Criminal": Criminal,
+    "Astronaut": Astronaut,
+    "Fashion": Fashion,
+    "Sith": Sith,
+    "SecretAgent": SecretAgent,
+    "Sailor": Sailor,
+    "ValiantKnight": ValiantKnight,
+    "Jedi": Jedi,
+    "GoodWizard": GoodWizard,
+    "BadWizard": BadWizard,
+    "DarkWarrior": DarkWarrior,
+    "Pirate": Pirate,
+    "MurderDrone": MurderDrone,
+}
@@ -0,0 +1,134 @@
+from __future__ import annotations
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+# Every field registered with config.register_member, in registration order.
+PROFILE_FIELDS = (
+    "userinventory",
+    "username",
+    "userjob",
+    "careerfield",
+    "careerlevel",
+    "careerprog",
+    "salary",
+    "userpic",
+    "usergender",
+    "usertraits",
+    "skillslist",
+    "consechigheffort",
+    "burnoutapplied",
+    "alignment",
+    "allymilestone",
+    "grantedtraits",
+    "learnedskills",
+    "learnedstances",
+    "learnableabilities",
+)
+_FIELD_SET = frozenset(PROFILE_FIELDS)
+
+# How long a loaded profile is reused before Config is read again.
+PROFILE_TTL = 10.0
+_MAX_CACHED = 256
+
+
+class LifeSimProfile:
+    """
+    One member's whole SpideyLifeSim record, read with a single Config call.
+
+    Assigning a field marks it dirty; lists and dicts edited in place need
+    `touch(field)`. The cache writes the dirty fields back once when the command ends.
+    """
+
+    __slots__ = PROFILE_FIELDS + ("member", "_dirty")
+
+    def __init__(self, member, data: dict):
+        object.__setattr__(self, "member", member)
+        object.__setattr__(self, "_dirty", set())
+        for field in PROFILE_FIELDS:
+            object.__setattr__(self, field, data.get(field))
+
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        if name in _FIELD_SET:
+            self._dirty.add(name)
+
+    def touch(self, *fields: str) -> None:
+        self._dirty.update(fields)
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._dirty)
+
+    @property
+    def display_name(self) -> str:
+        return self.username if self.username != "None" else self.member.display_name
+
+    def as_dict(self) -> dict:
+        return {field: getattr(self, field) for field in PROFILE_FIELDS}
+
+
+class ProfileCache:
+    """
+    Short-lived per-member profiles on top of the cog's Config.
+
+    A load is one `member(m).all()` read. A save rewrites only the dirty fields on
+    a fresh read of the record, so anything else written since the load (a store
+    purchase during a long command, say) is kept. Commands that still write Config
+    directly call `forget(member)` so the next load sees their change.
+    """
+
+    def __init__(self, config, ttl: float = PROFILE_TTL):
+        self.config = config
+        self.ttl = ttl
+        self._entries: dict[tuple[int, int], tuple[float, LifeSimProfile]] = {}
+
+    @staticmethod
+    def _key(member) -> tuple[int, int]:
+        return (member.guild.id, member.id)
+
+    def _prune(self, now: float) -> None:
+        for key in [k for k, (expires, _) in self._entries.items() if expires < now]:
+            del self._entries[key]
+        while len(self._entries) >= _MAX_CACHED:
+            self._entries.pop(next(iter(self._entries)))
+
+    async def load(self, member) -> LifeSimProfile:
+        key = self._key(member)
+        now = time.monotonic()
+        hit = self._entries.get(key)
+        if hit is not None and hit[0] >= now:
+            return hit[1]
+        profile = LifeSimProfile(member, await self.config.member(member).all())
+        self._prune(now)
+        self._entries[key] = (now + self.ttl, profile)
+        return profile
+
+    async def save(self, profile: LifeSimProfile) -> None:
+        if not profile.dirty:
+            return
+        async with self.config.member(profile.member).all() as data:
+            for field in profile._dirty:
+                data[field] = getattr(profile, field)
+            for field in _FIELD_SET - profile._dirty:
+                object.__setattr__(profile, field, data.get(field))
+        profile._dirty.clear()
+        self._entries[self._key(profile.member)] = (time.monotonic() + self.ttl, profile)
+
+    async def refresh(self, profile: LifeSimProfile) -> None:
+        """Re-read every field not changed since the last save, e.g. after waiting on a reply."""
+        data = await self.config.member(profile.member).all()
+        for field in _FIELD_SET - profile._dirty:
+            object.__setattr__(profile, field, data.get(field))
+
+    def forget(self, member) -> None:
+        self._entries.pop(self._key(member), None)
+
+    @asynccontextmanager
+    async def open(self, member) -> AsyncIterator[LifeSimProfile]:
+        """Load a profile for the length of a command and write back whatever changed."""
+        profile = await self.load(member)
+        try:
+            yield profile
+        finally:
+            await self.save(profile)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+import heapq
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Hashable
+
+Key = tuple[Hashable, ...]
+
+
+class CooldownScheduler:
+    """
+    Wall-clock deadlines keyed by (member, action), persisted to a JSON file.
+
+    `due` maps each key to the time it runs out, so `remaining` is one dict lookup.
+    A heap of (deadline, key) lets `expire` drop everything that has run out in one
+    pass. Restarting a key leaves its old heap entry behind; it is skipped when
+    popped because it no longer matches `due`.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.due: dict[Key, float] = {}
+        self._heap: list[tuple[float, Key]] = []
+        self._load()
+
+    # ---------- persistence ----------
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                rows = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Cooldown load error: {e}")
+            return
+        for *key, deadline in rows:
+            self.due[tuple(key)] = float(deadline)
+        self._heap = [(deadline, key) for key, deadline in self.due.items()]
+        heapq.heapify(self._heap)
+
+    def _save(self) -> None:
+        tmp = f"{self.path}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump([[*key, deadline] for key, deadline in self.due.items()], f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"Cooldown save error: {e}")
+
+    # ---------- deadlines ----------
+
+    def start(self, key: Key, duration: timedelta, since: datetime | None = None) -> None:
+        """Run `key` for `duration` from now (or from `since`, for carried-over timers)."""
+        begin = since.timestamp() if since is not None else time.time()
+        deadline = begin + duration.total_seconds()
+        self.due[key] = deadline
+        heapq.heappush(self._heap, (deadline, key))
+        self._save()
+
+    def clear(self, key: Key) -> None:
+        if self.due.pop(key, None) is not None:
+            self._save()
+
+    def remaining(self, key: Key) -> float:
+        """Seconds until `key` runs out; 0 when it isn't running."""
+        deadline = self.due.get(key)
+        if deadline is None:
+            return 0.0
+        return max(deadline - time.time(), 0.0)
+
+    def active(self, key: Key) -> bool:
+        return self.remaining(key) > 0
+
+    def expire(self) -> list[Key]:
+        """Drop every key that has run out and return them, saving once."""
+        now = time.time()
+        expired: list[Key] = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, key = heapq.heappop(self._heap)
+            if self.due.get(key) == deadline:
+                del self.due[key]
+                expired.append(key)
+        if expired:
+            self._save()
+        return expired
+
+
+def split_remaining(seconds: float) -> tuple[int, int, int]:
+    """(hours, minutes, seconds) of a remaining time, for cooldown messages."""
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return hours, minutes, secs
@@ -9,7 +9,7 @@ from discord.ext.commands import BucketType
 from discord.ui import View, Button
 from random import choice
 import aiohttp
-from typing import Dict, List, Literal, Optional, Any, NoReturn
+from typing import List, Literal, Optional, Any, NoReturn
 from abc import ABC
 from discord import Member, Guild, File
 from collections import Counter
@@ -23,19 +23,21 @@ from discord import app_commands
 from redbot.core import Config, checks, commands, bank
 from redbot.core.config import Config
 from redbot.core.commands import Cog
+from redbot.core.data_manager import cog_data_path
 
 
 from .storestuff import FOODITEMS, SKILLITEMS, VEHICLES, ENTERTAINMENT, LUXURYITEMS, ALLITEMS
 from .skills import SKILLSLIST, MAGICSTANCES, MAGICSKILLS, BROADSWORDSKILLS, LIGHTSABERSKILLS, CUTLASSSKILLS, FORCEPOWERS, FORCESTANCES, SKILLTREES
-from .jobs import ALLJOBS, CAREEROPPOSITE, SUBJOBS, Culinary, Business, Programming, Medicine, LawEnforcement, Artist, Film, Military, Writing, SocialMedia, Athletic, Legal, Journalism, Engineering, Music, Science, Education, Politics, Criminal, Astronaut, Fashion, Sith, SecretAgent, Jedi, Sailor, DarkWarrior, ValiantKnight, Pirate, MurderDrone
-from .traits import HINDRANCES, SOCIALTRAITS, VALUETRAITS, NATURETRAITS, INTERESTTRAITS, ALLTRAITS
+from .jobs import ALLJOBS
+from .traits import HINDRANCES, SOCIALTRAITS, VALUETRAITS, NATURETRAITS, INTERESTTRAITS
 from .alignment import AlignmentManager
+from .catalog import CAREERS, ALIGNED_PATHS, SKILLS, TRAITS, TRAIT_CATEGORIES, CAREER_PATH_INDEX, SKILL_INDEX
+from .profile import ProfileCache
+from .scheduler import CooldownScheduler, split_remaining
 
 
 log = logging.getLogger("red.spideysimp-cogs.SpideyLifeSim")
 
-skill_cooldowns: Dict[str, Dict[str, datetime]] = {}
-
 store_slots = []
 
 userinventory = []
@@ -48,7 +50,6 @@ usertraits = []
 careerlevel = 0
 careerprog = 0
 salary = 0
-work_cooldowns = {}
 current_traits = []
 consechigheffort = 0
 burnoutapplied = None
@@ -101,7 +102,11 @@ EQUIVALENTSKILLS = {
 
 learnableabilities = []
 
-next_refresh_time = None
+WORK_COOLDOWN = timedelta(days=1)
+SKILL_COOLDOWN = timedelta(minutes=60)
+BURNOUT_DURATION = timedelta(days=7)
+STORE_REFRESH = timedelta(hours=6)
+STORE_KEY = (0, 0, "storerefresh")
 
 async def fetch_url(session, url):
     async with session.get(url) as response:
@@ -134,16 +139,10 @@ class SpideyLifeSim(Cog):
         self.bot = bot
         self.alignmentmanager = AlignmentManager()
         self.config = Config.get_conf(self, identifier=684457913250480143, force_registration=True)
-        fooddefault = random.choice(list(FOODITEMS.keys()))
-        skilldefault = random.choice(list(SKILLITEMS.keys()))
-        vehicledefault = random.choice(list(VEHICLES.keys()))
-        entertainmentdefault = random.choice(list(ENTERTAINMENT.keys()))
-        luxurydefault = random.choice(list(LUXURYITEMS.keys()))
-        store_slots.insert(0, fooddefault)
-        store_slots.insert(1, skilldefault)
-        store_slots.insert(2, vehicledefault)
-        store_slots.insert(3, entertainmentdefault)
-        store_slots.insert(4, luxurydefault)
+        self.profiles = ProfileCache(self.config)
+        self.cooldowns = CooldownScheduler(str(cog_data_path(self) / "cooldowns.json"))
+        self.config.register_global(store_slots=[])
+        self.roll_store()
 
         self.storerefresh.start()
 
@@ -174,20 +173,33 @@ class SpideyLifeSim(Cog):
     def cog_unload(self):
         self.storerefresh.cancel()
 
-    @tasks.loop(hours=6)
+    @staticmethod
+    def roll_store():
+        """Pick a new item for each of the five store slots."""
+        store_slots[:] = [
+            random.choice(list(FOODITEMS.keys())),
+            random.choice(list(SKILLITEMS.keys())),
+            random.choice(list(VEHICLES.keys())),
+            random.choice(list(ENTERTAINMENT.keys())),
+            random.choice(list(LUXURYITEMS.keys())),
+        ]
+
+    @tasks.loop(minutes=1)
     async def storerefresh(self):
+        """Expire finished cooldowns and restock the store when its timer runs out."""
+        self.cooldowns.expire()
+        if self.cooldowns.active(STORE_KEY):
+            return
+        self.roll_store()
+        await self.config.store_slots.set(store_slots)
+        self.cooldowns.start(STORE_KEY, STORE_REFRESH)
 
-            store_slots.clear()
-            fooditem = random.choice(list(FOODITEMS.keys()))
-            skillitem = random.choice(list(SKILLITEMS.keys()))
-            vehicleitem = random.choice(list(VEHICLES.keys()))
-            entertainmentitem = random.choice(list(ENTERTAINMENT.keys()))
-            luxuryitem = random.choice(list(LUXURYITEMS.keys()))
-            store_slots.insert(0, fooditem)
-            store_slots.insert(1, skillitem)
-            store_slots.insert(2, vehicleitem)
-            store_slots.insert(3, entertainmentitem)
-            store_slots.insert(4, luxuryitem)
+    @storerefresh.before_loop
+    async def load_store(self):
+        """Keep the stock from before a restart while its refresh timer is still running."""
+        saved = await self.config.store_slots()
+        if len(saved) == len(store_slots) and self.cooldowns.active(STORE_KEY):
+            store_slots[:] = saved
 
 
     async def red_delete_data_for_user(self, **kwargs):
@@ -201,12 +213,13 @@ class SpideyLifeSim(Cog):
     async def practice_skill(self, interaction:discord.Interaction, skillname:str, progress: bool = True, user: discord.Member = None):
         """Handle the skill practice process with a progress bar."""
         user = user or interaction.user
-        skillslist = await self.config.member(user).skillslist()
-        username = await self.config.member(user).username()
-        if username == "None":
-            username = user.display_name
-        
-        usertraits = await self.config.member(user).usertraits()
+        async with self.profiles.open(user) as profile:
+            await self._practice_skill(interaction, profile, skillname, progress)
+
+    async def _practice_skill(self, interaction: discord.Interaction, profile, skillname: str, progress: bool):
+        skillslist = profile.skillslist
+        username = profile.display_name
+        usertraits = profile.usertraits
         skillvalues = skillslist.get(skillname, [0, 0, [], []])
         print(f"Debug: skillvalues for {skillname} are {skillvalues}")
         if len(skillvalues) < 2:
@@ -230,8 +243,7 @@ class SpideyLifeSim(Cog):
                 return
     
         skilladdperc = random.randint(5, 33)
-        boost_traits = SKILLSLIST.get(skillname)[2]
-        for trait in boost_traits:
+        for trait in SKILLS[skillname].boost_traits:
             if trait in usertraits:
                 skilladdperc = int(skilladdperc * 1.2)
         
@@ -255,7 +267,7 @@ class SpideyLifeSim(Cog):
             await interaction.followup.send(f"Congratulations, {username}! Your {skillname} skill is now Level {skilllevel}!")
 
         skillslist[skillname] = [skilllevel, newskillperc]
-        await self.config.member(user).skillslist.set(skillslist)
+        profile.touch("skillslist")
         if progress == True:
             def generate_progress_bar(percentage):
                 """Generate a progress bar with blocks for a percentage."""
@@ -283,19 +295,8 @@ class SpideyLifeSim(Cog):
         store_items = [item.get(store_slots[i]) for i, item in enumerate(items)]
         store_title = "Here's what's available in the shop right now:"
 
-        next_iter = getattr(self.storerefresh, "next_iteration", None) or getattr(
-            self.storerefresh, "_next_iteration", None
-        )
-        if next_iter is not None:
-            now = datetime.now(next_iter.tzinfo) if next_iter.tzinfo else datetime.now()
-            remaining = (next_iter - now).total_seconds()
-
-            if remaining < 0:
-                remaining = 0
-            
-            remaining = int(remaining)
-            hours, remainder = divmod(remaining, 3600)
-            minutes, seconds = divmod(remainder, 60)
+        if self.cooldowns.active(STORE_KEY):
+            hours, minutes, seconds = split_remaining(self.cooldowns.remaining(STORE_KEY))
             cooldown_timer = f"**Next refresh in:** {hours}h {minutes}m {seconds}s"
         else:
             cooldown_timer = "Next refresh time is being calculated."
@@ -356,6 +357,7 @@ class SpideyLifeSim(Cog):
         await bank.withdraw_credits(interaction.user, total_cost)
         async with self.config.member(interaction.user).userinventory() as inventory:
             inventory.extend([item_for_purchase] * itemcount)
+        self.profiles.forget(interaction.user)
 
         user_balance = await bank.get_balance(interaction.user)
         item_plural = "s" if itemcount > 1 else ""
@@ -396,6 +398,7 @@ class SpideyLifeSim(Cog):
             for _ in range(min(count, inventory.count(itemtosell))):
                 inventory.remove(itemtosell)
                 await bank.deposit_credits(interaction.user, sell_price)
+        self.profiles.forget(interaction.user)
 
         user_balance = await bank.get_balance(interaction.user)
         item_plural = "s" if count > 1 else ""
@@ -408,8 +411,9 @@ class SpideyLifeSim(Cog):
         """See your user profile."""
         if user is None:
             user = interaction.user
-        user_data = await self.config.member(user).all()
-        profilename = user_data["username"] if user_data["username"] != "None" else user.display_name
+        profile = await self.profiles.load(user)
+        user_data = profile.as_dict()
+        profilename = profile.display_name
         currency = await bank.get_currency_name(interaction.guild)
         userbalance = await bank.get_balance(user)
         alignment = user_data["alignment"]
@@ -495,6 +499,7 @@ class SpideyLifeSim(Cog):
         def check(message): return message.author == interaction.user and message.content.lower() in ["good", "evil"]
         try:
             message = await self.bot.wait_for('message', timeout=30.0, check=check)
+            self.profiles.forget(interaction.user)
             if message.content.lower() == "good":
                 await self.config.member(interaction.user).allymilestone.set("Radiant Wanderer")
                 await self.config.member(interaction.user).alignment.set(25)
@@ -527,18 +532,8 @@ class SpideyLifeSim(Cog):
     ])
     async def profile_traitsview(self, interaction: discord.Interaction, category: str):
         """View traits and their descriptions via categories."""
-        response = category.lower()
-        if response == "hindrances":
-            data = HINDRANCES
-        elif response == "social":
-            data = SOCIALTRAITS
-        elif response == "values":
-            data = VALUETRAITS
-        elif response == "nature":
-            data = NATURETRAITS
-        elif response == "interests":
-            data = INTERESTTRAITS
-        else:
+        data = TRAIT_CATEGORIES.get(category.lower())
+        if data is None:
             await interaction.response.send_message("Looks like maybe you typed the category wrong! Try again please!")
             return
         pages = paginate(data)
@@ -635,6 +630,7 @@ class SpideyLifeSim(Cog):
 
         user_traits.extend(selected_additional_traits)
         await self.config.member(interaction.user).usertraits.set(user_traits)
+        self.profiles.forget(interaction.user)
         await interaction.followup.send(f"Profile updated! Your traits are now:\n{', '.join(user_traits)}")
 
 
@@ -690,7 +686,7 @@ class SpideyLifeSim(Cog):
 
                 # Trait buttons
                 for trait in page_traits:
-                    conflicts = ALLTRAITS.get(trait, {}).get("conflicts", [])
+                    conflicts = TRAITS[trait].conflicts if trait in TRAITS else ()
                     disabled = (
                         trait in self.current_traits
                         or any(conflict in self.current_traits for conflict in conflicts)
@@ -850,12 +846,31 @@ class SpideyLifeSim(Cog):
     async def slsprofile_removetraits(self, interaction: discord.Interaction, user: discord.Member) -> None:
         """Only usable by bot owners. This command is here for legitimate accidental trait additions. The idea is traits should not be changed during the lifetime of a character."""
         await self.config.member(user).usertraits.set([])
+        self.profiles.forget(user)
         await interaction.response.send_message(f"{user}'s traits have been deleted successfully.")
 
 
+    @staticmethod
+    def _clear_career(profile, careeritems):
+        """Make a profile unemployed and take back the career's starting items."""
+        profile.userjob = "Unemployed"
+        profile.careerfield = "Unemployed"
+        profile.careerprog = 0
+        profile.careerlevel = 0
+        profile.salary = 0
+        for item in careeritems:
+            if item in profile.userinventory:
+                profile.userinventory.remove(item)
+        profile.touch("userinventory")
+
+    @staticmethod
+    def cooldown_key(member, action: str) -> tuple:
+        return (member.guild.id, member.id, action)
+
     async def update_and_confirm(self, ctx, attribute, value):
         """Helper function to update an attribute and confirm it."""
         await self.config.member(ctx.author).set_raw(attribute, value=value)
+        self.profiles.forget(ctx.author)
         await ctx.send(f"Your {attribute} has been updated to {value}.")
 
     async def display_profile(self, interaction, title, description, image_url):
@@ -897,6 +912,7 @@ class SpideyLifeSim(Cog):
         await self.config.member(member).grantedtraits.set([])
         await self.config.member(member).learnedskills.set(LEARNEDSKILLS)
         await self.config.member(member).learnedstances.set(STANCES)
+        self.profiles.forget(member)
 
 
 
@@ -930,12 +946,7 @@ class SpideyLifeSim(Cog):
     
     async def skills_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
         """Autocomplete function for skills."""
-        current = current.lower()
-        choices = []
-        for skill in SKILLSLIST.keys():
-            if current in skill.lower():
-                choices.append(app_commands.Choice(name=skill, value=skill))
-        return choices[:25]
+        return [app_commands.Choice(name=skill, value=skill) for skill in SKILL_INDEX.search(current)]
 
     @skills.command(name="practice", description="Work on a skill of your choice.")
     @app_commands.describe(skillname="The skill you want to practice.")
@@ -954,33 +965,25 @@ class SpideyLifeSim(Cog):
             return
 
         await self.practice_skill(interaction, skillname)
-        cooldown_duration = timedelta(minutes=60)  # Adjust duration as needed
-        current_time = datetime.now()
-        user_cooldowns = skill_cooldowns.get(interaction.user.id, {})
-        user_cooldowns[skillname] = current_time + cooldown_duration
-        skill_cooldowns[interaction.user.id] = user_cooldowns
+        self.cooldowns.start(self.cooldown_key(interaction.user, skillname), SKILL_COOLDOWN)
 
     async def is_on_cooldown(self, interaction, skillname):
         """Check if the user is on cooldown for a skill."""
-        current_time = datetime.now()
-        user_cooldowns = skill_cooldowns.get(interaction.user.id, {})
-        if skillname in user_cooldowns:
-            cooldown_time = user_cooldowns[skillname]
-            if current_time < cooldown_time:
-                remaining_seconds = (cooldown_time - current_time).total_seconds()
-                minutes, seconds = divmod(int(remaining_seconds), 60)
-                await interaction.response.send_message(f"```You're so tired from practicing {skillname}. Try waiting {minutes} minutes and {seconds} seconds to practice again.```" if minutes else f"```You're so tired from practicing {skillname}. Try waiting {seconds} seconds to practice again.```")
-                return True
+        remaining_seconds = self.cooldowns.remaining(self.cooldown_key(interaction.user, skillname))
+        if remaining_seconds:
+            minutes, seconds = divmod(int(remaining_seconds), 60)
+            await interaction.response.send_message(f"```You're so tired from practicing {skillname}. Try waiting {minutes} minutes and {seconds} seconds to practice again.```" if minutes else f"```You're so tired from practicing {skillname}. Try waiting {seconds} seconds to practice again.```")
+            return True
         return False
 
     async def has_required_items(self, interaction, skillname):
         """Check if the user has the required items to practice a skill."""
-        skillsinfo = SKILLSLIST.get(skillname, [])
-        if len(skillsinfo) < 4:
+        skill = SKILLS.get(skillname)
+        required_items = skill.items if skill else ()
+        if not required_items:
             return True
-        required_items = skillsinfo[3]
-        userinventory = await self.config.member(interaction.user).userinventory()
-        if required_items and not any(item in userinventory for item in required_items):
+        userinventory = (await self.profiles.load(interaction.user)).userinventory
+        if not any(item in userinventory for item in required_items):
             await interaction.response.send_message(f"```You need one of these items to practice {skillname}: {', '.join(required_items)}. Buy them from the store!```")
             return False
         return True
@@ -1061,6 +1064,7 @@ class SpideyLifeSim(Cog):
                 await ctx.send(f"You have discovered a new ability in the {stance} stance: **{ability}**!")
                 learnableabilities.append(ability)
                 await self.config.member(ctx.author).learnableabilities.set(learnableabilities)
+                self.profiles.forget(ctx.author)
                 
                 
             except asyncio.TimeoutError:
@@ -1082,6 +1086,7 @@ class SpideyLifeSim(Cog):
             await ctx.send(f"You have discovered the stance **{validstance}**! Feel free to use it in duels!")
             learnedstances[validstance] = True
             await self.config.member(ctx.author).learnedstances.set(learnedstances)
+            self.profiles.forget(ctx.author)
     
     
     @slsskills.command(name="learn", aliases=["l"])
@@ -1105,6 +1110,7 @@ class SpideyLifeSim(Cog):
             await ctx.send(f"You have successfully added {skill} to your ability list!")
             await self.config.member(ctx.author).learnedskills.set(learnedskills)
             await self.config.member(ctx.author).learnableabilities.set(learnableabilities)
+            self.profiles.forget(ctx.author)
         except asyncio.TimeoutError:
             await ctx.send("Response timed out! Please try again!")
             self.slsskills_learn.reset_cooldown(ctx)
@@ -1161,24 +1167,17 @@ class SpideyLifeSim(Cog):
 
     async def career_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
         """Autocomplete function for careers."""
-        current = current.lower()
-        choices = []
-        for career in ALLJOBS.keys():
-            if current in career.lower():
-                choices.append(app_commands.Choice(name=career, value=career))
-        return choices[:25]
+        return [app_commands.Choice(name=career, value=career) for career in CAREER_PATH_INDEX.search(current)]
 
     async def subcareer_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
         """Autocomplete function for subcareers."""
         current = current.lower()
         top_level_career = interaction.namespace.careername
-        if top_level_career not in ALLJOBS:
-            return []
-        choices = []
-        for subcareer in SUBJOBS.keys():
-            if current in subcareer.lower() and subcareer in CAREEROPPOSITE[top_level_career]:
-                choices.append(app_commands.Choice(name=subcareer, value=subcareer))
-        return choices[:25]
+        return [
+            app_commands.Choice(name=subcareer, value=subcareer)
+            for subcareer in ALIGNED_PATHS.get(top_level_career, ())
+            if current in subcareer.lower()
+        ]
 
     @careers.command(name="aboutcareer", description="See more information about a particular career!")
     @app_commands.describe(careername="The career you want to learn about.")
@@ -1195,10 +1194,8 @@ class SpideyLifeSim(Cog):
             await interaction.followup.send("```The specified career wasn't found. Double-check spelling and try again!```")
             return
         
-        jobdict = ALLJOBS
-        if ALLJOBS[careername] == None:
-            jobdict = SUBJOBS
-            jobopts = CAREEROPPOSITE[careername]
+        if careername in ALIGNED_PATHS:
+            jobopts = ALIGNED_PATHS[careername]
             await interaction.followup.send(f"Would you like to see the career information for `{jobopts[0]}` or `{jobopts[1]}`?")
             lower_jobopts = [opt.lower() for opt in jobopts]
             def check(message): return message.author == interaction.user and message.content.lower() in lower_jobopts
@@ -1216,14 +1213,14 @@ class SpideyLifeSim(Cog):
                 await interaction.followup.send("Prompt timed out. Please try again.")
                 return
 
-        jobinfo = jobdict[careername]
-        requiredskills = jobinfo[4]
+        career = CAREERS[careername]
+        requiredskills = career.skills
         em = discord.Embed(
             title=careername, 
-            description=f"{jobinfo[0]}\n**Boss:** {jobinfo[2]}\n**Required skill{'s' if len(requiredskills) != 1 else ''}:** {', '.join(requiredskills)}", 
+            description=f"{career.description}\n**Boss:** {career.supervisor}\n**Required skill{'s' if len(requiredskills) != 1 else ''}:** {', '.join(requiredskills)}", 
             color=discord.Color.red()
         )
-        em.set_image(url=jobinfo[1])
+        em.set_image(url=career.image)
         await interaction.followup.send(embed=em)
 
     @careers.command(name="careerapply", description="Apply to a career of your choosing!")
@@ -1235,8 +1232,9 @@ class SpideyLifeSim(Cog):
             await interaction.response.send_message("```Specify a job name to apply!```")
             return
 
-        userjob = await self.config.member(interaction.user).userjob()
-        careerfield = await self.config.member(interaction.user).careerfield()
+        profile = await self.profiles.load(interaction.user)
+        userjob = profile.userjob
+        careerfield = profile.careerfield
 
         if careerfield == jobname:
             await interaction.response.send_message("```You're already in that career!```")
@@ -1248,11 +1246,9 @@ class SpideyLifeSim(Cog):
             await interaction.response.send_message("```Job not found. Try retyping it!```")
             return
         
-        maindict = ALLJOBS
-        if ALLJOBS.get(jobname) == None:
-            maindict = SUBJOBS
-            jobopts = CAREEROPPOSITE.get(jobname)
-            alignment = await self.config.member(interaction.user).alignment()
+        if jobname in ALIGNED_PATHS:
+            jobopts = ALIGNED_PATHS[jobname]
+            alignment = profile.alignment
             if alignment > 0:
                 await interaction.response.send_message("Because you are good, the following career seems ideal for you:")
                 jobname = jobopts[0]
@@ -1264,16 +1260,15 @@ class SpideyLifeSim(Cog):
                 return
             
     
-        jobdict = globals().get(jobname)
-        if not jobdict:
+        career = CAREERS.get(jobname)
+        if not career:
             await interaction.response.send_message("```Internal error! Contact support if this persists.```")
             return
 
-        maincareerlist = maindict[jobname]
-        requiredskills = maincareerlist[4]
+        requiredskills = career.skills
         currency = await bank.get_currency_name(interaction.guild)
-        startercareer = list(jobdict.keys())[0]
-        description, salary = jobdict[startercareer][:2]
+        starter = career.position(1)
+        startercareer, description, salary = starter.title, starter.description, starter.salary
     
         em = discord.Embed(
             title=f"{jobname} Application",
@@ -1281,12 +1276,12 @@ class SpideyLifeSim(Cog):
             f"Apply for the **{jobname} Career Path.**\n"
             f"Starting as **{startercareer}**: {description}\n"
             f"Salary: **{salary} {currency}**\n"
-            f"Supervisor: **{maincareerlist[2]}**\n"
+            f"Supervisor: **{career.supervisor}**\n"
             f"Required skill(s): **{', '.join(requiredskills)}**"
             ),
             color=discord.Color.red()
         )
-        em.set_image(url=maincareerlist[1])
+        em.set_image(url=career.image)
         await interaction.response.send_message(embed=em)
         await interaction.response.send_message("Type `Confirm` to secure this job or `Cancel` to cancel.")
 
@@ -1296,14 +1291,15 @@ class SpideyLifeSim(Cog):
             message = await self.bot.wait_for('message', timeout=30.0, check=check)
             if message.content.lower() == "confirm":
                 await interaction.response.send_message(f"Congratulations {interaction.user.mention}, you've been hired for the {jobname} job!")
-                await self.config.member(interaction.user).userjob.set(startercareer)
-                await self.config.member(interaction.user).careerfield.set(jobname)
-                await self.config.member(interaction.user).careerlevel.set(1)
-                await self.config.member(interaction.user).salary.set(salary)
-                async with self.config.member(interaction.user).userinventory() as inventory:
-                    inventory.extend(maincareerlist[3])
-                recruitmessage = discord.Embed(title=f"Message from {maincareerlist[2]}", description=f"{maincareerlist[6]}")
-                recruitmessage.set_thumbnail(url=maincareerlist[5])
+                async with self.profiles.open(interaction.user) as profile:
+                    profile.userjob = startercareer
+                    profile.careerfield = jobname
+                    profile.careerlevel = 1
+                    profile.salary = salary
+                    profile.userinventory.extend(career.items)
+                    profile.touch("userinventory")
+                recruitmessage = discord.Embed(title=f"Message from {career.supervisor}", description=f"{career.welcome}")
+                recruitmessage.set_thumbnail(url=career.supervisor_image)
                 await interaction.response.send_message(embed=recruitmessage)
             else:
                 await interaction.response.send_message(f"Application for {jobname} has been canceled.")
@@ -1313,8 +1309,9 @@ class SpideyLifeSim(Cog):
     @careers.command(name="quitjob", description="Quit your job with this function!")
     async def slscareers_quitjob(self, interaction: discord.Interaction):
         """Quit your job with this function!"""
-        userjob = await self.config.member(interaction.user).userjob()
-        careerfield = await self.config.member(interaction.user).careerfield()
+        profile = await self.profiles.load(interaction.user)
+        userjob = profile.userjob
+        careerfield = profile.careerfield
         if userjob == "Unemployed":
             await interaction.response.send_message("You can't quit a job if you don't have a job.")
             return
@@ -1324,26 +1321,16 @@ class SpideyLifeSim(Cog):
         def check(message):
             return message.author == interaction.user and message.content.lower() in ["yes", "no"]
 
-        if careerfield in SUBJOBS.keys():
-            maincareerlist = SUBJOBS[careerfield]
-        else:
-            maincareerlist = ALLJOBS[careerfield]
+        career = CAREERS[careerfield]
 
         try:
             message = await self.bot.wait_for('message', timeout=30.0, check=check)
             if message.content.lower() == "yes":
                 await interaction.response.send_message("You have quit your job!")
-                await self.config.member(interaction.user).userjob.set("Unemployed")
-                await self.config.member(interaction.user).careerfield.set("Unemployed")
-                await self.config.member(interaction.user).careerprog.set(0)
-                await self.config.member(interaction.user).careerlevel.set(0)
-                await self.config.member(interaction.user).salary.set(0)
-                for i in maincareerlist[3]:
-                    async with self.config.member(interaction.user).userinventory() as inventory:
-                        if i in inventory:
-                            inventory.remove(i)
-                leavemessage = discord.Embed(title=f"Message from {maincareerlist[2]}", description=f"{maincareerlist[7]}")
-                leavemessage.set_thumbnail(url=maincareerlist[5])
+                async with self.profiles.open(interaction.user) as profile:
+                    self._clear_career(profile, career.items)
+                leavemessage = discord.Embed(title=f"Message from {career.supervisor}", description=f"{career.farewell}")
+                leavemessage.set_thumbnail(url=career.supervisor_image)
                 await interaction.response.send_message(embed=leavemessage)
             else:
                 await interaction.response.send_message("Resignation canceled.")
@@ -1360,82 +1347,71 @@ class SpideyLifeSim(Cog):
     async def slscareers_gotowork(self, interaction: discord.Interaction, effort: str):
         """Go to work at your job!"""
         await interaction.response.defer(thinking=True)
-        user_id = interaction.user.id
-        userjob = await self.config.member(interaction.user).userjob()
-        careerfield = await self.config.member(interaction.user).careerfield()
-        careerprog = await self.config.member(interaction.user).careerprog()
-        careerlevel = await self.config.member(interaction.user).careerlevel()
-        skillslist = await self.config.member(interaction.user).skillslist()
-        salary = await self.config.member(interaction.user).salary()
-        usertraits = await self.config.member(interaction.user).usertraits()
-        username = await self.config.member(interaction.user).username()
-        consechigheffort = await self.config.member(interaction.user).consechigheffort()
-        burnoutapplied = await self.config.member(interaction.user).burnoutapplied()
-        grantedtraits = await self.config.member(interaction.user).grantedtraits()
-        alignment = await self.config.member(interaction.user).alignment()
+        async with self.profiles.open(interaction.user) as profile:
+            await self._go_to_work(interaction, profile, effort)
+
+    async def _go_to_work(self, interaction: discord.Interaction, profile, effort: str):
+        userjob = profile.userjob
+        careerfield = profile.careerfield
+        careerprog = profile.careerprog
+        careerlevel = profile.careerlevel
+        skillslist = profile.skillslist
+        salary = profile.salary
+        usertraits = profile.usertraits
+        username = profile.display_name
+        consechigheffort = profile.consechigheffort
+        burnoutapplied = profile.burnoutapplied
+        grantedtraits = profile.grantedtraits
+        alignment = profile.alignment
         burnoutbool = None
-        if username == "None":
-            username = interaction.user.display_name
 
-        current_time = datetime.now()
-        last_work_time = work_cooldowns.get(user_id)
+        work_key = self.cooldown_key(interaction.user, "work")
+        burnout_key = self.cooldown_key(interaction.user, "burnout")
 
-        if last_work_time and current_time - last_work_time < timedelta(days=1):
-            remaining_time = timedelta(days=1) - (current_time - last_work_time)
-            hours, remainder = divmod(remaining_time.seconds, 3600)
-            minutes, _ = divmod(remainder, 60)
+        if self.cooldowns.active(work_key):
+            hours, minutes, _ = split_remaining(self.cooldowns.remaining(work_key))
             await interaction.followup.send(f"```You can only go to work once every day. Try again in {hours} hours and {minutes} minutes.```")
             return
 
         if userjob == "Unemployed":
             await interaction.followup.send("```You need a job to go to work!```")
             return
+        career = CAREERS[careerfield]
         firebool = False
-        oppositecareer = None
         oppvalue = None
-        for key, value in CAREEROPPOSITE.items():
-            if careerfield in value:
-                oppositecareer = key
-                if careerfield == value[0] and alignment <= -25:
-                    firebool = True
-                    oppvalue = 1
-                elif careerfield == value[1] and alignment >= 25:
-                    firebool = True
-                    oppvalue = 0
-                break
+        if career.opposite:
+            good, evil = ALIGNED_PATHS[career.path]
+            if careerfield == good and alignment <= -25:
+                firebool = True
+                oppvalue = 1
+            elif careerfield == evil and alignment >= 25:
+                firebool = True
+                oppvalue = 0
             
         if firebool == True:
             await interaction.followup.send(f"You are becoming too {'evil' if oppvalue == 1 else 'good'} for the {careerfield} field. Your supervisor has words to say:")
             em = discord.Embed(
-                title=f"Message from {SUBJOBS.get(careerfield)[2]}",
-                description=f"{SUBJOBS.get(careerfield)[8]}"
+                title=f"Message from {career.supervisor}",
+                description=f"{career.dismissal}"
             )
-            em.set_thumbnail(url=SUBJOBS.get(careerfield)[5])
+            em.set_thumbnail(url=career.supervisor_image)
             await interaction.response.send_message(embed=em)
             afterlevel = careerlevel - 2 if careerlevel - 2 > 0 else 1
-            await self.config.member(interaction.user).userjob.set("Unemployed")
-            await self.config.member(interaction.user).careerfield.set("Unemployed")
-            await self.config.member(interaction.user).careerprog.set(0)
-            await self.config.member(interaction.user).careerlevel.set(0)
-            await self.config.member(interaction.user).salary.set(0)
-            for i in SUBJOBS.get(careerfield)[3]:
-                async with self.config.member(interaction.user).userinventory() as inventory:
-                    if i in inventory:
-                        inventory.remove(i)
-                
+            self._clear_career(profile, career.items)
+            # The offer below waits on the user, so don't hold unsaved changes across it.
+            await self.profiles.save(profile)
             await asyncio.sleep(3)
-            oppcareername = CAREEROPPOSITE.get(oppositecareer)[oppvalue]
-            oppdict = globals().get(oppcareername)
-            opposingcareer = SUBJOBS.get(oppcareername)
+            oppcareername = career.opposite
+            opposingcareer = CAREERS[oppcareername]
             em2 = discord.Embed(
-                title=f"Message from {opposingcareer[2]}",
-                description = f"{opposingcareer[9]}"
+                title=f"Message from {opposingcareer.supervisor}",
+                description = f"{opposingcareer.offer}"
             )
-            em2.set_thumbnail(url=opposingcareer[5])
+            em2.set_thumbnail(url=opposingcareer.supervisor_image)
             await interaction.followup.send(embed=em2)
             currency = await bank.get_currency_name(interaction.guild)
-            nextposition = list(oppdict.keys())[afterlevel - 1]
-            nextsalary = oppdict[nextposition][1]
+            nextjob = opposingcareer.position(afterlevel)
+            nextposition, nextsalary = nextjob.title, nextjob.salary
             await interaction.followup.send(
                 f"You are being offered the position: {nextposition}, starting at level {afterlevel} "
                 f"with a daily salary of {humanize.intcomma(nextsalary)} {currency}. Do you accept? `yes` or `no`"
@@ -1445,14 +1421,14 @@ class SpideyLifeSim(Cog):
 
             try:
                 message = await self.bot.wait_for('message', timeout=30.0, check=check)
+                await self.profiles.refresh(profile)
                 if message.content.lower() == "yes":
-                    await self.config.member(interaction.user).userjob.set(nextposition)
-                    await self.config.member(interaction.user).careerfield.set(oppcareername)
-                    await self.config.member(interaction.user).salary.set(nextsalary)
-                    await self.config.member(interaction.user).careerlevel.set(afterlevel)
-                    for i in opposingcareer[3]:
-                        async with self.config.member(interaction.user).userinventory() as inventory:
-                            inventory.append(i)
+                    profile.userjob = nextposition
+                    profile.careerfield = oppcareername
+                    profile.salary = nextsalary
+                    profile.careerlevel = afterlevel
+                    profile.userinventory.extend(opposingcareer.items)
+                    profile.touch("userinventory")
                     await interaction.followup.send("You have accepted the offer and started your new career!")
                     return
                 else:
@@ -1464,13 +1440,15 @@ class SpideyLifeSim(Cog):
 
 
         if "Burned Out" in grantedtraits:
-            current_time = datetime.now()
             if burnoutapplied:
-                burnoutdate = datetime.fromisoformat(burnoutapplied)
-                if current_time - burnoutdate > timedelta(days=7):
+                if burnout_key not in self.cooldowns.due:
+                    # burnout from before the scheduler, or one that already expired
+                    self.cooldowns.start(burnout_key, BURNOUT_DURATION, since=datetime.fromisoformat(burnoutapplied))
+                if not self.cooldowns.active(burnout_key):
+                    self.cooldowns.clear(burnout_key)
                     grantedtraits.remove("Burned Out")
-                    await self.config.member(interaction.user).grantedtraits.set(grantedtraits)
-                    await self.config.member(interaction.user).burnoutapplied.set(None)
+                    profile.touch("grantedtraits")
+                    profile.burnoutapplied = None
                     await interaction.followup.send("You've recovered from your burnout and feel refreshed!")
                 else:
                     await interaction.followup.send(
@@ -1479,7 +1457,7 @@ class SpideyLifeSim(Cog):
                     )
             else:
                 grantedtraits.remove("Burned Out")
-                await self.config.member(interaction.user).grantedtraits.set(grantedtraits)
+                profile.touch("grantedtraits")
                 await interaction.followup.send("There has been an error with your traits. You appear to have burnout but no set burnout date. Burned Out was removed from your traits, but if you ever see this error again, please report it.")
 
         goodtraits = ["Driven Achiever", "Disciplined", "Workaholic", "Lucky"]
@@ -1523,15 +1501,12 @@ class SpideyLifeSim(Cog):
         if effort != "high":
             consechigheffort = 0
         
-        await self.config.member(interaction.user).consechigheffort.set(consechigheffort)
+        profile.consechigheffort = consechigheffort
         
-        work_cooldowns[user_id] = current_time
+        self.cooldowns.start(work_key, WORK_COOLDOWN)
 
         skill_values = []
-        careerdict = ALLJOBS
-        if careerfield not in ALLJOBS:
-            careerdict = SUBJOBS
-        jobskillreq = careerdict.get(careerfield)[4]
+        jobskillreq = career.skills
         for skill in jobskillreq:
             skill_value = skillslist.get(skill, [0])
             skill_values.append(skill_value[0])
@@ -1547,21 +1522,20 @@ class SpideyLifeSim(Cog):
             await interaction.followup.send("Your performance was reduced by 50% due to burnout.")
         
         newjobperc = careerprog + jobaddperc
-        jobdict = globals().get(careerfield)
-       
         currency = await bank.get_currency_name(interaction.guild)
 
-        if newjobperc >= 100 and promotionlevel < 10:
+        promotionlevel = careerlevel + 1
+        if newjobperc >= 100 and promotionlevel <= career.max_level:
             if all(promotionlevel <= skill_value for skill_value in skill_values):
-                promotioncareer = list(jobdict.keys())[careerlevel]
-                promotionsalary, promotionbonus = jobdict[promotioncareer][1:3]
+                promotion = career.position(promotionlevel)
+                promotioncareer = promotion.title
+                promotionsalary, promotionbonus = promotion.salary, promotion.bonus
                 promotionsalary = round(promotionsalary * (random.randint(100, 115) / 100))
                 promotionbonus = round(promotionbonus * (random.randint(100, 115) / 100))
-                promotionlevel = careerlevel + 1
                 newjobperc -= 100
-                await self.config.member(interaction.user).userjob.set(promotioncareer)
-                await self.config.member(interaction.user).careerlevel.set(promotionlevel)
-                await self.config.member(interaction.user).salary.set(promotionsalary)
+                profile.userjob = promotioncareer
+                profile.careerlevel = promotionlevel
+                profile.salary = promotionsalary
                 await bank.deposit_credits(interaction.user, promotionbonus)
                 await interaction.followup.send(
                     f"Promoted from {userjob} to {promotioncareer}!\n"
@@ -1571,50 +1545,50 @@ class SpideyLifeSim(Cog):
                 newjobperc = 99
                 missing_skills = [skill for skill, value in zip(jobskillreq, skill_values) if promotionlevel > value]
                 await interaction.followup.send(f"Increase your {', '.join(missing_skills)} skill(s) to level {promotionlevel} for promotion!")
-        if newjobperc >= 100 and promotionlevel >= 10:
+        if newjobperc >= 100 and promotionlevel > career.max_level:
             newjobperc = 50
             raiseamount = random.randint(5, 25)
             salary *= (1 + raiseamount / 100)
-            await self.config.member(interaction.user).salary.set(salary)
+            profile.salary = salary
             await interaction.followup.send(f"Because you're already at the maximum level in your career, you have instead received a raise of {raiseamount}% which increases your salary to {humanize.intcomma(round(salary))} {currency}!")
 
         if burnoutbool is not None:
             if burnoutbool == True:
                 grantedtraits.append("Burned Out")
-                await self.config.member(interaction.user).grantedtraits.set(grantedtraits)
-                await self.config.member(interaction.user).burnoutapplied.set(datetime.now().isoformat())
+                profile.touch("grantedtraits")
+                profile.burnoutapplied = datetime.now().isoformat()
+                self.cooldowns.start(burnout_key, BURNOUT_DURATION)
                 await interaction.followup.send("You pushed yourself too hard at work over the past couple days. You're burnt out now. Consider taking it easy.")
             elif burnoutbool == False:
                 grantedtraits.remove("Burned Out")
-                await self.config.member(interaction.user).grantedtraits.set(grantedtraits)
-                await self.config.member(interaction.user).burnoutapplied.set(None)
+                profile.touch("grantedtraits")
+                profile.burnoutapplied = None
+                self.cooldowns.clear(burnout_key)
                 await interaction.followup.send("You've recovered from your burnout by putting in a more manageable effort today!")
 
         await bank.deposit_credits(interaction.user, salary)
-        await self.config.member(interaction.user).careerprog.set(newjobperc)
+        profile.careerprog = newjobperc
         await interaction.followup.send(f"Worked in the {careerfield} Field, earning {humanize.intcomma(salary)} {currency}.")
 
     @careers.command(name="careerreview", description="Review current career information.")
     async def slscareers_careerreview(self, interaction: discord.Interaction):
         """Review current career information."""
-        userjob = await self.config.member(interaction.user).userjob()
-        careerfield = await self.config.member(interaction.user).careerfield()
-        careerprog = await self.config.member(interaction.user).careerprog()
-        careerlevel = await self.config.member(interaction.user).careerlevel()
-        salary = await self.config.member(interaction.user).salary()
-        username = await self.config.member(interaction.user).username()
+        profile = await self.profiles.load(interaction.user)
+        userjob = profile.userjob
+        careerfield = profile.careerfield
+        careerprog = profile.careerprog
+        careerlevel = profile.careerlevel
+        salary = profile.salary
+        username = profile.username
         currency = await bank.get_currency_name(interaction.guild)
-        burnoutapplied = await self.config.member(interaction.user).burnoutapplied()
+        burnoutapplied = profile.burnoutapplied
         burnoutdesc = ""
-        if "Burned Out" in grantedtraits:
+        if "Burned Out" in profile.grantedtraits and burnoutapplied:
             burnoutdate = datetime.fromisoformat(burnoutapplied)
             burnoutdesc = f"Currently burned out as of {humanize.naturaltime(burnoutdate)}."
         
-        jobdict = ALLJOBS
-        if careerfield not in ALLJOBS:
-            jobdict = SUBJOBS
-        jobinfo = jobdict.get(careerfield)
-        if not jobinfo:
+        career = CAREERS.get(careerfield)
+        if userjob != "Unemployed" and not career:
             await interaction.response.send_message("```Career information not found.```")
             return
         if userjob == "Unemployed":
@@ -1629,5 +1603,5 @@ class SpideyLifeSim(Cog):
                     f"**Salary:** {humanize.intcomma(salary)} {currency}\n**Progress:** {progressionbar}\n{burnoutdesc}",
             color=discord.Color.red()
         )
-        em.set_image(url=jobinfo[1])
+        em.set_image(url=career.image)
         await interaction.response.send_message(embed=em)
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""
+Time a burst of concurrent chart requests through ChartRenderer against drawing them on the loop.
+
+    python spideystocks/bench_chart_renderer.py --charts 32 --points 2000 --workers 2
+
+Each request draws a different series (so every one is a cache miss) with the
+stockgraph style. While a burst runs, a heartbeat task sleeps 50 ms at a time and
+records how late it wakes up: that is how long the event loop (and the gateway
+heartbeat) was held up. "inline" draws on the loop the way the commands used to;
+"pool" goes through ChartRenderer, and "cached" repeats the pool burst so every
+request is a cache hit. Needs matplotlib.
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import math
+import random
+import statistics
+import time
+
+from matplotlib.figure import Figure
+
+if __package__:
+    from .chart_renderer import ChartRenderer, figure_png
+else:  # run as a script, without the package __init__ (which loads the cog)
+    from chart_renderer import ChartRenderer, figure_png
+
+HEARTBEAT = 0.05
+
+
+def render_series(title: str, values: list[float]) -> bytes:
+    """Same figure as charts.render_history, on a plain index axis."""
+    import matplotlib.style
+
+    with matplotlib.style.context("dark_background"):
+        fig = Figure(figsize=(8, 4))
+        ax = fig.add_subplot()
+        ax.plot(range(len(values)), values, linestyle='-')
+        ax.set_title(title)
+        ax.set_xlabel("Time")
+        ax.set_ylabel("Price")
+        fig.tight_layout()
+        return figure_png(fig)
+
+
+def make_series(n: int, points: int) -> list[float]:
+    rng = random.Random(n)
+    price, out = 100.0, []
+    for _ in range(points):
+        price *= math.exp(rng.gauss(0, 0.01))
+        out.append(round(price, 2))
+    return out
+
+
+async def _heartbeat(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT)
+        lags.append(max(0.0, time.perf_counter() - t0 - HEARTBEAT) * 1000.0)
+
+
+async def burst(series: list[list[float]], renderer: ChartRenderer | None) -> tuple[list[float], list[float]]:
+    """Request every chart at once; returns (ms from the burst to each chart, heartbeat lag ms)."""
+    lags: list[float] = []
+    stop = asyncio.Event()
+    beat = asyncio.create_task(_heartbeat(lags, stop))
+    await asyncio.sleep(0)
+    t0 = time.perf_counter()
+
+    async def one(n: int, values: list[float]) -> float:
+        if renderer is None:
+            render_series(f"STOCK{n}", values)
+        else:
+            await renderer.render(render_series, f"STOCK{n}", values)
+        return (time.perf_counter() - t0) * 1000.0
+
+    latencies = await asyncio.gather(*(one(n, values) for n, values in enumerate(series)))
+    stop.set()
+    await beat
+    return list(latencies), lags
+
+
+def _summary(latencies: list[float], lags: list[float]) -> str:
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return (
+        f"p50 {statistics.median(ordered):8.1f} ms  p99 {p99:8.1f} ms  "
+        f"worst heartbeat lag {max(lags, default=0.0):8.1f} ms"
+    )
+
+
+async def run(args) -> None:
+    series = [make_series(n, args.points) for n in range(args.charts)]
+    renderer = ChartRenderer(workers=args.workers, max_entries=max(args.charts, 1))
+    try:
+        # start the workers (and their matplotlib import) before timing anything
+        await asyncio.gather(*(renderer.render(render_series, "warmup", [float(i), 1.0]) for i in range(args.workers)))
+        print(f"inline  {_summary(*await burst(series, None))}")
+        print(f"pool    {_summary(*await burst(series, renderer))}")
+        print(f"cached  {_summary(*await burst(series, renderer))}")
+        print("renderer stats:", renderer.stats())
+    finally:
+        renderer.shutdown()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--charts", type=int, default=32)
+    parser.add_argument("--points", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args(argv)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
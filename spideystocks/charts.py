@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from matplotlib.figure import Figure
+
+from .chart_renderer import figure_png
+
+
+# ---------- render functions (run in the pool) ----------
+
+def render_history(title: str, times: list, values: list[float], ylabel: str) -> bytes:
+    """Dark-theme line chart of a price or index series against datetimes."""
+    import matplotlib.style
+
+    with matplotlib.style.context("dark_background"):
+        fig = Figure(figsize=(8, 4))
+        ax = fig.add_subplot()
+        ax.plot(times, values, linestyle='-')
+        ax.set_title(title)
+        ax.set_xlabel("Time")
+        ax.set_ylabel(ylabel)
+        fig.autofmt_xdate()
+        fig.tight_layout()
+        return figure_png(fig)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+import numpy as np
+
+BASELINE_VOLUME = 100_000
+DEFAULT_BANKRUPTCY_THRESHOLD = 50
+NPC_TRADE_PCT = (0.01, 0.05)
+
+
+class MarketFrame:
+    """
+    Columnar snapshot of market_data["companies"], one row per symbol in dict order.
+
+    The JSON dicts stay the source of truth (buy/sell, events and splits all edit
+    them directly), so a frame is gathered at the start of a tick, stepped for every
+    ticker at once, and the touched columns are written back.
+    """
+
+    __slots__ = ("symbols", "price", "volume", "total", "available", "npc", "yields", "threshold")
+
+    def __init__(self, companies: dict):
+        rows = list(companies.values())
+        n = len(rows)
+        self.symbols = list(companies.keys())
+        self.price = np.fromiter((c["price"] for c in rows), dtype=np.float64, count=n)
+        self.volume = np.fromiter((c.get("daily_volume", BASELINE_VOLUME) for c in rows), dtype=np.float64, count=n)
+        self.total = np.fromiter((c.get("total_shares", 0) for c in rows), dtype=np.int64, count=n)
+        self.available = np.fromiter((c.get("available_shares", 0) for c in rows), dtype=np.int64, count=n)
+        self.npc = np.fromiter((c.get("npc_holdings", 0) for c in rows), dtype=np.int64, count=n)
+        self.yields = np.fromiter((c.get("dividend_yield", 0) for c in rows), dtype=np.float64, count=n)
+        self.threshold = np.fromiter(
+            (c.get("bankruptcy_threshold", DEFAULT_BANKRUPTCY_THRESHOLD) for c in rows), dtype=np.float64, count=n
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def write_prices(self, companies: dict) -> None:
+        for symbol, p in zip(self.symbols, np.round(self.price, 4).tolist()):
+            companies[symbol]["price"] = p
+
+    def write_shares(self, companies: dict) -> None:
+        for symbol, avail, npc in zip(self.symbols, self.available.tolist(), self.npc.tolist()):
+            company = companies[symbol]
+            company["available_shares"] = avail
+            company["npc_holdings"] = npc
+
+
+def price_step(frame: MarketFrame, modifier: float, rng: np.random.Generator) -> np.ndarray:
+    """
+    One 5-minute tick for every ticker: ±5% noise scaled by liquidity (thin volume
+    swings harder, clamped to 0.5x–2x) plus the shared investor modifier. Prices
+    floor at 1.0. Updates `frame.price` in place and returns it.
+    """
+    n = len(frame)
+    factor = np.divide(
+        BASELINE_VOLUME, frame.volume,
+        out=np.full(n, 2.0), where=frame.volume > 0,
+    )
+    np.clip(factor, 0.5, 2.0, out=factor)
+    noise = rng.uniform(-0.05, 0.05, n) * factor
+    np.maximum(frame.price * (1.0 + noise + modifier), 1.0, out=frame.price)
+    return frame.price
+
+
+def index_step(values: np.ndarray, modifier: float, rng: np.random.Generator) -> np.ndarray:
+    """±1% drift for every index plus the whole-market index modifier, rounded to 0.1."""
+    change = rng.uniform(-0.01, 0.01, len(values))
+    return np.round(values * (1.0 + change + modifier), 1)
+
+
+def npc_step(frame: MarketFrame, buy_probability: float, sell_probability: float, rng: np.random.Generator):
+    """
+    NPCs buy 1–5% of the float on some tickers, then sell 1–5% of their holdings on
+    others. Share columns are updated in place; returns (bought, sold) per ticker.
+    """
+    n = len(frame)
+    lo, hi = NPC_TRADE_PCT
+
+    buy = (rng.random(n) < buy_probability)
+    bought = np.floor(frame.available * rng.uniform(lo, hi, n)).astype(np.int64) * buy
+    frame.available -= bought
+    frame.npc += bought
+
+    sell = (rng.random(n) < sell_probability) & (frame.npc > 0)
+    sold = np.floor(frame.npc * rng.uniform(lo, hi, n)).astype(np.int64) * sell
+    frame.available += sold
+    frame.npc -= sold
+    return bought, sold
+
+
+def payout_per_share(frame: MarketFrame) -> np.ndarray:
+    """Dividend per share for each ticker; nothing below the bankruptcy threshold."""
+    return np.where(frame.price < frame.threshold, 0.0, frame.price * frame.yields)
+
+
+def holdings_matrix(portfolios: dict, symbols: list[str]) -> tuple[list[str], np.ndarray]:
+    """(user ids, users x symbols share matrix) from market_data["portfolios"]."""
+    col = {s: j for j, s in enumerate(symbols)}
+    users = list(portfolios.keys())
+    rows: list[int] = []
+    cols: list[int] = []
+    vals: list[float] = []
+    for i, uid in enumerate(users):
+        for symbol, shares in portfolios[uid].items():
+            j = col.get(symbol)
+            if j is not None and shares > 0:
+                rows.append(i)
+                cols.append(j)
+                vals.append(shares)
+    matrix = np.zeros((len(users), len(symbols)), dtype=np.float64)
+    if rows:
+        np.add.at(matrix, (np.asarray(rows), np.asarray(cols)), np.asarray(vals, dtype=np.float64))
+    return users, matrix
+
+
+def dividend_totals(portfolios: dict, frame: MarketFrame) -> list[tuple[str, int]]:
+    """Whole-credit dividend owed to each user across all their holdings, skipping zeros."""
+    users, matrix = holdings_matrix(portfolios, frame.symbols)
+    if not users:
+        return []
+    totals = np.floor(matrix @ payout_per_share(frame)).astype(np.int64)
+    return [(users[i], int(totals[i])) for i in np.flatnonzero(totals > 0)]
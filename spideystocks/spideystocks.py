@@ -2,19 +2,28 @@ import discord
 import json
 import os
 import random
-import io
 from datetime import datetime, timedelta, timezone
 from discord.ext import commands, tasks
 from discord import app_commands
 from redbot.core import commands, bank
-import matplotlib.pyplot as plt
+from redbot.core.errors import BalanceTooHigh
 import humanize
 import pytz
 import copy
+import asyncio
+import numpy as np
+from typing import Literal
+from .timeseries import TimeSeriesStore
+from .chart_renderer import get_renderer, release_renderer
+from .charts import render_history
+from .market_engine import MarketFrame, price_step, index_step, npc_step, dividend_totals
 
 BASE_DIR = os.path.dirname(os.path.realpath(__file__))
 DATA_FILE = os.path.join(BASE_DIR, "market_data.json")
+HISTORY_FILE = os.path.join(BASE_DIR, "market_history.bin")
 HISTORY_LIMIT = 288
+INDEX_HISTORY_LIMIT = 20
+MARKET_TZ = pytz.timezone("US/Pacific")
 SPLIT_THRESHOLD = 1000.0
 SPLIT_RATIO = 2
 MERGE_THRESHOLD = 1.5
@@ -209,6 +218,13 @@ class SpideyStocks(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.data = load_data()
+        self.history = TimeSeriesStore(
+            HISTORY_FILE, MARKET_TZ,
+            raw_capacity={"stock": HISTORY_LIMIT, "index": INDEX_HISTORY_LIMIT},
+        )
+        self._migrate_history()
+        self.rng = np.random.default_rng()
+        self.charts = get_renderer(bot)
         self.investor_modifier = 0.0
         self.market_injection = 0.0
         self.index_modifier = 0.0
@@ -230,7 +246,47 @@ class SpideyStocks(commands.Cog):
             self.bot.loop.create_task(self.market_open())
 
     
+    def _migrate_history(self):
+        """Move any price/index history lists out of market_data.json into the series store."""
+        moved = False
+        for symbol, company in self.data["companies"].items():
+            legacy = company.pop("price_history", None)
+            if legacy is not None:
+                moved = True
+            if not self.history.has(f"stock:{symbol}"):
+                self.history.reset(f"stock:{symbol}", legacy or [company["price"]], spacing=300)
+        for name, index in self.data.get("indices", {}).items():
+            legacy = index.pop("history", None)
+            if legacy is not None:
+                moved = True
+            if not self.history.has(f"index:{name}"):
+                self.history.reset(f"index:{name}", legacy or [index["value"]], spacing=1800)
+        self.history.flush()
+        if moved:
+            save_data(self.data)
+
+    def record_price(self, symbol: str, company: dict):
+        self.history.append(f"stock:{symbol}", company["price"])
+
+    def pct_change(self, key: str) -> float | None:
+        last = self.history.last(key, 2)
+        if len(last) >= 2 and last[-2] != 0:
+            return ((last[-1] - last[-2]) / last[-2]) * 100
+        return None
+
+    def series_points(self, key: str, span: str):
+        """(x, y) for a graph: raw recent ticks, or closes of the hourly/daily rollups."""
+        if span == "recent":
+            times, values = self.history.recent(key)
+        else:
+            bars = self.history.bars(key, span)
+            times = [b[0] for b in bars]
+            values = [b[4] for b in bars]
+        return [datetime.fromtimestamp(t, MARKET_TZ) for t in times], values
+
     def cog_unload(self):
+        self.history.flush()
+        release_renderer(self.bot)
         self.market_check_loop.cancel()
         self.distribute_dividends.cancel()
         self.auto_stock_split.cancel()
@@ -260,30 +316,14 @@ class SpideyStocks(commands.Cog):
             buy_probability = base_buy_probability
             sell_probability = base_sell_probability
 
-        for symbol, company in self.data["companies"].items():
-            # Ensure npc_holdings key exists.
-            if "npc_holdings" not in company:
-                company["npc_holdings"] = 0
-
-            # NPC Buying
-            if random.random() < buy_probability:
-                # Buy between 1% and 5% of available shares
-                buy_pct = random.uniform(0.01, 0.05)
-                shares_to_buy = int(company["available_shares"] * buy_pct)
-                if shares_to_buy > 0:
-                    company["available_shares"] -= shares_to_buy
-                    company["npc_holdings"] += shares_to_buy
-                    print(f"NPCs bought {shares_to_buy} shares of {symbol}.")
-
-            # NPC Selling
-            if random.random() < sell_probability and company["npc_holdings"] > 0:
-                # Sell between 1% and 5% of NPC holdings
-                sell_pct = random.uniform(0.01, 0.05)
-                shares_to_sell = int(company["npc_holdings"] * sell_pct)
-                if shares_to_sell > 0:
-                    company["available_shares"] += shares_to_sell
-                    company["npc_holdings"] -= shares_to_sell
-                    print(f"NPCs sold {shares_to_sell} shares of {symbol}.")
+        companies = self.data["companies"]
+        frame = MarketFrame(companies)
+        bought, sold = npc_step(frame, buy_probability, sell_probability, self.rng)
+        frame.write_shares(companies)
+        for i in np.flatnonzero(bought):
+            print(f"NPCs bought {bought[i]} shares of {frame.symbols[i]}.")
+        for i in np.flatnonzero(sold):
+            print(f"NPCs sold {sold[i]} shares of {frame.symbols[i]}.")
         save_data(self.data)
     
     @tasks.loop(hours=12)
@@ -395,45 +435,47 @@ class SpideyStocks(commands.Cog):
         Randomly update stock prices every 5 minutes.
         Adjust the price volatility based on liquidity: 
         if daily_volume is lower than a baseline, price swings are larger.
+        Every ticker moves in one vectorised step (see market_engine.price_step).
         """
-        baseline_volume = 100000  # Define a baseline volume.
-
         scaled_modifier = self.investor_modifier * (5/30)
-        
-        for company in self.data["companies"].values():
-            # Get the company's liquidity; default to baseline if not provided.
-            volume = company.get("daily_volume", baseline_volume)
-            # Compute a volatility factor: if volume is lower than baseline, factor > 1 (more volatility).
-            # For example, factor = baseline_volume / volume.
-            volatility_factor = baseline_volume / volume  
-            # Alternatively, you might clamp this factor between, say, 0.5 and 2.
-            volatility_factor = max(0.5, min(2.0, volatility_factor))
-            market_noise = random.uniform(-0.05, 0.05) * volatility_factor
-            delta = 1 + market_noise + scaled_modifier
-            old_price = company["price"]
-            new_price = max(1.0, old_price * delta)
-            company["price"] = round(new_price, 4)  # Keep as float internally.
-            history = company.setdefault("price_history", [])
-            history.append(new_price)
-            if len(history) > HISTORY_LIMIT:
-                history.pop(0)
+
+        companies = self.data["companies"]
+        frame = MarketFrame(companies)
+        new_prices = price_step(frame, scaled_modifier, self.rng)
+        frame.write_prices(companies)
+        now = datetime.now(timezone.utc).timestamp()
+        for symbol, new_price in zip(frame.symbols, new_prices.tolist()):
+            self.history.append(f"stock:{symbol}", new_price, now)
+        self.history.flush()
         save_data(self.data)
 
 
 
     @tasks.loop(hours=24)
     async def distribute_dividends(self):
-        for symbol, company in self.data["companies"].items():
-            dividend_yield = company.get("dividend_yield", 0)
-            if company["price"] < company.get("bankruptcy_threshold", 50):
-                dividend_yield = 0
-            dividend_per_share = company["price"] * dividend_yield
-            for user_id, portfolio in self.data["portfolios"].items():
-                shares = portfolio.get(symbol, 0)
-                if shares > 0:
-                    total_dividend = dividend_per_share * shares
-                    await bank.deposit_credits(user_id, int(total_dividend))
+        """Pay every holder their day's dividends across all symbols in a single deposit."""
+        frame = MarketFrame(self.data["companies"])
+        payouts = dividend_totals(self.data["portfolios"], frame)
+        await self.settle_payouts(payouts)
         save_data(self.data)
+
+    async def settle_payouts(self, payouts: list[tuple[str, int]]):
+        """One bank deposit per user, yielding to the event loop between chunks."""
+        for n, (user_id, amount) in enumerate(payouts, start=1):
+            try:
+                # holders who share no cached guild with the bot aren't in get_user
+                user = await self.bot.get_or_fetch_user(int(user_id))
+            except discord.HTTPException as e:
+                print(f"Dividend payout skipped for {user_id} ({amount} credits): {e}")
+                continue
+            try:
+                await bank.deposit_credits(user, amount)
+            except BalanceTooHigh as e:
+                await bank.set_balance(user, e.max_balance)
+            except Exception as e:
+                print(f"Dividend payout error for {user_id}: {e}")
+            if n % 50 == 0:
+                await asyncio.sleep(0)
     
     @tasks.loop(minutes=30)
     async def update_indices_and_investor_modifier(self):
@@ -444,26 +486,19 @@ class SpideyStocks(commands.Cog):
         Also apply an index modifier that can be updated by whole-market events.
         """
         # Update each index with lower volatility (e.g., ±1%), factoring in the index_modifier.
-        for index in self.data["indices"].values():
-            old_value = index["value"]
-            change = random.uniform(-0.01, 0.01)  # ±1%
-            # Apply both the random change and the index_modifier.
-            new_value = round(old_value * (1 + change + self.index_modifier), 1)
-            index["value"] = new_value
-            index.setdefault("history", []).append(new_value)
-            if len(index["history"]) > 20:
-                index["history"].pop(0)
-        
-        # Calculate the average percentage change for each index.
-        total_change = 0
-        count = 0
-        for index in self.data["indices"].values():
-            history = index["history"]
-            if len(history) >= 2:
-                change_pct = (history[-1] - history[-2]) / history[-2]
-                total_change += change_pct
-                count += 1
-        avg_change = total_change / count if count > 0 else 0
+        indices = self.data["indices"]
+        names = list(indices.keys())
+        old_values = np.fromiter((indices[n]["value"] for n in names), dtype=np.float64, count=len(names))
+        # Apply both the random ±1% change and the index_modifier.
+        new_values = index_step(old_values, self.index_modifier, self.rng)
+        for name, new_value in zip(names, new_values.tolist()):
+            indices[name]["value"] = new_value
+            self.history.append(f"index:{name}", new_value)
+        self.history.flush()
+
+        # Average percentage change across indices.
+        moved = old_values != 0
+        avg_change = float(np.mean((new_values[moved] - old_values[moved]) / old_values[moved])) if moved.any() else 0
 
         # Clamp the base modifier to a reasonable range (e.g., ±3%).
         base_modifier = max(-0.03, min(0.03, avg_change))
@@ -501,9 +536,8 @@ class SpideyStocks(commands.Cog):
         update_message = f"**Market Update (as of {formatted_time}):**\n"
         for index_name, index in self.data.get("indices", {}).items():
             current_value = index.get("value", 0)
-            history = index.get("history", [])
-            if len(history) >= 2 and history[-2] != 0:
-                percent_change = ((history[-1] - history[-2]) / history[-2]) * 100
+            percent_change = self.pct_change(f"index:{index_name}")
+            if percent_change is not None:
                 update_message += f"{index_name}: {current_value:.1f} ({percent_change:+.2f}%)\n"
             else:
                 update_message += f"{index_name}: {current_value:.1f}\n"
@@ -529,10 +563,10 @@ class SpideyStocks(commands.Cog):
                         elif tier_roll < 0.6:
                             event = random.choice(SECTOR_EVENTS)
                             update_message += "\n**Sector News (Morning):**\n" + event["message"]
-                            for company in self.data["companies"].values():
+                            for symbol, company in self.data["companies"].items():
                                 if company.get("category") in event["affected_sectors"]:
                                     company["price"] = max(1.0, company["price"] * (1 + event["modifier"]))
-                                    company.setdefault("price_history", []).append(company["price"])
+                                    self.record_price(symbol, company)
                         else:
                             company_symbol = random.choice(list(self.data["companies"].keys()))
                             event = random.choice(INDIVIDUAL_EVENTS)
@@ -540,7 +574,7 @@ class SpideyStocks(commands.Cog):
                             update_message += "\n**Corporate News (Morning):**\n" + event_message
                             company = self.data["companies"][company_symbol]
                             company["price"] = max(1.0, company["price"] * (1 + event["modifier"]))
-                            company.setdefault("price_history", []).append(company["price"])
+                            self.record_price(company_symbol, company)
                 self.morning_event_triggered = True
         else:
             self.morning_event_triggered = False
@@ -562,10 +596,10 @@ class SpideyStocks(commands.Cog):
                         elif tier_roll < 0.6:
                             event = random.choice(SECTOR_EVENTS)
                             update_message += "\n**Sector News (Evening):**\n" + event["message"]
-                            for company in self.data["companies"].values():
+                            for symbol, company in self.data["companies"].items():
                                 if company.get("category") in event["affected_sectors"]:
                                     company["price"] = max(1.0, company["price"] * (1 + event["modifier"]))
-                                    company.setdefault("price_history", []).append(company["price"])
+                                    self.record_price(symbol, company)
                         else:
                             company_symbol = random.choice(list(self.data["companies"].keys()))
                             event = random.choice(INDIVIDUAL_EVENTS)
@@ -573,7 +607,7 @@ class SpideyStocks(commands.Cog):
                             update_message += "\n**Corporate News (Evening):**\n" + event_message
                             company = self.data["companies"][company_symbol]
                             company["price"] = max(1.0, company["price"] * (1 + event["modifier"]))
-                            company.setdefault("price_history", []).append(company["price"])
+                            self.record_price(company_symbol, company)
                 self.evening_event_triggered = True
         else:
             self.evening_event_triggered = False
@@ -590,10 +624,10 @@ class SpideyStocks(commands.Cog):
                 elif tier_roll < 0.6:
                     event = random.choice(SECTOR_EVENTS)
                     update_message += "\n**Sector News:**\n" + event["message"]
-                    for company in self.data["companies"].values():
+                    for symbol, company in self.data["companies"].items():
                         if company.get("category") in event["affected_sectors"]:
                             company["price"] = max(1.0, company["price"] * (1 + event["modifier"]))
-                            company.setdefault("price_history", []).append(company["price"])
+                            self.record_price(symbol, company)
                 else:
                     company_symbol = random.choice(list(self.data["companies"].keys()))
                     event = random.choice(INDIVIDUAL_EVENTS)
@@ -601,13 +635,14 @@ class SpideyStocks(commands.Cog):
                     update_message += "\n**Corporate News:**\n" + event_message
                     company = self.data["companies"][company_symbol]
                     company["price"] = max(1.0, company["price"] * (1 + event["modifier"]))
-                    company.setdefault("price_history", []).append(company["price"])
+                    self.record_price(company_symbol, company)
         
         channel_id = self.data.get("update_channel_id")
         if channel_id:
             channel = self.bot.get_channel(channel_id)
             if channel:
                 await channel.send(update_message)
+        self.history.flush()
         save_data(self.data)
 
 
@@ -670,11 +705,7 @@ class SpideyStocks(commands.Cog):
                 market_cap_str = self.abbreviate_number(int(market_cap))
                 available_str = self.abbreviate_number(available)
                 # Calculate percent change from the last two entries, if available
-                history = comp.get("price_history", [])
-                if len(history) >= 2 and history[-2] != 0:
-                    pct_change = ((history[-1] - history[-2]) / history[-2]) * 100
-                else:
-                    pct_change = 0
+                pct_change = self.pct_change(f"stock:{symbol}") or 0
                 line = (f"{rank:<4} {ticker:<6} {name:<20}"
                         f"{price:>10,.2f}{pct_change:>8.2f}"
                         f"{market_cap_str:>12}{available_str:>10}")
@@ -718,9 +749,8 @@ class SpideyStocks(commands.Cog):
         if indices:
             for index_name, index in indices.items():
                 current_value = index.get("value", 0)
-                history = index.get("history", [])
-                if len(history) >= 2 and history[-2] != 0:
-                    pct_change = ((history[-1] - history[-2]) / history[-2]) * 100
+                pct_change = self.pct_change(f"index:{index_name}")
+                if pct_change is not None:
                     message += f"{index_name}: {current_value:.1f} ({pct_change:+.2f}%)\n"
                 else:
                     message += f"{index_name}: {current_value:.1f}\n"
@@ -852,38 +882,33 @@ class SpideyStocks(commands.Cog):
 
     @stocks.command(name="stock_graph", description="Display a line graph of a stock's price history by ticker.")
     @app_commands.autocomplete(ticker=ticker_autocomplete)
-    @app_commands.describe(ticker="The ticker symbol of the company.")
-    async def stockgraph(self, interaction: discord.Interaction, ticker: str):
+    @app_commands.describe(ticker="The ticker symbol of the company.", span="Recent ticks (default), hourly closes or daily closes.")
+    async def stockgraph(self, interaction: discord.Interaction, ticker: str, span: Literal["recent", "hourly", "daily"] = "recent"):
         ticker = ticker.strip()
         symbol, company = self.get_company_by_ticker(ticker)
         if symbol is None or company is None:
             await interaction.response.send_message("That ticker does not exist.")
             return
         
-        price_history = company.get("price_history", [company["price"]])
-        times = list(range(len(price_history)))
-
-        plt.figure(figsize=(8,4))
-        plt.style.use('dark_background')
-        plt.plot(times, price_history, linestyle='-')
-        plt.title(f"{company['name']} Price History (Ticker: {company.get('ticker')})")
-        plt.xlabel("Time")
-        plt.ylabel("Price")
-        plt.tight_layout()
-
-        buf = io.BytesIO()
-        plt.savefig(buf, format="png")
-        plt.close()
-        buf.seek(0)
+        times, price_history = self.series_points(f"stock:{symbol}", span)
+        if not price_history:
+            times, price_history = [datetime.now(MARKET_TZ)], [company["price"]]
+
+        await interaction.response.defer()
+        buf = await self.charts.render_file(
+            render_history,
+            f"{company['name']} Price History (Ticker: {company.get('ticker')})",
+            times, price_history, "Price",
+        )
         file = discord.File(fp=buf, filename="stockgraph.png")
 
         embed = discord.Embed(
             title=f"{company['name']} Stock Price History",
-            description="Price history over the recent period.",
+            description=f"Price history ({span}).",
             color=discord.Color.green()
         )
         embed.set_image(url="attachment://stockgraph.png")
-        await interaction.response.send_message(embed=embed, file=file)
+        await interaction.followup.send(embed=embed, file=file)
 
     async def index_name_autocomplete(self, interaction: discord.Interaction, current: str):
         current = current.strip().lower()
@@ -896,9 +921,9 @@ class SpideyStocks(commands.Cog):
         return suggestions
     
     @stocks.command(name="index_graph", description="Display a line graph of a market index's history.")
-    @app_commands.describe(index_name="The name of the market index (e.g., 'Dough Jones Index').")
+    @app_commands.describe(index_name="The name of the market index (e.g., 'Dough Jones Index').", span="Recent values (default), hourly closes or daily closes.")
     @app_commands.autocomplete(index_name=index_name_autocomplete)
-    async def indexgraph(self, interaction: discord.Interaction, index_name: str):
+    async def indexgraph(self, interaction: discord.Interaction, index_name: str, span: Literal["recent", "hourly", "daily"] = "recent"):
         """
         Display the history of a market index as a line graph.
         Example: /indexgraph "Dough Jones Index"
@@ -909,35 +934,23 @@ class SpideyStocks(commands.Cog):
             await interaction.response.send_message("That index does not exist. Please check the index name.")
             return
 
-        index = indices[index_name]
-        history = index.get("history", [])
+        times, history = self.series_points(f"index:{index_name}", span)
         if not history:
             await interaction.response.send_message("No history data available for this index.")
             return
 
         # Generate a line graph for the index history.
-        times = list(range(len(history)))
-        plt.figure(figsize=(8, 4))
-        plt.style.use('dark_background')
-        plt.plot(times, history, linestyle='-')
-        plt.title(f"{index_name} History")
-        plt.xlabel("Time")
-        plt.ylabel("Index Value")
-        plt.tight_layout()
-
-        buf = io.BytesIO()
-        plt.savefig(buf, format="png")
-        plt.close()
-        buf.seek(0)
+        await interaction.response.defer()
+        buf = await self.charts.render_file(render_history, f"{index_name} History", times, history, "Index Value")
         file = discord.File(fp=buf, filename="indexgraph.png")
 
         embed = discord.Embed(
             title=f"{index_name} History",
-            description="Index history over the recent period.",
+            description=f"Index history ({span}).",
             color=discord.Color.blue()
         )
         embed.set_image(url="attachment://indexgraph.png")
-        await interaction.response.send_message(embed=embed, file=file)
+        await interaction.followup.send(embed=embed, file=file)
     
 
     @commands.command(name="reset_market", hidden=True)
@@ -975,7 +988,14 @@ class SpideyStocks(commands.Cog):
                 grant = int(max(MIN_HOLD, min(MAX_HOLD, raw_grant)))
                 port[sym] = grant
 
-        # 5) persist & confirm
+        # 5) restart the price/index series from the baseline seeds
+        for sym, comp in self.data["companies"].items():
+            self.history.reset(f"stock:{sym}", comp.pop("price_history", None) or [comp["price"]])
+        for name, index in self.data["indices"].items():
+            self.history.reset(f"index:{name}", index.pop("history", None) or [index["value"]], spacing=1800)
+        self.history.flush()
+
+        # 6) persist & confirm
         save_data(self.data)
         await ctx.send("✅ Market reset complete: companies and indices restored; shareholders re-allocated via hybrid formula.")
 
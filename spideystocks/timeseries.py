@@ -0,0 +1,334 @@
+from __future__ import annotations
+import os
+import struct
+import time
+from array import array
+from datetime import datetime
+
+MAGIC = b"SPSTK1\n"
+# Rewrite the append-only file from memory once it grows past this.
+COMPACT_BYTES = 4_000_000
+
+HOURLY_CAPACITY = 24 * 120  # ~4 months of trading hours
+DAILY_CAPACITY = 365 * 5
+
+_NAME = struct.Struct("<BHH")      # kind, series id, name length (+ utf-8 name)
+_TICK = struct.Struct("<BHdd")     # kind, series id, ts, value
+_BAR = struct.Struct("<BHBddddd")  # kind, series id, tier, ts, open, high, low, close
+_CLEAR = struct.Struct("<BH")      # kind, series id
+K_NAME, K_TICK, K_BAR, K_CLEAR = 0, 1, 2, 3
+
+TIERS = ("hourly", "daily")
+
+
+class RingBuffer:
+    """Fixed-capacity (timestamp, value) ring over two array('d')s."""
+
+    __slots__ = ("capacity", "ts", "vals", "head", "count")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.ts = array("d", bytes(8 * capacity))
+        self.vals = array("d", bytes(8 * capacity))
+        self.head = 0  # next write slot
+        self.count = 0
+
+    def append(self, ts: float, value: float) -> None:
+        self.ts[self.head] = ts
+        self.vals[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def clear(self) -> None:
+        self.head = 0
+        self.count = 0
+
+    def _order(self):
+        start = (self.head - self.count) % self.capacity
+        if start + self.count <= self.capacity:
+            return [(start, start + self.count)]
+        return [(start, self.capacity), (0, self.head)]
+
+    def values(self) -> list[float]:
+        out: list[float] = []
+        for a, b in self._order():
+            out.extend(self.vals[a:b])
+        return out
+
+    def times(self) -> list[float]:
+        out: list[float] = []
+        for a, b in self._order():
+            out.extend(self.ts[a:b])
+        return out
+
+    def last(self, n: int = 1) -> list[float]:
+        n = min(n, self.count)
+        return [self.vals[(self.head - n + i) % self.capacity] for i in range(n)]
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class OHLCRing:
+    """Ring of OHLC bars; the newest bar is updated in place while ticks land in its bucket."""
+
+    __slots__ = ("capacity", "ts", "o", "h", "l", "c", "head", "count")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.ts = array("d", bytes(8 * capacity))
+        self.o = array("d", bytes(8 * capacity))
+        self.h = array("d", bytes(8 * capacity))
+        self.l = array("d", bytes(8 * capacity))
+        self.c = array("d", bytes(8 * capacity))
+        self.head = 0
+        self.count = 0
+
+    def _last(self) -> int:
+        return (self.head - 1) % self.capacity
+
+    def last_ts(self) -> float | None:
+        return self.ts[self._last()] if self.count else None
+
+    def put_bar(self, bucket: float, o: float, h: float, l: float, c: float) -> None:
+        i = self.head
+        self.ts[i], self.o[i], self.h[i], self.l[i], self.c[i] = bucket, o, h, l, c
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def add(self, bucket: float, value: float) -> bool:
+        """Fold a tick into its bucket. Returns False for ticks older than the newest bar."""
+        last = self.last_ts()
+        if last is not None and bucket < last:
+            return False
+        if last is not None and bucket == last:
+            i = self._last()
+            if value > self.h[i]:
+                self.h[i] = value
+            if value < self.l[i]:
+                self.l[i] = value
+            self.c[i] = value
+            return True
+        self.put_bar(bucket, value, value, value, value)
+        return True
+
+    def clear(self) -> None:
+        self.head = 0
+        self.count = 0
+
+    def bars(self) -> list[tuple[float, float, float, float, float]]:
+        start = (self.head - self.count) % self.capacity
+        return [
+            (self.ts[j], self.o[j], self.h[j], self.l[j], self.c[j])
+            for j in ((start + k) % self.capacity for k in range(self.count))
+        ]
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class Series:
+    __slots__ = ("sid", "name", "raw", "hourly", "daily")
+
+    def __init__(self, sid: int, name: str, raw_capacity: int):
+        self.sid = sid
+        self.name = name
+        self.raw = RingBuffer(raw_capacity)
+        self.hourly = OHLCRing(HOURLY_CAPACITY)
+        self.daily = OHLCRing(DAILY_CAPACITY)
+
+
+class TimeSeriesStore:
+    """
+    Price/index history kept out of market_data.json.
+
+    Each series has a raw ring of recent ticks plus hourly and daily OHLC rollups,
+    all backed by array('d'). Changes go to an append-only binary log (`path`) that
+    is replayed on start-up and rewritten from memory once it passes COMPACT_BYTES.
+    Daily buckets follow the market's local calendar day (`tz`).
+    """
+
+    def __init__(self, path: str, tz, raw_capacity: dict[str, int] | None = None, default_capacity: int = 288):
+        self.path = path
+        self.tz = tz
+        self.raw_capacity = raw_capacity or {}
+        self.default_capacity = default_capacity
+        self.series: dict[str, Series] = {}
+        self._by_id: dict[int, Series] = {}
+        self._pending: list[bytes] = []
+        self._load()
+
+    # ---------- buckets ----------
+
+    def _capacity_for(self, name: str) -> int:
+        prefix = name.split(":", 1)[0]
+        return self.raw_capacity.get(prefix, self.default_capacity)
+
+    @staticmethod
+    def hour_bucket(ts: float) -> float:
+        return float(int(ts // 3600) * 3600)
+
+    def day_bucket(self, ts: float) -> float:
+        d = datetime.fromtimestamp(ts, self.tz)
+        return d.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+
+    # ---------- series ----------
+
+    def _get(self, name: str, *, log: bool = True) -> Series:
+        s = self.series.get(name)
+        if s is None:
+            sid = len(self._by_id) + 1
+            while sid in self._by_id:
+                sid += 1
+            s = self._register(sid, name)
+            if log:
+                raw = name.encode("utf-8")
+                self._pending.append(_NAME.pack(K_NAME, sid, len(raw)) + raw)
+        return s
+
+    def _register(self, sid: int, name: str) -> Series:
+        s = Series(sid, name, self._capacity_for(name))
+        self.series[name] = s
+        self._by_id[sid] = s
+        return s
+
+    def _fold(self, s: Series, ts: float, value: float) -> None:
+        s.raw.append(ts, value)
+        s.hourly.add(self.hour_bucket(ts), value)
+        s.daily.add(self.day_bucket(ts), value)
+
+    def append(self, name: str, value: float, ts: float | None = None) -> None:
+        ts = time.time() if ts is None else float(ts)
+        s = self._get(name)
+        self._fold(s, ts, float(value))
+        self._pending.append(_TICK.pack(K_TICK, s.sid, ts, float(value)))
+
+    def reset(self, name: str, seed: list[float] | None = None, spacing: float = 300.0) -> None:
+        """Drop a series' history (e.g. a market reset), optionally seeding recent values."""
+        s = self._get(name)
+        s.raw.clear()
+        s.hourly.clear()
+        s.daily.clear()
+        self._pending.append(_CLEAR.pack(K_CLEAR, s.sid))
+        if seed:
+            now = time.time()
+            for i, v in enumerate(seed):
+                self.append(name, v, now - spacing * (len(seed) - 1 - i))
+
+    def has(self, name: str) -> bool:
+        s = self.series.get(name)
+        return bool(s and len(s.raw))
+
+    # ---------- reads ----------
+
+    def last(self, name: str, n: int = 1) -> list[float]:
+        s = self.series.get(name)
+        return s.raw.last(n) if s else []
+
+    def recent(self, name: str) -> tuple[list[float], list[float]]:
+        s = self.series.get(name)
+        if not s:
+            return [], []
+        return s.raw.times(), s.raw.values()
+
+    def bars(self, name: str, tier: str) -> list[tuple[float, float, float, float, float]]:
+        s = self.series.get(name)
+        if not s:
+            return []
+        return (s.hourly if tier == "hourly" else s.daily).bars()
+
+    # ---------- persistence ----------
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as fh:
+            blob = fh.read()
+        if not blob.startswith(MAGIC):
+            return
+        pos = len(MAGIC)
+        n = len(blob)
+        while pos < n:
+            kind = blob[pos]
+            if kind == K_NAME:
+                if pos + _NAME.size > n:
+                    break
+                _, sid, ln = _NAME.unpack_from(blob, pos)
+                end = pos + _NAME.size + ln
+                if end > n:
+                    break
+                name = blob[pos + _NAME.size:end].decode("utf-8")
+                if name not in self.series:
+                    self._register(sid, name)
+                pos = end
+            elif kind == K_TICK:
+                if pos + _TICK.size > n:
+                    break
+                _, sid, ts, v = _TICK.unpack_from(blob, pos)
+                s = self._by_id.get(sid)
+                if s:
+                    self._fold(s, ts, v)
+                pos += _TICK.size
+            elif kind == K_BAR:
+                if pos + _BAR.size > n:
+                    break
+                _, sid, tier, ts, o, h, l, c = _BAR.unpack_from(blob, pos)
+                s = self._by_id.get(sid)
+                if s:
+                    (s.hourly if tier == 0 else s.daily).put_bar(ts, o, h, l, c)
+                pos += _BAR.size
+            elif kind == K_CLEAR:
+                if pos + _CLEAR.size > n:
+                    break
+                _, sid = _CLEAR.unpack_from(blob, pos)
+                s = self._by_id.get(sid)
+                if s:
+                    s.raw.clear()
+                    s.hourly.clear()
+                    s.daily.clear()
+                pos += _CLEAR.size
+            else:
+                break
+        if pos < n:
+            # torn or unknown tail from a crash mid-write
+            with open(self.path, "r+b") as fh:
+                fh.truncate(pos)
+
+    def flush(self) -> int:
+        """Append pending records. Returns bytes written."""
+        if not self._pending:
+            return 0
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        payload = b"".join(self._pending)
+        with open(self.path, "ab") as fh:
+            if new_file:
+                fh.write(MAGIC)
+            fh.write(payload)
+        self._pending.clear()
+        if os.path.getsize(self.path) > COMPACT_BYTES:
+            self.compact()
+        return len(payload)
+
+    def compact(self) -> None:
+        """Rewrite the log as names + rollup bars + the raw rings."""
+        parts = [MAGIC]
+        for s in self.series.values():
+            raw = s.name.encode("utf-8")
+            parts.append(_NAME.pack(K_NAME, s.sid, len(raw)) + raw)
+        for s in self.series.values():
+            for tier, ring in ((0, s.hourly), (1, s.daily)):
+                for ts, o, h, l, c in ring.bars():
+                    parts.append(_BAR.pack(K_BAR, s.sid, tier, ts, o, h, l, c))
+            # ticks after the bars: folding them again only re-touches the newest bucket
+            for ts, v in zip(s.raw.times(), s.raw.values()):
+                parts.append(_TICK.pack(K_TICK, s.sid, ts, v))
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(b"".join(parts))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, self.path)
+        self._pending.clear()
@@ -0,0 +1,127 @@
+"""
+Time research availability and bonus lookups on the largest tech-tree branch,
+tree walk against TechTreeIndex.
+
+    python spideyutils/bench_tech_index.py --lookups 20000
+
+The walk is the tree traversal get_available_techs and calculate_total_bonus did
+before the index. The country steps through the branch one unlocked tech at a
+time; at every step both paths must agree. "index, cold" drops the country's
+cached state before each lookup (as a research change does), "index, warm" is a
+repeat lookup such as an autocomplete keystroke. Needs only cold_war.json.
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import time
+from collections import Counter
+
+if __package__:
+    from .tech_index import TechTreeIndex
+else:  # run as a script, without the package __init__ (which loads the cog)
+    from tech_index import TechTreeIndex
+
+COLD_WAR_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cold_war.json")
+SPIRITS = [
+    {"name": f"Spirit {n}", "research_bonus": {"generic": 0.01, "NAVAL": 0.02, "AERIAL": 0.02}}
+    for n in range(6)
+]
+
+
+def walk_available(branch: str, country_data: dict, tech_tree: dict) -> list[str]:
+    """The pre-index tree walk."""
+    unlocked = country_data.get("RESEARCH", {}).get("unlocked_techs", [])
+    active = [
+        data["tech"]
+        for data in country_data.get("RESEARCH", {}).get("active_slots", {}).values()
+        if isinstance(data, dict) and "tech" in data
+    ]
+    available = []
+    branch_data = tech_tree.get(branch, {})
+    branch_starter = branch_data.get("branch", {}).get("starter_tech")
+    if branch_starter and branch_starter not in unlocked and branch_starter not in active:
+        available.append(branch_starter)
+        return available
+    for _key, sub_branch in branch_data.items():
+        if not isinstance(sub_branch, dict):
+            continue
+        starter = sub_branch.get("starter_tech")
+        if starter and starter not in unlocked and starter not in active:
+            available.append(starter)
+            continue
+        node = sub_branch.get("child")
+        previous = None
+        while node:
+            tech = node.get("tech")
+            if tech and tech not in unlocked and tech not in active:
+                parent = sub_branch.get("starter_tech") if previous is None else previous.get("tech")
+                if parent in unlocked:
+                    available.append(tech)
+                    break
+            previous = node
+            node = node.get("child")
+    return available
+
+
+def walk_bonus(country_data: dict, branch: str) -> float:
+    total = country_data["RESEARCH"]["research_bonus"]
+    for spirit in country_data.get("national_spirits", []):
+        bonuses = spirit.get("research_bonus") or spirit.get("modifiers", {}).get("research_bonus", {})
+        total += bonuses.get(branch.upper(), 0.0)
+        total += bonuses.get("generic", 0.0)
+    return total
+
+
+def _time(fn, lookups: int) -> float:
+    """Mean microseconds per call."""
+    t0 = time.perf_counter()
+    for _ in range(lookups):
+        fn()
+    return (time.perf_counter() - t0) / lookups * 1e6
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--lookups", type=int, default=20_000, help="lookups per progress step")
+    args = parser.parse_args(argv)
+
+    with open(COLD_WAR_FILE, encoding="utf-8") as f:
+        tech_tree = json.load(f)["TECH_TREE"]
+    index = TechTreeIndex(tech_tree)
+    branch, size = Counter(node.branch for node in index.nodes).most_common(1)[0]
+    order = [node.name for node in index.nodes if node.branch == branch]
+    print(f"largest branch: {branch} ({size} techs)")
+
+    totals = Counter()
+    for step in range(len(order) + 1):
+        country = {
+            "RESEARCH": {"unlocked_techs": order[:step], "active_slots": {}, "research_bonus": 0.05},
+            "national_spirits": SPIRITS,
+        }
+        index.touch("bench")
+        expected = walk_available(branch, country, tech_tree)
+        assert index.available_for("bench", country, branch) == expected, f"mismatch after {step} techs"
+        assert abs(index.total_bonus("bench", country, branch) - walk_bonus(country, branch)) < 1e-9
+
+        totals["walk"] += _time(lambda: (walk_available(branch, country, tech_tree), walk_bonus(country, branch)), args.lookups)
+
+        def cold():
+            index.touch("bench")
+            index.available_for("bench", country, branch)
+            index.total_bonus("bench", country, branch)
+
+        totals["index, cold"] += _time(cold, args.lookups)
+        totals["index, warm"] += _time(
+            lambda: (index.available_for("bench", country, branch), index.total_bonus("bench", country, branch)),
+            args.lookups,
+        )
+
+    steps = len(order) + 1
+    print(f"availability + bonus, mean over {steps} progress steps (results match the walk at every step):")
+    for name, total in totals.items():
+        print(f"  {name:<12} {total / steps:7.2f} us")
+
+
+if __name__ == "__main__":
+    main()
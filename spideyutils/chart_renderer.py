@@ -0,0 +1,183 @@
+from __future__ import annotations
+import asyncio
+import functools
+import hashlib
+import multiprocessing
+import os
+import pickle
+import site
+import time
+from collections import OrderedDict, deque
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+CHART_WORKERS = 2
+CHART_CACHE_ENTRIES = 128
+# Red installs each cog on its own, so every charting cog ships a copy of this file
+# (spideygov, spideystocks, spideyutils, thirtyyearswarrp). Keep them byte-identical:
+# edit one, copy it over the others, and run `python tools/check_shared_copies.py`.
+# Cogs only share a renderer when their copies match: the bot attribute is keyed by a
+# hash of this file, so a stale copy gets a renderer of its own instead of a mismatched one.
+with open(__file__, "rb") as _source:
+    RENDERER_REVISION = hashlib.blake2b(_source.read(), digest_size=6).hexdigest()
+# Attribute on the bot that every chart-drawing cog shares, so one pool serves them all.
+_BOT_ATTR = "_spidey_chart_renderer_" + RENDERER_REVISION
+# Red imports cogs from their install folder without putting it on sys.path, so
+# workers add it themselves before unpickling a cog's render function.
+_COGS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def figure_png(fig: Figure, **savefig_kwargs) -> bytes:
+    """Rasterise a Figure through its own Agg canvas (no pyplot state involved)."""
+    FigureCanvasAgg(fig)
+    buf = BytesIO()
+    fig.savefig(buf, format="png", **savefig_kwargs)
+    return buf.getvalue()
+
+
+class ChartRenderer:
+    """
+    Renders charts off the event loop in a small process pool.
+
+    Render functions are module-level and take plain data, build a Figure with the
+    object-oriented API and return PNG bytes. Results are cached by a hash of the
+    function and its arguments, and identical requests already in flight share one
+    render. If the pool breaks (or can't start) rendering falls back to a thread.
+
+    Workers are started with forkserver (or spawn), never fork, so they don't
+    inherit the bot's event loop, sockets or threads.
+    """
+
+    def __init__(self, workers: int = CHART_WORKERS, max_entries: int = CHART_CACHE_ENTRIES):
+        self.workers = workers
+        self.max_entries = max_entries
+        self.users = 0
+        self._executor: ProcessPoolExecutor | None = None
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self.latencies: deque[float] = deque(maxlen=1024)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(fn: Callable, args: tuple, kwargs: dict) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{fn.__module__}.{fn.__qualname__}".encode())
+        h.update(pickle.dumps((args, sorted(kwargs.items())), protocol=4))
+        return h.hexdigest()
+
+    def _pool(self) -> ProcessPoolExecutor | None:
+        if self._executor is None:
+            try:
+                method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(method),
+                    initializer=site.addsitedir,
+                    initargs=(_COGS_DIR,),
+                )
+            except (OSError, NotImplementedError) as e:
+                print(f"Chart pool unavailable, rendering in threads: {e}")
+                return None
+        return self._executor
+
+    async def _run(self, call: Callable[[], bytes]) -> bytes:
+        loop = asyncio.get_running_loop()
+        pool = self._pool()
+        if pool is not None:
+            try:
+                return await loop.run_in_executor(pool, call)
+            except BrokenProcessPool as e:
+                print(f"Chart pool broke, restarting: {e}")
+                self._executor = None
+            except ImportError as e:
+                print(f"Chart worker couldn't import the render function, using a thread: {e}")
+        return await asyncio.to_thread(call)
+
+    async def render(self, fn: Callable[..., bytes], *args, **kwargs) -> bytes:
+        key = self.key(fn, args, kwargs)
+        png = self._cache.get(key)
+        if png is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return png
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        t0 = time.perf_counter()
+        try:
+            png = await self._run(functools.partial(fn, *args, **kwargs))
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved when nobody else is waiting
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        self.latencies.append(time.perf_counter() - t0)
+        fut.set_result(png)
+
+        self._cache[key] = png
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return png
+
+    async def render_file(self, fn: Callable[..., bytes], *args, **kwargs) -> BytesIO:
+        return BytesIO(await self.render(fn, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        lat = sorted(self.latencies)
+
+        def pct(p: float) -> float:
+            if not lat:
+                return 0.0
+            return round(lat[min(len(lat) - 1, int(p * len(lat)))] * 1000.0, 1)
+
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._cache),
+            "hit_ratio": (self.hits / total) if total else 0.0,
+            "renders": len(lat),
+            "p50_ms": pct(0.50),
+            "p99_ms": pct(0.99),
+        }
+
+
+def get_renderer(bot) -> ChartRenderer:
+    """The bot-wide renderer; each cog that draws charts takes a reference on load."""
+    renderer = getattr(bot, _BOT_ATTR, None)
+    if renderer is None:
+        renderer = ChartRenderer()
+        setattr(bot, _BOT_ATTR, renderer)
+    renderer.users += 1
+    return renderer
+
+
+def release_renderer(bot) -> None:
+    """Drop a cog's reference; the pool shuts down with the last one."""
+    renderer = getattr(bot, _BOT_ATTR, None)
+    if renderer is None:
+        return
+    renderer.users -= 1
+    if renderer.users <= 0:
+        renderer.shutdown()
+        delattr(bot, _BOT_ATTR)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from matplotlib.figure import Figure
+
+from .chart_renderer import figure_png
+
+
+# ---------- render functions (run in the pool) ----------
+
+def render_ideology_donut(country_name: str, labels: list[str], values: list[float], colors: list) -> bytes:
+    """Ideology donut; values are percentages, tiny slices move to a legend."""
+    from matplotlib.patches import Circle
+
+    fig = Figure(figsize=(6, 6))
+    ax = fig.add_subplot()
+    wedges, texts, autotexts = ax.pie(
+        values, labels=labels, colors=colors, startangle=90,
+        autopct=lambda pct: f"{pct:.0f}%" if pct >= 4 else "",
+        pctdistance=0.72, labeldistance=1.05,
+    )
+    ax.add_artist(Circle((0, 0), 0.60, fc="white"))
+    ax.set_title(f"{country_name} — Ideology Breakdown")
+    ax.axis("equal")
+    if any(t.get_text() == "" for t in autotexts):
+        ax.legend(wedges, labels, loc="lower center", bbox_to_anchor=(0.5, -0.02), ncol=3, frameon=False)
+    return figure_png(fig, bbox_inches="tight", dpi=200)
@@ -0,0 +1,539 @@
+from __future__ import annotations
+import asyncio
+import contextlib
+import copy
+import json
+import os
+import tempfile
+import time
+from typing import Any
+
+# Write-behind: flush this long after the last change, but never later than FLUSH_MAX_DELAY
+# after the first unsaved one.
+FLUSH_DELAY = 2.0
+FLUSH_MAX_DELAY = 10.0
+
+# Reference sections of cold_war.json that commands only ever read. When the overlay
+# doesn't touch them the merged view shares one frozen (read-only) copy per process
+# instead of copying them per load.
+READ_ONLY_SECTIONS = ("TECH_TREE", "DOCTRINES", "NATIONAL PROJECTS", "PRODUCTION", "REGIONS", "ESPIONAGE")
+
+_STATIC_CACHE: dict[str, tuple[float, dict]] = {}
+# id(static section) -> its frozen twin, so every load shares one read-only copy
+_FROZEN_CACHE: dict[int, tuple[Any, Any]] = {}
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError("static Cold War data is shared and read-only; copy.deepcopy() it first")
+
+
+class FrozenDict(dict):
+    """A dict that refuses changes. Copies of it are plain, mutable dicts."""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def copy(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo) -> dict:
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce_ex__(self, protocol):
+        return (dict, (), None, None, iter(self.items()))
+
+
+class FrozenList(list):
+    """A list that refuses changes. Copies of it are plain, mutable lists."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+
+    def copy(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo) -> list:
+        return [copy.deepcopy(v, memo) for v in self]
+
+    def __reduce_ex__(self, protocol):
+        return (list, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """A read-only deep twin of parsed JSON (dicts and lists; leaves are immutable already)."""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+def _frozen_section(section: Any) -> Any:
+    hit = _FROZEN_CACHE.get(id(section))
+    if hit is None or hit[0] is not section:
+        hit = _FROZEN_CACHE[id(section)] = (section, freeze(section))
+    return hit[1]
+
+
+def load_static(path: str) -> dict:
+    """Parse the static layer once per process (re-read only if the file changes on disk)."""
+    mtime = os.path.getmtime(path)
+    hit = _STATIC_CACHE.get(path)
+    if hit and hit[0] == mtime:
+        return hit[1]
+    with open(path, "r") as f:
+        data = json.load(f)
+    _STATIC_CACHE[path] = (mtime, data)
+    return data
+
+
+def union_into(base: list, items: list) -> list:
+    """Append items not already in `base`, keeping order. Set-backed for hashable items."""
+    seen = set()
+    unhashable = []
+    for x in base:
+        try:
+            seen.add(x)
+        except TypeError:
+            unhashable.append(x)
+    for item in items:
+        try:
+            if item in seen:
+                continue
+            seen.add(item)
+        except TypeError:
+            if item in unhashable:
+                continue
+            unhashable.append(item)
+        base.append(item)
+    return base
+
+
+def deep_merge(base: dict, overlay: dict) -> dict:
+    """
+    Overlay `overlay` onto `base` with “additive” merge semantics:
+     - dicts  ⇒ recurse
+     - numbers ⇒ base + overlay
+     - lists   ⇒ extend base by any items in overlay not already present
+     - everything else ⇒ replace
+    """
+    for k, v in overlay.items():
+        if k in base and isinstance(base[k], dict) and isinstance(v, dict):
+            deep_merge(base[k], v)
+
+        elif k in base and isinstance(base[k], (int, float)) and isinstance(v, (int, float)):
+            # numeric delta
+            base[k] = base[k] + v
+
+        elif k in base and isinstance(base[k], list) and isinstance(v, list):
+            # union-merge lists of primitives
+            union_into(base[k], v)
+
+        else:
+            # strings, bools, None, or mismatched types → override
+            base[k] = v
+
+    return base
+
+
+class LazyCountries(dict):
+    """
+    The merged COUNTRIES mapping. A country is only deep-copied out of the static layer
+    and merged with its overlay the first time something looks at it; bulk access
+    (iteration, items(), len) materializes whatever is still pending, in original order.
+    """
+
+    def __init__(self, static_countries: dict, overlay_countries: dict):
+        super().__init__()
+        self._static = static_countries
+        self._overlay = overlay_countries
+        self._order = list(static_countries) + [k for k in overlay_countries if k not in static_countries]
+        self._pending = set(self._order)
+
+    def is_pending(self, name: str) -> bool:
+        return name in self._pending
+
+    def _build(self, name: str) -> None:
+        base = copy.deepcopy(self._static.get(name, {}))
+        ov = self._overlay.get(name)
+        if isinstance(ov, dict):
+            deep_merge(base, ov)
+        elif ov is not None:
+            base = copy.deepcopy(ov)
+        dict.__setitem__(self, name, base)
+        self._pending.discard(name)
+
+    def _fill(self) -> None:
+        if not self._pending:
+            return
+        for name in self._order:
+            if name in self._pending:
+                self._build(name)
+        # lazy builds happened out of order; put keys back the way the files list them
+        built = {k: dict.__getitem__(self, k) for k in self._order if dict.__contains__(self, k)}
+        extra = {k: v for k, v in dict.items(self) if k not in built}
+        dict.clear(self)
+        dict.update(self, built)
+        dict.update(self, extra)
+
+    def peek(self, name: str, key: str, default: Any = None) -> Any:
+        """Merged value of one top-level scalar (e.g. player_id) without materializing the country."""
+        if name not in self._pending:
+            return dict.get(self, name, {}).get(key, default)
+        probe: dict = {}
+        st = self._static.get(name, {})
+        if isinstance(st, dict) and key in st:
+            probe[key] = copy.deepcopy(st[key])
+        ov = self._overlay.get(name, {})
+        if isinstance(ov, dict) and key in ov:
+            deep_merge(probe, {key: copy.deepcopy(ov[key])})
+        return probe.get(key, default)
+
+    def names(self) -> list[str]:
+        """Country keys in file order, without materializing anything."""
+        return self._order + [k for k in dict.keys(self) if k not in self._order]
+
+    # single-key access
+    def __getitem__(self, name):
+        if name in self._pending:
+            self._build(name)
+        return dict.__getitem__(self, name)
+
+    def get(self, name, default=None):
+        if name in self._pending:
+            self._build(name)
+        return dict.get(self, name, default)
+
+    def __contains__(self, name):
+        return name in self._pending or dict.__contains__(self, name)
+
+    def setdefault(self, name, default=None):
+        if name in self._pending:
+            self._build(name)
+        return dict.setdefault(self, name, default)
+
+    def __setitem__(self, name, value):
+        self._pending.discard(name)
+        dict.__setitem__(self, name, value)
+
+    def __delitem__(self, name):
+        if name in self._pending:
+            self._build(name)
+        dict.__delitem__(self, name)
+
+    def pop(self, name, *default):
+        if name in self._pending:
+            self._build(name)
+        return dict.pop(self, name, *default)
+
+    # bulk access
+    def __iter__(self):
+        self._fill()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        return len(self._pending) + dict.__len__(self)
+
+    def keys(self):
+        self._fill()
+        return dict.keys(self)
+
+    def values(self):
+        self._fill()
+        return dict.values(self)
+
+    def items(self):
+        self._fill()
+        return dict.items(self)
+
+    def copy(self):
+        self._fill()
+        return dict(dict.items(self))
+
+    def __eq__(self, other):
+        self._fill()
+        return dict.__eq__(self, other)
+
+    def __repr__(self):
+        self._fill()
+        return dict.__repr__(self)
+
+    def __reduce_ex__(self, protocol):
+        # deepcopy / pickle see a plain, fully merged dict
+        self._fill()
+        return (dict, (), None, None, iter(dict.items(self)))
+
+
+def _apply_set(root: dict, path: list, value: Any) -> None:
+    node = root
+    for key in path[:-1]:
+        nxt = node.get(key)
+        if not isinstance(nxt, dict):
+            nxt = {}
+            node[key] = nxt
+        node = nxt
+    node[path[-1]] = value
+
+
+class ColdWarState:
+    """
+    Layered Cold War RP state.
+
+      static  – cold_war.json, parsed once per process and never written
+      overlay – cold_war_modifiers.json, the dynamic layer every command edits
+      view    – static ⊕ overlay, with countries merged lazily on first use
+
+    Path-addressed changes go through `apply()`, which updates the overlay, patches the
+    view, and appends the resulting value to `<modifiers>.deltas` (absolute values, so a
+    replay after a crash is idempotent). The overlay file itself is rewritten
+    write-behind on a debounce, or once at the end of a `batch()`.
+    """
+
+    def __init__(self, static_path: str, dynamic_path: str, *, flush_delay: float = FLUSH_DELAY,
+                 max_delay: float = FLUSH_MAX_DELAY):
+        self.static_path = static_path
+        self.dynamic_path = dynamic_path
+        self.delta_path = dynamic_path + ".deltas"
+        self.flush_delay = flush_delay
+        self.max_delay = max_delay
+
+        self.static: dict = {}
+        self.overlay: dict = {}
+        self.view: dict = {}
+
+        self.dirty = False
+        self._timer: asyncio.TimerHandle | None = None
+        self._first_dirty: float | None = None
+        self._batch_depth = 0
+        self._batched: list[str] = []
+
+        self.deltas = 0
+        self.flushes = 0
+        self.last_flush_ms = 0.0
+
+    # ---------- loading ----------
+
+    def load(self, default_overlay: dict, *, discard_pending: bool = False) -> dict:
+        """(Re)build all three layers. Returns the merged view."""
+        self._cancel_timer()
+        self._batched.clear()
+        self.static = load_static(self.static_path)
+
+        if os.path.exists(self.dynamic_path):
+            with open(self.dynamic_path, "r") as f:
+                self.overlay = json.load(f)
+        else:
+            self.overlay = copy.deepcopy(default_overlay)
+        # LazyCountries keeps a reference to this dict, so it has to exist up front
+        if not isinstance(self.overlay.get("COUNTRIES"), dict):
+            self.overlay["COUNTRIES"] = {}
+
+        replayed = 0
+        if discard_pending:
+            self._truncate_deltas()
+        else:
+            replayed = self._replay_deltas()
+
+        self.view = self._materialize()
+        self.dirty = False
+        if replayed:
+            self.dirty = True
+            self.flush()
+        return self.view
+
+    def _replay_deltas(self) -> int:
+        n = 0
+        try:
+            with open(self.delta_path, "r", encoding="utf-8") as fh:
+                for line in fh:
+                    if not line.endswith("\n"):
+                        break  # torn tail
+                    try:
+                        path, value = json.loads(line)
+                    except ValueError:
+                        break
+                    _apply_set(self.overlay, path, value)
+                    n += 1
+        except FileNotFoundError:
+            pass
+        return n
+
+    def _materialize(self) -> dict:
+        view: dict = {}
+        keys = list(self.static) + [k for k in self.overlay if k not in self.static]
+        for k in keys:
+            st = self.static.get(k)
+            ov = self.overlay.get(k)
+            if k == "COUNTRIES":
+                view[k] = LazyCountries(st or {}, ov or {})
+            elif k in READ_ONLY_SECTIONS and k not in self.overlay:
+                view[k] = _frozen_section(st)
+            elif k not in self.overlay:
+                view[k] = copy.deepcopy(st)
+            elif k not in self.static:
+                view[k] = copy.deepcopy(ov)
+            else:
+                merged = deep_merge({k: copy.deepcopy(st)}, {k: copy.deepcopy(ov)})
+                view[k] = merged[k]
+        return view
+
+    def players(self) -> dict[str, Any]:
+        """{country: player_id} in file order, without merging every country."""
+        countries = self.view.get("COUNTRIES", {})
+        if isinstance(countries, LazyCountries):
+            return {name: countries.peek(name, "player_id") for name in countries.names()}
+        return {name: details.get("player_id") for name, details in countries.items()}
+
+    def player_countries(self, user_id: int) -> list[str]:
+        """Every country controlled by `user_id`, in file order."""
+        return [name for name, pid in self.players().items() if pid == user_id]
+
+    def player_country(self, user_id: int) -> str | None:
+        """Country controlled by `user_id`, looked up without merging every country."""
+        countries = self.view.get("COUNTRIES", {})
+        if isinstance(countries, LazyCountries):
+            for name in countries.names():
+                if countries.peek(name, "player_id") == user_id:
+                    return name
+            return None
+        for name, details in countries.items():
+            if details.get("player_id") == user_id:
+                return name
+        return None
+
+    # ---------- changes ----------
+
+    def apply(self, path: list, overlay_value: Any, view_patch: Any) -> None:
+        """
+        Record that the overlay leaf at `path` now holds `overlay_value`, and merge
+        `view_patch` into the view at the same path (skipped for countries that are
+        still unmaterialized; they'll be built from the overlay when first used).
+        """
+        countries = self.view.get("COUNTRIES")
+        lazy_skip = (
+            len(path) > 1 and path[0] == "COUNTRIES"
+            and isinstance(countries, LazyCountries) and countries.is_pending(path[1])
+        )
+        if not lazy_skip:
+            if isinstance(self.view.get(path[0]), FrozenDict):
+                # first change to a shared static section: give this view its own copy
+                self.view[path[0]] = copy.deepcopy(self.view[path[0]])
+            patch: dict = {}
+            d = patch
+            for key in path[:-1]:
+                d = d.setdefault(key, {})
+            d[path[-1]] = view_patch
+            deep_merge(self.view, patch)
+
+        line = json.dumps([list(path), overlay_value], ensure_ascii=False, separators=(",", ":")) + "\n"
+        self.deltas += 1
+        if self._batch_depth:
+            self._batched.append(line)
+        else:
+            self._append_deltas([line])
+        self.schedule_flush()
+
+    def _append_deltas(self, lines: list[str]) -> None:
+        os.makedirs(os.path.dirname(self.delta_path) or ".", exist_ok=True)
+        with open(self.delta_path, "a", encoding="utf-8") as fh:
+            fh.write("".join(lines))
+
+    def _truncate_deltas(self) -> None:
+        try:
+            with open(self.delta_path, "w", encoding="utf-8"):
+                pass
+        except Exception:
+            pass
+
+    # ---------- write-behind ----------
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._first_dirty = None
+
+    def schedule_flush(self) -> None:
+        """Mark the overlay dirty and (re)arm the debounced flush."""
+        self.dirty = True
+        if self._batch_depth:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        now = loop.time()
+        if self._first_dirty is None:
+            self._first_dirty = now
+        if self._timer is not None:
+            self._timer.cancel()
+        delay = min(self.flush_delay, max(0.0, self._first_dirty + self.max_delay - now))
+        self._timer = loop.call_later(delay, self._flush_cb)
+
+    def _flush_cb(self) -> None:
+        self._timer = None
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"Cold War flush failed: {e}")
+
+    def save(self) -> None:
+        """
+        Persist in-place overlay edits now. Inside a batch() the write still happens
+        once, when the batch ends.
+        """
+        self.dirty = True
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self) -> bool:
+        """Write the overlay now if anything changed. Returns True if a write happened."""
+        self._cancel_timer()
+        if self._batched:
+            self._append_deltas(self._batched)
+            self._batched = []
+        if not self.dirty:
+            return False
+
+        t0 = time.perf_counter()
+        content = json.dumps(self.overlay, indent=2)
+        folder = os.path.dirname(self.dynamic_path) or "."
+        fd, tmp = tempfile.mkstemp(prefix="cw_", suffix=".json", dir=folder)
+        try:
+            with os.fdopen(fd, "w") as fh:
+                fh.write(content)
+            os.replace(tmp, self.dynamic_path)
+        finally:
+            if os.path.exists(tmp):
+                try:
+                    os.remove(tmp)
+                except Exception:
+                    pass
+        # the snapshot now contains every logged delta
+        self._truncate_deltas()
+        self.dirty = False
+        self.flushes += 1
+        self.last_flush_ms = (time.perf_counter() - t0) * 1000.0
+        return True
+
+    @contextlib.asynccontextmanager
+    async def batch(self):
+        """Group many apply() calls (e.g. a turn tick) into one delta append and one flush."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def stats(self) -> dict:
+        countries = self.view.get("COUNTRIES")
+        return {
+            "deltas": self.deltas,
+            "flushes": self.flushes,
+            "dirty": self.dirty,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+            "countries_pending": len(countries._pending) if isinstance(countries, LazyCountries) else 0,
+        }
@@ -12,13 +12,12 @@ from collections import defaultdict, Counter
 import math
 from typing import Literal
 from discord.app_commands import Choice
-import copy
 import shutil
 import uuid
-from io import BytesIO
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+from .cold_war_state import ColdWarState, union_into
+from .tech_index import TechTreeIndex, RESEARCH_SECTIONS
+from .chart_renderer import get_renderer, release_renderer
+from .charts import render_ideology_donut
 
 
 BASE_DIR = os.path.dirname(__file__)
@@ -52,35 +51,6 @@ IDEOLOGY_COLORS = {
 BACKUP_CHANNEL_ID = 1357944150502412288
 
 
-def deep_merge(base: dict, overlay: dict) -> dict:
-    """
-    Overlay `overlay` onto `base` with “additive” merge semantics:
-     - dicts  ⇒ recurse
-     - numbers ⇒ base + overlay
-     - lists   ⇒ extend base by any items in overlay not already present
-     - everything else ⇒ replace
-    """
-    for k, v in overlay.items():
-        if k in base and isinstance(base[k], dict) and isinstance(v, dict):
-            deep_merge(base[k], v)
-
-        elif k in base and isinstance(base[k], (int, float)) and isinstance(v, (int, float)):
-            # numeric delta
-            base[k] = base[k] + v
-
-        elif k in base and isinstance(base[k], list) and isinstance(v, list):
-            # union-merge lists of primitives
-            for item in v:
-                if item not in base[k]:
-                    base[k].append(item)
-
-        else:
-            # strings, bools, None, or mismatched types → override
-            base[k] = v
-
-    return base
-
-
 async def backup_dynamic_json(self):
     try:
         with open(dynamic_path, "r") as f:
@@ -109,7 +79,8 @@ def _normalize(values: list[float]) -> list[float]:
     return [v * 100.0 / total for v in values]
 
 
-def ideology_pie_image(country_name: str, ideology_map: dict[str, float]) -> BytesIO:
+def ideology_pie_data(ideology_map: dict[str, float]) -> tuple[list[str], list[float], list]:
+    """(labels, percentages, colors) for render_ideology_donut."""
     labels = [k for k in ["Democratic","Fascist","Communist","Authoritarian","Monarchic"] if k in ideology_map]
     values = [max(0.0, float(ideology_map[k])) for k in labels]
     total = sum(values)
@@ -117,20 +88,7 @@ def ideology_pie_image(country_name: str, ideology_map: dict[str, float]) -> Byt
         labels, values = ["No Data"], [100.0]
     else:
         values = [v * 100.0 / total for v in values]
-
-    colors = [IDEOLOGY_COLORS.get(k) for k in labels]
-    fig = plt.figure(figsize=(6, 6))
-    wedges, texts, autotexts = plt.pie(
-        values, labels=labels, colors=colors, startangle=90,
-        autopct=lambda pct: f"{pct:.0f}%" if pct >= 4 else "",
-        pctdistance=0.72, labeldistance=1.05,
-    )
-    centre = plt.Circle((0,0), 0.60, fc="white"); fig.gca().add_artist(centre)
-    plt.title(f"{country_name} — Ideology Breakdown"); plt.axis("equal")
-    if any(t.get_text()=="" for t in autotexts):
-        plt.legend(wedges, labels, loc="lower center", bbox_to_anchor=(0.5,-0.02), ncol=3, frameon=False)
-    buf = BytesIO(); plt.savefig(buf, format="png", bbox_inches="tight", dpi=200)
-    plt.close(fig); buf.seek(0); return buf
+    return labels, values, [IDEOLOGY_COLORS.get(k) for k in labels]
 
 class AlliancePollButton(ui.Button):
     def __init__(self, cog, alliance: str, poll_id: str, option: str):
@@ -625,6 +583,8 @@ class SpideyUtils(commands.Cog):
         self.static_data = {}
         self.dynamic_data = {}
         self.cold_war_data = {}
+        self.state = ColdWarState(static_path, dynamic_path)
+        self.charts = get_renderer(bot)
         self.load_data()
         self.alternate_country_dict = {}
         self.scheduled_backup.start()
@@ -642,6 +602,7 @@ class SpideyUtils(commands.Cog):
     @tasks.loop(hours=24)
     async def scheduled_backup(self):
         try:
+            self.state.flush()
             with open(dynamic_path, "r") as f:
                 data = json.load(f)
 
@@ -659,31 +620,27 @@ class SpideyUtils(commands.Cog):
         except Exception as e:
             print(f"Scheduled backup failed: {e}")
     
-    def load_data(self):
-         # 1) load the static + dynamic JSON
-            with open(static_path, "r") as f:
-                self.static_data = json.load(f)
-            
-            
-            if os.path.exists(dynamic_path):
-                with open(dynamic_path, "r") as f:
-                    self.dynamic_data = json.load(f)
-            else:
-                self.dynamic_data = {
-                    "turn": 0,
-                    "current_year": None,
-                    "day": None,
-                    "COUNTRIES": {},
-                    "UN": {},
-                    "GLOBAL_HISTORY": {}
-                }
-
-            merged = copy.deepcopy(self.static_data)
-            self.cold_war_data = deep_merge(merged, self.dynamic_data)
+    def load_data(self, discard_pending: bool = False):
+        # static layer is parsed once and shared; countries are merged on first use
+        self.cold_war_data = self.state.load(
+            {
+                "turn": 0,
+                "current_year": None,
+                "day": None,
+                "COUNTRIES": {},
+                "UN": {},
+                "GLOBAL_HISTORY": {}
+            },
+            discard_pending=discard_pending,
+        )
+        self.static_data = self.state.static
+        self.dynamic_data = self.state.overlay
+        self.tech_index = TechTreeIndex(self.cold_war_data.get("TECH_TREE", {}))
 
     def save_data(self):
-        with open(dynamic_path, "w") as f:
-            json.dump(self.dynamic_data, f, indent=2)
+        # callers edited dynamic_data in place, which isn't in the .deltas log, so write now
+        # (bulk ticks run inside state.batch() and still write once at the end)
+        self.state.save()
 
 
     rp = app_commands.Group(name="rp", description="Cold War RP commands")
@@ -701,7 +658,8 @@ class SpideyUtils(commands.Cog):
     
     async def cog_unload(self):
         self.scheduled_backup.cancel()
-        self.save_data()
+        self.state.flush()
+        release_renderer(self.bot)
         await backup_dynamic_json(self)
 
     
@@ -716,7 +674,7 @@ class SpideyUtils(commands.Cog):
     ):
         """
         Apply exactly one of the provided deltas at the given path in self.dynamic_data,
-        save the modifiers JSON, *and* merge the same change into self.cold_war_data.
+        log it for the write-behind flush, *and* merge the same change into self.cold_war_data.
         dict_path should be something like ['countries', 'Germany', 'research', 'research_bonus'].
         """
         # 1) Drill down to the parent node in dynamic_data
@@ -725,13 +683,16 @@ class SpideyUtils(commands.Cog):
             node = node.setdefault(key, {})
 
         leaf = dict_path[-1]
-        # 2) Apply whichever delta was provided
+        # 2) Apply whichever delta was provided; `patch` is what gets deep-merged into the view
         if int_delta is not None:
             node[leaf] = node.get(leaf, 0) + int_delta
+            patch = int_delta  # additive semantics
         elif str_val is not None:
             node[leaf] = str_val
+            patch = str_val
         elif bool_val is not None:
             node[leaf] = bool_val
+            patch = bool_val
         elif dict_delta is not None:
             existing = node.get(leaf)
             # if there’s no existing dict, just set it outright
@@ -741,39 +702,18 @@ class SpideyUtils(commands.Cog):
                 # override existing keys with your new ones
                 existing.update(dict_delta)
                 node[leaf] = existing
+            patch = dict_delta
         elif list_delta is not None:
             existing = node.get(leaf, [])
-            # union-merge
-            for item in list_delta:
-                if item not in existing:
-                    existing.append(item)
-            node[leaf] = existing
+            node[leaf] = union_into(existing, list_delta)
+            patch = list_delta
         else:
             raise ValueError("Must provide exactly one of int_delta, str_val, bool_val, dict_delta, or list_delta")
 
-        # 3) Persist the modifiers JSON
-        self.save_data()
-
-        # 4) Build a tiny “overlay” dict to patch self.cold_war_data in-place
-        overlay = {}
-        d = overlay
-        for key in dict_path[:-1]:
-            d = d.setdefault(key, {})
-        # now d is the parent; set the same leaf value
-        if int_delta is not None:
-            # use additive semantics
-            d[leaf] = int_delta
-        elif str_val is not None:
-            d[leaf] = str_val
-        elif bool_val is not None:
-            d[leaf] = bool_val
-        elif dict_delta is not None:
-            d[leaf] = dict_delta
-        else:  # list_delta
-            d[leaf] = list_delta
-
-        # 5) Deep-merge that overlay into cold_war_data
-        deep_merge(self.cold_war_data, overlay)
+        # 3) Log the new leaf value, patch cold_war_data, and schedule the flush
+        self.state.apply(dict_path, node[leaf], patch)
+        if len(dict_path) > 2 and dict_path[0] == "COUNTRIES" and dict_path[2] in RESEARCH_SECTIONS:
+            self.tech_index.touch(dict_path[1])
 
     def init_spy_data(self, country: str):
         """
@@ -792,6 +732,11 @@ class SpideyUtils(commands.Cog):
     
     
     async def resolve_spy_ops(self):
+        # every delta of the tick lands in one journal append and one file write
+        async with self.state.batch():
+            await self._resolve_spy_ops()
+
+    async def _resolve_spy_ops(self):
         espionage_defs = self.cold_war_data.get("ESPIONAGE", {}).get("operations", {})
         global_log = []
         spy_results = {}
@@ -1051,76 +996,36 @@ class SpideyUtils(commands.Cog):
         adjusted = base_time + penalty
         return int(adjusted * (1 - total_bonus))
 
-    def gather_the_children(self, node: dict, year: int, embed: discord.Embed, unlocked, in_progress, total_bonus):
-        active_techs = [
-            slot_data["tech"]
-            for slot_data in in_progress.values()
-            if isinstance(slot_data, dict) and "tech" in slot_data
-        ]
-
-        
-        if not isinstance(node, dict):
-            return
-
-        tech_name = node.get("tech")
-        if tech_name:
-            base = node.get("research_time", 0)
-            r_year = node.get("research_year", None)
-            desc = node.get("description", "No description.")
-            adjusted = self.calculate_research_time(base, r_year, year, total_bonus)
-            status = "[✓]" if tech_name in unlocked else "[🛠]" if tech_name in active_techs else "[ ]"
-            if status == "✓":
-                label = f"[✓] {tech_name} ({r_year})"
-            elif status == "🛠":
-                days_remaining = next(
-                    (slot_data["days_remaining"] for slot_data in in_progress.values()
-                    if isinstance(slot_data, dict) and slot_data.get("tech") == tech_name),
-                    adjusted
-                )
-                label = f"[🛠] {tech_name} ({r_year}) – {days_remaining} days remaining"
-            else:
-                label = f"[ ] {tech_name} ({r_year}) – {adjusted} days"
+    def tech_field(self, name: str, node: dict, year, tech_state: dict, total_bonus):
+        base = node.get("research_time", 0)
+        r_year = node.get("research_year", None)
+        desc = node.get("description", "No description.")
+        adjusted = self.calculate_research_time(base, r_year, year, total_bonus)
+        if tech_state["unlocked"] & self.tech_index.mask([name]):
+            label = f"[✓] {name} ({r_year})"
+        elif name in tech_state["active_names"]:
+            days_remaining = tech_state["days"].get(name)
+            if days_remaining is None:
+                days_remaining = adjusted
+            label = f"[🛠] {name} ({r_year}) – {days_remaining} days remaining"
+        else:
+            label = f"[ ] {name} ({r_year}) – {adjusted} days"
+        return label, desc
 
+    def gather_the_children(self, sub_branch: dict, year, embed: discord.Embed, tech_state: dict, total_bonus):
+        for node in self.tech_index.chain(sub_branch):
+            label, desc = self.tech_field(node["tech"], node, year, tech_state, total_bonus)
             embed.add_field(name=label, value=desc, inline=False)
 
-        # Recurse into children only once
-        if isinstance(node.get("child"), dict):
-            self.gather_the_children(node["child"], year, embed, unlocked, in_progress, total_bonus)
-
-
-    def create_the_embed(self, sub_branch, year, unlocked, in_progress, total_bonus, bonus_summary):
-        active_techs = [
-            slot_data["tech"]
-            for slot_data in in_progress.values()
-            if isinstance(slot_data, dict) and "tech" in slot_data
-        ]
-        
+    def create_the_embed(self, sub_branch, year, tech_state, total_bonus, bonus_summary):
         embed = discord.Embed(
             title=f"📦 {sub_branch['sub_branch_name']} Sub-Branch",
             description=f"🔧 Research Speed Modifiers:\n{bonus_summary}",
             color=discord.Color.gold()
         )
-        starter_name = sub_branch.get("starter_tech")
-        base = sub_branch.get("research_time", 0)
-        r_year = sub_branch.get("research_year", None)
-        desc = sub_branch.get("description", "No description.")
-        adjusted = self.calculate_research_time(base, r_year, year, total_bonus)
-        status = "[✓]" if starter_name in unlocked else "[🛠]" if starter_name in active_techs else "[ ]"
-        if status == "✓":
-            label = f"[✓] {starter_name} ({r_year})"
-        elif status == "🛠":
-            days_remaining = next(
-                (slot_data["days_remaining"] for slot_data in in_progress.values()
-                if isinstance(slot_data, dict) and slot_data.get("tech") == starter_name),
-                adjusted
-            )
-            label = f"[🛠] {starter_name} ({r_year}) – {days_remaining} days remaining"
-        else:
-            label = f"[ ] {starter_name} ({r_year}) – {adjusted} days"
-
+        label, desc = self.tech_field(sub_branch.get("starter_tech"), sub_branch, year, tech_state, total_bonus)
         embed.add_field(name=label, value=desc, inline=False)
-        if "child" in sub_branch:
-            self.gather_the_children(sub_branch["child"], year, embed, unlocked, in_progress, total_bonus)
+        self.gather_the_children(sub_branch, year, embed, tech_state, total_bonus)
         return embed
     
     def format_bonus(self, bonus):
@@ -1156,43 +1061,9 @@ class SpideyUtils(commands.Cog):
         countries = self.cold_war_data.get("COUNTRIES", {})
         return [app_commands.Choice(name=c, value=c) for c in countries if (current.lower() in c.lower()) and (countries.get(c, {}).get("player_id")== interaction.user.id)][:25]
     
-    def get_available_techs(self, branch: str, country_data: dict, tech_tree: dict):
-        unlocked = country_data.get("RESEARCH", {}).get("unlocked_techs", [])
-        active = [
-            data["tech"]
-            for data in country_data.get("RESEARCH", {}).get("active_slots", {}).values()
-            if isinstance(data, dict) and "tech" in data
-        ]
-        available = []
-
-        branch_data = tech_tree.get(branch, {})
-        branch_starter = branch_data.get("branch", {}).get("starter_tech")
-        if branch_starter and branch_starter not in unlocked and branch_starter not in active:
-            available.append(branch_starter)
-            return available
-
-        for key, sub_branch in branch_data.items():
-            if not isinstance(sub_branch, dict):
-                continue
-
-            starter = sub_branch.get("starter_tech")
-            if starter and starter not in unlocked and starter not in active:
-                available.append(starter)
-                continue
-
-            node = sub_branch.get("child")
-            previous = None
-            while node:
-                tech = node.get("tech")
-                if tech and tech not in unlocked and tech not in active:
-                    parent = sub_branch.get("starter_tech") if previous is None else previous.get("tech")
-                    if parent in unlocked:
-                        available.append(tech)
-                        break
-                previous = node
-                node = node.get("child")
-
-        return available
+    def get_available_techs(self, branch: str, country: str) -> list[str]:
+        country_data = self.cold_war_data["COUNTRIES"][country]
+        return self.tech_index.available_for(country, country_data, branch)
 
     
     async def autocomplete_available_techs(self, interaction: discord.Interaction, current: str):
@@ -1206,18 +1077,12 @@ class SpideyUtils(commands.Cog):
         if not country and str(interaction.user.id) in self.alternate_country_dict:
             country = self.alternate_country_dict.get(str(interaction.user.id))
         elif not country:
-            for c_key, details in self.cold_war_data["COUNTRIES"].items():
-                if details.get("player_id") == interaction.user.id:
-                    country = c_key
-                    break
+            country = self.state.player_country(interaction.user.id)
 
         if not country or country not in self.cold_war_data["COUNTRIES"]:
             return []
 
-        country_data = self.cold_war_data["COUNTRIES"][country]
-        tech_tree = self.cold_war_data.get("TECH_TREE", {})
-
-        available = self.get_available_techs(branch, country_data, tech_tree)
+        available = self.get_available_techs(branch, country)
         return [
             app_commands.Choice(name=t, value=t)
             for t in available if current.lower() in t.lower()
@@ -1251,10 +1116,7 @@ class SpideyUtils(commands.Cog):
         if not country and str(interaction.user.id) in self.alternate_country_dict:
             country = self.alternate_country_dict[str(interaction.user.id)]
         if not country:
-            for c_key, details in self.cold_war_data["COUNTRIES"].items():
-                if details.get("player_id") == interaction.user.id:
-                    country = c_key
-                    break
+            country = self.state.player_country(interaction.user.id)
         if not country or country not in self.cold_war_data["COUNTRIES"]:
             return await interaction.response.send_message(
                 "❌ Could not determine your country.", ephemeral=True
@@ -1363,10 +1225,7 @@ class SpideyUtils(commands.Cog):
         if not country and str(interaction.user.id) in self.alternate_country_dict:
             country = self.alternate_country_dict[str(interaction.user.id)]
         if not country:
-            for c_key, details in self.cold_war_data["COUNTRIES"].items():
-                if details.get("player_id") == interaction.user.id:
-                    country = c_key
-                    break
+            country = self.state.player_country(interaction.user.id)
         if not country or country not in self.cold_war_data["COUNTRIES"]:
             return await interaction.followup.send("❌ Could not determine your country.", ephemeral=True)
 
@@ -1401,10 +1260,7 @@ class SpideyUtils(commands.Cog):
         if not country and str(interaction.user.id) in self.alternate_country_dict:
             country = self.alternate_country_dict.get(str(interaction.user.id))
         elif not country:
-            for c_key, details in self.cold_war_data["COUNTRIES"].items():
-                if details.get("player_id") == interaction.user.id:
-                    country = c_key
-                    break
+            country = self.state.player_country(interaction.user.id)
 
         if not country or country not in self.cold_war_data["COUNTRIES"]:
             return await interaction.followup.send("❌ Could not determine your country.", ephemeral=True)
@@ -1429,44 +1285,20 @@ class SpideyUtils(commands.Cog):
             return await interaction.followup.send(f"❌ Slot {slot} is already occupied.", ephemeral=True)
 
         # Locate tech from available options
-        tech_tree = self.cold_war_data.get("TECH_TREE", {})
-        available_techs = self.get_available_techs(branch, country_data, tech_tree)
+        available_techs = self.get_available_techs(branch, country)
 
         if tech_name not in available_techs:
             return await interaction.followup.send(f"❌ `{tech_name}` is not currently researchable.", ephemeral=True)
 
         # Get the actual tech node for data lookup
-        def find_tech_node(branch_data, name):
-            for sb in branch_data.values():
-                if not isinstance(sb, dict):
-                    continue
-                if sb.get("starter_tech") == name:
-                    return sb
-                node = sb.get("child")
-                while node:
-                    if node.get("tech") == name:
-                        return node
-                    node = node.get("child")
-            return None
-
-        target = find_tech_node(tech_tree.get(branch, {}), tech_name)
+        target = self.tech_index.find(branch, tech_name)
         if not target:
             return await interaction.followup.send("❌ Could not find that tech node.", ephemeral=True)
 
         base_time = target.get("research_time", 0)
         tech_year = target.get("research_year", int(year))
 
-        # Calculate total bonus
-        def calculate_total_bonus(branch_name: str, country_data: dict):
-            generic_bonus = country_data.get("RESEARCH", {}).get("research_bonus")
-            bonus = generic_bonus
-            for spirit in country_data.get("national_spirits", []):
-                bonuses = spirit.get("research_bonus") or spirit.get("modifiers", {}).get("research_bonus", {})
-                bonus += bonuses.get(branch_name.upper(), 0.0)
-                bonus += bonuses.get("generic", 0.0)
-            return bonus
-
-        total_bonus = calculate_total_bonus(branch, country_data)
+        total_bonus = self.tech_index.total_bonus(country, country_data, branch)
         adjusted_time = self.calculate_research_time(base_time, tech_year, year, total_bonus)
         carry_used = carryover.get(slot, 0)
         remaining_days = max(0, adjusted_time - carry_used)
@@ -1507,10 +1339,7 @@ class SpideyUtils(commands.Cog):
         if not country and str(interaction.user.id) in self.alternate_country_dict:
             country = self.alternate_country_dict[str(interaction.user.id)]
         elif not country:
-            for c_key, details in countries.items():
-                if details.get("player_id") == interaction.user.id:
-                    country = c_key
-                    break
+            country = self.state.player_country(interaction.user.id)
 
         if not country or country not in countries:
             return await interaction.followup.send("❌ Could not determine your country.", ephemeral=True)
@@ -1580,18 +1409,13 @@ class SpideyUtils(commands.Cog):
             return await interaction.followup.send("❌ Could not determine your country.", ephemeral=True)
 
         country_data = self.cold_war_data["COUNTRIES"].get(country_name, {})
+        tech_state = self.tech_index.country_state(country_name, country_data)
         unlocked = country_data.get("RESEARCH", {}).get("unlocked_techs", [])
         in_progress = dict(country_data.get("RESEARCH", {}).get("active_slots"))
-        generic_bonus = country_data.get("RESEARCH", {}).get("research_bonus")
+        generic_bonus = tech_state["generic"]
 
         def calculate_total_bonus(branch_name):
-            bonus = generic_bonus
-            for spirit in country_data.get("national_spirits", []):
-                # Check both possible paths
-                bonuses = spirit.get("research_bonus") or spirit.get("modifiers", {}).get("research_bonus", {})
-                bonus += bonuses.get(branch_name.upper(), 0.0)
-                bonus += bonuses.get("generic", 0.0)
-            return bonus
+            return self.tech_index.total_bonus(country_name, country_data, branch_name)
 
         if not branch and not sub_branch:
             embed = discord.Embed(title="📚 Tech Tree Overview", color=discord.Color.blue())
@@ -1645,18 +1469,17 @@ class SpideyUtils(commands.Cog):
                     continue
                 bonus = calculate_total_bonus(branch)
                 bonus_summary = f"{self.format_bonus(generic_bonus)} from generic bonus\n{self.format_bonus(bonus - generic_bonus)} from national spirits\n→ Effective bonus: {self.format_bonus(bonus)}"
-                embeds.append(self.create_the_embed(sub_data, year, unlocked, in_progress, bonus, bonus_summary))
+                embeds.append(self.create_the_embed(sub_data, year, tech_state, bonus, bonus_summary))
             return await interaction.followup.send(embeds=embeds[:10])
 
-        for branch_name, contents in tech_tree.items():
-            for sb_key, sub_data in contents.items():
-                if sb_key == "branch" or not isinstance(sub_data, dict):
-                    continue
-                if sub_data.get("sub_branch_name", "").lower() == sub_branch.lower():
-                    bonus = calculate_total_bonus(branch_name)
-                    bonus_summary = f"{self.format_bonus(generic_bonus)} from generic bonus\n{self.format_bonus(bonus - generic_bonus)}% from national spirits\n→ Effective bonus: {self.format_bonus(bonus)}%"
-                    embed = self.create_the_embed(sub_data, year, unlocked, in_progress, bonus, bonus_summary)
-                    return await interaction.followup.send(embed=embed)
+        found = self.tech_index.sub_by_name.get(sub_branch.lower())
+        if found and found[1] != "branch":
+            branch_name, sb_key = found
+            sub_data = tech_tree[branch_name][sb_key]
+            bonus = calculate_total_bonus(branch_name)
+            bonus_summary = f"{self.format_bonus(generic_bonus)} from generic bonus\n{self.format_bonus(bonus - generic_bonus)}% from national spirits\n→ Effective bonus: {self.format_bonus(bonus)}%"
+            embed = self.create_the_embed(sub_data, year, tech_state, bonus, bonus_summary)
+            return await interaction.followup.send(embed=embed)
 
         await interaction.followup.send("❌ Could not find specified branch or sub-branch.", ephemeral=True)
 
@@ -1667,10 +1490,7 @@ class SpideyUtils(commands.Cog):
             country = self.alternate_country_dict[str(interaction.user.id)]
 
         if not country:
-            for c_key, details in self.cold_war_data["COUNTRIES"].items():
-                if details.get("player_id") == interaction.user.id:
-                    country = c_key
-                    break
+            country = self.state.player_country(interaction.user.id)
 
         if not country or country not in self.cold_war_data["COUNTRIES"]:
             return []
@@ -1700,10 +1520,7 @@ class SpideyUtils(commands.Cog):
         if not country and str(interaction.user.id) in self.alternate_country_dict:
             country = self.alternate_country_dict[str(interaction.user.id)]
         if not country:
-            for c_key, details in self.cold_war_data["COUNTRIES"].items():
-                if details.get("player_id") == interaction.user.id:
-                    country = c_key
-                    break
+            country = self.state.player_country(interaction.user.id)
 
         if not country or country not in self.cold_war_data["COUNTRIES"]:
             return await interaction.followup.send("❌ Could not determine your country.", ephemeral=True)
@@ -1767,10 +1584,7 @@ class SpideyUtils(commands.Cog):
             country = self.alternate_country_dict[str(interaction.user.id)]
 
         if not country:
-            for c_key, details in self.cold_war_data["COUNTRIES"].items():
-                if details.get("player_id") == interaction.user.id:
-                    country = c_key
-                    break
+            country = self.state.player_country(interaction.user.id)
 
         if not country or country not in self.cold_war_data["COUNTRIES"]:
             return await interaction.followup.send("❌ Could not determine your country.", ephemeral=True)
@@ -1872,10 +1686,7 @@ class SpideyUtils(commands.Cog):
         if str(interaction.user.id) in self.alternate_country_dict:
             country = self.alternate_country_dict[str(interaction.user.id)]
         else:
-            for c_key, details in self.cold_war_data["COUNTRIES"].items():
-                if details.get("player_id") == interaction.user.id:
-                    country = c_key
-                    break
+            country = self.state.player_country(interaction.user.id)
         if not country:
             return await interaction.response.send_message("❌ Could not determine your country.", ephemeral=True)
 
@@ -1932,10 +1743,7 @@ class SpideyUtils(commands.Cog):
         if str(interaction.user.id) in self.alternate_country_dict:
             country = self.alternate_country_dict[str(interaction.user.id)]
         else:
-            for c_key, details in self.cold_war_data["COUNTRIES"].items():
-                if details.get("player_id") == interaction.user.id:
-                    country = c_key
-                    break
+            country = self.state.player_country(interaction.user.id)
         if not country:
             return await interaction.response.send_message("❌ Could not determine your country.", ephemeral=True) 
 
@@ -2079,10 +1887,7 @@ class SpideyUtils(commands.Cog):
         if str(interaction.user.id) in self.alternate_country_dict:
             user_country = self.alternate_country_dict[str(interaction.user.id)]
         else:
-            for c, d in self.cold_war_data["COUNTRIES"].items():
-                if d.get("player_id") == interaction.user.id:
-                    user_country = c
-                    break
+            user_country = self.state.player_country(interaction.user.id)
 
         sg_key    = un_block.get("secretary_general", "Vacant")
         is_admin  = interaction.user.guild_permissions.administrator
@@ -2210,10 +2015,7 @@ class SpideyUtils(commands.Cog):
         if str(interaction.user.id) in self.alternate_country_dict:
             country = self.alternate_country_dict[str(interaction.user.id)]
         else:
-            for c, data in self.cold_war_data["COUNTRIES"].items():
-                if data.get("player_id") == interaction.user.id:
-                    country = c
-                    break
+            country = self.state.player_country(interaction.user.id)
         if not country:
             return await interaction.response.send_message(
                 "❌ Could not determine your country for voting.", ephemeral=True
@@ -2337,14 +2139,12 @@ class SpideyUtils(commands.Cog):
 
     @diplomacy.command(name="country_view", description="See all countries and their players")
     async def country_view(self, interaction: Interaction):
-        countries = self.cold_war_data["COUNTRIES"]
         embed = Embed(
             title="🌐 Cold War Countries & Players",
             description="Click a name to DM the player.",
             color=discord.Color.blurple()
         )
-        for name, data in countries.items():
-            pid = data.get("player_id")
+        for name, pid in self.state.players().items():
             mention = f"<@{pid}>" if pid else "—"
             embed.add_field(name=name, value=mention, inline=False)
         await interaction.response.send_message(embed=embed)
@@ -2386,7 +2186,7 @@ class SpideyUtils(commands.Cog):
         return max(10, (foreign + spy_score) - domestic)
 
     def get_best_intel_country(self, user_id, countries):
-        options = [(name, data) for name, data in countries.items() if data.get("player_id") == user_id]
+        options = [(name, countries[name]) for name in self.state.player_countries(user_id) if name in countries]
         if not options:
             return None
         return max(options, key=lambda x: x[1].get("ESPIONAGE", {}).get("foreign_intelligence_score", 0) +
@@ -2578,7 +2378,7 @@ class SpideyUtils(commands.Cog):
                 "Monarchic": ideology_breakdown.get("monarchic", 0) or 0,
             }
             if sum(ideo_raw.values()) > 0:
-                png = ideology_pie_image(country, ideo_raw)
+                png = await self.charts.render_file(render_ideology_donut, country, *ideology_pie_data(ideo_raw))
                 chart_file = discord.File(png, filename="ideology.png")
                 pol.set_image(url="attachment://ideology.png")
                 files.append(chart_file)
@@ -2677,10 +2477,7 @@ class SpideyUtils(commands.Cog):
         if not country and str(interaction.user.id) in self.alternate_country_dict:
             country = self.alternate_country_dict[str(interaction.user.id)]
         if not country:
-            for c_key, det in self.cold_war_data["COUNTRIES"].items():
-                if det.get("player_id") == interaction.user.id:
-                    country = c_key
-                    break
+            country = self.state.player_country(interaction.user.id)
         if not country or country not in self.cold_war_data["COUNTRIES"]:
             return await interaction.followup.send("❌ Could not determine your country.", ephemeral=True)
 
@@ -2744,7 +2541,7 @@ class SpideyUtils(commands.Cog):
         try:
             shutil.copy(template, dynamic_path)
             # re-load into memory
-            self.load_data()
+            self.load_data(discard_pending=True)
             await ctx.send("✅ `cold_war_modifiers.json` has been restored from the template.")
         except Exception as e:
             await ctx.send(f"❌ Failed to restore modifiers: {e}")
@@ -2760,10 +2557,7 @@ class SpideyUtils(commands.Cog):
         if not country and str(interaction.user.id) in self.alternate_country_dict:
             country = self.alternate_country_dict[str(interaction.user.id)]
         if not country:
-            for c_key, details in self.cold_war_data["COUNTRIES"].items():
-                if details.get("player_id") == interaction.user.id:
-                    country = c_key
-                    break
+            country = self.state.player_country(interaction.user.id)
         if not country or country not in self.cold_war_data["COUNTRIES"]:
             return await interaction.followup.send("❌ Could not determine your country.", ephemeral=True)
 
@@ -3273,10 +3067,7 @@ class SpideyUtils(commands.Cog):
         if not country and str(interaction.user.id) in self.alternate_country_dict:
             country = self.alternate_country_dict[str(interaction.user.id)]
         if not country:
-            for c_key, details in self.cold_war_data["COUNTRIES"].items():
-                if details.get("player_id") == interaction.user.id:
-                    country = c_key
-                    break
+            country = self.state.player_country(interaction.user.id)
         if not country or country not in self.cold_war_data["COUNTRIES"]:
             return await interaction.response.send_message("❌ Could not determine your country.", ephemeral=True)
         
@@ -3294,11 +3085,7 @@ class SpideyUtils(commands.Cog):
         you = interaction.user
         # collect pending for your country
         pend = self.dynamic_data.get("diplomacy", {}).get("pending", {})
-        your_country = None
-        for c, d in self.cold_war_data["COUNTRIES"].items():
-            if d.get("player_id") == you.id:
-                your_country = c
-                break
+        your_country = self.state.player_country(you.id)
         if not your_country:
             return await interaction.response.send_message("❌ You don’t represent a country.", ephemeral=True)
 
@@ -3331,10 +3118,7 @@ class SpideyUtils(commands.Cog):
         if str(uid) in self.alternate_country_dict:
             user_country = self.alternate_country_dict[str(uid)]
         else:
-            for country, info in self.cold_war_data["COUNTRIES"].items():
-                if info.get("player_id") == uid:
-                    user_country = country
-                    break
+            user_country = self.state.player_country(uid)
 
         pending = self.dynamic_data.get("diplomacy", {}).get("pending", {})
         choices = []
@@ -3415,11 +3199,7 @@ class SpideyUtils(commands.Cog):
     @alliances.command(name="create", description="Found a new alliance/coalition")
     async def create(self, interaction: Interaction):
             you = interaction.user
-            your_country = None
-            for c, d in self.cold_war_data["COUNTRIES"].items():
-                if d.get("player_id") == you.id:
-                    your_country = c
-                    break
+            your_country = self.state.player_country(you.id)
             if not your_country:
                 return await interaction.response.send_message("❌ You don’t represent a country.", ephemeral=True)
         
@@ -3520,10 +3300,7 @@ class SpideyUtils(commands.Cog):
         if str(interaction.user.id) in self.alternate_country_dict:
             your_country = self.alternate_country_dict[str(interaction.user.id)]
         else:
-            for c, d in self.cold_war_data["COUNTRIES"].items():
-                if d.get("player_id") == interaction.user.id:
-                    your_country = c
-                    break
+            your_country = self.state.player_country(interaction.user.id)
         if not your_country:
             return await interaction.response.send_message(
                 "❌ Couldn't figure out your country.", ephemeral=True
@@ -3969,10 +3746,7 @@ class SpideyUtils(commands.Cog):
         if str(interaction.user.id) in self.alternate_country_dict:
             your_country = self.alternate_country_dict[str(interaction.user.id)]
         else:
-            for country, data in self.cold_war_data["COUNTRIES"].items():
-                if data.get("player_id") == interaction.user.id:
-                    your_country = country
-                    break
+            your_country = self.state.player_country(interaction.user.id)
 
         leader_country = alliances[alliance]["leader"]
         if your_country != leader_country:
@@ -4052,10 +3826,7 @@ class SpideyUtils(commands.Cog):
         user = interaction.user
         user_country = self.alternate_country_dict.get(str(user.id))
         if not user_country:
-            for country, data in self.cold_war_data["COUNTRIES"].items():
-                if data.get("player_id") == user.id:
-                    user_country = country
-                    break
+            user_country = self.state.player_country(user.id)
 
         # only alliance members may vote
         if not user_country or user_country not in dyn[alliance]["members"]:
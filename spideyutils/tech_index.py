@@ -0,0 +1,200 @@
+from __future__ import annotations
+from typing import Any
+
+# Country-data sections whose changes can move availability or research bonuses.
+RESEARCH_SECTIONS = ("RESEARCH", "national_spirits")
+
+
+class TechNode:
+    __slots__ = ("idx", "name", "branch", "sub_key", "parent", "children", "data", "bit", "prereqs")
+
+    def __init__(self, idx: int, name: str, branch: str, sub_key: str, parent: int | None, data: dict):
+        self.idx = idx
+        self.name = name
+        self.branch = branch
+        self.sub_key = sub_key
+        self.parent = parent
+        self.children: list[int] = []
+        self.data = data  # the original tree node (research_time, research_year, description)
+        self.bit = 1 << idx
+        self.prereqs = 0  # bitmask of every ancestor
+
+
+class TechTreeIndex:
+    """
+    Flattened, read-only view of TECH_TREE built once per load.
+
+    Every starter/child node becomes a TechNode with a bit; branches keep their
+    sub-branch chains as index lists, and per-country unlocked/in-progress bitsets
+    plus bonus totals are cached until a RESEARCH or national_spirits change for
+    that country calls `touch()`. Availability results are memoised per
+    (branch, unlocked bits, active bits) so repeat lookups are a dict hit.
+    """
+
+    def __init__(self, tech_tree: dict):
+        self.nodes: list[TechNode] = []
+        self.by_name: dict[str, int] = {}
+        self.by_branch_name: dict[tuple[str, str], int] = {}
+        # branch -> [(sub_key, starter idx | None, [chain idx...])], in file order
+        self.branch_subs: dict[str, list[tuple[str, int | None, list[int]]]] = {}
+        self.branch_mask: dict[str, int] = {}
+        self.branch_starter: dict[str, int | None] = {}
+        # lowercased sub_branch_name -> (branch, sub_key)
+        self.sub_by_name: dict[str, tuple[str, str]] = {}
+        self.chain_of: dict[int, list[int]] = {}  # id(sub-branch dict) -> chain
+
+        self._countries: dict[str, dict] = {}
+        self._available: dict[tuple[str, int, int], list[str]] = {}
+
+        for branch, contents in (tech_tree or {}).items():
+            if isinstance(contents, dict):
+                self._add_branch(branch, contents)
+
+    def _add(self, name: str, branch: str, sub_key: str, parent: int | None, data: dict) -> int:
+        idx = len(self.nodes)
+        node = TechNode(idx, name, branch, sub_key, parent, data)
+        if parent is not None:
+            p = self.nodes[parent]
+            p.children.append(idx)
+            node.prereqs = p.prereqs | p.bit
+        self.nodes.append(node)
+        self.by_name.setdefault(name, idx)
+        self.by_branch_name.setdefault((branch, name), idx)
+        self.branch_mask[branch] = self.branch_mask.get(branch, 0) | node.bit
+        return idx
+
+    def _add_branch(self, branch: str, contents: dict) -> None:
+        subs: list[tuple[str, int | None, list[int]]] = []
+        self.branch_mask.setdefault(branch, 0)
+        branch_root = None
+        for sub_key, sub in contents.items():
+            if not isinstance(sub, dict):
+                continue
+            starter_name = sub.get("starter_tech")
+            starter = None
+            if starter_name:
+                starter = self._add(starter_name, branch, sub_key, branch_root if sub_key != "branch" else None, sub)
+                if sub_key == "branch":
+                    branch_root = starter
+            chain: list[int] = []
+            prev = starter
+            node = sub.get("child")
+            while isinstance(node, dict):
+                tech = node.get("tech")
+                if tech:
+                    prev = self._add(tech, branch, sub_key, prev, node)
+                    chain.append(prev)
+                node = node.get("child")
+            subs.append((sub_key, starter, chain))
+            self.chain_of[id(sub)] = chain
+            if sub_key == "branch":
+                self.branch_starter[branch] = starter
+            name = sub.get("sub_branch_name")
+            if name:
+                self.sub_by_name.setdefault(name.lower(), (branch, sub_key))
+        self.branch_starter.setdefault(branch, None)
+        self.branch_subs[branch] = subs
+
+    # ---------- lookups ----------
+
+    def mask(self, names) -> int:
+        m = 0
+        for n in names or ():
+            idx = self.by_name.get(n)
+            if idx is not None:
+                m |= self.nodes[idx].bit
+        return m
+
+    def find(self, branch: str, name: str) -> dict | None:
+        """The tree node for `name` in `branch` (the sub-branch dict for starters)."""
+        idx = self.by_branch_name.get((branch, name))
+        return self.nodes[idx].data if idx is not None else None
+
+    def chain(self, sub_branch: dict) -> list[dict]:
+        """Child nodes under a sub-branch starter, in order."""
+        return [self.nodes[i].data for i in self.chain_of.get(id(sub_branch), ())]
+
+    def available(self, branch: str, unlocked: int, active: int) -> list[str]:
+        """
+        Techs that can be started in `branch`: the branch starter alone until it's
+        unlocked, then each sub-branch's starter or its first open tech whose
+        prerequisite is unlocked.
+        """
+        bm = self.branch_mask.get(branch, 0)
+        key = (branch, unlocked & bm, active & bm)
+        hit = self._available.get(key)
+        if hit is not None:
+            return list(hit)
+
+        done = unlocked | active
+        out: list[str] = []
+        starter = self.branch_starter.get(branch)
+        if starter is not None and not (done & self.nodes[starter].bit):
+            out.append(self.nodes[starter].name)
+        else:
+            for _sub_key, s_idx, chain in self.branch_subs.get(branch, ()):
+                if s_idx is not None and not (done & self.nodes[s_idx].bit):
+                    out.append(self.nodes[s_idx].name)
+                    continue
+                for i in chain:
+                    node = self.nodes[i]
+                    if done & node.bit:
+                        continue
+                    if node.parent is not None and unlocked & self.nodes[node.parent].bit:
+                        out.append(node.name)
+                        break
+
+        self._available[key] = out
+        return list(out)
+
+    # ---------- per-country state ----------
+
+    def touch(self, country: str) -> None:
+        self._countries.pop(country, None)
+
+    def reset(self) -> None:
+        self._countries.clear()
+
+    def country_state(self, country: str, country_data: dict) -> dict:
+        """Cached unlocked/active bitsets, days remaining and bonus totals for one country."""
+        st = self._countries.get(country)
+        if st is not None:
+            return st
+
+        research = country_data.get("RESEARCH", {})
+        slots = research.get("active_slots", {}) or {}
+        days: dict[str, Any] = {}
+        active_names = []
+        for slot_data in slots.values():
+            if isinstance(slot_data, dict) and "tech" in slot_data:
+                active_names.append(slot_data["tech"])
+                days.setdefault(slot_data["tech"], slot_data.get("days_remaining"))
+
+        st = {
+            "unlocked": self.mask(research.get("unlocked_techs", [])),
+            "active": self.mask(active_names),
+            "active_names": set(active_names),
+            "days": days,
+            "generic": research.get("research_bonus"),
+            "bonus": {},
+        }
+        self._countries[country] = st
+        return st
+
+    def available_for(self, country: str, country_data: dict, branch: str) -> list[str]:
+        st = self.country_state(country, country_data)
+        return self.available(branch, st["unlocked"], st["active"])
+
+    def total_bonus(self, country: str, country_data: dict, branch: str):
+        """Generic research bonus plus every national spirit's bonus for `branch`, cached."""
+        st = self.country_state(country, country_data)
+        hit = st["bonus"].get(branch)
+        if hit is not None:
+            return hit
+        total = st["generic"]
+        for spirit in country_data.get("national_spirits", []):
+            bonuses = spirit.get("research_bonus") or spirit.get("modifiers", {}).get("research_bonus", {})
+            total += bonuses.get(branch.upper(), 0.0)
+            total += bonuses.get("generic", 0.0)
+        st["bonus"][branch] = total
+        return total
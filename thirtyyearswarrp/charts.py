@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from matplotlib.figure import Figure
+
+from .chart_renderer import figure_png
+
+
+# ---------- render functions (run in the pool) ----------
+
+def render_religion_donut(labels: list[str], sizes: list[float], colors: list[str]) -> bytes:
+    """Transparent religion donut with a legend on the right."""
+    fig = Figure(figsize=(4.8, 4.8), dpi=200)
+    ax = fig.add_subplot()
+    wedges, _ = ax.pie(sizes, labels=None, colors=colors, startangle=90, wedgeprops=dict(width=0.5))
+    ax.legend(wedges, labels, loc="center left", bbox_to_anchor=(1.0, 0.5), frameon=False, fontsize=8)
+    ax.axis('equal')
+    fig.tight_layout()
+    return figure_png(fig, transparent=True)
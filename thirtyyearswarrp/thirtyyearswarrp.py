@@ -7,11 +7,9 @@ import discord
 from discord import app_commands
 from redbot.core import commands
 
-from io import BytesIO
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
 import random, math
+from .chart_renderer import get_renderer, release_renderer
+from .charts import render_religion_donut
 
 from copy import deepcopy
 
@@ -203,8 +201,8 @@ def ensure_country_defaults(static: Dict[str, Any], dynamic: Dict[str, Any], cou
                 # Deep copy dict defaults so we don't share references
                 dynamic[country_key][k] = json.loads(json.dumps(default))
 
-def make_religion_pie(rel_mix: Dict[str, float]) -> BytesIO:
-    """Return a PNG pie chart buffer from a {religion: percent} dict."""
+def religion_pie_data(rel_mix: Dict[str, float]) -> Tuple[List[str], List[float], List[str]]:
+    """(labels, percentages, colors) for render_religion_donut from a {religion: percent} dict."""
     labels, sizes, colors = [], [], []
     total = sum(max(0, float(v)) for v in rel_mix.values()) or 1.0
     for name, val in rel_mix.items():
@@ -219,18 +217,8 @@ def make_religion_pie(rel_mix: Dict[str, float]) -> BytesIO:
     # avoid empty chart
     if not sizes:
         labels, sizes, colors = ["No Data"], [100], ["#666666"]
+    return labels, sizes, colors
 
-    fig, ax = plt.subplots(figsize=(4.8, 4.8), dpi=200)
-    wedges, _ = ax.pie(sizes, labels=None, colors=colors, startangle=90, wedgeprops=dict(width=0.5))
-    ax.legend(wedges, labels, loc="center left", bbox_to_anchor=(1.0, 0.5), frameon=False, fontsize=8)
-    ax.axis('equal')
-
-    buf = BytesIO()
-    plt.tight_layout()
-    fig.savefig(buf, format="png", transparent=True)
-    plt.close(fig)
-    buf.seek(0)
-    return buf
 # --- VIEW: show a country summary + religion pie ---------------------------
 
 def fuzz_numeric(val: float | int, low_pct: int = 5, high_pct: int = 5) -> tuple[float, float]:
@@ -504,9 +492,11 @@ class ThirtyYearsWarRP(commands.Cog):
         self.dynamic_data = load_json(DATA_FILE)
         bootstrap_recompute_all(self)
         self.actions_data = load_json(ACTIONS_FILE)
+        self.charts = get_renderer(bot)
 
     async def cog_unload(self):
         save_json(DATA_FILE, self.dynamic_data)
+        release_renderer(self.bot)
     
     tyw = app_commands.Group(name="tyw", description="Commands related to the Thirty Years' War RP.")
     gm = app_commands.Group(name="gm", description="Game Master commands.", parent=tyw, default_permissions=discord.Permissions(administrator=True))
@@ -642,7 +632,7 @@ class ThirtyYearsWarRP(commands.Cog):
             # Religion pie card
             e_relig = discord.Embed(title="Religion Mix", color=discord.Color.blue())
             rel_mix = dyn.get("religion", {"Catholic": 0, "Protestant": 0, "Muslim": 0})
-            pie_buf = make_religion_pie(rel_mix)
+            pie_buf = await self.charts.render_file(render_religion_donut, *religion_pie_data(rel_mix))
             pie_file = discord.File(pie_buf, filename="religion_pie.png")
             e_relig.set_image(url="attachment://religion_pie.png")
             add_religion_fields(e_relig, rel_mix, is_owner, mask)
@@ -661,7 +651,7 @@ class ThirtyYearsWarRP(commands.Cog):
         elif chosen == "religion":
             e = discord.Embed(title=f"{static_c.get('name', country)} – Religion", color=discord.Color.blue())
             rel_mix = dyn.get("religion", {"Catholic": 0, "Protestant": 0, "Muslim": 0})
-            pie_buf = make_religion_pie(rel_mix)
+            pie_buf = await self.charts.render_file(render_religion_donut, *religion_pie_data(rel_mix))
             pie_file = discord.File(pie_buf, filename="religion_pie.png")
             e.set_image(url="attachment://religion_pie.png")
             add_religion_fields(e, rel_mix, is_owner, mask)
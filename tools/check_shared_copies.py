@@ -0,0 +1,33 @@
+"""
+Fail when the copies of a shared module drift apart.
+
+Red installs each cog on its own, so a few helpers are copied into every cog that
+uses them. Edit one copy, copy it over the rest, then run:
+
+    python tools/check_shared_copies.py
+"""
+import hashlib
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SHARED = ("message_router.py", "chart_renderer.py", "corp_store.py")
+
+
+def main() -> int:
+    failed = False
+    for name in SHARED:
+        copies = sorted(ROOT.glob(f"*/{name}"))
+        digests = {path: hashlib.md5(path.read_bytes()).hexdigest() for path in copies}
+        if len(set(digests.values())) > 1:
+            failed = True
+            print(f"{name}: copies differ")
+            for path, digest in digests.items():
+                print(f"  {digest}  {path.relative_to(ROOT)}")
+        else:
+            print(f"{name}: {len(copies)} copies match")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
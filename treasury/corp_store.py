@@ -0,0 +1,222 @@
+from __future__ import annotations
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+from typing import Callable
+
+import pytz
+
+# Schema version of the corporation documents; bump and append to MIGRATIONS to change it.
+SCHEMA_VERSION = 1
+# Attribute on the bot that Corporations and Treasury share, so both edit the same dicts.
+_BOT_ATTR = "_spidey_corporations"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS corporations (
+    name TEXT PRIMARY KEY,
+    doc TEXT NOT NULL,
+    status TEXT,
+    auto_renew INTEGER NOT NULL DEFAULT 0,
+    renewal_due TEXT  -- UTC isoformat, so text order is time order
+);
+CREATE INDEX IF NOT EXISTS corporations_autorenew_due ON corporations(auto_renew, renewal_due);
+CREATE INDEX IF NOT EXISTS corporations_status_due ON corporations(status, renewal_due);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _utc_iso(value) -> str | None:
+    """
+    renewal_due as UTC isoformat. The column is compared as text, which only
+    orders correctly when every value has the same offset; naive times count as UTC.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _migrate_v1(name: str, comp: dict) -> None:
+    """CEO falls back to the registering owner; every company gets the Corporations fields."""
+    if ("CEO" not in comp or comp["CEO"] is None) and "owner" in comp:
+        comp["CEO"] = comp["owner"]
+    default_fields = {
+        "category": "general",       # e.g., tech, retail, healthcare, etc.
+        "office_purchased": False,   # Whether the company has purchased HQ space
+        "CEO": None,                 # Owner's Discord user id (as string)
+        "busy_season": 1.0,          # Multiplier for seasonal performance; default is neutral.
+        "date_registered": str(datetime.now(pytz.timezone("US/Pacific"))),
+        "land": None,
+        "office": None,
+        "balance": 0,
+        "randd_skill": 0,
+        "employees": {},
+        "active_projects": [],
+        "pending_projects": {},
+        "products": {},
+        "manufacturing_line": {},
+        "manufacturing_locations": {}
+    }
+    comp["name"] = name
+    for field, default in default_fields.items():
+        if field not in comp:
+            comp[field] = default
+
+
+MIGRATIONS: list[tuple[int, Callable[[str, dict], None]]] = [
+    (1, _migrate_v1),
+]
+
+
+class CorporationStore:
+    """
+    The one corporation registry for the process, shared by Corporations and Treasury.
+
+    `corps` is a plain {name: dict} that both cogs read and mutate in place; after a
+    change the cog calls `save(name)` and only that row is rewritten in SQLite.
+    Status, auto-renew and renewal_due are mirrored into indexed columns, so
+    renewals and revocations query just the companies that are due. Migrations in
+    MIGRATIONS run once per schema version, and the old corporations.json is
+    imported the first time the database is created.
+    """
+
+    def __init__(self, db_path: str, legacy_json: str | None = None):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode = WAL;")
+        self.conn.execute("PRAGMA synchronous = NORMAL;")
+        self.conn.executescript(_SCHEMA)
+        self.users = 0
+        self.listeners: list[Callable[[str, dict | None], None]] = []
+
+        if legacy_json and self._version() is None:
+            self._import_json(legacy_json)
+        self.corps: dict[str, dict] = {
+            name: json.loads(doc) for name, doc in self.conn.execute("SELECT name, doc FROM corporations")
+        }
+        self._migrate()
+
+    # ---------- schema ----------
+
+    def _version(self) -> int | None:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        return int(row[0]) if row else None
+
+    def _set_version(self, version: int) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)", (str(version),))
+
+    def _import_json(self, path: str) -> None:
+        data = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Corporations import error: {e}")
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO corporations VALUES (?,?,?,?,?)",
+                [self._row(name, comp) for name, comp in data.items()],
+            )
+            self._set_version(0)
+        if data:
+            print(f"Imported {len(data)} corporations from {os.path.basename(path)}.")
+
+    def _migrate(self) -> None:
+        version = self._version() or 0
+        pending = [(v, fn) for v, fn in MIGRATIONS if v > version]
+        if not pending:
+            return
+        for name, comp in self.corps.items():
+            for _v, fn in pending:
+                fn(name, comp)
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO corporations VALUES (?,?,?,?,?)",
+                [self._row(name, comp) for name, comp in self.corps.items()],
+            )
+            self._set_version(pending[-1][0])
+        print(f"Corporations migrated to schema v{pending[-1][0]}.")
+
+    # ---------- writes ----------
+
+    @staticmethod
+    def _row(name: str, comp: dict) -> tuple:
+        return (
+            name,
+            json.dumps(comp),
+            comp.get("status"),
+            1 if comp.get("auto_renew") else 0,
+            _utc_iso(comp.get("renewal_due")),
+        )
+
+    def save(self, name: str) -> None:
+        """Persist one company after its dict was changed (or drop it if it's gone)."""
+        comp = self.corps.get(name)
+        with self.conn:
+            if comp is None:
+                self.conn.execute("DELETE FROM corporations WHERE name = ?", (name,))
+            else:
+                self.conn.execute("INSERT OR REPLACE INTO corporations VALUES (?,?,?,?,?)", self._row(name, comp))
+        for fn in self.listeners:
+            try:
+                fn(name, comp)
+            except Exception as e:
+                print(f"Corporation listener error: {e}")
+
+    def add(self, name: str, comp: dict) -> None:
+        for _v, fn in MIGRATIONS:
+            fn(name, comp)
+        self.corps[name] = comp
+        self.save(name)
+
+    # ---------- due-date queries ----------
+
+    def due_for_renewal(self, now: datetime) -> list[str]:
+        """Auto-renewing companies whose renewal_due has passed."""
+        rows = self.conn.execute(
+            "SELECT name FROM corporations WHERE auto_renew = 1 AND renewal_due <= ? ORDER BY renewal_due",
+            (_utc_iso(now),),
+        )
+        return [r[0] for r in rows]
+
+    def overdue(self, now: datetime, status: str = "Active") -> list[str]:
+        rows = self.conn.execute(
+            "SELECT name FROM corporations WHERE status = ? AND renewal_due < ? ORDER BY renewal_due",
+            (status, _utc_iso(now)),
+        )
+        return [r[0] for r in rows]
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def get_store(bot, db_path: str, legacy_json: str | None = None) -> CorporationStore:
+    """The bot-wide store; each cog that uses it takes a reference on load."""
+    store = getattr(bot, _BOT_ATTR, None)
+    if store is None:
+        store = CorporationStore(db_path, legacy_json)
+        setattr(bot, _BOT_ATTR, store)
+    store.users += 1
+    return store
+
+
+def release_store(bot) -> None:
+    store = getattr(bot, _BOT_ATTR, None)
+    if store is None:
+        return
+    store.users -= 1
+    if store.users <= 0:
+        store.close()
+        delattr(bot, _BOT_ATTR)
@@ -9,6 +9,7 @@ import os
 import json
 from datetime import datetime, timedelta, timezone
 import shutil
+from .corp_store import get_store, release_store
 
 registration_fee = 5000
 renewal_fee = 2000
@@ -64,7 +65,9 @@ class Treasury(commands.Cog):
         self.tax_file = os.path.join(DATA_DIR, "taxes.json")
         self.corporations_file = os.path.join(DATA_DIR, "corporations.json")
         self.load_taxes()
-        self.load_corporations()
+        # Shared with the Corporations cog; save rows with self.store.save(name).
+        self.store = get_store(bot, os.path.join(DATA_DIR, "corporations.db"), self.corporations_file)
+        self.corporations = self.store.corps
         self.auto_renew_corporations.start()
     
 
@@ -80,24 +83,23 @@ class Treasury(commands.Cog):
         
     def cog_unload(self):
         self.auto_renew_corporations.stop()
+        release_store(self.bot)
     
     @tasks.loop(hours=24)
     async def auto_renew_corporations(self):
         now = datetime.now(timezone.utc)
-        for company_name, corp in self.corporations.items():
-            if corp.get("auto_renew", False):
-                renewal_due = datetime.fromisoformat(corp["renewal_due"])
-                if now >= renewal_due:
-                    success, message = await self.renew_corporation(company_name)
-                    owner = corp["owner"]
-                    try:
-                        user = await self.bot.fetch_user(owner)
-                        if success:
-                            await user.send(f"Your corporation '{company_name}' has been auto-renewed. {message}")
-                        else:
-                            await user.send(f"Auto-renewal failed for '{company_name}': {message}")
-                    except Exception:
-                        pass
+        for company_name in self.store.due_for_renewal(now):
+            corp = self.corporations[company_name]
+            success, message = await self.renew_corporation(company_name)
+            owner = corp["owner"]
+            try:
+                user = await self.bot.fetch_user(owner)
+                if success:
+                    await user.send(f"Your corporation '{company_name}' has been auto-renewed. {message}")
+                else:
+                    await user.send(f"Auto-renewal failed for '{company_name}': {message}")
+            except Exception:
+                pass
     
     def load_taxes(self):
         try:
@@ -111,19 +113,6 @@ class Treasury(commands.Cog):
         with open(self.tax_file, "w") as file:
             json.dump(self.taxes, file, indent=4)
     
-    def load_corporations(self):
-        try:
-            with open(self.corporations_file, "r") as file:
-                self.corporations = json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.corporations = {}
-            print(f"Loading corporations from: {self.corporations_file}")
-            self.save_corporations()
-    
-    def save_corporations(self):
-        with open(self.corporations_file, "w") as file:
-            json.dump(self.corporations, file, indent=4)
-    
     async def register_corporation(self, owner: discord.Member, company_name: str, ctx: commands.Context):
         if company_name in self.corporations:
             return False, "A corporation with this name already exists."
@@ -142,14 +131,13 @@ class Treasury(commands.Cog):
         
         await bank.withdraw_credits(owner, registration_fee)
         renewal_data = datetime.now(timezone.utc) + timedelta(days=30)
-        self.corporations[company_name] = {
+        self.store.add(company_name, {
             "owner": owner.id,
             "registered_on": datetime.now(timezone.utc).isoformat(),
             "renewal_due": renewal_data.isoformat(),
             "status": "Active",
             "auto_renew": False
-        }
-        self.save_corporations()
+        })
         return True, f"Corporation '{company_name}' successfully registered! Next renewal due: {renewal_data.strftime('%Y-%m-%d')}"
 
     async def renew_corporation(self, company_name: str):
@@ -174,18 +162,17 @@ class Treasury(commands.Cog):
         await bank.withdraw_credits(owner, fee)
         new_renewal_date = datetime.now(timezone.utc) + timedelta(days=30)
         corp["renewal_due"] = new_renewal_date.isoformat()
-        self.save_corporations()
+        self.store.save(company_name)
         return True, f"{company_name} successfully renewed! Next renewal due: {new_renewal_date.strftime('%Y-%m-%d')}"
 
     async def check_expired_corporations(self, ctx):
         now = datetime.now(timezone.utc)
         revoked_corps = []
-        for company_name, details in self.corporations.items():
-            renewal_due = datetime.fromisoformat(details["renewal_due"])
-            if renewal_due < now and details["status"] == "Active":
-                details["status"] = "Revoked"
-                revoked_corps.append((company_name, details["owner"]))
-        self.save_corporations()
+        for company_name in self.store.overdue(now, status="Active"):
+            details = self.corporations[company_name]
+            details["status"] = "Revoked"
+            self.store.save(company_name)
+            revoked_corps.append((company_name, details["owner"]))
 
         for corp, owner in revoked_corps:
             user = discord.utils.get(ctx.guild.members, name=owner)
@@ -255,7 +242,7 @@ class Treasury(commands.Cog):
         
         current = corp.get("auto_renew", False)
         corp["auto_renew"] = not current
-        self.save_corporations()
+        self.store.save(corp_name)
         status = "enabled" if corp["auto_renew"] else "disabled"
         await ctx.send(f"Auto-renewal has been {status} for {corp_name}.")
 